@@ -3,11 +3,15 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLabel, QTreeWidget, 
                             QTreeWidgetItem, QTabBar, QFrame, QSplitter, 
                             QToolBar, QAction, QGroupBox, QMenu, QLineEdit,
-                            QComboBox)
+                            QComboBox, QFileDialog, QMessageBox)
 from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
+from report_generator import current_project, write_report
+import stall_watchdog
+import tracing
 
 class BICCAStudio(QMainWindow):
+    @tracing.traced("ui", "Home.__init__")
     def __init__(self):
         super().__init__()
         self.setWindowTitle("<untitled draft> - BICCA Studio 1.0.0")
@@ -108,6 +112,7 @@ class BICCAStudio(QMainWindow):
         
         reports_action = QAction("Reports", self)
         reports_action.setFont(QFont("Arial", 10, QFont.Bold))
+        reports_action.triggered.connect(self.generate_report)
         menubar.addAction(reports_action)
         
         help_action = QAction("Help", self)
@@ -223,6 +228,17 @@ class BICCAStudio(QMainWindow):
             self.help_menu_widget.show()
             self.help_menu_widget.raise_()
     
+    def generate_report(self):
+        # Close dropdown menus before showing the save dialog
+        self.file_menu_widget.hide()
+        self.help_menu_widget.hide()
+        
+        path, _ = QFileDialog.getSaveFileName(self, "Save Report", "report.pdf", "PDF Files (*.pdf)")
+        if not path:
+            return
+        pages = write_report(path, [current_project()])
+        QMessageBox.information(self, "Report", f"Report saved to {path} ({pages} pages)")
+    
     def create_toolbar(self):
         toolbar = QToolBar()
         toolbar.setMovable(False)
@@ -559,10 +575,60 @@ class BICCAStudio(QMainWindow):
     def create_status_bar(self):
         status_bar = self.statusBar()
         
+        # Time spent per trace category, refreshed while the window is open
+        self.trace_label = QLabel(tracing.summary_text())
+        self.trace_label.setStyleSheet("color: #555555; padding: 0px 10px;")
+        status_bar.addWidget(self.trace_label)
+        
+        self.tracing_btn = QPushButton()
+        self.tracing_btn.setCheckable(True)
+        self.tracing_btn.setChecked(tracing.enabled())
+        self.tracing_btn.setStyleSheet("padding: 5px 15px;")
+        self.tracing_btn.toggled.connect(self.toggle_tracing)
+        self.update_tracing_button()
+        status_bar.addPermanentWidget(self.tracing_btn)
+        
+        trace_btn = QPushButton("Export Trace")
+        trace_btn.setStyleSheet("padding: 5px 15px;")
+        trace_btn.clicked.connect(self.export_trace)
+        status_bar.addPermanentWidget(trace_btn)
+        
         data_btn = QPushButton("▲ Data")
         data_btn.setStyleSheet("padding: 5px 15px;")
         
         status_bar.addPermanentWidget(data_btn)
+        
+        self.trace_timer = QTimer(self)
+        self.trace_timer.timeout.connect(self.update_trace_summary)
+        self.trace_timer.start(1000)
+    
+    def update_trace_summary(self):
+        self.trace_label.setText(tracing.summary_text())
+    
+    def toggle_tracing(self, checked):
+        if checked:
+            tracing.enable()
+            self.statusBar().showMessage("Tracing started", 3000)
+        else:
+            # Recorded spans are kept for the next export
+            tracing.disable()
+            self.statusBar().showMessage("Tracing stopped", 3000)
+        self.update_tracing_button()
+    
+    def update_tracing_button(self):
+        self.tracing_btn.setText("Stop Tracing" if self.tracing_btn.isChecked() else "Start Tracing")
+    
+    def export_trace(self):
+        if not tracing.events():
+            hint = "" if tracing.enabled() else "; click Start Tracing first"
+            self.statusBar().showMessage(f"No spans recorded yet{hint}", 5000)
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "trace.json", "Trace Files (*.json)")
+        if not path:
+            return
+        count = tracing.export_chrome_trace(path)
+        note = "" if tracing.enabled() else " (tracing is stopped)"
+        self.statusBar().showMessage(f"{count} spans written to {path}{note}", 5000)
     
     def update_tutorial_content(self):
         # Get current page data
@@ -603,6 +669,8 @@ class BICCAStudio(QMainWindow):
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    watchdog = stall_watchdog.start()
+    app.aboutToQuit.connect(watchdog.stop)
     window = BICCAStudio()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -9,73 +9,74 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from ProjectDetails_BridgeANDTrafficData_Window import Ui_BridgeTraffic_Dialog
-from ProjectDetails_Foundation_Window import Ui_Foundation_Dialog
-from ProjectDetails_CarbonEmissionData_Window import Ui_CarbonEmission_Dialog
-from ProjectDetails_DemolitionANDRecyclingData_Window import Ui_Demolition_Dialog
-from ProjectDetails_FinancialData_Window import Ui_FinancialData_Dialog
-from ProjectDetails_MaintenanceANDRepairData_Window import Ui_Maintenance_Dialog
-from ProjectDetails_Miscellaneous_Window import Ui_Miscellaneous_Dialog
-from ProjectDetails_SubStructure_Window import Ui_SubStructure_Dialog
-from ProjectDetails_SuperStructure_Window import Ui_SuperStructure_Dialog
+import dialog_schema
+from report_generator import current_project, write_report
+import autosave_journal
+import form_data_storage
+from version_history import store_for
+from VersionHistory_Window import VersionHistoryDialog, create_copy
+from project_navigator import ProjectNavigatorDock
+import stall_watchdog
+import tracing
 
 class Ui_MainWindow(object):
+    def openSchemaWindow(self, schema):
+        self.navigator.show_section(schema)
+
     def openBridgeTrafficWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_BridgeTraffic_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.BRIDGE_TRAFFIC)
 
     def openFoundationWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_Foundation_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.FOUNDATION)
 
     def openCarbonEmissionWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_CarbonEmission_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.CARBON_EMISSION)
 
     def openDemolitionWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_Demolition_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
-    
+        self.openSchemaWindow(dialog_schema.DEMOLITION)
+
     def openFinancialWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_FinancialData_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.FINANCIAL)
 
     def openMaintenanceWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_Maintenance_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.MAINTENANCE)
 
     def openMiscellaneousWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_Miscellaneous_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.MISCELLANEOUS)
 
-    def openSubStructureWindow(self):   
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_SubStructure_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+    def openSubStructureWindow(self):
+        self.openSchemaWindow(dialog_schema.SUB_STRUCTURE)
 
     def openSuperStructureWindow(self):
-        self.window = QtWidgets.QDialog()
-        self.ui = Ui_SuperStructure_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.show()
+        self.openSchemaWindow(dialog_schema.SUPER_STRUCTURE)
+
+    def exportReport(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self.centralwidget, "Save Report", "report.pdf", "PDF Files (*.pdf)")
+        if not path:
+            return
+        pages = write_report(path, [current_project()])
+        self.statusbar.showMessage(f"Report saved to {path} ({pages} pages)", 5000)
+
+    def versionStore(self):
+        if form_data_storage.journal is not None:
+            return store_for(form_data_storage.journal.project_path)
+        return store_for(autosave_journal.DEFAULT_PROJECT_PATH)
+
+    def openVersionHistory(self):
+        self.versionWindow = VersionHistoryDialog(self.versionStore(), self.centralwidget)
+        # A restore replaces the form data; show it in the open pages
+        self.versionWindow.finished.connect(lambda result: self.navigator.reload())
+        self.versionWindow.show()
+
+    def createCopy(self):
+        path = create_copy(self.versionStore(), self.centralwidget)
+        if path:
+            self.statusbar.showMessage(f"Copy saved to {path}", 5000)
 
     # ...existing code...
 
+    @tracing.traced("ui", "MainWindow.setupUi")
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(1440, 1024)
@@ -539,6 +540,8 @@ class Ui_MainWindow(object):
         icon18.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/78ff94ca74c504343b797700f5d515a40ab72143.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.actionOpen_File.setIcon(icon18)
         self.actionOpen_File.setObjectName("actionOpen_File")
+        self.actionGenerate_Report = QtWidgets.QAction(MainWindow)
+        self.actionGenerate_Report.setObjectName("actionGenerate_Report")
         self.menuFile.addAction(self.actionNew)
         self.menuFile.addAction(self.actionOpen)
         self.menuFile.addAction(self.actionSave)
@@ -549,6 +552,7 @@ class Ui_MainWindow(object):
         self.menuFile.addAction(self.actionExport)
         self.menuFile.addAction(self.actionVersion_History)
         self.menuFile.addAction(self.actionInfo)
+        self.menuReports.addAction(self.actionGenerate_Report)
         self.menuHelp.addAction(self.actionContact_Us)
         self.menuHelp.addAction(self.actionFeedback)
         self.menuHelp.addAction(self.actionVideo_Tutorials)
@@ -581,6 +585,20 @@ class Ui_MainWindow(object):
         self.pushButton_2.toggled['bool'].connect(self.widget_5.setVisible)
         self.pushButton_10.toggled['bool'].connect(self.show_outputs_section)
 
+        # Project Details: one shared tree and form pane for every input section
+        self.navigator = ProjectNavigatorDock(MainWindow)
+        MainWindow.addDockWidget(QtCore.Qt.LeftDockWidgetArea, self.navigator)
+        self.navigator.hide()
+
+        # Reports
+        self.actionPrint.triggered.connect(self.exportReport)
+        self.actionExport.triggered.connect(self.exportReport)
+        self.actionGenerate_Report.triggered.connect(self.exportReport)
+
+        # Versions
+        self.actionVersion_History.triggered.connect(self.openVersionHistory)
+        self.actionCreate_a_Copy.triggered.connect(self.createCopy)
+
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
@@ -881,6 +899,7 @@ class Ui_MainWindow(object):
         self.actionEdit.setText(_translate("MainWindow", "Edit"))
         self.actionFile.setText(_translate("MainWindow", "File"))
         self.actionOpen_File.setText(_translate("MainWindow", "Open File"))
+        self.actionGenerate_Report.setText(_translate("MainWindow", "Generate PDF Report..."))
 
     def show_outputs_section(self, checked):
         # For now, Outputs button click doesn't show anything specific
@@ -891,8 +910,20 @@ class Ui_MainWindow(object):
 if __name__ == "__main__":
     import sys
     app = QtWidgets.QApplication(sys.argv)
+    # Recover unsaved edits from the last session and keep journaling new ones
+    try:
+        journal = autosave_journal.start()
+    except ValueError as error:
+        QtWidgets.QMessageBox.critical(None, "Cannot Open Project", str(error))
+        sys.exit(1)
+    app.aboutToQuit.connect(journal.close)
+    # Log the GUI stack whenever the interface freezes
+    watchdog = stall_watchdog.start()
+    app.aboutToQuit.connect(watchdog.stop)
     MainWindow = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
     ui.setupUi(MainWindow)
+    if journal.recovered:
+        ui.statusbar.showMessage(f"Recovered {journal.recovered} unsaved edits from the last session", 10000)
     MainWindow.show()
     sys.exit(app.exec_())
@@ -1,811 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'C:\Users\saans\AppData\Local\Programs\Python\Python310\Lib\site-packages\qt5_applications\Qt\bin\ProjectDetails_CarbonEmissionData_Window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QMessageBox
-
-
-class Ui_CarbonEmission_Dialog(object):
-    def setupUi(self, CarbonEmission_Dialog):
-        CarbonEmission_Dialog.setObjectName("CarbonEmission_Dialog")
-        CarbonEmission_Dialog.resize(1440, 1000)
-        self.buttonBox = QtWidgets.QDialogButtonBox(CarbonEmission_Dialog)
-        self.buttonBox.setGeometry(QtCore.QRect(540, 690, 341, 32))
-        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close | QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox.setObjectName("buttonBox")
-        self.label = QtWidgets.QLabel(CarbonEmission_Dialog)
-        self.label.setGeometry(QtCore.QRect(10, 60, 244, 691))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label.setText("")
-        self.label.setObjectName("label")
-        self.pushButton = QtWidgets.QPushButton(CarbonEmission_Dialog)
-        self.pushButton.setGeometry(QtCore.QRect(10, 35, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton.setFont(font)
-        self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton.setIcon(icon)
-        self.pushButton.setAutoRepeat(False)
-        self.pushButton.setObjectName("pushButton")
-        self.widget_2 = QtWidgets.QWidget(CarbonEmission_Dialog)
-        self.widget_2.setGeometry(QtCore.QRect(350, 60, 778, 708))
-        self.widget_2.setStyleSheet("background-color: #fff9f9")
-        self.widget_2.setObjectName("widget_2")
-        self.label_56 = QtWidgets.QLabel(self.widget_2)
-        self.label_56.setGeometry(QtCore.QRect(20, 10, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_56.setFont(font)
-        self.label_56.setObjectName("label_56")
-        self.comboBox_19 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_19.setGeometry(QtCore.QRect(140, 10, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_19.setFont(font)
-        self.comboBox_19.setStyleSheet("background-color: #ffffff")
-        self.comboBox_19.setObjectName("comboBox_19")
-        self.comboBox_19.addItem("")
-        self.comboBox_19.addItem("")
-        self.label_57 = QtWidgets.QLabel(self.widget_2)
-        self.label_57.setGeometry(QtCore.QRect(20, 70, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_57.setFont(font)
-        self.label_57.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_57.setObjectName("label_57")
-        self.label_58 = QtWidgets.QLabel(self.widget_2)
-        self.label_58.setGeometry(QtCore.QRect(601, 70, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_58.setFont(font)
-        self.label_58.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_58.setObjectName("label_58")
-        self.label_59 = QtWidgets.QLabel(self.widget_2)
-        self.label_59.setGeometry(QtCore.QRect(191, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_59.setFont(font)
-        self.label_59.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_59.setObjectName("label_59")
-        self.label_60 = QtWidgets.QLabel(self.widget_2)
-        self.label_60.setGeometry(QtCore.QRect(311, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_60.setFont(font)
-        self.label_60.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_60.setObjectName("label_60")
-        self.label_61 = QtWidgets.QLabel(self.widget_2)
-        self.label_61.setGeometry(QtCore.QRect(440, 70, 151, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_61.setFont(font)
-        self.label_61.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_61.setObjectName("label_61")
-        self.comboBox_20 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_20.setGeometry(QtCore.QRect(30, 100, 140, 22))
-        self.comboBox_20.setStyleSheet("background-color: #ffffff")
-        self.comboBox_20.setObjectName("comboBox_20")
-        self.comboBox_20.addItem("")
-        self.comboBox_20.addItem("")
-        self.comboBox_21 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_21.setGeometry(QtCore.QRect(30, 130, 140, 22))
-        self.comboBox_21.setStyleSheet("background-color: #ffffff")
-        self.comboBox_21.setObjectName("comboBox_21")
-        self.comboBox_21.addItem("")
-        self.comboBox_21.addItem("")
-        self.lineEdit_37 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_37.setGeometry(QtCore.QRect(210, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_37.setFont(font)
-        self.lineEdit_37.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_37.setObjectName("lineEdit_37")
-        self.lineEdit_38 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_38.setGeometry(QtCore.QRect(210, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_38.setFont(font)
-        self.lineEdit_38.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_38.setObjectName("lineEdit_38")
-        self.label_62 = QtWidgets.QLabel(self.widget_2)
-        self.label_62.setGeometry(QtCore.QRect(340, 100, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_62.setFont(font)
-        self.label_62.setStyleSheet("background-color: #ffffff")
-        self.label_62.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_62.setObjectName("label_62")
-        self.label_63 = QtWidgets.QLabel(self.widget_2)
-        self.label_63.setGeometry(QtCore.QRect(340, 130, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_63.setFont(font)
-        self.label_63.setStyleSheet("background-color: #ffffff")
-        self.label_63.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_63.setObjectName("label_63")
-        self.lineEdit_39 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_39.setGeometry(QtCore.QRect(450, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_39.setFont(font)
-        self.lineEdit_39.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_39.setObjectName("lineEdit_39")
-        self.lineEdit_40 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_40.setGeometry(QtCore.QRect(450, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_40.setFont(font)
-        self.lineEdit_40.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_40.setObjectName("lineEdit_40")
-        self.lineEdit_41 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_41.setGeometry(QtCore.QRect(610, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_41.setFont(font)
-        self.lineEdit_41.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_41.setObjectName("lineEdit_41")
-        self.lineEdit_42 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_42.setGeometry(QtCore.QRect(610, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_42.setFont(font)
-        self.lineEdit_42.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_42.setObjectName("lineEdit_42")
-        self.pushButton_13 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_13.setGeometry(QtCore.QRect(300, 200, 190, 23))
-        self.pushButton_13.setStyleSheet("background-color: #ffffff")
-        self.pushButton_13.setObjectName("pushButton_13")
-        self.pushButton_49 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_49.setGeometry(QtCore.QRect(310, 440, 190, 23))
-        self.pushButton_49.setStyleSheet("background-color: #ffffff")
-        self.pushButton_49.setObjectName("pushButton_49")
-        self.buttonBox_5 = QtWidgets.QDialogButtonBox(self.widget_2)
-        self.buttonBox_5.setGeometry(QtCore.QRect(430, 670, 341, 32))
-        self.buttonBox_5.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox_5.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox_5.setCenterButtons(False)
-        self.buttonBox_5.setObjectName("buttonBox_5")
-        self.line_7 = QtWidgets.QFrame(self.widget_2)
-        self.line_7.setGeometry(QtCore.QRect(10, 230, 761, 16))
-        self.line_7.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_7.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_7.setLineWidth(2)
-        self.line_7.setMidLineWidth(2)
-        self.line_7.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_7.setObjectName("line_7")
-        self.line_8 = QtWidgets.QFrame(self.widget_2)
-        self.line_8.setGeometry(QtCore.QRect(10, 470, 761, 16))
-        self.line_8.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_8.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_8.setLineWidth(2)
-        self.line_8.setMidLineWidth(2)
-        self.line_8.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_8.setObjectName("line_8")
-        self.label_74 = QtWidgets.QLabel(self.widget_2)
-        self.label_74.setGeometry(QtCore.QRect(540, 100, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_74.setFont(font)
-        self.label_74.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_74.setObjectName("label_74")
-        self.label_75 = QtWidgets.QLabel(self.widget_2)
-        self.label_75.setGeometry(QtCore.QRect(540, 130, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_75.setFont(font)
-        self.label_75.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_75.setObjectName("label_75")
-        self.label_76 = QtWidgets.QLabel(self.widget_2)
-        self.label_76.setGeometry(QtCore.QRect(700, 100, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_76.setFont(font)
-        self.label_76.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_76.setObjectName("label_76")
-        self.label_77 = QtWidgets.QLabel(self.widget_2)
-        self.label_77.setGeometry(QtCore.QRect(700, 130, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_77.setFont(font)
-        self.label_77.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_77.setObjectName("label_77")
-        self.label_78 = QtWidgets.QLabel(self.widget_2)
-        self.label_78.setGeometry(QtCore.QRect(539, 340, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_78.setFont(font)
-        self.label_78.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_78.setObjectName("label_78")
-        self.label_79 = QtWidgets.QLabel(self.widget_2)
-        self.label_79.setGeometry(QtCore.QRect(699, 370, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_79.setFont(font)
-        self.label_79.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_79.setObjectName("label_79")
-        self.label_64 = QtWidgets.QLabel(self.widget_2)
-        self.label_64.setGeometry(QtCore.QRect(339, 340, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_64.setFont(font)
-        self.label_64.setStyleSheet("background-color: #ffffff")
-        self.label_64.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_64.setObjectName("label_64")
-        self.label_65 = QtWidgets.QLabel(self.widget_2)
-        self.label_65.setGeometry(QtCore.QRect(339, 370, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_65.setFont(font)
-        self.label_65.setStyleSheet("background-color: #ffffff")
-        self.label_65.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_65.setObjectName("label_65")
-        self.lineEdit_43 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_43.setGeometry(QtCore.QRect(609, 370, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_43.setFont(font)
-        self.lineEdit_43.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_43.setObjectName("lineEdit_43")
-        self.lineEdit_44 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_44.setGeometry(QtCore.QRect(209, 370, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_44.setFont(font)
-        self.lineEdit_44.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_44.setObjectName("lineEdit_44")
-        self.label_80 = QtWidgets.QLabel(self.widget_2)
-        self.label_80.setGeometry(QtCore.QRect(699, 340, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_80.setFont(font)
-        self.label_80.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_80.setObjectName("label_80")
-        self.label_66 = QtWidgets.QLabel(self.widget_2)
-        self.label_66.setGeometry(QtCore.QRect(19, 250, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_66.setFont(font)
-        self.label_66.setObjectName("label_66")
-        self.lineEdit_45 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_45.setGeometry(QtCore.QRect(449, 370, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_45.setFont(font)
-        self.lineEdit_45.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_45.setObjectName("lineEdit_45")
-        self.label_67 = QtWidgets.QLabel(self.widget_2)
-        self.label_67.setGeometry(QtCore.QRect(19, 310, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_67.setFont(font)
-        self.label_67.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_67.setObjectName("label_67")
-        self.label_81 = QtWidgets.QLabel(self.widget_2)
-        self.label_81.setGeometry(QtCore.QRect(539, 370, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_81.setFont(font)
-        self.label_81.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_81.setObjectName("label_81")
-        self.label_68 = QtWidgets.QLabel(self.widget_2)
-        self.label_68.setGeometry(QtCore.QRect(600, 310, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_68.setFont(font)
-        self.label_68.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_68.setObjectName("label_68")
-        self.label_69 = QtWidgets.QLabel(self.widget_2)
-        self.label_69.setGeometry(QtCore.QRect(190, 310, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_69.setFont(font)
-        self.label_69.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_69.setObjectName("label_69")
-        self.comboBox_22 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_22.setGeometry(QtCore.QRect(29, 340, 140, 22))
-        self.comboBox_22.setStyleSheet("background-color: #ffffff")
-        self.comboBox_22.setObjectName("comboBox_22")
-        self.comboBox_22.addItem("")
-        self.comboBox_22.addItem("")
-        self.label_70 = QtWidgets.QLabel(self.widget_2)
-        self.label_70.setGeometry(QtCore.QRect(439, 310, 151, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_70.setFont(font)
-        self.label_70.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_70.setObjectName("label_70")
-        self.lineEdit_46 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_46.setGeometry(QtCore.QRect(449, 340, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_46.setFont(font)
-        self.lineEdit_46.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_46.setObjectName("lineEdit_46")
-        self.comboBox_23 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_23.setGeometry(QtCore.QRect(29, 370, 140, 22))
-        self.comboBox_23.setStyleSheet("background-color: #ffffff")
-        self.comboBox_23.setObjectName("comboBox_23")
-        self.comboBox_23.addItem("")
-        self.comboBox_23.addItem("")
-        self.comboBox_24 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_24.setGeometry(QtCore.QRect(139, 250, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_24.setFont(font)
-        self.comboBox_24.setStyleSheet("background-color: #ffffff")
-        self.comboBox_24.setObjectName("comboBox_24")
-        self.comboBox_24.addItem("")
-        self.comboBox_24.addItem("")
-        self.lineEdit_47 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_47.setGeometry(QtCore.QRect(609, 340, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_47.setFont(font)
-        self.lineEdit_47.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_47.setObjectName("lineEdit_47")
-        self.lineEdit_48 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_48.setGeometry(QtCore.QRect(209, 340, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_48.setFont(font)
-        self.lineEdit_48.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_48.setObjectName("lineEdit_48")
-        self.label_71 = QtWidgets.QLabel(self.widget_2)
-        self.label_71.setGeometry(QtCore.QRect(310, 310, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_71.setFont(font)
-        self.label_71.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_71.setObjectName("label_71")
-        self.label_82 = QtWidgets.QLabel(self.widget_2)
-        self.label_82.setGeometry(QtCore.QRect(539, 580, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_82.setFont(font)
-        self.label_82.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_82.setObjectName("label_82")
-        self.label_83 = QtWidgets.QLabel(self.widget_2)
-        self.label_83.setGeometry(QtCore.QRect(699, 610, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_83.setFont(font)
-        self.label_83.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_83.setObjectName("label_83")
-        self.label_84 = QtWidgets.QLabel(self.widget_2)
-        self.label_84.setGeometry(QtCore.QRect(339, 580, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_84.setFont(font)
-        self.label_84.setStyleSheet("background-color: #ffffff")
-        self.label_84.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_84.setObjectName("label_84")
-        self.label_85 = QtWidgets.QLabel(self.widget_2)
-        self.label_85.setGeometry(QtCore.QRect(339, 610, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_85.setFont(font)
-        self.label_85.setStyleSheet("background-color: #ffffff")
-        self.label_85.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_85.setObjectName("label_85")
-        self.lineEdit_49 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_49.setGeometry(QtCore.QRect(609, 610, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_49.setFont(font)
-        self.lineEdit_49.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_49.setObjectName("lineEdit_49")
-        self.lineEdit_50 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_50.setGeometry(QtCore.QRect(209, 610, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_50.setFont(font)
-        self.lineEdit_50.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_50.setObjectName("lineEdit_50")
-        self.label_86 = QtWidgets.QLabel(self.widget_2)
-        self.label_86.setGeometry(QtCore.QRect(699, 580, 71, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_86.setFont(font)
-        self.label_86.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_86.setObjectName("label_86")
-        self.label_87 = QtWidgets.QLabel(self.widget_2)
-        self.label_87.setGeometry(QtCore.QRect(19, 490, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_87.setFont(font)
-        self.label_87.setObjectName("label_87")
-        self.lineEdit_51 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_51.setGeometry(QtCore.QRect(449, 610, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_51.setFont(font)
-        self.lineEdit_51.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_51.setObjectName("lineEdit_51")
-        self.label_88 = QtWidgets.QLabel(self.widget_2)
-        self.label_88.setGeometry(QtCore.QRect(19, 550, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_88.setFont(font)
-        self.label_88.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_88.setObjectName("label_88")
-        self.label_89 = Qtwidgets.QLabel(self.widget_2)
-        self.label_89.setGeometry(QtCore.QRect(539, 610, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_89.setFont(font)
-        self.label_89.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_89.setObjectName("label_89")
-        self.label_90 = QtWidgets.QLabel(self.widget_2)
-        self.label_90.setGeometry(QtCore.QRect(600, 550, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_90.setFont(font)
-        self.label_90.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_90.setObjectName("label_90")
-        self.label_91 = QtWidgets.QLabel(self.widget_2)
-        self.label_91.setGeometry(QtCore.QRect(190, 550, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_91.setFont(font)
-        self.label_91.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_91.setObjectName("label_91")
-        self.comboBox_25 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_25.setGeometry(QtCore.QRect(29, 580, 140, 22))
-        self.comboBox_25.setStyleSheet("background-color: #ffffff")
-        self.comboBox_25.setObjectName("comboBox_25")
-        self.comboBox_25.addItem("")
-        self.comboBox_25.addItem("")
-        self.label_92 = QtWidgets.QLabel(self.widget_2)
-        self.label_92.setGeometry(QtCore.QRect(439, 550, 151, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_92.setFont(font)
-        self.label_92.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_92.setObjectName("label_92")
-        self.lineEdit_52 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_52.setGeometry(QtCore.QRect(449, 580, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_52.setFont(font)
-        self.lineEdit_52.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_52.setObjectName("lineEdit_52")
-        self.comboBox_26 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_26.setGeometry(QtCore.QRect(29, 610, 140, 22))
-        self.comboBox_26.setStyleSheet("background-color: #ffffff")
-        self.comboBox_26.setObjectName("comboBox_26")
-        self.comboBox_26.addItem("")
-        self.comboBox_26.addItem("")
-        self.comboBox_27 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_27.setGeometry(QtCore.QRect(139, 490, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_27.setFont(font)
-        self.comboBox_27.setStyleSheet("background-color: #ffffff")
-        self.comboBox_27.setObjectName("comboBox_27")
-        self.comboBox_27.addItem("")
-        self.comboBox_27.addItem("")
-        self.lineEdit_53 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_53.setGeometry(QtCore.QRect(609, 580, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_53.setFont(font)
-        self.lineEdit_53.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_53.setObjectName("lineEdit_53")
-        self.lineEdit_54 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_54.setGeometry(QtCore.QRect(209, 580, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_54.setFont(font)
-        self.lineEdit_54.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_54.setObjectName("lineEdit_54")
-        self.label_93 = QtWidgets.QLabel(self.widget_2)
-        self.label_93.setGeometry(QtCore.QRect(310, 550, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_93.setFont(font)
-        self.label_93.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_93.setObjectName("label_93")
-        self.pushButton_50 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_50.setGeometry(QtCore.QRect(310, 670, 190, 23))
-        self.pushButton_50.setStyleSheet("background-color: #ffffff")
-        self.pushButton_50.setObjectName("pushButton_50")
-        self.scrollArea = QtWidgets.QScrollArea(CarbonEmission_Dialog)
-        self.scrollArea.setGeometry(QtCore.QRect(10, 65, 241, 681))
-        self.scrollArea.setAutoFillBackground(False)
-        self.scrollArea.setStyleSheet("background-color: #fff9f9")
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setObjectName("scrollArea")
-        self.scrollAreaWidgetContents_4 = QtWidgets.QWidget()
-        self.scrollAreaWidgetContents_4.setGeometry(QtCore.QRect(0, 0, 239, 679))
-        self.scrollAreaWidgetContents_4.setObjectName("scrollAreaWidgetContents_4")
-        self.label_72 = QtWidgets.QLabel(self.scrollAreaWidgetContents_4)
-        self.label_72.setGeometry(QtCore.QRect(0, 0, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_72.setFont(font)
-        self.label_72.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_72.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_72.setObjectName("label_72")
-        self.widget_11 = QtWidgets.QWidget(self.scrollAreaWidgetContents_4)
-        self.widget_11.setGeometry(QtCore.QRect(0, 30, 221, 357))
-        self.widget_11.setStyleSheet("background-color: #fff9f9")
-        self.widget_11.setObjectName("widget_11")
-        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.widget_11)
-        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_4.setObjectName("verticalLayout_4")
-        self.pushButton_51 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_51.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
-        self.pushButton_51.setIcon(icon1)
-        self.pushButton_51.setCheckable(True)
-        self.pushButton_51.setAutoDefault(True)
-        self.pushButton_51.setObjectName("pushButton_51")
-        self.verticalLayout_4.addWidget(self.pushButton_51)
-        self.widget_12 = QtWidgets.QWidget(self.widget_11)
-        self.widget_12.setObjectName("widget_12")
-        self.formLayout_4 = QtWidgets.QFormLayout(self.widget_12)
-        self.formLayout_4.setObjectName("formLayout_4")
-        self.pushButton_52 = QtWidgets.QPushButton(self.widget_12)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_52.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_52.setIcon(icon2)
-        self.pushButton_52.setObjectName("pushButton_52")
-        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_52)
-        self.pushButton_53 = QtWidgets.QPushButton(self.widget_12)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_53.setFont(font)
-        self.pushButton_53.setIcon(icon2)
-        self.pushButton_53.setObjectName("pushButton_53")
-        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.pushButton_53)
-        self.pushButton_54 = QtWidgets.QPushButton(self.widget_12)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_54.setFont(font)
-        self.pushButton_54.setIcon(icon2)
-        self.pushButton_54.setObjectName("pushButton_54")
-        self.formLayout_4.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pushButton_54)
-        self.pushButton_55 = QtWidgets.QPushButton(self.widget_12)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_55.setFont(font)
-        self.pushButton_55.setIcon(icon2)
-        self.pushButton_55.setObjectName("pushButton_55")
-        self.formLayout_4.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.pushButton_55)
-        self.verticalLayout_4.addWidget(self.widget_12)
-        self.pushButton_56 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_56.setFont(font)
-        self.pushButton_56.setObjectName("pushButton_56")
-        self.verticalLayout_4.addWidget(self.pushButton_56)
-        self.pushButton_57 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_57.setFont(font)
-        self.pushButton_57.setIcon(icon1)
-        self.pushButton_57.setCheckable(True)
-        self.pushButton_57.setObjectName("pushButton_57")
-        self.verticalLayout_4.addWidget(self.pushButton_57)
-        self.widget_13 = QtWidgets.QWidget(self.widget_11)
-        self.widget_13.setMinimumSize(QtCore.QSize(203, 21))
-        self.widget_13.setMaximumSize(QtCore.QSize(281, 21))
-        self.widget_13.setObjectName("widget_13")
-        self.pushButton_58 = QtWidgets.QPushButton(self.widget_13)
-        self.pushButton_58.setGeometry(QtCore.QRect(20, 0, 183, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_58.setFont(font)
-        self.pushButton_58.setIcon(icon2)
-        self.pushButton_58.setObjectName("pushButton_58")
-        self.verticalLayout_4.addWidget(self.widget_13)
-        self.pushButton_59 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_59.setFont(font)
-        self.pushButton_59.setObjectName("pushButton_59")
-        self.verticalLayout_4.addWidget(self.pushButton_59)
-        self.pushButton_60 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_60.setFont(font)
-        self.pushButton_60.setObjectName("pushButton_60")
-        self.verticalLayout_4.addWidget(self.pushButton_60)
-        self.pushButton_61 = QtWidgets.QPushButton(self.widget_11)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_61.setFont(font)
-        self.pushButton_61.setObjectName("pushButton_61")
-        self.verticalLayout_4.addWidget(self.pushButton_61)
-        self.label_73 = QtWidgets.QLabel(self.scrollAreaWidgetContents_4)
-        self.label_73.setGeometry(QtCore.QRect(0, 387, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_73.setFont(font)
-        self.label_73.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_73.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_73.setObjectName("label_73")
-        self.textBrowser_4 = QtWidgets.QTextBrowser(self.scrollAreaWidgetContents_4)
-        self.textBrowser_4.setGeometry(QtCore.QRect(0, 418, 221, 221))
-        self.textBrowser_4.setStyleSheet("background-color: #fff9f9")
-        self.textBrowser_4.setObjectName("textBrowser_4")
-        self.verticalScrollBar_4 = QtWidgets.QScrollBar(self.scrollAreaWidgetContents_4)
-        self.verticalScrollBar_4.setGeometry(QtCore.QRect(220, 0, 16, 641))
-        self.verticalScrollBar_4.setStyleSheet("background-color: #F0F0F0")
-        self.verticalScrollBar_4.setOrientation(QtCore.Qt.Vertical)
-        self.verticalScrollBar_4.setObjectName("verticalScrollBar_4")
-        self.scrollArea.setWidget(self.scrollAreaWidgetContents_4)
-        self.pushButton_62 = QtWidgets.QPushButton(CarbonEmission_Dialog)
-        self.pushButton_62.setGeometry(QtCore.QRect(350, 35, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        font.setWeight(75)
-        self.pushButton_62.setFont(font)
-        self.pushButton_62.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton_62.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton_62.setStyleSheet("background-color: rgb(240,230,230)")
-        self.pushButton_62.setIcon(icon)
-        self.pushButton_62.setAutoRepeat(False)
-        self.pushButton_62.setObjectName("pushButton_62")
-
-        self.retranslateUi(CarbonEmission_Dialog)
-        self.buttonBox_5.accepted.connect(CarbonEmission_Dialog.accept) # type: ignore
-        self.buttonBox_5.rejected.connect(CarbonEmission_Dialog.reject) # type: ignore
-        self.pushButton_51.toggled['bool'].connect(self.widget_5.setVisible) # type: ignore
-        self.pushButton_57.toggled['bool'].connect(self.widget_8.setVisible) # type: ignore
-        self.buttonBox.rejected.connect(self.show_warning) # type: ignore
-        QtCore.QMetaObject.connectSlotsByName(CarbonEmission_Dialog)
-
-    def show_warning(self):
-        """
-        Show a warning window when the Close button is pressed.
-        """
-        warning_box = QMessageBox()
-        warning_box.setIcon(QMessageBox.Warning)
-        warning_box.setWindowTitle("Confirm Close")
-        warning_box.setText("Are you sure you want to close without saving?")
-        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        warning_box.setDefaultButton(QMessageBox.No)
-
-        # Check the user's response
-        response = warning_box.exec_()
-        if response == QMessageBox.Yes:
-            QtWidgets.QApplication.quit()  # Close the application
-        else:
-            pass  # Do nothing, return to the dialog
-
-    def retranslateUi(self, CarbonEmission_Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        CarbonEmission_Dialog.setWindowTitle(_translate("CarbonEmission_Dialog", "Carbon Emission Data"))
-        self.pushButton.setText(_translate("CarbonEmission_Dialog", "Project Details Window      "))
-        self.label_56.setText(_translate("CarbonEmission_Dialog", "Componenet:"))
-        self.comboBox_19.setItemText(0, _translate("CarbonEmission_Dialog", "Earthwork"))
-        self.comboBox_19.setItemText(1, _translate("CarbonEmission_Dialog", "RCC in Foundation"))
-        self.label_57.setText(_translate("CarbonEmission_Dialog", "Material Type and Grade"))
-        self.label_58.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Factor"))
-        self.label_59.setText(_translate("CarbonEmission_Dialog", "Quantity"))
-        self.label_60.setText(_translate("CarbonEmission_Dialog", "Unit"))
-        self.label_61.setText(_translate("CarbonEmission_Dialog", "Emboided Carbon Energy"))
-        self.comboBox_20.setItemText(0, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.comboBox_20.setItemText(1, _translate("CarbonEmission_Dialog", "Steel"))
-        self.comboBox_21.setItemText(0, _translate("CarbonEmission_Dialog", "Steel"))
-        self.comboBox_21.setItemText(1, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.label_62.setText(_translate("CarbonEmission_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_63.setText(_translate("CarbonEmission_Dialog", "kg"))
-        self.pushButton_13.setText(_translate("CarbonEmission_Dialog", "+ Add Material"))
-        self.pushButton_49.setText(_translate("CarbonEmission_Dialog", "+ Add Material"))
-        self.label_74.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_75.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_76.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_77.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_78.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_79.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_64.setText(_translate("CarbonEmission_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_65.setText(_translate("CarbonEmission_Dialog", "kg"))
-        self.label_80.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_66.setText(_translate("CarbonEmission_Dialog", "Componenet:"))
-        self.label_67.setText(_translate("CarbonEmission_Dialog", "Material Type and Grade"))
-        self.label_81.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_68.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Factor"))
-        self.label_69.setText(_translate("CarbonEmission_Dialog", "Quantity"))
-        self.comboBox_22.setItemText(0, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.comboBox_22.setItemText(1, _translate("CarbonEmission_Dialog", "Steel"))
-        self.label_70.setText(_translate("CarbonEmission_Dialog", "Emboided Carbon Energy"))
-        self.comboBox_23.setItemText(0, _translate("CarbonEmission_Dialog", "Steel"))
-        self.comboBox_23.setItemText(1, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.comboBox_24.setItemText(0, _translate("CarbonEmission_Dialog", "Earthwork"))
-        self.comboBox_24.setItemText(1, _translate("CarbonEmission_Dialog", "RCC in Foundation"))
-        self.label_71.setText(_translate("CarbonEmission_Dialog", "Unit"))
-        self.label_82.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_83.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_84.setText(_translate("CarbonEmission_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_85.setText(_translate("CarbonEmission_Dialog", "kg"))
-        self.label_86.setText(_translate("CarbonEmission_Dialog", "kg C02e/kg"))
-        self.label_87.setText(_translate("CarbonEmission_Dialog", "Componenet:"))
-        self.label_88.setText(_translate("CarbonEmission_Dialog", "Material Type and Grade"))
-        self.label_89.setText(_translate("CarbonEmission_Dialog", "(MJ/kg)"))
-        self.label_90.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Factor"))
-        self.label_91.setText(_translate("CarbonEmission_Dialog", "Quantity"))
-        self.comboBox_25.setItemText(0, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.comboBox_25.setItemText(1, _translate("CarbonEmission_Dialog", "Steel"))
-        self.label_92.setText(_translate("CarbonEmission_Dialog", "Emboided Carbon Energy"))
-        self.comboBox_26.setItemText(0, _translate("CarbonEmission_Dialog", "Steel"))
-        self.comboBox_26.setItemText(1, _translate("CarbonEmission_Dialog", "Concrete"))
-        self.comboBox_27.setItemText(0, _translate("CarbonEmission_Dialog", "Earthwork"))
-        self.comboBox_27.setItemText(1, _translate("CarbonEmission_Dialog", "RCC in Foundation"))
-        self.label_93.setText(_translate("CarbonEmission_Dialog", "Unit"))
-        self.pushButton_50.setText(_translate("CarbonEmission_Dialog", "+ Add Material"))
-        self.label_72.setText(_translate("CarbonEmission_Dialog", "Input Parameters"))
-        self.pushButton_51.setText(_translate("CarbonEmission_Dialog", "Structure Works Data"))
-        self.pushButton_52.setText(_translate("CarbonEmission_Dialog", "Foundation"))
-        self.pushButton_53.setText(_translate("CarbonEmission_Dialog", "Super-Structure"))
-        self.pushButton_54.setText(_translate("CarbonEmission_Dialog", "Sub-Structure"))
-        self.pushButton_55.setText(_translate("CarbonEmission_Dialog", "Miscellaneous"))
-        self.pushButton_56.setText(_translate("CarbonEmission_Dialog", "Financial Data"))
-        self.pushButton_57.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Data"))
-        self.pushButton_58.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Cost Data"))
-        self.pushButton_59.setText(_translate("CarbonEmission_Dialog", "Bridge and Traffic Data"))
-        self.pushButton_60.setText(_translate("CarbonEmission_Dialog", "Maintenance and Repair"))
-        self.pushButton_61.setText(_translate("CarbonEmission_Dialog", "Disposal and Recycling"))
-        self.label_73.setText(_translate("CarbonEmission_Dialog", "Output"))
-        self.textBrowser_4.setHtml(_translate("CarbonEmission_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Construction Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Carbon emission Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Time Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Road User Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Carbon Emission due to Re-Routing</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Periodic Maintenance Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Maintenance Emission Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Routine Inspectection Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Repair &amp; Rehabilitation Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Reconstruction Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Demolition &amp; Disposal Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
-        self.pushButton_62.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Data       "))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    CarbonEmission_Dialog = QtWidgets.QDialog()
-    ui = Ui_CarbonEmission_Dialog()
-    ui.setupUi(CarbonEmission_Dialog)
-    CarbonEmission_Dialog.show()
-    sys.exit(app.exec_())
@@ -1,595 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'C:\Users\saans\AppData\Local\Programs\Python\Python310\Lib\site-packages\qt5_applications\Qt\bin\ProjectDetails_Foundation_Window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from form_data_storage import save_form_data
-from PyQt5.QtWidgets import QMessageBox
-
-class Ui_Foundation_Dialog(object):
-    def setupUi(self, Foundation_Dialog):
-        Foundation_Dialog.setObjectName("Foundation_Dialog")
-        Foundation_Dialog.resize(1440, 1000)
-        Foundation_Dialog.setAutoFillBackground(False)
-        Foundation_Dialog.setStyleSheet("background-color:#FAFAFA")
-        self.label = QtWidgets.QLabel(Foundation_Dialog)
-        self.label.setGeometry(QtCore.QRect(10, 50, 244, 691))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label.setText("")
-        self.label.setObjectName("label")
-        self.pushButton = QtWidgets.QPushButton(Foundation_Dialog)
-        self.pushButton.setGeometry(QtCore.QRect(10, 25, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton.setFont(font)
-        self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton.setIcon(icon)
-        self.pushButton.setAutoRepeat(False)
-        self.pushButton.setObjectName("pushButton")
-        self.scrollArea = QtWidgets.QScrollArea(Foundation_Dialog)
-        self.scrollArea.setGeometry(QtCore.QRect(10, 55, 241, 681))
-        self.scrollArea.setAutoFillBackground(False)
-        self.scrollArea.setStyleSheet("background-color: #fff9f9")
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setObjectName("scrollArea")
-        self.scrollAreaWidgetContents = QtWidgets.QWidget()
-        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 239, 679))
-        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
-        self.label_2 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
-        self.label_2.setGeometry(QtCore.QRect(0, 0, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_2.setFont(font)
-        self.label_2.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_2.setObjectName("label_2")
-        self.widget = QtWidgets.QWidget(self.scrollAreaWidgetContents)
-        self.widget.setGeometry(QtCore.QRect(0, 30, 221, 357))
-        self.widget.setStyleSheet("background-color: #fff9f9")
-        self.widget.setObjectName("widget")
-        self.verticalLayout = QtWidgets.QVBoxLayout(self.widget)
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout.setObjectName("verticalLayout")
-        self.pushButton_15 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_15.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
-        self.pushButton_15.setIcon(icon1)
-        self.pushButton_15.setCheckable(True)
-        self.pushButton_15.setAutoDefault(True)
-        self.pushButton_15.setObjectName("pushButton_15")
-        self.verticalLayout.addWidget(self.pushButton_15)
-        self.widget_5 = QtWidgets.QWidget(self.widget)
-        self.widget_5.setObjectName("widget_5")
-        self.formLayout = QtWidgets.QFormLayout(self.widget_5)
-        self.formLayout.setObjectName("formLayout")
-        self.pushButton_20 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_20.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_20.setIcon(icon2)
-        self.pushButton_20.setObjectName("pushButton_20")
-        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_20)
-        self.pushButton_21 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_21.setFont(font)
-        self.pushButton_21.setIcon(icon2)
-        self.pushButton_21.setObjectName("pushButton_21")
-        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.pushButton_21)
-        self.pushButton_22 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_22.setFont(font)
-        self.pushButton_22.setIcon(icon2)
-        self.pushButton_22.setObjectName("pushButton_22")
-        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pushButton_22)
-        self.pushButton_23 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_23.setFont(font)
-        self.pushButton_23.setIcon(icon2)
-        self.pushButton_23.setObjectName("pushButton_23")
-        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.pushButton_23)
-        self.verticalLayout.addWidget(self.widget_5)
-        self.pushButton_19 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_19.setFont(font)
-        self.pushButton_19.setObjectName("pushButton_19")
-        self.verticalLayout.addWidget(self.pushButton_19)
-        self.pushButton_16 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_16.setFont(font)
-        self.pushButton_16.setIcon(icon1)
-        self.pushButton_16.setCheckable(True)
-        self.pushButton_16.setObjectName("pushButton_16")
-        self.verticalLayout.addWidget(self.pushButton_16)
-        self.widget_8 = QtWidgets.QWidget(self.widget)
-        self.widget_8.setMinimumSize(QtCore.QSize(203, 21))
-        self.widget_8.setMaximumSize(QtCore.QSize(281, 21))
-        self.widget_8.setObjectName("widget_8")
-        self.pushButton_14 = QtWidgets.QPushButton(self.widget_8)
-        self.pushButton_14.setGeometry(QtCore.QRect(20, 0, 183, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_14.setFont(font)
-        self.pushButton_14.setIcon(icon2)
-        self.pushButton_14.setObjectName("pushButton_14")
-        self.verticalLayout.addWidget(self.widget_8)
-        self.pushButton_17 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_17.setFont(font)
-        self.pushButton_17.setObjectName("pushButton_17")
-        self.verticalLayout.addWidget(self.pushButton_17)
-        self.pushButton_18 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_18.setFont(font)
-        self.pushButton_18.setObjectName("pushButton_18")
-        self.verticalLayout.addWidget(self.pushButton_18)
-        self.pushButton_10 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_10.setFont(font)
-        self.pushButton_10.setObjectName("pushButton_10")
-        self.verticalLayout.addWidget(self.pushButton_10)
-        self.label_3 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
-        self.label_3.setGeometry(QtCore.QRect(0, 387, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_3.setFont(font)
-        self.label_3.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_3.setObjectName("label_3")
-        self.textBrowser = QtWidgets.QTextBrowser(self.scrollAreaWidgetContents)
-        self.textBrowser.setGeometry(QtCore.QRect(0, 418, 221, 221))
-        self.textBrowser.setStyleSheet("background-color: #fff9f9")
-        self.textBrowser.setObjectName("textBrowser")
-        self.verticalScrollBar = QtWidgets.QScrollBar(self.scrollAreaWidgetContents)
-        self.verticalScrollBar.setGeometry(QtCore.QRect(220, 0, 16, 641))
-        self.verticalScrollBar.setStyleSheet("background-color: #F0F0F0")
-        self.verticalScrollBar.setOrientation(QtCore.Qt.Vertical)
-        self.verticalScrollBar.setObjectName("verticalScrollBar")
-        self.widget.raise_()
-        self.label_2.raise_()
-        self.label_3.raise_()
-        self.textBrowser.raise_()
-        self.verticalScrollBar.raise_()
-        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
-        self.widget_2 = QtWidgets.QWidget(Foundation_Dialog)
-        self.widget_2.setGeometry(QtCore.QRect(350, 50, 778, 624))
-        self.widget_2.setStyleSheet("background-color: #fff9f9")
-        self.widget_2.setObjectName("widget_2")
-        self.label_4 = QtWidgets.QLabel(self.widget_2)
-        self.label_4.setGeometry(QtCore.QRect(20, 10, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_4.setFont(font)
-        self.label_4.setObjectName("label_4")
-        self.comboBox = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox.setGeometry(QtCore.QRect(140, 10, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox.setFont(font)
-        self.comboBox.setStyleSheet("background-color: #ffffff")
-        self.comboBox.setObjectName("comboBox")
-        self.comboBox.addItem("")
-        self.comboBox.addItem("")
-        self.pushButton_2 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_2.setGeometry(QtCore.QRect(350, 10, 190, 23))
-        self.pushButton_2.setStyleSheet("background-color: #ffffff")
-        self.pushButton_2.setObjectName("pushButton_2")
-        self.label_5 = QtWidgets.QLabel(self.widget_2)
-        self.label_5.setGeometry(QtCore.QRect(20, 70, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_5.setFont(font)
-        self.label_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_5.setObjectName("label_5")
-        self.label_6 = QtWidgets.QLabel(self.widget_2)
-        self.label_6.setGeometry(QtCore.QRect(551, 70, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_6.setFont(font)
-        self.label_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_6.setObjectName("label_6")
-        self.label_7 = QtWidgets.QLabel(self.widget_2)
-        self.label_7.setGeometry(QtCore.QRect(191, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_7.setFont(font)
-        self.label_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_7.setObjectName("label_7")
-        self.label_8 = QtWidgets.QLabel(self.widget_2)
-        self.label_8.setGeometry(QtCore.QRect(311, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_8.setFont(font)
-        self.label_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_8.setObjectName("label_8")
-        self.label_9 = QtWidgets.QLabel(self.widget_2)
-        self.label_9.setGeometry(QtCore.QRect(431, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_9.setFont(font)
-        self.label_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_9.setObjectName("label_9")
-        self.comboBox_2 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_2.setGeometry(QtCore.QRect(30, 100, 140, 22))
-        self.comboBox_2.setStyleSheet("background-color: #ffffff")
-        self.comboBox_2.setObjectName("comboBox_2")
-        self.comboBox_3 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_3.setGeometry(QtCore.QRect(30, 130, 140, 22))
-        self.comboBox_3.setStyleSheet("background-color: #ffffff")
-        self.comboBox_3.setObjectName("comboBox_3")
-        self.lineEdit = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit.setGeometry(QtCore.QRect(210, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit.setFont(font)
-        self.lineEdit.setStyleSheet("background-color: #ffffff")
-        self.lineEdit.setObjectName("lineEdit")
-        self.lineEdit_2 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_2.setGeometry(QtCore.QRect(210, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_2.setFont(font)
-        self.lineEdit_2.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_2.setObjectName("lineEdit_2")
-        self.label_10 = QtWidgets.QLabel(self.widget_2)
-        self.label_10.setGeometry(QtCore.QRect(340, 100, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_10.setFont(font)
-        self.label_10.setStyleSheet("background-color: #ffffff")
-        self.label_10.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_10.setObjectName("label_10")
-        self.label_11 = QtWidgets.QLabel(self.widget_2)
-        self.label_11.setGeometry(QtCore.QRect(340, 130, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_11.setFont(font)
-        self.label_11.setStyleSheet("background-color: #ffffff")
-        self.label_11.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_11.setObjectName("label_11")
-        self.lineEdit_3 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_3.setGeometry(QtCore.QRect(450, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_3.setFont(font)
-        self.lineEdit_3.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_3.setObjectName("lineEdit_3")
-        self.lineEdit_4 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_4.setGeometry(QtCore.QRect(450, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_4.setFont(font)
-        self.lineEdit_4.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_4.setObjectName("lineEdit_4")
-        self.lineEdit_5 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_5.setGeometry(QtCore.QRect(570, 100, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_5.setFont(font)
-        self.lineEdit_5.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_5.setObjectName("lineEdit_5")
-        self.lineEdit_6 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_6.setGeometry(QtCore.QRect(570, 130, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_6.setFont(font)
-        self.lineEdit_6.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_6.setObjectName("lineEdit_6")
-        self.pushButton_3 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_3.setGeometry(QtCore.QRect(300, 200, 190, 23))
-        self.pushButton_3.setStyleSheet("background-color: #ffffff")
-        self.pushButton_3.setObjectName("pushButton_3")
-        self.label_12 = QtWidgets.QLabel(self.widget_2)
-        self.label_12.setGeometry(QtCore.QRect(30, 330, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_12.setFont(font)
-        self.label_12.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_12.setObjectName("label_12")
-        self.comboBox_4 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_4.setGeometry(QtCore.QRect(150, 270, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_4.setFont(font)
-        self.comboBox_4.setStyleSheet("background-color: #ffffff")
-        self.comboBox_4.setObjectName("comboBox_4")
-        self.comboBox_4.addItem("")
-        self.comboBox_4.addItem("")
-        self.label_13 = QtWidgets.QLabel(self.widget_2)
-        self.label_13.setGeometry(QtCore.QRect(441, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_13.setFont(font)
-        self.label_13.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_13.setObjectName("label_13")
-        self.label_14 = QtWidgets.QLabel(self.widget_2)
-        self.label_14.setGeometry(QtCore.QRect(350, 390, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_14.setFont(font)
-        self.label_14.setStyleSheet("background-color: #ffffff")
-        self.label_14.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_14.setObjectName("label_14")
-        self.label_15 = QtWidgets.QLabel(self.widget_2)
-        self.label_15.setGeometry(QtCore.QRect(561, 330, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_15.setFont(font)
-        self.label_15.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_15.setObjectName("label_15")
-        self.label_16 = QtWidgets.QLabel(self.widget_2)
-        self.label_16.setGeometry(QtCore.QRect(350, 360, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_16.setFont(font)
-        self.label_16.setStyleSheet("background-color: #ffffff")
-        self.label_16.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_16.setObjectName("label_16")
-        self.label_17 = QtWidgets.QLabel(self.widget_2)
-        self.label_17.setGeometry(QtCore.QRect(321, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_17.setFont(font)
-        self.label_17.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_17.setObjectName("label_17")
-        self.lineEdit_7 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_7.setGeometry(QtCore.QRect(220, 390, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_7.setFont(font)
-        self.lineEdit_7.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_7.setObjectName("lineEdit_7")
-        self.lineEdit_8 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_8.setGeometry(QtCore.QRect(580, 360, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_8.setFont(font)
-        self.lineEdit_8.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_8.setObjectName("lineEdit_8")
-        self.label_18 = QtWidgets.QLabel(self.widget_2)
-        self.label_18.setGeometry(QtCore.QRect(201, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_18.setFont(font)
-        self.label_18.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_18.setObjectName("label_18")
-        self.pushButton_4 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_4.setGeometry(QtCore.QRect(310, 460, 190, 23))
-        self.pushButton_4.setStyleSheet("background-color: #ffffff")
-        self.pushButton_4.setObjectName("pushButton_4")
-        self.lineEdit_9 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_9.setGeometry(QtCore.QRect(220, 360, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_9.setFont(font)
-        self.lineEdit_9.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_9.setObjectName("lineEdit_9")
-        self.lineEdit_10 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_10.setGeometry(QtCore.QRect(460, 360, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_10.setFont(font)
-        self.lineEdit_10.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_10.setObjectName("lineEdit_10")
-        self.lineEdit_11 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_11.setGeometry(QtCore.QRect(460, 390, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_11.setFont(font)
-        self.lineEdit_11.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_11.setObjectName("lineEdit_11")
-        self.pushButton_5 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_5.setGeometry(QtCore.QRect(360, 270, 190, 23))
-        self.pushButton_5.setStyleSheet("background-color: #ffffff")
-        self.pushButton_5.setObjectName("pushButton_5")
-        self.label_19 = QtWidgets.QLabel(self.widget_2)
-        self.label_19.setGeometry(QtCore.QRect(30, 270, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_19.setFont(font)
-        self.label_19.setObjectName("label_19")
-        self.lineEdit_12 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_12.setGeometry(QtCore.QRect(580, 390, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_12.setFont(font)
-        self.lineEdit_12.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_12.setObjectName("lineEdit_12")
-        self.comboBox_5 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_5.setGeometry(QtCore.QRect(40, 360, 140, 22))
-        self.comboBox_5.setStyleSheet("background-color: #ffffff")
-        self.comboBox_5.setObjectName("comboBox_5")
-        self.comboBox_5.addItem("")
-        self.comboBox_5.addItem("")
-        self.comboBox_6 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_6.setGeometry(QtCore.QRect(40, 390, 140, 22))
-        self.comboBox_6.setStyleSheet("background-color: #ffffff")
-        self.comboBox_6.setObjectName("comboBox_6")
-        self.comboBox_6.addItem("")
-        self.comboBox_6.addItem("")
-        self.buttonBox = QtWidgets.QDialogButtonBox(self.widget_2)
-        self.buttonBox.setGeometry(QtCore.QRect(420, 580, 341, 32))
-        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox.setCenterButtons(False)
-        self.buttonBox.setObjectName("buttonBox")
-        self.line = QtWidgets.QFrame(self.widget_2)
-        self.line.setGeometry(QtCore.QRect(10, 250, 761, 16))
-        self.line.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line.setLineWidth(2)
-        self.line.setMidLineWidth(2)
-        self.line.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line.setObjectName("line")
-        self.line_2 = QtWidgets.QFrame(self.widget_2)
-        self.line_2.setGeometry(QtCore.QRect(10, 500, 761, 16))
-        self.line_2.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_2.setLineWidth(2)
-        self.line_2.setMidLineWidth(2)
-        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_2.setObjectName("line_2")
-        self.pushButton_6 = QtWidgets.QPushButton(Foundation_Dialog)
-        self.pushButton_6.setGeometry(QtCore.QRect(350, 25, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        font.setWeight(75)
-        self.pushButton_6.setFont(font)
-        self.pushButton_6.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton_6.setStyleSheet("background-color: rgb(240,230,230)")
-        self.pushButton_6.setIcon(icon)
-        self.pushButton_6.setAutoRepeat(False)
-        self.pushButton_6.setObjectName("pushButton_6")
-
-        self.retranslateUi(Foundation_Dialog)
-        self.buttonBox.accepted.connect(Foundation_Dialog.accept) # type: ignore
-        self.buttonBox.accepted.connect(self.save_data)
-        self.buttonBox.rejected.connect(self.show_warning) # type: ignore
-        self.pushButton_15.toggled['bool'].connect(self.widget_5.setVisible) # type: ignore
-        self.pushButton_16.toggled['bool'].connect(self.widget_8.setVisible) # type: ignore
-
-        QtCore.QMetaObject.connectSlotsByName(Foundation_Dialog)
-        
-    def show_warning(self):
-        """
-        Show a warning window when the Close button is pressed.
-        """
-        warning_box = QMessageBox()
-        warning_box.setIcon(QMessageBox.Warning)
-        warning_box.setWindowTitle("Confirm Close")
-        warning_box.setText("Are you sure you want to close without saving?")
-        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        warning_box.setDefaultButton(QMessageBox.No)
-
-        # Check the user's response
-        response = warning_box.exec_()
-        if response == QMessageBox.Yes:
-            QtWidgets.QApplication.quit()  # Close the application
-        else:
-            pass  # Do nothing, return to the dialog
-
-    def save_data(self):
-        """
-        Collect form data and save it to the global dictionary.
-        """
-        data = {
-            "component": self.comboBox.currentText(),
-            "sub_component": self.comboBox_2.currentText(),
-            "quantity": self.lineEdit.text(),
-            "unit": self.label_10.text(),
-            "rate": self.lineEdit_3.text(),
-            "material_type": self.comboBox_4.currentText(),
-        }
-        save_form_data("Foundation_Dialog", data)
-
-    def retranslateUi(self, Foundation_Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        Foundation_Dialog.setWindowTitle(_translate("Foundation_Dialog", "Dialog"))
-        self.pushButton.setText(_translate("Foundation_Dialog", "Project Details Window      "))
-        self.label_2.setText(_translate("Foundation_Dialog", "Input Parameters"))
-        self.pushButton_15.setText(_translate("Foundation_Dialog", "Structure Works Data"))
-        self.pushButton_20.setText(_translate("Foundation_Dialog", "Foundation"))
-        self.pushButton_21.setText(_translate("Foundation_Dialog", "Super-Structure"))
-        self.pushButton_22.setText(_translate("Foundation_Dialog", "Sub-Structure"))
-        self.pushButton_23.setText(_translate("Foundation_Dialog", "Miscellaneous"))
-        self.pushButton_19.setText(_translate("Foundation_Dialog", "Financial Data"))
-        self.pushButton_16.setText(_translate("Foundation_Dialog", "Carbon Emission Data"))
-        self.pushButton_14.setText(_translate("Foundation_Dialog", "Carbon Emission Cost Data"))
-        self.pushButton_17.setText(_translate("Foundation_Dialog", "Bridge and Traffic Data"))
-        self.pushButton_18.setText(_translate("Foundation_Dialog", "Maintenance and Repair"))
-        self.pushButton_10.setText(_translate("Foundation_Dialog", "Disposal and Recycling"))
-        self.label_3.setText(_translate("Foundation_Dialog", "Output"))
-        self.textBrowser.setHtml(_translate("Foundation_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Construction Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Carbon emission Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Time Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Road User Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Carbon Emission due to Re-Routing</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Periodic Maintenance Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Maintenance Emission Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Routine Inspectection Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Repair &amp; Rehabilitation Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Reconstruction Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Demolition &amp; Disposal Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
-        self.label_4.setText(_translate("Foundation_Dialog", "Componenets:"))
-        self.comboBox.setItemText(0, _translate("Foundation_Dialog", "Earthwork"))
-        self.comboBox.setItemText(1, _translate("Foundation_Dialog", "RCC in Foundation"))
-        self.pushButton_2.setText(_translate("Foundation_Dialog", "+ Add Sub-Component"))
-        self.label_5.setText(_translate("Foundation_Dialog", "Material Type and Grade"))
-        self.label_6.setText(_translate("Foundation_Dialog", "Rate Data Source"))
-        self.label_7.setText(_translate("Foundation_Dialog", "Quantity"))
-        self.label_8.setText(_translate("Foundation_Dialog", "Unit"))
-        self.label_9.setText(_translate("Foundation_Dialog", "Rate"))
-        self.label_10.setText(_translate("Foundation_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_11.setText(_translate("Foundation_Dialog", "kg"))
-        self.pushButton_3.setText(_translate("Foundation_Dialog", "+ Add Material"))
-        self.label_12.setText(_translate("Foundation_Dialog", "Material Type and Grade"))
-        self.comboBox_4.setItemText(0, _translate("Foundation_Dialog", "RCC in Foundation"))
-        self.comboBox_4.setItemText(1, _translate("Foundation_Dialog", "Earthwork"))
-        self.label_13.setText(_translate("Foundation_Dialog", "Rate"))
-        self.label_14.setText(_translate("Foundation_Dialog", "kg"))
-        self.label_15.setText(_translate("Foundation_Dialog", "Rate Data Source"))
-        self.label_16.setText(_translate("Foundation_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_17.setText(_translate("Foundation_Dialog", "Unit"))
-        self.label_18.setText(_translate("Foundation_Dialog", "Quantity"))
-        self.pushButton_4.setText(_translate("Foundation_Dialog", "+ Add Material"))
-        self.pushButton_5.setText(_translate("Foundation_Dialog", "+ Add Sub-Component"))
-        self.label_19.setText(_translate("Foundation_Dialog", "Componenets:"))
-        self.comboBox_5.setItemText(0, _translate("Foundation_Dialog", "Concrete"))
-        self.comboBox_5.setItemText(1, _translate("Foundation_Dialog", "Steel"))
-        self.comboBox_6.setItemText(0, _translate("Foundation_Dialog", "Steel"))
-        self.comboBox_6.setItemText(1, _translate("Foundation_Dialog", "Concrete"))
-        self.pushButton_6.setText(_translate("Foundation_Dialog", "Foundation                      "))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    Foundation_Dialog = QtWidgets.QDialog()
-    ui = Ui_Foundation_Dialog()
-    ui.setupUi(Foundation_Dialog)
-    Foundation_Dialog.show()
-    sys.exit(app.exec_())
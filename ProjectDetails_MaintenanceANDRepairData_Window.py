@@ -1,420 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'C:\Users\saans\AppData\Local\Programs\Python\Python310\Lib\site-packages\qt5_applications\Qt\bin\ProjectDetails_Maintenance&RepairData_Window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QMessageBox
-
-
-class Ui_Maintenance_Dialog(object):
-    def setupUi(self, Maintenance_Dialog):
-        Maintenance_Dialog.setObjectName("Maintenance_Dialog")
-        Maintenance_Dialog.resize(1440, 1000)
-        Maintenance_Dialog.setStyleSheet("background-color: #fafafa")
-        self.pushButton_6 = QtWidgets.QPushButton(Maintenance_Dialog)
-        self.pushButton_6.setGeometry(QtCore.QRect(350, 35, 261, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        font.setWeight(75)
-        self.pushButton_6.setFont(font)
-        self.pushButton_6.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton_6.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_6.setIcon(icon)
-        self.pushButton_6.setAutoRepeat(False)
-        self.pushButton_6.setObjectName("pushButton_6")
-        self.label = QtWidgets.QLabel(Maintenance_Dialog)
-        self.label.setGeometry(QtCore.QRect(10, 60, 244, 691))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label.setText("")
-        self.label.setObjectName("label")
-        self.widget_2 = QtWidgets.QWidget(Maintenance_Dialog)
-        self.widget_2.setGeometry(QtCore.QRect(350, 60, 784, 304))
-        self.widget_2.setStyleSheet("background-color: #fff9f9")
-        self.widget_2.setObjectName("widget_2")
-        self.label_4 = QtWidgets.QLabel(self.widget_2)
-        self.label_4.setGeometry(QtCore.QRect(20, 240, 201, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_4.setFont(font)
-        self.label_4.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_4.setObjectName("label_4")
-        self.label_5 = QtWidgets.QLabel(self.widget_2)
-        self.label_5.setGeometry(QtCore.QRect(600, 60, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_5.setFont(font)
-        self.label_5.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_5.setObjectName("label_5")
-        self.label_6 = QtWidgets.QLabel(self.widget_2)
-        self.label_6.setGeometry(QtCore.QRect(600, 30, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_6.setFont(font)
-        self.label_6.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_6.setObjectName("label_6")
-        self.label_7 = QtWidgets.QLabel(self.widget_2)
-        self.label_7.setGeometry(QtCore.QRect(600, 90, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_7.setFont(font)
-        self.label_7.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_7.setObjectName("label_7")
-        self.label_8 = QtWidgets.QLabel(self.widget_2)
-        self.label_8.setGeometry(QtCore.QRect(20, 200, 221, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_8.setFont(font)
-        self.label_8.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_8.setObjectName("label_8")
-        self.lineEdit_5 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_5.setGeometry(QtCore.QRect(270, 30, 181, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_5.setFont(font)
-        self.lineEdit_5.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_5.setObjectName("lineEdit_5")
-        self.buttonBox_2 = QtWidgets.QDialogButtonBox(self.widget_2)
-        self.buttonBox_2.setGeometry(QtCore.QRect(440, 270, 341, 32))
-        self.buttonBox_2.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox_2.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox_2.setObjectName("buttonBox_2")
-        self.label_21 = QtWidgets.QLabel(self.widget_2)
-        self.label_21.setGeometry(QtCore.QRect(470, 30, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_21.setFont(font)
-        self.label_21.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_21.setObjectName("label_21")
-        self.label_22 = QtWidgets.QLabel(self.widget_2)
-        self.label_22.setGeometry(QtCore.QRect(470, 90, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_22.setFont(font)
-        self.label_22.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_22.setObjectName("label_22")
-        self.label_23 = QtWidgets.QLabel(self.widget_2)
-        self.label_23.setGeometry(QtCore.QRect(470, 200, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_23.setFont(font)
-        self.label_23.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_23.setObjectName("label_23")
-        self.label_24 = QtWidgets.QLabel(self.widget_2)
-        self.label_24.setGeometry(QtCore.QRect(470, 240, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_24.setFont(font)
-        self.label_24.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_24.setObjectName("label_24")
-        self.textBrowser_2 = QtWidgets.QTextBrowser(self.widget_2)
-        self.textBrowser_2.setGeometry(QtCore.QRect(20, 10, 231, 51))
-        self.textBrowser_2.setObjectName("textBrowser_2")
-        self.textBrowser_3 = QtWidgets.QTextBrowser(self.widget_2)
-        self.textBrowser_3.setGeometry(QtCore.QRect(20, 70, 231, 51))
-        self.textBrowser_3.setObjectName("textBrowser_3")
-        self.textBrowser_4 = QtWidgets.QTextBrowser(self.widget_2)
-        self.textBrowser_4.setGeometry(QtCore.QRect(20, 130, 231, 51))
-        self.textBrowser_4.setObjectName("textBrowser_4")
-        self.lineEdit_7 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_7.setGeometry(QtCore.QRect(270, 90, 181, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_7.setFont(font)
-        self.lineEdit_7.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_7.setObjectName("lineEdit_7")
-        self.lineEdit_8 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_8.setGeometry(QtCore.QRect(270, 150, 181, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_8.setFont(font)
-        self.lineEdit_8.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_8.setObjectName("lineEdit_8")
-        self.lineEdit_9 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_9.setGeometry(QtCore.QRect(270, 200, 181, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_9.setFont(font)
-        self.lineEdit_9.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_9.setObjectName("lineEdit_9")
-        self.lineEdit_10 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_10.setGeometry(QtCore.QRect(270, 240, 181, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_10.setFont(font)
-        self.lineEdit_10.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_10.setObjectName("lineEdit_10")
-        self.label_25 = QtWidgets.QLabel(self.widget_2)
-        self.label_25.setGeometry(QtCore.QRect(470, 150, 51, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_25.setFont(font)
-        self.label_25.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_25.setObjectName("label_25")
-        self.pushButton = QtWidgets.QPushButton(Maintenance_Dialog)
-        self.pushButton.setGeometry(QtCore.QRect(10, 35, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton.setFont(font)
-        self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        self.pushButton.setIcon(icon)
-        self.pushButton.setAutoRepeat(False)
-        self.pushButton.setObjectName("pushButton")
-        self.scrollArea = QtWidgets.QScrollArea(Maintenance_Dialog)
-        self.scrollArea.setGeometry(QtCore.QRect(10, 65, 241, 681))
-        self.scrollArea.setAutoFillBackground(False)
-        self.scrollArea.setStyleSheet("background-color: #fff9f9")
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setObjectName("scrollArea")
-        self.scrollAreaWidgetContents = QtWidgets.QWidget()
-        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 239, 679))
-        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
-        self.label_2 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
-        self.label_2.setGeometry(QtCore.QRect(0, 0, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_2.setFont(font)
-        self.label_2.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_2.setObjectName("label_2")
-        self.widget = QtWidgets.QWidget(self.scrollAreaWidgetContents)
-        self.widget.setGeometry(QtCore.QRect(0, 30, 221, 357))
-        self.widget.setStyleSheet("background-color: #fff9f9")
-        self.widget.setObjectName("widget")
-        self.verticalLayout = QtWidgets.QVBoxLayout(self.widget)
-        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout.setObjectName("verticalLayout")
-        self.pushButton_15 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_15.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
-        self.pushButton_15.setIcon(icon1)
-        self.pushButton_15.setCheckable(True)
-        self.pushButton_15.setAutoDefault(True)
-        self.pushButton_15.setObjectName("pushButton_15")
-        self.verticalLayout.addWidget(self.pushButton_15)
-        self.widget_5 = QtWidgets.QWidget(self.widget)
-        self.widget_5.setObjectName("widget_5")
-        self.formLayout = QtWidgets.QFormLayout(self.widget_5)
-        self.formLayout.setObjectName("formLayout")
-        self.pushButton_20 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_20.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_20.setIcon(icon2)
-        self.pushButton_20.setObjectName("pushButton_20")
-        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_20)
-        self.pushButton_21 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_21.setFont(font)
-        self.pushButton_21.setIcon(icon2)
-        self.pushButton_21.setObjectName("pushButton_21")
-        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.pushButton_21)
-        self.pushButton_22 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_22.setFont(font)
-        self.pushButton_22.setIcon(icon2)
-        self.pushButton_22.setObjectName("pushButton_22")
-        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pushButton_22)
-        self.pushButton_23 = QtWidgets.QPushButton(self.widget_5)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_23.setFont(font)
-        self.pushButton_23.setIcon(icon2)
-        self.pushButton_23.setObjectName("pushButton_23")
-        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.pushButton_23)
-        self.verticalLayout.addWidget(self.widget_5)
-        self.pushButton_19 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_19.setFont(font)
-        self.pushButton_19.setObjectName("pushButton_19")
-        self.verticalLayout.addWidget(self.pushButton_19)
-        self.pushButton_16 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_16.setFont(font)
-        self.pushButton_16.setIcon(icon1)
-        self.pushButton_16.setCheckable(True)
-        self.pushButton_16.setObjectName("pushButton_16")
-        self.verticalLayout.addWidget(self.pushButton_16)
-        self.widget_8 = QtWidgets.QWidget(self.widget)
-        self.widget_8.setMinimumSize(QtCore.QSize(203, 21))
-        self.widget_8.setMaximumSize(QtCore.QSize(281, 21))
-        self.widget_8.setObjectName("widget_8")
-        self.pushButton_14 = QtWidgets.QPushButton(self.widget_8)
-        self.pushButton_14.setGeometry(QtCore.QRect(20, 0, 183, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_14.setFont(font)
-        self.pushButton_14.setIcon(icon2)
-        self.pushButton_14.setObjectName("pushButton_14")
-        self.verticalLayout.addWidget(self.widget_8)
-        self.pushButton_17 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_17.setFont(font)
-        self.pushButton_17.setObjectName("pushButton_17")
-        self.verticalLayout.addWidget(self.pushButton_17)
-        self.pushButton_18 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_18.setFont(font)
-        self.pushButton_18.setObjectName("pushButton_18")
-        self.verticalLayout.addWidget(self.pushButton_18)
-        self.pushButton_10 = QtWidgets.QPushButton(self.widget)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_10.setFont(font)
-        self.pushButton_10.setObjectName("pushButton_10")
-        self.verticalLayout.addWidget(self.pushButton_10)
-        self.label_3 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
-        self.label_3.setGeometry(QtCore.QRect(0, 387, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_3.setFont(font)
-        self.label_3.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_3.setObjectName("label_3")
-        self.textBrowser = QtWidgets.QTextBrowser(self.scrollAreaWidgetContents)
-        self.textBrowser.setGeometry(QtCore.QRect(0, 418, 221, 221))
-        self.textBrowser.setStyleSheet("background-color: #fff9f9")
-        self.textBrowser.setObjectName("textBrowser")
-        self.verticalScrollBar = QtWidgets.QScrollBar(self.scrollAreaWidgetContents)
-        self.verticalScrollBar.setGeometry(QtCore.QRect(220, 0, 16, 641))
-        self.verticalScrollBar.setStyleSheet("background-color: #F0F0F0")
-        self.verticalScrollBar.setOrientation(QtCore.Qt.Vertical)
-        self.verticalScrollBar.setObjectName("verticalScrollBar")
-        self.widget.raise_()
-        self.label_2.raise_()
-        self.label_3.raise_()
-        self.textBrowser.raise_()
-        self.verticalScrollBar.raise_()
-        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
-
-        self.retranslateUi(Maintenance_Dialog)
-        self.buttonBox_2.accepted.connect(Maintenance_Dialog.accept) # type: ignore
-        self.buttonBox_2.rejected.connect(self.show_warning) # type: ignore
-        self.pushButton_15.toggled['bool'].connect(self.widget_5.setVisible) # type: ignore
-        self.pushButton_16.toggled['bool'].connect(self.widget_8.setVisible) # type: ignore
-        QtCore.QMetaObject.connectSlotsByName(Maintenance_Dialog)
-
-    def show_warning(self):
-        """
-        Show a warning window when the Close button is pressed.
-        """
-        warning_box = QMessageBox()
-        warning_box.setIcon(QMessageBox.Warning)
-        warning_box.setWindowTitle("Confirm Close")
-        warning_box.setText("Are you sure you want to close without saving?")
-        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        warning_box.setDefaultButton(QMessageBox.No)
-
-        # Check the user's response
-        response = warning_box.exec_()
-        if response == QMessageBox.Yes:
-            QtWidgets.QApplication.quit()  # Close the application
-        else:
-            pass  # Do nothing, return to the dialog
-
-    def retranslateUi(self, Maintenance_Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        Maintenance_Dialog.setWindowTitle(_translate("Maintenance_Dialog", "Maintenance and Repair Data"))
-        self.pushButton_6.setText(_translate("Maintenance_Dialog", "Maintenance and Repair Data          "))
-        self.label_4.setText(_translate("Maintenance_Dialog", "Frequency of Routine Inspection"))
-        self.label_5.setText(_translate("Maintenance_Dialog", "Investment Ratio"))
-        self.label_6.setText(_translate("Maintenance_Dialog", "Interest Rate"))
-        self.label_7.setText(_translate("Maintenance_Dialog", "Duration of Study "))
-        self.label_8.setText(_translate("Maintenance_Dialog", "Frequency of Periodic Maintenance"))
-        self.label_21.setText(_translate("Maintenance_Dialog", "(%)"))
-        self.label_22.setText(_translate("Maintenance_Dialog", "(%)"))
-        self.label_23.setText(_translate("Maintenance_Dialog", "(years)"))
-        self.label_24.setText(_translate("Maintenance_Dialog", "(years)"))
-        self.textBrowser_2.setHtml(_translate("Maintenance_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt;\">Periodic Maintenance Cost rate as percentage to total construction cost</span></p></body></html>"))
-        self.textBrowser_3.setHtml(_translate("Maintenance_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt;\">Annual Routine Inspection cost rate as percentage of total construction cost</span></p></body></html>"))
-        self.textBrowser_4.setHtml(_translate("Maintenance_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt;\">Repair and Rehabilitation cost rate as<br />percentage of total construction cost </span></p></body></html>"))
-        self.label_25.setText(_translate("Maintenance_Dialog", "(%)"))
-        self.pushButton.setText(_translate("Maintenance_Dialog", "Project Details Window      "))
-        self.label_2.setText(_translate("Maintenance_Dialog", "Input Parameters"))
-        self.pushButton_15.setText(_translate("Maintenance_Dialog", "Structure Works Data"))
-        self.pushButton_20.setText(_translate("Maintenance_Dialog", "Foundation"))
-        self.pushButton_21.setText(_translate("Maintenance_Dialog", "Super-Structure"))
-        self.pushButton_22.setText(_translate("Maintenance_Dialog", "Sub-Structure"))
-        self.pushButton_23.setText(_translate("Maintenance_Dialog", "Miscellaneous"))
-        self.pushButton_19.setText(_translate("Maintenance_Dialog", "Financial Data"))
-        self.pushButton_16.setText(_translate("Maintenance_Dialog", "Carbon Emission Data"))
-        self.pushButton_14.setText(_translate("Maintenance_Dialog", "Carbon Emission Cost Data"))
-        self.pushButton_17.setText(_translate("Maintenance_Dialog", "Bridge and Traffic Data"))
-        self.pushButton_18.setText(_translate("Maintenance_Dialog", "Maintenance and Repair"))
-        self.pushButton_10.setText(_translate("Maintenance_Dialog", "Disposal and Recycling"))
-        self.label_3.setText(_translate("Maintenance_Dialog", "Output"))
-        self.textBrowser.setHtml(_translate("Maintenance_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Construction Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Carbon emission Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Time Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Road User Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Carbon Emission due to Re-Routing</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Periodic Maintenance Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Maintenance Emission Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Routine Inspectection Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Repair &amp; Rehabilitation Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Reconstruction Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Demolition &amp; Disposal Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    Maintenance_Dialog = QtWidgets.QDialog()
-    ui = Ui_Maintenance_Dialog()
-    ui.setupUi(Maintenance_Dialog)
-    Maintenance_Dialog.show()
-    sys.exit(app.exec_())
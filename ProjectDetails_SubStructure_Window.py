@@ -1,546 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'C:\Users\saans\AppData\Local\Programs\Python\Python310\Lib\site-packages\qt5_applications\Qt\bin\ProjectDetails_SubStructure_Window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QMessageBox
-from Warning_Window import Ui_Warning_Dialog
-
-class Ui_SubStructure_Dialog(object):
-    def setupUi(self, SubStructure_Dialog):
-        SubStructure_Dialog.setObjectName("SubStructure_Dialog")
-        SubStructure_Dialog.resize(1440, 1000)
-        SubStructure_Dialog.setStyleSheet("background-color:#FAFAFA")
-        self.label = QtWidgets.QLabel(SubStructure_Dialog)
-        self.label.setGeometry(QtCore.QRect(10, 35, 244, 691))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label.setText("")
-        self.label.setObjectName("label")
-        self.pushButton = QtWidgets.QPushButton(SubStructure_Dialog)
-        self.pushButton.setGeometry(QtCore.QRect(10, 10, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton.setFont(font)
-        self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton.setIcon(icon)
-        self.pushButton.setAutoRepeat(False)
-        self.pushButton.setObjectName("pushButton")
-        self.widget_2 = QtWidgets.QWidget(SubStructure_Dialog)
-        self.widget_2.setGeometry(QtCore.QRect(350, 35, 778, 624))
-        self.widget_2.setStyleSheet("background-color: #fff9f9")
-        self.widget_2.setObjectName("widget_2")
-        self.label_38 = QtWidgets.QLabel(self.widget_2)
-        self.label_38.setGeometry(QtCore.QRect(20, 10, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_38.setFont(font)
-        self.label_38.setObjectName("label_38")
-        self.comboBox_13 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_13.setGeometry(QtCore.QRect(140, 10, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_13.setFont(font)
-        self.comboBox_13.setStyleSheet("background-color: #ffffff")
-        self.comboBox_13.setObjectName("comboBox_13")
-        self.comboBox_13.addItem("")
-        self.pushButton_10 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_10.setGeometry(QtCore.QRect(350, 10, 190, 23))
-        self.pushButton_10.setStyleSheet("background-color: #ffffff")
-        self.pushButton_10.setObjectName("pushButton_10")
-        self.label_39 = QtWidgets.QLabel(self.widget_2)
-        self.label_39.setGeometry(QtCore.QRect(20, 70, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_39.setFont(font)
-        self.label_39.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_39.setObjectName("label_39")
-        self.label_40 = QtWidgets.QLabel(self.widget_2)
-        self.label_40.setGeometry(QtCore.QRect(551, 70, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_40.setFont(font)
-        self.label_40.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_40.setObjectName("label_40")
-        self.label_41 = QtWidgets.QLabel(self.widget_2)
-        self.label_41.setGeometry(QtCore.QRect(191, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_41.setFont(font)
-        self.label_41.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_41.setObjectName("label_41")
-        self.label_42 = QtWidgets.QLabel(self.widget_2)
-        self.label_42.setGeometry(QtCore.QRect(311, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_42.setFont(font)
-        self.label_42.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_42.setObjectName("label_42")
-        self.label_43 = QtWidgets.QLabel(self.widget_2)
-        self.label_43.setGeometry(QtCore.QRect(431, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_43.setFont(font)
-        self.label_43.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_43.setObjectName("label_43")
-        self.comboBox_14 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_14.setGeometry(QtCore.QRect(30, 100, 140, 22))
-        self.comboBox_14.setStyleSheet("background-color: #ffffff")
-        self.comboBox_14.setObjectName("comboBox_14")
-        self.comboBox_15 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_15.setGeometry(QtCore.QRect(30, 130, 140, 22))
-        self.comboBox_15.setStyleSheet("background-color: #ffffff")
-        self.comboBox_15.setObjectName("comboBox_15")
-        self.lineEdit_25 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_25.setGeometry(QtCore.QRect(210, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_25.setFont(font)
-        self.lineEdit_25.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_25.setObjectName("lineEdit_25")
-        self.lineEdit_26 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_26.setGeometry(QtCore.QRect(210, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_26.setFont(font)
-        self.lineEdit_26.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_26.setObjectName("lineEdit_26")
-        self.label_44 = QtWidgets.QLabel(self.widget_2)
-        self.label_44.setGeometry(QtCore.QRect(340, 100, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_44.setFont(font)
-        self.label_44.setStyleSheet("background-color: #ffffff")
-        self.label_44.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_44.setObjectName("label_44")
-        self.label_45 = QtWidgets.QLabel(self.widget_2)
-        self.label_45.setGeometry(QtCore.QRect(340, 130, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_45.setFont(font)
-        self.label_45.setStyleSheet("background-color: #ffffff")
-        self.label_45.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_45.setObjectName("label_45")
-        self.lineEdit_27 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_27.setGeometry(QtCore.QRect(450, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_27.setFont(font)
-        self.lineEdit_27.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_27.setObjectName("lineEdit_27")
-        self.lineEdit_28 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_28.setGeometry(QtCore.QRect(450, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_28.setFont(font)
-        self.lineEdit_28.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_28.setObjectName("lineEdit_28")
-        self.lineEdit_29 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_29.setGeometry(QtCore.QRect(570, 100, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_29.setFont(font)
-        self.lineEdit_29.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_29.setObjectName("lineEdit_29")
-        self.lineEdit_30 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_30.setGeometry(QtCore.QRect(570, 130, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_30.setFont(font)
-        self.lineEdit_30.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_30.setObjectName("lineEdit_30")
-        self.pushButton_13 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_13.setGeometry(QtCore.QRect(300, 200, 190, 23))
-        self.pushButton_13.setStyleSheet("background-color: #ffffff")
-        self.pushButton_13.setObjectName("pushButton_13")
-        self.label_46 = QtWidgets.QLabel(self.widget_2)
-        self.label_46.setGeometry(QtCore.QRect(30, 330, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_46.setFont(font)
-        self.label_46.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_46.setObjectName("label_46")
-        self.comboBox_16 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_16.setGeometry(QtCore.QRect(150, 270, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_16.setFont(font)
-        self.comboBox_16.setStyleSheet("background-color: #ffffff")
-        self.comboBox_16.setObjectName("comboBox_16")
-        self.comboBox_16.addItem("")
-        self.label_47 = QtWidgets.QLabel(self.widget_2)
-        self.label_47.setGeometry(QtCore.QRect(441, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_47.setFont(font)
-        self.label_47.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_47.setObjectName("label_47")
-        self.label_48 = QtWidgets.QLabel(self.widget_2)
-        self.label_48.setGeometry(QtCore.QRect(350, 390, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_48.setFont(font)
-        self.label_48.setStyleSheet("background-color: #ffffff")
-        self.label_48.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_48.setObjectName("label_48")
-        self.label_49 = QtWidgets.QLabel(self.widget_2)
-        self.label_49.setGeometry(QtCore.QRect(561, 330, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_49.setFont(font)
-        self.label_49.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_49.setObjectName("label_49")
-        self.label_50 = QtWidgets.QLabel(self.widget_2)
-        self.label_50.setGeometry(QtCore.QRect(350, 360, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_50.setFont(font)
-        self.label_50.setStyleSheet("background-color: #ffffff")
-        self.label_50.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_50.setObjectName("label_50")
-        self.label_51 = QtWidgets.QLabel(self.widget_2)
-        self.label_51.setGeometry(QtCore.QRect(321, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_51.setFont(font)
-        self.label_51.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_51.setObjectName("label_51")
-        self.lineEdit_31 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_31.setGeometry(QtCore.QRect(220, 390, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_31.setFont(font)
-        self.lineEdit_31.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_31.setObjectName("lineEdit_31")
-        self.lineEdit_32 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_32.setGeometry(QtCore.QRect(580, 360, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_32.setFont(font)
-        self.lineEdit_32.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_32.setObjectName("lineEdit_32")
-        self.label_52 = QtWidgets.QLabel(self.widget_2)
-        self.label_52.setGeometry(QtCore.QRect(201, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_52.setFont(font)
-        self.label_52.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_52.setObjectName("label_52")
-        self.pushButton_14 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_14.setGeometry(QtCore.QRect(310, 460, 190, 23))
-        self.pushButton_14.setStyleSheet("background-color: #ffffff")
-        self.pushButton_14.setObjectName("pushButton_14")
-        self.pushButton_15 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_15.setGeometry(QtCore.QRect(360, 270, 190, 23))
-        self.pushButton_15.setStyleSheet("background-color: #ffffff")
-        self.pushButton_15.setObjectName("pushButton_15")
-        self.label_53 = QtWidgets.QLabel(self.widget_2)
-        self.label_53.setGeometry(QtCore.QRect(30, 270, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_53.setFont(font)
-        self.label_53.setObjectName("label_53")
-        self.lineEdit_36 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_36.setGeometry(QtCore.QRect(580, 390, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_36.setFont(font)
-        self.lineEdit_36.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_36.setObjectName("lineEdit_36")
-        self.comboBox_17 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_17.setGeometry(QtCore.QRect(40, 360, 140, 22))
-        self.comboBox_17.setStyleSheet("background-color: #ffffff")
-        self.comboBox_17.setObjectName("comboBox_17")
-        self.comboBox_17.addItem("")
-        self.comboBox_17.addItem("")
-        self.comboBox_18 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_18.setGeometry(QtCore.QRect(40, 390, 140, 22))
-        self.comboBox_18.setStyleSheet("background-color: #ffffff")
-        self.comboBox_18.setObjectName("comboBox_18")
-        self.comboBox_18.addItem("")
-        self.comboBox_18.addItem("")
-        self.line_5 = QtWidgets.QFrame(self.widget_2)
-        self.line_5.setGeometry(QtCore.QRect(10, 250, 761, 16))
-        self.line_5.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_5.setLineWidth(2)
-        self.line_5.setMidLineWidth(2)
-        self.line_5.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_5.setObjectName("line_5")
-        self.line_6 = QtWidgets.QFrame(self.widget_2)
-        self.line_6.setGeometry(QtCore.QRect(10, 500, 761, 16))
-        self.line_6.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_6.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_6.setLineWidth(2)
-        self.line_6.setMidLineWidth(2)
-        self.line_6.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_6.setObjectName("line_6")
-        self.buttonBox = QtWidgets.QDialogButtonBox(self.widget_2)
-        self.buttonBox.setGeometry(QtCore.QRect(430, 590, 341, 32))
-        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox.setObjectName("buttonBox")
-        self.pushButton_6 = QtWidgets.QPushButton(SubStructure_Dialog)
-        self.pushButton_6.setGeometry(QtCore.QRect(350, 10, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        font.setWeight(75)
-        self.pushButton_6.setFont(font)
-        self.pushButton_6.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton_6.setStyleSheet("background-color: rgb(240,230,230)")
-        self.pushButton_6.setIcon(icon)
-        self.pushButton_6.setAutoRepeat(False)
-        self.pushButton_6.setObjectName("pushButton_6")
-        self.scrollArea = QtWidgets.QScrollArea(SubStructure_Dialog)
-        self.scrollArea.setGeometry(QtCore.QRect(10, 40, 241, 681))
-        self.scrollArea.setAutoFillBackground(False)
-        self.scrollArea.setStyleSheet("background-color: #fff9f9")
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setObjectName("scrollArea")
-        self.scrollAreaWidgetContents_3 = QtWidgets.QWidget()
-        self.scrollAreaWidgetContents_3.setGeometry(QtCore.QRect(0, 0, 239, 679))
-        self.scrollAreaWidgetContents_3.setObjectName("scrollAreaWidgetContents_3")
-        self.label_54 = QtWidgets.QLabel(self.scrollAreaWidgetContents_3)
-        self.label_54.setGeometry(QtCore.QRect(0, 0, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_54.setFont(font)
-        self.label_54.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_54.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_54.setObjectName("label_54")
-        self.widget_4 = QtWidgets.QWidget(self.scrollAreaWidgetContents_3)
-        self.widget_4.setGeometry(QtCore.QRect(0, 30, 221, 357))
-        self.widget_4.setStyleSheet("background-color: #fff9f9")
-        self.widget_4.setObjectName("widget_4")
-        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.widget_4)
-        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_3.setObjectName("verticalLayout_3")
-        self.pushButton_34 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_34.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
-        self.pushButton_34.setIcon(icon1)
-        self.pushButton_34.setCheckable(True)
-        self.pushButton_34.setAutoDefault(True)
-        self.pushButton_34.setObjectName("pushButton_34")
-        self.verticalLayout_3.addWidget(self.pushButton_34)
-        self.widget_7 = QtWidgets.QWidget(self.widget_4)
-        self.widget_7.setObjectName("widget_7")
-        self.formLayout_3 = QtWidgets.QFormLayout(self.widget_7)
-        self.formLayout_3.setObjectName("formLayout_3")
-        self.pushButton_35 = QtWidgets.QPushButton(self.widget_7)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_35.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_35.setIcon(icon2)
-        self.pushButton_35.setObjectName("pushButton_35")
-        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_35)
-        self.pushButton_36 = QtWidgets.QPushButton(self.widget_7)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_36.setFont(font)
-        self.pushButton_36.setIcon(icon2)
-        self.pushButton_36.setObjectName("pushButton_36")
-        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.pushButton_36)
-        self.pushButton_37 = QtWidgets.QPushButton(self.widget_7)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_37.setFont(font)
-        self.pushButton_37.setIcon(icon2)
-        self.pushButton_37.setObjectName("pushButton_37")
-        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pushButton_37)
-        self.pushButton_38 = QtWidgets.QPushButton(self.widget_7)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_38.setFont(font)
-        self.pushButton_38.setIcon(icon2)
-        self.pushButton_38.setObjectName("pushButton_38")
-        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.pushButton_38)
-        self.verticalLayout_3.addWidget(self.widget_7)
-        self.pushButton_39 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_39.setFont(font)
-        self.pushButton_39.setObjectName("pushButton_39")
-        self.verticalLayout_3.addWidget(self.pushButton_39)
-        self.pushButton_40 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_40.setFont(font)
-        self.pushButton_40.setIcon(icon1)
-        self.pushButton_40.setCheckable(True)
-        self.pushButton_40.setObjectName("pushButton_40")
-        self.verticalLayout_3.addWidget(self.pushButton_40)
-        self.widget_10 = QtWidgets.QWidget(self.widget_4)
-        self.widget_10.setMinimumSize(QtCore.QSize(203, 21))
-        self.widget_10.setMaximumSize(QtCore.QSize(281, 21))
-        self.widget_10.setObjectName("widget_10")
-        self.pushButton_41 = QtWidgets.QPushButton(self.widget_10)
-        self.pushButton_41.setGeometry(QtCore.QRect(20, 0, 183, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_41.setFont(font)
-        self.pushButton_41.setIcon(icon2)
-        self.pushButton_41.setObjectName("pushButton_41")
-        self.verticalLayout_3.addWidget(self.widget_10)
-        self.pushButton_42 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_42.setFont(font)
-        self.pushButton_42.setObjectName("pushButton_42")
-        self.verticalLayout_3.addWidget(self.pushButton_42)
-        self.pushButton_43 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_43.setFont(font)
-        self.pushButton_43.setObjectName("pushButton_43")
-        self.verticalLayout_3.addWidget(self.pushButton_43)
-        self.pushButton_16 = QtWidgets.QPushButton(self.widget_4)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_16.setFont(font)
-        self.pushButton_16.setObjectName("pushButton_16")
-        self.verticalLayout_3.addWidget(self.pushButton_16)
-        self.label_55 = QtWidgets.QLabel(self.scrollAreaWidgetContents_3)
-        self.label_55.setGeometry(QtCore.QRect(0, 387, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_55.setFont(font)
-        self.label_55.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_55.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_55.setObjectName("label_55")
-        self.textBrowser_3 = QtWidgets.QTextBrowser(self.scrollAreaWidgetContents_3)
-        self.textBrowser_3.setGeometry(QtCore.QRect(0, 418, 221, 221))
-        self.textBrowser_3.setStyleSheet("background-color: #fff9f9")
-        self.textBrowser_3.setObjectName("textBrowser_3")
-        self.verticalScrollBar_3 = QtWidgets.QScrollBar(self.scrollAreaWidgetContents_3)
-        self.verticalScrollBar_3.setGeometry(QtCore.QRect(220, 0, 16, 641))
-        self.verticalScrollBar_3.setStyleSheet("background-color: #F0F0F0")
-        self.verticalScrollBar_3.setOrientation(QtCore.Qt.Vertical)
-        self.verticalScrollBar_3.setObjectName("verticalScrollBar_3")
-        self.scrollArea.setWidget(self.scrollAreaWidgetContents_3)
-
-        self.retranslateUi(SubStructure_Dialog)
-        self.buttonBox.accepted.connect(SubStructure_Dialog.accept) # type: ignore# type: ignore
-        self.buttonBox.rejected.connect(self.show_warning) # type: ignore
-        self.buttonBox.rejected.connect(SubStructure_Dialog.reject) 
-        QtCore.QMetaObject.connectSlotsByName(SubStructure_Dialog)
-
-    def show_warning(self):
-        """
-        Show a warning window when the Close button is pressed.
-        """
-        warning_box = QMessageBox()
-        warning_box.setIcon(QMessageBox.Warning)
-        warning_box.setWindowTitle("Confirm Close")
-        warning_box.setText("Are you sure you want to close without saving?")
-        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        warning_box.setDefaultButton(QMessageBox.No)
-
-        # Check the user's response
-        response = warning_box.exec_()
-        if response == QMessageBox.Yes:
-            self.buttonBox.rejected.connect(SubStructure_Dialog.reject)   # Close the application
-        else:
-            pass  # Do nothing, return to the dialog
-
-    def retranslateUi(self, SubStructure_Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        SubStructure_Dialog.setWindowTitle(_translate("SubStructure_Dialog", "Sub-Structure Dialog"))
-        self.pushButton.setText(_translate("SubStructure_Dialog", "Project Details Window      "))
-        self.label_38.setText(_translate("SubStructure_Dialog", "Componenets:"))
-        self.comboBox_13.setItemText(0, _translate("SubStructure_Dialog", "Piers"))
-        self.pushButton_10.setText(_translate("SubStructure_Dialog", "+ Add Sub-Component"))
-        self.label_39.setText(_translate("SubStructure_Dialog", "Material Type and Grade"))
-        self.label_40.setText(_translate("SubStructure_Dialog", "Rate Data Source"))
-        self.label_41.setText(_translate("SubStructure_Dialog", "Quantity"))
-        self.label_42.setText(_translate("SubStructure_Dialog", "Unit"))
-        self.label_43.setText(_translate("SubStructure_Dialog", "Rate"))
-        self.label_44.setText(_translate("SubStructure_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_45.setText(_translate("SubStructure_Dialog", "kg"))
-        self.pushButton_13.setText(_translate("SubStructure_Dialog", "+ Add Material"))
-        self.label_46.setText(_translate("SubStructure_Dialog", "Material Type and Grade"))
-        self.comboBox_16.setItemText(0, _translate("SubStructure_Dialog", "Abutment"))
-        self.label_47.setText(_translate("SubStructure_Dialog", "Rate"))
-        self.label_48.setText(_translate("SubStructure_Dialog", "kg"))
-        self.label_49.setText(_translate("SubStructure_Dialog", "Rate Data Source"))
-        self.label_50.setText(_translate("SubStructure_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_51.setText(_translate("SubStructure_Dialog", "Unit"))
-        self.label_52.setText(_translate("SubStructure_Dialog", "Quantity"))
-        self.pushButton_14.setText(_translate("SubStructure_Dialog", "+ Add Material"))
-        self.pushButton_15.setText(_translate("SubStructure_Dialog", "+ Add Sub-Component"))
-        self.label_53.setText(_translate("SubStructure_Dialog", "Componenets:"))
-        self.comboBox_17.setItemText(0, _translate("SubStructure_Dialog", "Concrete"))
-        self.comboBox_17.setItemText(1, _translate("SubStructure_Dialog", "Steel"))
-        self.comboBox_18.setItemText(0, _translate("SubStructure_Dialog", "Steel"))
-        self.comboBox_18.setItemText(1, _translate("SubStructure_Dialog", "Concrete"))
-        self.pushButton_6.setText(_translate("SubStructure_Dialog", "Sub-Structure           "))
-        self.label_54.setText(_translate("SubStructure_Dialog", "Input Parameters"))
-        self.pushButton_34.setText(_translate("SubStructure_Dialog", "Structure Works Data"))
-        self.pushButton_35.setText(_translate("SubStructure_Dialog", "Foundation"))
-        self.pushButton_36.setText(_translate("SubStructure_Dialog", "Super-Structure"))
-        self.pushButton_37.setText(_translate("SubStructure_Dialog", "Sub-Structure"))
-        self.pushButton_38.setText(_translate("SubStructure_Dialog", "Miscellaneous"))
-        self.pushButton_39.setText(_translate("SubStructure_Dialog", "Financial Data"))
-        self.pushButton_40.setText(_translate("SubStructure_Dialog", "Carbon Emission Data"))
-        self.pushButton_41.setText(_translate("SubStructure_Dialog", "Carbon Emission Cost Data"))
-        self.pushButton_42.setText(_translate("SubStructure_Dialog", "Bridge and Traffic Data"))
-        self.pushButton_43.setText(_translate("SubStructure_Dialog", "Maintenance and Repair"))
-        self.pushButton_16.setText(_translate("SubStructure_Dialog", "Disposal and Recycling"))
-        self.label_55.setText(_translate("SubStructure_Dialog", "Output"))
-        self.textBrowser_3.setHtml(_translate("SubStructure_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Construction Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Carbon emission Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Time Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Road User Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Carbon Emission due to Re-Routing</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Periodic Maintenance Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Maintenance Emission Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Routine Inspectection Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Repair &amp; Rehabilitation Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Reconstruction Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Demolition &amp; Disposal Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    SubStructure_Dialog = QtWidgets.QDialog()
-    ui = Ui_SubStructure_Dialog()
-    ui.setupUi(SubStructure_Dialog)
-    SubStructure_Dialog.show()
-    sys.exit(app.exec_())
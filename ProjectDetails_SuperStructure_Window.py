@@ -1,566 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'C:\Users\saans\AppData\Local\Programs\Python\Python310\Lib\site-packages\qt5_applications\Qt\bin\ProjectDetails_SuperStructure_Window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QMessageBox
-
-
-class Ui_SuperStructure_Dialog(object):
-    def setupUi(self, SuperStructure_Dialog):
-        SuperStructure_Dialog.setObjectName("SuperStructure_Dialog")
-        SuperStructure_Dialog.resize(1440, 1000)
-        SuperStructure_Dialog.setStyleSheet("background-color:#FAFAFA")
-        self.label = QtWidgets.QLabel(SuperStructure_Dialog)
-        self.label.setGeometry(QtCore.QRect(10, 35, 244, 691))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label.setText("")
-        self.label.setObjectName("label")
-        self.pushButton_6 = QtWidgets.QPushButton(SuperStructure_Dialog)
-        self.pushButton_6.setGeometry(QtCore.QRect(350, 10, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        font.setWeight(75)
-        self.pushButton_6.setFont(font)
-        self.pushButton_6.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton_6.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_6.setIcon(icon)
-        self.pushButton_6.setAutoRepeat(False)
-        self.pushButton_6.setObjectName("pushButton_6")
-        self.widget_2 = QtWidgets.QWidget(SuperStructure_Dialog)
-        self.widget_2.setGeometry(QtCore.QRect(350, 35, 778, 624))
-        self.widget_2.setStyleSheet("background-color: #fff9f9")
-        self.widget_2.setObjectName("widget_2")
-        self.label_20 = QtWidgets.QLabel(self.widget_2)
-        self.label_20.setGeometry(QtCore.QRect(20, 10, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_20.setFont(font)
-        self.label_20.setObjectName("label_20")
-        self.comboBox_7 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_7.setGeometry(QtCore.QRect(140, 10, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_7.setFont(font)
-        self.comboBox_7.setStyleSheet("background-color: #ffffff")
-        self.comboBox_7.setObjectName("comboBox_7")
-        self.comboBox_7.addItem("")
-        self.pushButton_7 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_7.setGeometry(QtCore.QRect(350, 10, 190, 23))
-        self.pushButton_7.setStyleSheet("background-color: #ffffff")
-        self.pushButton_7.setObjectName("pushButton_7")
-        self.label_21 = QtWidgets.QLabel(self.widget_2)
-        self.label_21.setGeometry(QtCore.QRect(20, 70, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_21.setFont(font)
-        self.label_21.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_21.setObjectName("label_21")
-        self.label_22 = QtWidgets.QLabel(self.widget_2)
-        self.label_22.setGeometry(QtCore.QRect(551, 70, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_22.setFont(font)
-        self.label_22.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_22.setObjectName("label_22")
-        self.label_23 = QtWidgets.QLabel(self.widget_2)
-        self.label_23.setGeometry(QtCore.QRect(191, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_23.setFont(font)
-        self.label_23.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_23.setObjectName("label_23")
-        self.label_24 = QtWidgets.QLabel(self.widget_2)
-        self.label_24.setGeometry(QtCore.QRect(311, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_24.setFont(font)
-        self.label_24.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_24.setObjectName("label_24")
-        self.label_25 = QtWidgets.QLabel(self.widget_2)
-        self.label_25.setGeometry(QtCore.QRect(431, 70, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_25.setFont(font)
-        self.label_25.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_25.setObjectName("label_25")
-        self.comboBox_8 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_8.setGeometry(QtCore.QRect(30, 100, 140, 22))
-        self.comboBox_8.setStyleSheet("background-color: #ffffff")
-        self.comboBox_8.setObjectName("comboBox_8")
-        self.comboBox_9 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_9.setGeometry(QtCore.QRect(30, 130, 140, 22))
-        self.comboBox_9.setStyleSheet("background-color: #ffffff")
-        self.comboBox_9.setObjectName("comboBox_9")
-        self.lineEdit_13 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_13.setGeometry(QtCore.QRect(210, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_13.setFont(font)
-        self.lineEdit_13.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_13.setObjectName("lineEdit_13")
-        self.lineEdit_14 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_14.setGeometry(QtCore.QRect(210, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_14.setFont(font)
-        self.lineEdit_14.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_14.setObjectName("lineEdit_14")
-        self.label_26 = QtWidgets.QLabel(self.widget_2)
-        self.label_26.setGeometry(QtCore.QRect(340, 100, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_26.setFont(font)
-        self.label_26.setStyleSheet("background-color: #ffffff")
-        self.label_26.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_26.setObjectName("label_26")
-        self.label_27 = QtWidgets.QLabel(self.widget_2)
-        self.label_27.setGeometry(QtCore.QRect(340, 130, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_27.setFont(font)
-        self.label_27.setStyleSheet("background-color: #ffffff")
-        self.label_27.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_27.setObjectName("label_27")
-        self.lineEdit_15 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_15.setGeometry(QtCore.QRect(450, 100, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_15.setFont(font)
-        self.lineEdit_15.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_15.setObjectName("lineEdit_15")
-        self.lineEdit_16 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_16.setGeometry(QtCore.QRect(450, 130, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_16.setFont(font)
-        self.lineEdit_16.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_16.setObjectName("lineEdit_16")
-        self.lineEdit_17 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_17.setGeometry(QtCore.QRect(570, 100, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_17.setFont(font)
-        self.lineEdit_17.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_17.setObjectName("lineEdit_17")
-        self.lineEdit_18 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_18.setGeometry(QtCore.QRect(570, 130, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_18.setFont(font)
-        self.lineEdit_18.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_18.setObjectName("lineEdit_18")
-        self.pushButton_8 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_8.setGeometry(QtCore.QRect(300, 200, 190, 23))
-        self.pushButton_8.setStyleSheet("background-color: #ffffff")
-        self.pushButton_8.setObjectName("pushButton_8")
-        self.label_28 = QtWidgets.QLabel(self.widget_2)
-        self.label_28.setGeometry(QtCore.QRect(30, 330, 161, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_28.setFont(font)
-        self.label_28.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_28.setObjectName("label_28")
-        self.comboBox_10 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_10.setGeometry(QtCore.QRect(150, 270, 190, 22))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.comboBox_10.setFont(font)
-        self.comboBox_10.setStyleSheet("background-color: #ffffff")
-        self.comboBox_10.setObjectName("comboBox_10")
-        self.comboBox_10.addItem("")
-        self.label_29 = QtWidgets.QLabel(self.widget_2)
-        self.label_29.setGeometry(QtCore.QRect(441, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_29.setFont(font)
-        self.label_29.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_29.setObjectName("label_29")
-        self.label_30 = QtWidgets.QLabel(self.widget_2)
-        self.label_30.setGeometry(QtCore.QRect(350, 390, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_30.setFont(font)
-        self.label_30.setStyleSheet("background-color: #ffffff")
-        self.label_30.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_30.setObjectName("label_30")
-        self.label_31 = QtWidgets.QLabel(self.widget_2)
-        self.label_31.setGeometry(QtCore.QRect(561, 330, 140, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_31.setFont(font)
-        self.label_31.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_31.setObjectName("label_31")
-        self.label_32 = QtWidgets.QLabel(self.widget_2)
-        self.label_32.setGeometry(QtCore.QRect(350, 360, 51, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_32.setFont(font)
-        self.label_32.setStyleSheet("background-color: #ffffff")
-        self.label_32.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_32.setObjectName("label_32")
-        self.label_33 = QtWidgets.QLabel(self.widget_2)
-        self.label_33.setGeometry(QtCore.QRect(321, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_33.setFont(font)
-        self.label_33.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_33.setObjectName("label_33")
-        self.lineEdit_19 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_19.setGeometry(QtCore.QRect(220, 390, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_19.setFont(font)
-        self.lineEdit_19.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_19.setObjectName("lineEdit_19")
-        self.lineEdit_20 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_20.setGeometry(QtCore.QRect(580, 360, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_20.setFont(font)
-        self.lineEdit_20.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_20.setObjectName("lineEdit_20")
-        self.label_34 = QtWidgets.QLabel(self.widget_2)
-        self.label_34.setGeometry(QtCore.QRect(201, 330, 110, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_34.setFont(font)
-        self.label_34.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_34.setObjectName("label_34")
-        self.pushButton_9 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_9.setGeometry(QtCore.QRect(310, 460, 190, 23))
-        self.pushButton_9.setStyleSheet("background-color: #ffffff")
-        self.pushButton_9.setObjectName("pushButton_9")
-        self.lineEdit_21 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_21.setGeometry(QtCore.QRect(220, 360, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_21.setFont(font)
-        self.lineEdit_21.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_21.setObjectName("lineEdit_21")
-        self.lineEdit_22 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_22.setGeometry(QtCore.QRect(460, 360, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_22.setFont(font)
-        self.lineEdit_22.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_22.setObjectName("lineEdit_22")
-        self.lineEdit_23 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_23.setGeometry(QtCore.QRect(460, 390, 81, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_23.setFont(font)
-        self.lineEdit_23.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_23.setObjectName("lineEdit_23")
-        self.pushButton_11 = QtWidgets.QPushButton(self.widget_2)
-        self.pushButton_11.setGeometry(QtCore.QRect(360, 270, 190, 23))
-        self.pushButton_11.setStyleSheet("background-color: #ffffff")
-        self.pushButton_11.setObjectName("pushButton_11")
-        self.label_35 = QtWidgets.QLabel(self.widget_2)
-        self.label_35.setGeometry(QtCore.QRect(30, 270, 91, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_35.setFont(font)
-        self.label_35.setObjectName("label_35")
-        self.lineEdit_24 = QtWidgets.QLineEdit(self.widget_2)
-        self.lineEdit_24.setGeometry(QtCore.QRect(580, 390, 101, 20))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.lineEdit_24.setFont(font)
-        self.lineEdit_24.setStyleSheet("background-color: #ffffff")
-        self.lineEdit_24.setObjectName("lineEdit_24")
-        self.comboBox_11 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_11.setGeometry(QtCore.QRect(40, 360, 140, 22))
-        self.comboBox_11.setStyleSheet("background-color: #ffffff")
-        self.comboBox_11.setObjectName("comboBox_11")
-        self.comboBox_11.addItem("")
-        self.comboBox_11.addItem("")
-        self.comboBox_12 = QtWidgets.QComboBox(self.widget_2)
-        self.comboBox_12.setGeometry(QtCore.QRect(40, 390, 140, 22))
-        self.comboBox_12.setStyleSheet("background-color: #ffffff")
-        self.comboBox_12.setObjectName("comboBox_12")
-        self.comboBox_12.addItem("")
-        self.comboBox_12.addItem("")
-        self.line_3 = QtWidgets.QFrame(self.widget_2)
-        self.line_3.setGeometry(QtCore.QRect(10, 250, 761, 16))
-        self.line_3.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_3.setLineWidth(2)
-        self.line_3.setMidLineWidth(2)
-        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_3.setObjectName("line_3")
-        self.line_4 = QtWidgets.QFrame(self.widget_2)
-        self.line_4.setGeometry(QtCore.QRect(10, 500, 761, 16))
-        self.line_4.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
-        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_4.setLineWidth(2)
-        self.line_4.setMidLineWidth(2)
-        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_4.setObjectName("line_4")
-        self.buttonBox = QtWidgets.QDialogButtonBox(self.widget_2)
-        self.buttonBox.setGeometry(QtCore.QRect(430, 580, 341, 32))
-        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
-        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Save)
-        self.buttonBox.setObjectName("buttonBox")
-        self.scrollArea = QtWidgets.QScrollArea(SuperStructure_Dialog)
-        self.scrollArea.setGeometry(QtCore.QRect(10, 40, 241, 681))
-        self.scrollArea.setAutoFillBackground(False)
-        self.scrollArea.setStyleSheet("background-color: #fff9f9")
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setObjectName("scrollArea")
-        self.scrollAreaWidgetContents_2 = QtWidgets.QWidget()
-        self.scrollAreaWidgetContents_2.setGeometry(QtCore.QRect(0, 0, 239, 679))
-        self.scrollAreaWidgetContents_2.setObjectName("scrollAreaWidgetContents_2")
-        self.label_36 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
-        self.label_36.setGeometry(QtCore.QRect(0, 0, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_36.setFont(font)
-        self.label_36.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_36.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_36.setObjectName("label_36")
-        self.widget_3 = QtWidgets.QWidget(self.scrollAreaWidgetContents_2)
-        self.widget_3.setGeometry(QtCore.QRect(0, 30, 221, 357))
-        self.widget_3.setStyleSheet("background-color: #fff9f9")
-        self.widget_3.setObjectName("widget_3")
-        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.widget_3)
-        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_2.setObjectName("verticalLayout_2")
-        self.pushButton_24 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_24.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
-        self.pushButton_24.setIcon(icon1)
-        self.pushButton_24.setCheckable(True)
-        self.pushButton_24.setAutoDefault(True)
-        self.pushButton_24.setObjectName("pushButton_24")
-        self.verticalLayout_2.addWidget(self.pushButton_24)
-        self.widget_6 = QtWidgets.QWidget(self.widget_3)
-        self.widget_6.setObjectName("widget_6")
-        self.formLayout_2 = QtWidgets.QFormLayout(self.widget_6)
-        self.formLayout_2.setObjectName("formLayout_2")
-        self.pushButton_25 = QtWidgets.QPushButton(self.widget_6)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_25.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.pushButton_25.setIcon(icon2)
-        self.pushButton_25.setObjectName("pushButton_25")
-        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_25)
-        self.pushButton_26 = QtWidgets.QPushButton(self.widget_6)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_26.setFont(font)
-        self.pushButton_26.setIcon(icon2)
-        self.pushButton_26.setObjectName("pushButton_26")
-        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.pushButton_26)
-        self.pushButton_27 = QtWidgets.QPushButton(self.widget_6)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_27.setFont(font)
-        self.pushButton_27.setIcon(icon2)
-        self.pushButton_27.setObjectName("pushButton_27")
-        self.formLayout_2.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pushButton_27)
-        self.pushButton_28 = QtWidgets.QPushButton(self.widget_6)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_28.setFont(font)
-        self.pushButton_28.setIcon(icon2)
-        self.pushButton_28.setObjectName("pushButton_28")
-        self.formLayout_2.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.pushButton_28)
-        self.verticalLayout_2.addWidget(self.widget_6)
-        self.pushButton_29 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_29.setFont(font)
-        self.pushButton_29.setObjectName("pushButton_29")
-        self.verticalLayout_2.addWidget(self.pushButton_29)
-        self.pushButton_30 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_30.setFont(font)
-        self.pushButton_30.setIcon(icon1)
-        self.pushButton_30.setCheckable(True)
-        self.pushButton_30.setObjectName("pushButton_30")
-        self.verticalLayout_2.addWidget(self.pushButton_30)
-        self.widget_9 = QtWidgets.QWidget(self.widget_3)
-        self.widget_9.setMinimumSize(QtCore.QSize(203, 21))
-        self.widget_9.setMaximumSize(QtCore.QSize(281, 21))
-        self.widget_9.setObjectName("widget_9")
-        self.pushButton_31 = QtWidgets.QPushButton(self.widget_9)
-        self.pushButton_31.setGeometry(QtCore.QRect(20, 0, 183, 21))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        font.setBold(False)
-        font.setWeight(50)
-        self.pushButton_31.setFont(font)
-        self.pushButton_31.setIcon(icon2)
-        self.pushButton_31.setObjectName("pushButton_31")
-        self.verticalLayout_2.addWidget(self.widget_9)
-        self.pushButton_32 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_32.setFont(font)
-        self.pushButton_32.setObjectName("pushButton_32")
-        self.verticalLayout_2.addWidget(self.pushButton_32)
-        self.pushButton_33 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_33.setFont(font)
-        self.pushButton_33.setObjectName("pushButton_33")
-        self.verticalLayout_2.addWidget(self.pushButton_33)
-        self.pushButton_12 = QtWidgets.QPushButton(self.widget_3)
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton_12.setFont(font)
-        self.pushButton_12.setObjectName("pushButton_12")
-        self.verticalLayout_2.addWidget(self.pushButton_12)
-        self.label_37 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
-        self.label_37.setGeometry(QtCore.QRect(0, 387, 221, 31))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.label_37.setFont(font)
-        self.label_37.setStyleSheet("background-color: rgb(240,230,230)")
-        self.label_37.setAlignment(QtCore.Qt.AlignCenter)
-        self.label_37.setObjectName("label_37")
-        self.textBrowser_2 = QtWidgets.QTextBrowser(self.scrollAreaWidgetContents_2)
-        self.textBrowser_2.setGeometry(QtCore.QRect(0, 418, 221, 221))
-        self.textBrowser_2.setStyleSheet("background-color: #fff9f9")
-        self.textBrowser_2.setObjectName("textBrowser_2")
-        self.verticalScrollBar_2 = QtWidgets.QScrollBar(self.scrollAreaWidgetContents_2)
-        self.verticalScrollBar_2.setGeometry(QtCore.QRect(220, 0, 16, 641))
-        self.verticalScrollBar_2.setStyleSheet("background-color: #F0F0F0")
-        self.verticalScrollBar_2.setOrientation(QtCore.Qt.Vertical)
-        self.verticalScrollBar_2.setObjectName("verticalScrollBar_2")
-        self.scrollArea.setWidget(self.scrollAreaWidgetContents_2)
-        self.pushButton = QtWidgets.QPushButton(SuperStructure_Dialog)
-        self.pushButton.setGeometry(QtCore.QRect(10, 10, 188, 25))
-        font = QtGui.QFont()
-        font.setPointSize(10)
-        self.pushButton.setFont(font)
-        self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
-        self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        self.pushButton.setIcon(icon)
-        self.pushButton.setAutoRepeat(False)
-        self.pushButton.setObjectName("pushButton")
-
-        self.retranslateUi(SuperStructure_Dialog)
-        self.buttonBox.accepted.connect(SuperStructure_Dialog.accept) # type: ignore
-        self.buttonBox.rejected.connect(self.show_warning) # type: ignore
-        QtCore.QMetaObject.connectSlotsByName(SuperStructure_Dialog)
-
-    def show_warning(self):
-        """
-        Show a warning window when the Close button is pressed.
-        """
-        warning_box = QMessageBox()
-        warning_box.setIcon(QMessageBox.Warning)
-        warning_box.setWindowTitle("Confirm Close")
-        warning_box.setText("Are you sure you want to close without saving?")
-        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        warning_box.setDefaultButton(QMessageBox.No)
-
-        # Check the user's response
-        response = warning_box.exec_()
-        if response == QMessageBox.Yes:
-            QtWidgets.QApplication.quit()  # Close the application
-        else:
-            pass  # Do nothing, return to the dialog
-
-    def retranslateUi(self, SuperStructure_Dialog):
-        _translate = QtCore.QCoreApplication.translate
-        SuperStructure_Dialog.setWindowTitle(_translate("SuperStructure_Dialog", "Dialog"))
-        self.pushButton_6.setText(_translate("SuperStructure_Dialog", "Super-Structure           "))
-        self.label_20.setText(_translate("SuperStructure_Dialog", "Componenets:"))
-        self.comboBox_7.setItemText(0, _translate("SuperStructure_Dialog", "Deck"))
-        self.pushButton_7.setText(_translate("SuperStructure_Dialog", "+ Add Sub-Component"))
-        self.label_21.setText(_translate("SuperStructure_Dialog", "Material Type and Grade"))
-        self.label_22.setText(_translate("SuperStructure_Dialog", "Rate Data Source"))
-        self.label_23.setText(_translate("SuperStructure_Dialog", "Quantity"))
-        self.label_24.setText(_translate("SuperStructure_Dialog", "Unit"))
-        self.label_25.setText(_translate("SuperStructure_Dialog", "Rate"))
-        self.label_26.setText(_translate("SuperStructure_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_27.setText(_translate("SuperStructure_Dialog", "kg"))
-        self.pushButton_8.setText(_translate("SuperStructure_Dialog", "+ Add Material"))
-        self.label_28.setText(_translate("SuperStructure_Dialog", "Material Type and Grade"))
-        self.comboBox_10.setItemText(0, _translate("SuperStructure_Dialog", "Cables"))
-        self.label_29.setText(_translate("SuperStructure_Dialog", "Rate"))
-        self.label_30.setText(_translate("SuperStructure_Dialog", "kg"))
-        self.label_31.setText(_translate("SuperStructure_Dialog", "Rate Data Source"))
-        self.label_32.setText(_translate("SuperStructure_Dialog", "<html><head/><body><p><span style=\" font-size:10pt;\">m</span><span style=\" font-size:10pt; vertical-align:super;\">3</span></p></body></html>"))
-        self.label_33.setText(_translate("SuperStructure_Dialog", "Unit"))
-        self.label_34.setText(_translate("SuperStructure_Dialog", "Quantity"))
-        self.pushButton_9.setText(_translate("SuperStructure_Dialog", "+ Add Material"))
-        self.pushButton_11.setText(_translate("SuperStructure_Dialog", "+ Add Sub-Component"))
-        self.label_35.setText(_translate("SuperStructure_Dialog", "Componenets:"))
-        self.comboBox_11.setItemText(0, _translate("SuperStructure_Dialog", "Concrete"))
-        self.comboBox_11.setItemText(1, _translate("SuperStructure_Dialog", "Steel"))
-        self.comboBox_12.setItemText(0, _translate("SuperStructure_Dialog", "Steel"))
-        self.comboBox_12.setItemText(1, _translate("SuperStructure_Dialog", "Concrete"))
-        self.label_36.setText(_translate("SuperStructure_Dialog", "Input Parameters"))
-        self.pushButton_24.setText(_translate("SuperStructure_Dialog", "Structure Works Data"))
-        self.pushButton_25.setText(_translate("SuperStructure_Dialog", "Foundation"))
-        self.pushButton_26.setText(_translate("SuperStructure_Dialog", "Super-Structure"))
-        self.pushButton_27.setText(_translate("SuperStructure_Dialog", "Sub-Structure"))
-        self.pushButton_28.setText(_translate("SuperStructure_Dialog", "Miscellaneous"))
-        self.pushButton_29.setText(_translate("SuperStructure_Dialog", "Financial Data"))
-        self.pushButton_30.setText(_translate("SuperStructure_Dialog", "Carbon Emission Data"))
-        self.pushButton_31.setText(_translate("SuperStructure_Dialog", "Carbon Emission Cost Data"))
-        self.pushButton_32.setText(_translate("SuperStructure_Dialog", "Bridge and Traffic Data"))
-        self.pushButton_33.setText(_translate("SuperStructure_Dialog", "Maintenance and Repair"))
-        self.pushButton_12.setText(_translate("SuperStructure_Dialog", "Disposal and Recycling"))
-        self.label_37.setText(_translate("SuperStructure_Dialog", "Output"))
-        self.textBrowser_2.setHtml(_translate("SuperStructure_Dialog", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Construction Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Initial Carbon emission Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Time Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Road User Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Carbon Emission due to Re-Routing</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Periodic Maintenance Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Maintenance Emission Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Routine Inspectection Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Repair &amp; Rehabilitation Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Reconstruction Costs</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Demolition &amp; Disposal Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
-        self.pushButton.setText(_translate("SuperStructure_Dialog", "Project Details Window      "))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    SuperStructure_Dialog = QtWidgets.QDialog()
-    ui = Ui_SuperStructure_Dialog()
-    ui.setupUi(SuperStructure_Dialog)
-    SuperStructure_Dialog.show()
-    sys.exit(app.exec_())
@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
 from PyQt5.QtGui import QIcon, QPainter, QBrush, QPen, QColor, QFont, QPainterPath
 from PyQt5.QtCore import Qt, QRectF, QPointF
 
+import tracing
+
 class DonutChart(QWidget):
     def __init__(self, title, subtitle, values, colors, labels, parent=None):
         super().__init__(parent)
@@ -115,6 +117,7 @@ class BCCStudioUI(QMainWindow):
         super().__init__()
         self.initUI()
         
+    @tracing.traced("ui", "Result_window3.BCCStudioUI.initUI")
     def initUI(self):
         # Set window title and size
         self.setWindowTitle("<untitled-draft> - BLCCA Studio 1.0.0")
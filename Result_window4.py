@@ -8,6 +8,13 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QSize, QPoint
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QPixmap
 
+from blcca_studio_app import BarChartWidget, PieChartWidget
+from form_data_storage import form_data
+import lcc_engine
+from report_generator import COST_COLORS, PILLAR_COLORS
+import tracing
+from what_if_panel import WhatIfPanel
+
 
 class CloseableTabWidget(QTabWidget):
     """Custom tab widget with closeable tabs"""
@@ -162,87 +169,45 @@ class TreePanel(QWidget):
 
 
 class DataWindowPanel(QWidget):
-    """Data Window Panel Implementation"""
+    """Data Window Panel: stage pies, cost head bars and what-if sliders of the project"""
     
-    def __init__(self, parent=None):
+    def __init__(self, project_form_data=None, parent=None):
         super(DataWindowPanel, self).__init__(parent)
+        self.project_form_data = form_data if project_form_data is None else project_form_data
+        self.results = lcc_engine.evaluate(self.project_form_data)
         self.initUI()
         
     def initUI(self):
         layout = QVBoxLayout(self)
-        
-        # Placeholder for chart area - upper section
-        chart_placeholder = QWidget()
-        chart_placeholder.setMinimumHeight(300)
-        chart_placeholder.setStyleSheet("background-color: #FFFFFF; border: 1px solid #CCCCCC;")
-        
-        placeholder_text = QLabel("Life-Cycle Costs for 50 years\n\nVisualization area for donut charts")
-        placeholder_text.setAlignment(Qt.AlignCenter)
-        chart_layout = QVBoxLayout(chart_placeholder)
-        chart_layout.addWidget(placeholder_text)
-        
-        layout.addWidget(chart_placeholder)
-        
-        # Create legend
-        legend_frame = QFrame()
-        legend_frame.setFrameShape(QFrame.StyledPanel)
-        legend_frame.setMaximumHeight(50)
-        legend_frame.setStyleSheet("background-color: #F5F5F5; border: 1px solid #DDDDDD;")
-        
-        legend_layout = QHBoxLayout(legend_frame)
-        
-        legend_items = [
-            ("Initial Stage", "#000000"),
-            ("Use Stage", "#006400"),
-            ("End-of-Life Stage", "#8B4513"),
-            ("Beyond-Life Stage", "#90EE90")
-        ]
-        
-        for text, color in legend_items:
-            color_box = QFrame()
-            color_box.setFixedSize(16, 16)
-            color_box.setStyleSheet(f"background-color: {color}; border: 1px solid black;")
-            
-            label = QLabel(text)
-            
-            item_layout = QHBoxLayout()
-            item_layout.setContentsMargins(0, 0, 0, 0)
-            item_layout.addWidget(color_box)
-            item_layout.addWidget(label)
-            
-            legend_layout.addLayout(item_layout)
-        
-        legend_layout.addStretch()
-        layout.addWidget(legend_frame)
-        
-        # Placeholder for horizontal bar chart - lower section
-        barchart_placeholder = QWidget()
-        barchart_placeholder.setMinimumHeight(300)
-        barchart_placeholder.setStyleSheet("background-color: #FFFFFF; border: 1px solid #CCCCCC;")
-        
-        barchart_text = QLabel("Horizontal bar chart area showing breakdown of life-cycle costs")
-        barchart_text.setAlignment(Qt.AlignCenter)
-        barchart_layout = QVBoxLayout(barchart_placeholder)
-        barchart_layout.addWidget(barchart_text)
-        
-        layout.addWidget(barchart_placeholder)
-        
-        # Total cost display
-        total_frame = QFrame()
-        total_layout = QHBoxLayout(total_frame)
-        total_layout.setContentsMargins(5, 5, 5, 5)
-        
-        total_layout.addStretch()
-        
-        total_label = QLabel("Total Life-Cycle Cost:")
-        total_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        total_layout.addWidget(total_label)
-        
-        total_value = QLabel("259.15 Lakh")
-        total_value.setStyleSheet("font-weight: bold; font-size: 12px;")
-        total_layout.addWidget(total_value)
-        
-        layout.addWidget(total_frame)
+        report = self.results.report_results()
+        study_period = self.results.study_period
+        
+        # Stage pies of each pillar - upper section
+        charts_widget = QWidget()
+        charts_layout = QHBoxLayout(charts_widget)
+        self.pies = {}
+        for pillar in lcc_engine.PILLARS:
+            self.pies[pillar] = PieChartWidget(
+                f"{pillar} cost distribution across\nstages for {study_period} years",
+                report["stages"][pillar], lcc_engine.STAGES, PILLAR_COLORS[pillar])
+            charts_layout.addWidget(self.pies[pillar])
+        
+        layout.addWidget(charts_widget)
+        
+        # Horizontal bar chart of the cost heads, with the total below - lower section
+        cost_heads = report["cost_heads"]
+        self.bar_chart = BarChartWidget(
+            f"Life-Cycle Costs for {study_period} years",
+            [value for _, value in cost_heads],
+            [label for label, _ in cost_heads],
+            COST_COLORS[:len(cost_heads)]
+        )
+        layout.addWidget(self.bar_chart)
+        
+        # What-if sliders repaint the charts above
+        self.what_if = WhatIfPanel(self.project_form_data)
+        self.what_if.changed.connect(self.show_results)
+        layout.addWidget(self.what_if)
         
         # Download and view options
         options_frame = QFrame()
@@ -276,72 +241,66 @@ class DataWindowPanel(QWidget):
         nav_layout.addWidget(next_btn)
         
         layout.addWidget(nav_frame)
+    
+    def show_results(self, results):
+        """Repaint the stage pies and the cost head bars with new results"""
+        report = results.report_results()
+        for pillar, pie in self.pies.items():
+            pie.update_data(report["stages"][pillar])
+        self.bar_chart.update_data([value for _, value in report["cost_heads"]])
 
 
 class ResultsWindowPanel(QWidget):
-    """Results Window Panel Implementation"""
+    """Results Window Panel: stage pie of each pillar, one tab each"""
     
-    def __init__(self, parent=None):
+    def __init__(self, results=None, parent=None):
         super(ResultsWindowPanel, self).__init__(parent)
+        self.results = lcc_engine.evaluate(form_data) if results is None else results
         self.initUI()
         
     def initUI(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
+        stages = self.results.report_results()["stages"]
+        study_period = self.results.study_period
+        self.pies = {}
         
         # Create tabbed widget for Economic, Social, Environmental costs
         tabs = QTabWidget()
         tabs.setDocumentMode(True)
         
-        # Economic cost tab
-        economic_tab = QWidget()
-        economic_layout = QVBoxLayout(economic_tab)
-        
-        cost_title = QLabel("Economic cost distribution across various stages for bridges for 50 years")
-        cost_title.setAlignment(Qt.AlignCenter)
-        economic_layout.addWidget(cost_title)
-        
-        chart_placeholder = QWidget()
-        chart_placeholder.setMinimumHeight(300)
-        chart_placeholder.setStyleSheet("background-color: #FFFFFF; border: 1px solid #CCCCCC;")
-        
-        chart_text = QLabel("Economic cost distribution donut chart")
-        chart_text.setAlignment(Qt.AlignCenter)
-        chart_layout = QVBoxLayout(chart_placeholder)
-        chart_layout.addWidget(chart_text)
-        
-        economic_layout.addWidget(chart_placeholder)
-        
-        # Download options
-        dl_layout = QHBoxLayout()
-        dl_layout.addWidget(QPushButton("Download as PNG"))
-        dl_layout.addWidget(QPushButton("Download as JPG"))
-        dl_layout.addWidget(QPushButton("Download as PDF"))
-        economic_layout.addLayout(dl_layout)
-        
-        # View options
-        view_layout = QHBoxLayout()
-        view_layout.addWidget(QPushButton("View as Pie Chart"))
-        view_layout.addWidget(QPushButton("View as Table"))
-        economic_layout.addLayout(view_layout)
-        
-        tabs.addTab(economic_tab, "Economic Cost")
-        
-        # Social cost tab
-        social_tab = QWidget()
-        social_layout = QVBoxLayout(social_tab)
-        social_layout.addWidget(QLabel("Social cost distribution across stages for PSC bridges for 50 years"))
-        social_layout.addWidget(QWidget())  # Placeholder for chart
-        tabs.addTab(social_tab, "Social Cost")
-        
-        # Environmental cost tab
-        env_tab = QWidget()
-        env_layout = QVBoxLayout(env_tab)
-        env_layout.addWidget(QLabel("Environmental cost distribution across stages for PSC bridges for 50 years"))
-        env_layout.addWidget(QWidget())  # Placeholder for chart
-        tabs.addTab(env_tab, "Environmental Cost")
+        for pillar in lcc_engine.PILLARS:
+            tab = QWidget()
+            tab_layout = QVBoxLayout(tab)
+            
+            self.pies[pillar] = PieChartWidget(
+                f"{pillar} cost distribution across stages for bridges for {study_period} years",
+                stages[pillar], lcc_engine.STAGES, PILLAR_COLORS[pillar])
+            self.pies[pillar].setMinimumHeight(300)
+            tab_layout.addWidget(self.pies[pillar])
+            
+            # Download options
+            dl_layout = QHBoxLayout()
+            dl_layout.addWidget(QPushButton("Download as PNG"))
+            dl_layout.addWidget(QPushButton("Download as JPG"))
+            dl_layout.addWidget(QPushButton("Download as PDF"))
+            tab_layout.addLayout(dl_layout)
+            
+            # View options
+            view_layout = QHBoxLayout()
+            view_layout.addWidget(QPushButton("View as Pie Chart"))
+            view_layout.addWidget(QPushButton("View as Table"))
+            tab_layout.addLayout(view_layout)
+            
+            tabs.addTab(tab, f"{pillar} Cost")
         
         layout.addWidget(tabs)
+    
+    def show_results(self, results):
+        """Repaint the stage pies with new results"""
+        stages = results.report_results()["stages"]
+        for pillar, pie in self.pies.items():
+            pie.update_data(stages[pillar])
 
 
 class BLCCAStudio(QMainWindow):
@@ -351,6 +310,7 @@ class BLCCAStudio(QMainWindow):
         super(BLCCAStudio, self).__init__()
         self.initUI()
         
+    @tracing.traced("ui", "Result_window4.BLCCAStudio.initUI")
     def initUI(self):
         # Set window properties
         self.setWindowTitle("BLCCA Studio 1.0.0")
@@ -395,13 +355,16 @@ class BLCCAStudio(QMainWindow):
         # Data Window tab
         data_tab = QScrollArea()
         data_tab.setWidgetResizable(True)
-        data_tab.setWidget(DataWindowPanel())
+        data_panel = DataWindowPanel()
+        data_tab.setWidget(data_panel)
         right_tabs.addTab(data_tab, "Data Window")
         
         # Results Window tab
         results_tab = QScrollArea()
         results_tab.setWidgetResizable(True)
-        results_tab.setWidget(ResultsWindowPanel())
+        results_panel = ResultsWindowPanel(data_panel.results)
+        data_panel.what_if.changed.connect(results_panel.show_results)
+        results_tab.setWidget(results_panel)
         right_tabs.addTab(results_tab, "Results Window")
         
         right_layout.addWidget(right_tabs)
@@ -0,0 +1,129 @@
+import html
+import time
+
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtWidgets import QMessageBox
+
+from autosave_journal import write_project
+from form_data_storage import form_data, replace_form_data
+from version_history import store_for
+
+
+class VersionHistoryDialog(QtWidgets.QDialog):
+    """List, save, restore and compare saved versions of the project"""
+
+    def __init__(self, store, parent=None):
+        super(VersionHistoryDialog, self).__init__(parent)
+        self.store = store
+        self.setWindowTitle("Version History")
+        self.resize(640, 480)
+        self.initUI()
+        self.refresh()
+
+    def initUI(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        # Version list, newest first; select two versions to compare them
+        self.version_list = QtWidgets.QListWidget()
+        self.version_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        layout.addWidget(self.version_list)
+
+        # Diff of the two selected versions
+        self.diff_view = QtWidgets.QTextBrowser()
+        layout.addWidget(self.diff_view)
+
+        button_layout = QtWidgets.QHBoxLayout()
+        save_button = QtWidgets.QPushButton("Save Version")
+        save_button.clicked.connect(self.save_version)
+        restore_button = QtWidgets.QPushButton("Restore")
+        restore_button.clicked.connect(self.restore_version)
+        compare_button = QtWidgets.QPushButton("Compare")
+        compare_button.clicked.connect(self.compare_versions)
+        close_button = QtWidgets.QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+
+        button_layout.addWidget(save_button)
+        button_layout.addWidget(restore_button)
+        button_layout.addWidget(compare_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        self.version_list.clear()
+        for manifest in reversed(self.store.versions()):
+            saved_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(manifest["time"]))
+            item = QtWidgets.QListWidgetItem(f"{saved_at}   {manifest['id']}   {manifest['message']}")
+            item.setData(QtCore.Qt.UserRole, manifest["id"])
+            self.version_list.addItem(item)
+
+    def selected_ids(self):
+        return [item.data(QtCore.Qt.UserRole) for item in self.version_list.selectedItems()]
+
+    def save_version(self):
+        message, ok = QtWidgets.QInputDialog.getText(self, "Save Version", "Description:")
+        if not ok:
+            return
+        versions = self.store.versions()
+        parent = versions[-1]["id"] if versions else None
+        self.store.commit(form_data, message, parent)
+        self.refresh()
+
+    def restore_version(self):
+        selected = self.selected_ids()
+        if len(selected) != 1:
+            QMessageBox.information(self, "Restore", "Select one version to restore.")
+            return
+        response = QMessageBox.question(self, "Restore",
+                                        "Replace the current input data with the selected version?")
+        if response == QMessageBox.Yes:
+            replace_form_data(self.store.checkout(selected[0]))
+
+    def compare_versions(self):
+        selected = self.selected_ids()
+        if len(selected) != 2:
+            QMessageBox.information(self, "Compare", "Select two versions to compare.")
+            return
+        # The list is newest first, so the second selection is the older version
+        new_id, old_id = sorted(selected, key=lambda version_id: self.store.manifest(version_id)["time"],
+                                reverse=True)
+        diff = self.store.diff(old_id, new_id)
+
+        lines = [f"<b>Changes from {old_id} to {new_id}</b>"]
+        for path in diff["added"]:
+            lines.append(html.escape(f"Added: {' / '.join(path)}"))
+        for path in diff["removed"]:
+            lines.append(html.escape(f"Removed: {' / '.join(path)}"))
+        for path, fields in sorted(diff["changed"].items()):
+            for field, (old_value, new_value) in sorted(fields.items()):
+                lines.append(html.escape(f"{' / '.join(path)} - {field}: {old_value}") + " &rarr; "
+                             + html.escape(str(new_value)))
+        if len(lines) == 1:
+            lines.append("No differences")
+        self.diff_view.setHtml("<br>".join(lines))
+
+
+def create_copy(store, parent=None):
+    """
+    Save the current input data as a separate project file.
+
+    The copy starts with the current state as its first version. Version ids
+    belong to one store, so the version it was copied from is named in the
+    message rather than recorded as its parent.
+
+    Args:
+        store (VersionStore): Version store of the current project.
+        parent (QWidget): Parent widget for the file dialog.
+
+    Returns:
+        str: The path of the copy, or None when cancelled.
+    """
+    path, _ = QtWidgets.QFileDialog.getSaveFileName(parent, "Create a Copy", "copy.json",
+                                                    "Project Files (*.json)")
+    if not path:
+        return None
+    write_project(path, form_data)
+    versions = store.versions()
+    message = f"Created as a copy of version {versions[-1]['id']}" if versions else "Created as a copy"
+    store_for(path).commit(form_data, message)
+    return path
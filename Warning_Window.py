@@ -10,8 +10,11 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+import tracing
+
 
 class Ui_Warning_Dialog(object):
+    @tracing.traced("ui", "Warning_Dialog.setupUi")
     def setupUi(self, Warning_Dialog):
         Warning_Dialog.setObjectName("Warning_Dialog")
         Warning_Dialog.resize(394, 151)
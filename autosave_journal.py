@@ -0,0 +1,280 @@
+"""
+Autosave and crash recovery for the project form data.
+
+Every field edit is appended to a journal file next to the project file.
+Writes happen on a background thread: edits are queued by the GUI thread
+without touching the disk, and the writer drains the queue in batches with a
+single ``fsync`` per batch. Every ``compact_every`` edits the writer folds the
+journal into the project file (written atomically) and truncates the journal.
+
+On start-up the project file is loaded and any journal left behind by a crash
+is replayed on top of it, so at most the last unsynced batch is lost. A torn
+last line is cut off before new entries are appended after it. A batch the
+writer fails to store is logged, kept in ``error`` and retried with the next
+one; ``close`` raises the error if the last attempt fails too.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+import form_data_storage
+import tracing
+import units
+
+
+logger = logging.getLogger("blcca_studio.autosave")
+
+# Project file used until the user saves the draft under a name of their own
+DEFAULT_PROJECT_PATH = os.path.join(os.path.expanduser("~"), ".blcca_studio", "untitled_draft.json")
+
+def journal_path_for(project_path):
+    """Return the journal file used for ``project_path``."""
+    return project_path + ".journal"
+
+
+def _copy(value):
+    """Deep copy of JSON data, so later changes by the caller are not journaled."""
+    return json.loads(json.dumps(value))
+
+
+def _read_journal(journal_path):
+    """
+    Read the complete entries of a journal.
+
+    Returns:
+        tuple: (list of entries, length in bytes of the lines they fill).
+        Reading stops at the first line that is not a newline-terminated
+        JSON entry, e.g. one torn by a crash mid-write.
+    """
+    entries, length = [], 0
+    if not os.path.exists(journal_path):
+        return entries, length
+    with open(journal_path, "rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+            length += len(line)
+    return entries, length
+
+
+def _apply(state, entry):
+    """Apply one journal entry to a form data dictionary."""
+    window_name = entry["window"]
+    if window_name is None:
+        state.clear()
+        state.update(json.loads(json.dumps(entry["value"])))
+    elif entry.get("field") is None:
+        state[window_name] = dict(entry["value"])
+    else:
+        state.setdefault(window_name, {})[entry["field"]] = entry["value"]
+
+
+@tracing.traced("io")
+def load_project(project_path):
+    """
+    Load a project file and replay any journal left next to it.
+
+    Args:
+        project_path (str): Path to the project file.
+
+    Returns:
+        tuple: (form data dict, number of journal entries replayed).
+
+    Raises:
+        ValueError: If the recovered data uses unit codes the dialogs do
+            not offer, see ``units.check_project``.
+    """
+    state = {}
+    if os.path.exists(project_path):
+        with open(project_path, encoding="utf-8") as handle:
+            state = json.load(handle)
+
+    entries, _length = _read_journal(journal_path_for(project_path))
+    for entry in entries:
+        _apply(state, entry)
+    replayed = len(entries)
+    try:
+        units.check_project(state)
+    except ValueError as error:
+        raise ValueError(f"{project_path}: {error}") from None
+    return state, replayed
+
+
+@tracing.traced("io")
+def write_project(project_path, state):
+    """
+    Atomically replace the project file with ``state``.
+
+    Args:
+        project_path (str): Path to the project file.
+        state (dict): Form data to store.
+    """
+    tmp_path = project_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(state, handle, indent=2, sort_keys=True)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, project_path)
+
+
+class AutosaveJournal(object):
+    """Append-only journal of form edits written by a background thread."""
+
+    _STOP = object()
+
+    def __init__(self, project_path, state=None, batch_interval=0.5, compact_every=500, recovered=0):
+        """
+        Args:
+            project_path (str): Project file that compaction writes to.
+            state (dict): Form data already reflected in the project file and
+                journal, usually the result of ``load_project``.
+            batch_interval (float): Seconds the writer waits to collect a batch.
+            compact_every (int): Journal entries between compactions.
+            recovered (int): Entries already in the journal but not in the
+                project file, i.e. replayed by ``load_project``.
+        """
+        self.project_path = project_path
+        self.journal_path = journal_path_for(project_path)
+        self.batch_interval = batch_interval
+        self.compact_every = compact_every
+
+        # The writer keeps its own copy so compaction never reads form_data
+        # while the GUI thread is changing it
+        self._state = _copy(state or {})
+        self._queue = queue.Queue()
+        self.recovered = recovered
+        self._entries_since_compaction = recovered
+        self.error = None
+        self._trim_torn_tail()
+        # Unbuffered, so a failed write leaves nothing behind to be flushed later
+        self._journal = open(self.journal_path, "ab", buffering=0)
+        self._thread = threading.Thread(target=self._run, name="autosave-journal", daemon=True)
+        self._thread.start()
+
+    def _trim_torn_tail(self):
+        """Cut the journal after its last complete entry, so appends start on a fresh line."""
+        if not os.path.exists(self.journal_path):
+            return
+        _entries, length = _read_journal(self.journal_path)
+        if os.path.getsize(self.journal_path) > length:
+            logger.warning("Dropping a torn entry at the end of %s", self.journal_path)
+            with open(self.journal_path, "r+b") as handle:
+                handle.truncate(length)
+                os.fsync(handle.fileno())
+
+    def record(self, window_name, field, value):
+        """Queue a single field edit. Never blocks on disk I/O."""
+        self._queue.put({"t": time.time(), "window": window_name, "field": field, "value": _copy(value)})
+
+    def record_window(self, window_name, data):
+        """Queue a replacement of all saved data of one window."""
+        self._queue.put({"t": time.time(), "window": window_name, "field": None, "value": _copy(data)})
+
+    def record_reset(self, data):
+        """Queue a replacement of the whole form data, e.g. a restored version."""
+        self._queue.put({"t": time.time(), "window": None, "field": None, "value": _copy(data)})
+
+    def compact(self):
+        """Request a compaction on the writer thread."""
+        self._queue.put("compact")
+
+    def close(self):
+        """
+        Flush pending edits, compact into the project file and stop.
+
+        Raises:
+            OSError: If the last edits could not be written.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        running = True
+        pending = []
+        while running:
+            batch = [self._queue.get()]
+            # Give the GUI a moment to queue more edits so they share one fsync
+            time.sleep(self.batch_interval)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending += [item for item in batch if isinstance(item, dict)]
+            running = self._STOP not in batch
+            try:
+                if pending:
+                    self._write_batch(pending)
+                    pending = []
+                if not running or "compact" in batch or self._entries_since_compaction >= self.compact_every:
+                    self._compact()
+                self.error = None
+            except OSError as error:
+                # Keep the edits for the next batch: the disk may come back
+                logger.exception("Autosave to %s failed", self.journal_path)
+                self.error = error
+        self._journal.close()
+
+    @tracing.traced("io")
+    def _write_batch(self, entries):
+        start = os.fstat(self._journal.fileno()).st_size
+        data = memoryview("".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8"))
+        try:
+            while data:
+                data = data[self._journal.write(data):]
+            os.fsync(self._journal.fileno())
+        except OSError:
+            # Do not leave part of the batch for the retry to append after
+            os.ftruncate(self._journal.fileno(), start)
+            raise
+        for entry in entries:
+            _apply(self._state, entry)
+        self._entries_since_compaction += len(entries)
+
+    def _compact(self):
+        if self._entries_since_compaction == 0 and os.path.exists(self.project_path):
+            return
+        write_project(self.project_path, self._state)
+        # Everything in the journal is now in the project file
+        self._journal.truncate(0)
+        self._journal.seek(0)
+        os.fsync(self._journal.fileno())
+        self._entries_since_compaction = 0
+
+
+def start(project_path=DEFAULT_PROJECT_PATH, **kwargs):
+    """
+    Recover ``project_path`` into the global form data and start autosaving.
+
+    Args:
+        project_path (str): Project file to recover and autosave to.
+        **kwargs: Passed on to ``AutosaveJournal``.
+
+    Returns:
+        AutosaveJournal: The running journal, also attached to form_data_storage;
+        its ``recovered`` attribute is the number of edits replayed.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(project_path)), exist_ok=True)
+    state, replayed = load_project(project_path)
+    form_data_storage.form_data.clear()
+    form_data_storage.form_data.update(state)
+    journal = AutosaveJournal(project_path, state, recovered=replayed, **kwargs)
+    form_data_storage.attach_journal(journal)
+    if replayed:
+        logger.info("Recovered %d unsaved edits from %s", replayed, journal.journal_path)
+        # Fold the replayed edits into the project file so they are not replayed again
+        journal.compact()
+    return journal
+
@@ -0,0 +1,241 @@
+"""
+Portfolio computations spread over worker processes through shared memory.
+
+Sending large arrays to a process pool pickles a copy of them into every
+task. Instead, ``run`` places the input and output arrays of a
+computation in ``multiprocessing.shared_memory`` blocks once. Tasks only
+carry the block names, shapes and dtypes plus the range of rows to work
+on; every worker attaches to the blocks as NumPy views and writes its rows
+of the outputs in place. Memory use stays about one copy of the data
+whatever the number of workers.
+
+Blocks are owned by a ``SharedArrays`` object in the parent process and
+are unlinked when it is closed: at the end of ``run`` even if a worker
+raised or died, at interpreter exit for blocks still open, and by the
+``multiprocessing`` resource tracker if the parent itself is killed.
+Workers detach from the blocks at the end of every task, so a pool reused
+over many runs does not keep unlinked blocks mapped.
+
+A kernel is a module-level function ``kernel(inputs, outputs, start, stop,
+**options)`` that fills ``outputs[...][start:stop]`` from ``inputs``; see
+``_expected_costs_kernel``. ``deterioration.portfolio_cash_flows`` runs
+very large portfolios through ``portfolio_expected_costs``, and
+``monte_carlo.run`` spreads its sample chunks with ``run``.
+"""
+
+import atexit
+import concurrent.futures
+import os
+import sys
+import traceback
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from deterioration import expected_costs
+
+
+# Rows handled by one task when no chunk size is given
+DEFAULT_CHUNK_ROWS = 2048
+
+_open_blocks = weakref.WeakSet()
+
+
+class SharedArrays(object):
+    """Named NumPy arrays backed by shared memory blocks owned by this process."""
+
+    def __init__(self):
+        self.arrays = {}
+        self._blocks = []
+        _open_blocks.add(self)
+
+    def create(self, name, shape, dtype=float):
+        """
+        Allocate a zero-filled shared array.
+
+        Args:
+            name (str): Key of the array.
+            shape (tuple): Shape of the array.
+            dtype: NumPy dtype.
+
+        Returns:
+            ndarray: View of the shared block.
+        """
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        self._blocks.append(block)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array[...] = 0
+        self.arrays[name] = array
+        return array
+
+    def put(self, name, values):
+        """Copy an array into a new shared block and return the shared view."""
+        values = np.asarray(values)
+        array = self.create(name, values.shape, values.dtype)
+        array[...] = values
+        return array
+
+    def specs(self):
+        """Picklable description of the arrays, for ``attach`` in a worker."""
+        return {name: (block.name, array.shape, array.dtype.str)
+                for (name, array), block in zip(self.arrays.items(), self._blocks)}
+
+    def close(self):
+        """Release and unlink every block; views of them must not be used afterwards."""
+        self.arrays = {}
+        blocks, self._blocks = self._blocks, []
+        for block in blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+@atexit.register
+def _close_open_blocks():
+    for arrays in list(_open_blocks):
+        arrays.close()
+
+
+# Blocks this worker process is attached to, by block name
+_attached = {}
+
+
+def _attach_block(block_name):
+    # Pool workers share the parent's resource tracker, so attaching does
+    # not make the worker responsible for unlinking the block
+    if block_name not in _attached:
+        _attached[block_name] = shared_memory.SharedMemory(name=block_name)
+    return _attached[block_name]
+
+
+def attach(specs):
+    """
+    Views of shared arrays described by ``SharedArrays.specs``.
+
+    The blocks stay attached until ``detach``; drop the views first.
+
+    Returns:
+        dict: name -> ndarray sharing memory with the parent process.
+    """
+    return {name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attach_block(block_name).buf)
+            for name, (block_name, shape, dtype) in specs.items()}
+
+
+def detach():
+    """Close every block attached by ``attach`` in this process."""
+    while _attached:
+        _name, block = _attached.popitem()
+        block.close()
+
+
+def _run_chunk(kernel, input_specs, output_specs, start, stop, options):
+    try:
+        kernel(attach(input_specs), attach(output_specs), start, stop, **options)
+        return stop - start
+    finally:
+        # The frames of a raised error hold views of the blocks; the
+        # traceback text sent to the parent does not need their locals
+        traceback.clear_frames(sys.exc_info()[2])
+        detach()
+
+
+def run(kernel, inputs, outputs, rows, workers=None, chunk_rows=None, pool=None, **options):
+    """
+    Run ``kernel`` over ``rows`` rows in worker processes.
+
+    Args:
+        kernel (callable): Module-level kernel, see the module docstring.
+        inputs (dict): name -> array; arrays are copied into shared memory once.
+        outputs (dict): name -> (shape, dtype) of the arrays to fill.
+        rows (int): Number of rows split into tasks.
+        workers (int): Worker processes; one per CPU by default.
+        chunk_rows (int): Rows per task; ``DEFAULT_CHUNK_ROWS`` by default.
+        pool (concurrent.futures.ProcessPoolExecutor): Pool to run the tasks
+            in, left running for further calls; a new pool of ``workers``
+            processes by default.
+        **options: Extra keyword arguments of the kernel.
+
+    Returns:
+        dict: name -> output array, copied out of shared memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_rows = chunk_rows or max(1, min(DEFAULT_CHUNK_ROWS, -(-rows // workers)))
+    with SharedArrays() as shared_inputs, SharedArrays() as shared_outputs:
+        for name, values in inputs.items():
+            shared_inputs.put(name, values)
+        for name, (shape, dtype) in outputs.items():
+            shared_outputs.create(name, shape, dtype)
+        input_specs, output_specs = shared_inputs.specs(), shared_outputs.specs()
+        owned_pool = concurrent.futures.ProcessPoolExecutor(workers) if pool is None else None
+        try:
+            tasks = [(owned_pool or pool).submit(_run_chunk, kernel, input_specs, output_specs,
+                                                 start, min(start + chunk_rows, rows), options)
+                     for start in range(0, rows, chunk_rows)]
+            try:
+                for task in concurrent.futures.as_completed(tasks):
+                    # Re-raises a worker exception or BrokenProcessPool; the
+                    # blocks are unlinked on the way out either way
+                    task.result()
+            finally:
+                # No task may still write to the blocks once they are unlinked
+                for task in tasks:
+                    task.cancel()
+                concurrent.futures.wait(tasks)
+        finally:
+            if owned_pool is not None:
+                owned_pool.shutdown()
+        return {name: array.copy() for name, array in shared_outputs.arrays.items()}
+
+
+def _expected_costs_kernel(inputs, outputs, start, stop, years):
+    rows = slice(start, stop)
+    result = expected_costs(inputs["rates"][rows], inputs["construction_costs"][rows],
+                            inputs["repair_rate"][rows], inputs["repair_state"][rows],
+                            inputs["reconstruction_state"][rows], years)
+    for name in ("repair", "reconstruction", "repair_events", "reconstruction_events"):
+        outputs[name][rows] = result[name]
+
+
+def portfolio_expected_costs(rates, construction_costs, repair_rate, repair_state,
+                             reconstruction_state, years, workers=None):
+    """
+    ``deterioration.expected_costs`` of a very large set of components, in parallel.
+
+    Args:
+        rates (array): Shape (n, N_STATES - 1) deterioration probabilities.
+        construction_costs (array): Shape (n,) initial cost of each component.
+        repair_rate (array): Shape (n,) repair cost as a share of construction cost.
+        repair_state (array): Shape (n,) 1-based state at which to repair.
+        reconstruction_state (array): Shape (n,) 1-based state at which to reconstruct.
+        years (int): Study period in years.
+        workers (int): Worker processes; one per CPU by default.
+
+    Returns:
+        dict: ``repair``, ``reconstruction``, ``repair_events`` and
+        ``reconstruction_events`` of shape (n, years). The condition
+        distributions are not kept.
+    """
+    n = len(construction_costs)
+    n_rows = np.arange(n)
+    inputs = {
+        "rates": np.asarray(rates, dtype=float),
+        "construction_costs": np.asarray(construction_costs, dtype=float),
+        "repair_rate": np.broadcast_to(np.asarray(repair_rate, dtype=float), n_rows.shape),
+        "repair_state": np.broadcast_to(np.asarray(repair_state, dtype=int), n_rows.shape),
+        "reconstruction_state": np.broadcast_to(np.asarray(reconstruction_state, dtype=int), n_rows.shape),
+    }
+    outputs = {name: ((n, years), float)
+               for name in ("repair", "reconstruction", "repair_events", "reconstruction_events")}
+    return run(_expected_costs_kernel, inputs, outputs, n, workers, years=years)
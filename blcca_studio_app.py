@@ -2,12 +2,52 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QTreeWidget, QTreeWidgetItem, QTabWidget, QDockWidget,
                             QToolBar, QAction, QPushButton, QFrame, QSplitter, QScrollArea,
-                            QTableWidget, QTableWidgetItem, QHeaderView)
+                            QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog,
+                            QMessageBox)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QPainter, QColor, QBrush, QPen
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
+from report_generator import current_project, write_report
+from form_data_storage import form_data
+import lcc_engine
+import tracing
+from monte_carlo_panel import MonteCarloPanel
+from what_if_panel import WhatIfPanel
+
+
+class ChartBlitter(object):
+    """Repaints the changing artists of a chart over a cached copy of the rest"""
+    
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.artists = []
+        self.background = None
+        canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def set_artists(self, artists):
+        """Artists left out of full draws and repainted by ``update``"""
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
+    
+    def on_draw(self, event):
+        # A full draw leaves out the animated artists: keep that as the background
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_artists()
+    
+    def draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+    
+    def update(self):
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
 
 
 class PieChartWidget(QWidget):
@@ -19,6 +59,7 @@ class PieChartWidget(QWidget):
         self.colors = colors
         self.initUI()
         
+    @tracing.traced("render")
     def initUI(self):
         layout = QVBoxLayout()
         
@@ -30,7 +71,29 @@ class PieChartWidget(QWidget):
         # Create matplotlib Figure and Canvas
         self.figure, self.ax = plt.subplots(figsize=(5, 4))
         self.canvas = FigureCanvas(self.figure)
+        self.blitter = ChartBlitter(self.canvas)
+        
+        self.plot()
+        
+        # Add the canvas to the layout
+        layout.addWidget(self.canvas)
         
+        self.setLayout(layout)
+    
+    def plot(self):
+        """Draw the pie of the current data from scratch"""
+        self.ax.clear()
+        self.wedges = []
+        self.autotexts = []
+        self.blitter.set_artists([])
+        self.figure.patch.set_facecolor('none')
+        
+        # Nothing to divide up until the project has results
+        if sum(self.data) <= 0:
+            self.ax.axis('off')
+            self.ax.text(0.5, 0.5, "No results yet", ha='center', va='center', fontsize=9, color='#888888')
+            return
+
         # Create the pie chart
         wedges, texts, autotexts = self.ax.pie(
             self.data, 
@@ -40,21 +103,42 @@ class PieChartWidget(QWidget):
             wedgeprops={'edgecolor': 'w', 'linewidth': 1},
             textprops={'fontsize': 8}
         )
+        self.wedges = wedges
+        self.autotexts = autotexts
         
         # Equal aspect ratio ensures that pie is drawn as a circle
         self.ax.axis('equal')
         
         # Remove the default matplotlib frame
-        self.figure.patch.set_facecolor('none')
         self.ax.set_facecolor('none')
         
         # Add legend
-        self.ax.legend(wedges, self.labels, loc="center right", fontsize=8)
+        legend = self.ax.legend(wedges, self.labels, loc="center right", fontsize=8)
         
-        # Add the canvas to the layout
-        layout.addWidget(self.canvas)
-        
-        self.setLayout(layout)
+        # The legend overlaps the pie, so it is repainted on top of the wedges
+        self.blitter.set_artists(list(wedges) + list(autotexts) + [legend])
+    
+    def update_data(self, data):
+        """Show new values, moving the existing wedges instead of redrawing the axes"""
+        if list(data) == list(self.data):
+            return
+        self.data = data
+        if not self.wedges or sum(data) <= 0:
+            self.plot()
+            self.canvas.draw_idle()
+            return
+        
+        # Same layout as Axes.pie: counter-clockwise from 90 degrees, labels at 0.6 radius
+        fractions = np.asarray(data, dtype=float) / sum(data)
+        theta = 90 + 360 * np.concatenate([[0.0], np.cumsum(fractions)])
+        for wedge, autotext, theta1, theta2, fraction in zip(self.wedges, self.autotexts,
+                                                             theta[:-1], theta[1:], fractions):
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            middle = np.deg2rad((theta1 + theta2) / 2)
+            autotext.set_position((0.6 * np.cos(middle), 0.6 * np.sin(middle)))
+            autotext.set_text(f'{100 * fraction:1.1f}%')
+        self.blitter.update()
 
 
 class BarChartWidget(QWidget):
@@ -66,6 +150,7 @@ class BarChartWidget(QWidget):
         self.colors = colors
         self.initUI()
         
+    @tracing.traced("render")
     def initUI(self):
         layout = QVBoxLayout()
         
@@ -85,11 +170,16 @@ class BarChartWidget(QWidget):
         self.ax.set_yticklabels(self.labels, fontsize=8)
         self.ax.invert_yaxis()  # labels read top-to-bottom
         
+        self.bars = bars
+        self.blitter = ChartBlitter(self.canvas)
+        
         # Add values to the end of each bar
+        self.value_texts = []
         for i, bar in enumerate(bars):
             width = bar.get_width()
-            self.ax.text(width + 1, bar.get_y() + bar.get_height()/2, 
-                    f'{self.data[i]}', va='center', fontsize=8)
+            self.value_texts.append(self.ax.text(width + 1, bar.get_y() + bar.get_height()/2, 
+                    f'{self.data[i]}', va='center', fontsize=8))
+        self.blitter.set_artists(list(bars) + self.value_texts)
         
         # Remove the default matplotlib frame
         self.figure.patch.set_facecolor('none')
@@ -106,13 +196,35 @@ class BarChartWidget(QWidget):
         layout.addWidget(self.canvas)
         
         # Total cost label
-        total = sum(self.data)
-        total_label = QLabel(f"Total Life-Cycle Cost: {total} Lakh")
-        total_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-        total_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(total_label)
+        total = round(sum(self.data), 2)
+        self.total_label = QLabel(f"Total Life-Cycle Cost: {total} Lakh")
+        self.total_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.total_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.total_label)
         
         self.setLayout(layout)
+    
+    def update_data(self, data):
+        """Show new values by resizing the existing bars"""
+        if list(data) == list(self.data):
+            return
+        self.data = data
+        for bar, text, value in zip(self.bars, self.value_texts, data):
+            bar.set_width(value)
+            text.set_x(value + 1)
+            text.set_text(f'{value}')
+        self.total_label.setText(f"Total Life-Cycle Cost: {round(sum(data), 2)} Lakh")
+        
+        # The axis only changes, and needs a full draw, when the bars outgrow
+        # it or shrink to less than half of it
+        low, high = self.ax.get_xlim()
+        data_low, data_high = min(min(data), 0), max(max(data), 0)
+        if data_low < low or data_high > high or (data_high - data_low) < (high - low) / 2:
+            self.ax.relim()
+            self.ax.autoscale_view(scaley=False)
+            self.canvas.draw_idle()
+        else:
+            self.blitter.update()
 
 
 class BLCCAStudio(QMainWindow):
@@ -120,6 +232,7 @@ class BLCCAStudio(QMainWindow):
         super().__init__()
         self.initUI()
         
+    @tracing.traced("ui")
     def initUI(self):
         # Set window properties
         self.setWindowTitle('BLCCA Studio 1.0')
@@ -229,35 +342,41 @@ class BLCCAStudio(QMainWindow):
         charts_widget = QWidget()
         charts_layout = QHBoxLayout(charts_widget)
         
+        # Every chart below is a reduction of the same cached result tensor
+        results = lcc_engine.evaluate(form_data)
+        study_period = results.study_period
+        report = results.report_results()
+        stage_values = report["stages"]
+
         # Economic cost pie chart
-        economic_data = [28.4, 64.15, 7.45]
-        economic_labels = ["Initial Stage", "Use Stage", "End-of-Life Stage"]
-        economic_colors = ['#3366cc', '#109618', '#ff9900']
-        economic_pie = PieChartWidget(
-            "Economic cost distribution across\nvarious stages for bridges for 50 years",
+        economic_data = stage_values["Economic"]
+        economic_labels = lcc_engine.STAGES
+        economic_colors = ['#3366cc', '#109618', '#ff9900', '#4B0082']
+        self.economic_pie = PieChartWidget(
+            f"Economic cost distribution across\nvarious stages for bridges for {study_period} years",
             economic_data, economic_labels, economic_colors
         )
-        charts_layout.addWidget(economic_pie)
+        charts_layout.addWidget(self.economic_pie)
         
         # Social cost pie chart
-        social_data = [54.82, 40.18, 5.0]
-        social_labels = ["Initial Stage", "Use Stage", "End-of-Life Stage"]
-        social_colors = ['#dc3912', '#990099', '#0099c6']
-        social_pie = PieChartWidget(
-            "Social cost distribution across\nstages for PSC bridges for 50 years",
+        social_data = stage_values["Social"]
+        social_labels = lcc_engine.STAGES
+        social_colors = ['#dc3912', '#990099', '#0099c6', '#4B0082']
+        self.social_pie = PieChartWidget(
+            f"Social cost distribution across\nstages for PSC bridges for {study_period} years",
             social_data, social_labels, social_colors
         )
-        charts_layout.addWidget(social_pie)
+        charts_layout.addWidget(self.social_pie)
         
         # Environmental cost pie chart
-        env_data = [16.65, 76.03, 7.32]
-        env_labels = ["Initial Stage", "Use Stage", "End-of-Life Stage"]
-        env_colors = ['#dd4477', '#66aa00', '#b82e2e']
-        env_pie = PieChartWidget(
-            "Environmental cost distribution across\nstages for PSC bridges for 50 years",
+        env_data = stage_values["Environmental"]
+        env_labels = lcc_engine.STAGES
+        env_colors = ['#dd4477', '#66aa00', '#b82e2e', '#4B0082']
+        self.env_pie = PieChartWidget(
+            f"Environmental cost distribution across\nstages for PSC bridges for {study_period} years",
             env_data, env_labels, env_colors
         )
-        charts_layout.addWidget(env_pie)
+        charts_layout.addWidget(self.env_pie)
         
         data_layout.addWidget(charts_widget)
         
@@ -265,7 +384,7 @@ class BLCCAStudio(QMainWindow):
         legend_widget = QWidget()
         legend_layout = QHBoxLayout(legend_widget)
         
-        stages = ["Initial Stage", "Use Stage", "End-of-Life Stage", "Beyond-Life Stage"]
+        stages = lcc_engine.STAGES
         colors = ["#000080", "#006400", "#8B4513", "#4B0082"]
         
         for stage, color in zip(stages, colors):
@@ -289,31 +408,23 @@ class BLCCAStudio(QMainWindow):
         data_layout.addWidget(legend_widget)
         
         # Bar chart for life-cycle costs
-        cost_labels = [
-            "Initial Construction Cost",
-            "Initial Carbon Emission Cost",
-            "Time Cost", 
-            "User Time Cost",
-            "Carbon Emission due to Re-Routing",
-            "Periodic Maintenance Costs",
-            "Maintenance Emission Cost",
-            "Routine Inspection Cost",
-            "Repair & Rehabilitation Cost",
-            "Demolition & Disposal Cost",
-            "Recycling Cost"
-        ]
-        cost_data = [49.83, 8.53, 123.19, 29.03, 1.44, 16.99, 14.52, 1.95, 5.77, 8.0]
-        cost_colors = ['#3366cc', '#dc3912', '#ff9900', '#109618', '#990099', '#0099c6', 
-                      '#dd4477', '#66aa00', '#b82e2e', '#316395', '#994499']
-        
-        bar_chart = BarChartWidget(
-            "Life-Cycle Costs for 50 years",
-            cost_data[:len(cost_labels)-1],  # One less data point than labels
-            cost_labels[:-1],  # Remove the last label
-            cost_colors[:-1]   # Remove the last color
+        cost_heads = report["cost_heads"]
+        cost_labels = [label for label, _ in cost_heads]
+        cost_data = [value for _, value in cost_heads]
+        cost_colors = ['#3366cc', '#dc3912', '#ff9900', '#109618', '#990099', '#0099c6',
+                      '#dd4477', '#66aa00', '#b82e2e', '#316395', '#994499', '#22aa99', '#aaaa11']
+
+        self.bar_chart = BarChartWidget(
+            f"Life-Cycle Costs for {study_period} years",
+            cost_data,
+            cost_labels,
+            cost_colors[:len(cost_labels)]
         )
-        data_layout.addWidget(bar_chart)
-        
+        data_layout.addWidget(self.bar_chart)
+
+        # Keep the displayed results so the Reports menu prints the same values
+        self.report_results = report
+
         # Navigation buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -348,10 +459,55 @@ class BLCCAStudio(QMainWindow):
         
         # Reports menu
         reports_menu = menubar.addMenu('Reports')
+        report_action = QAction('Generate PDF Report...', self)
+        report_action.triggered.connect(self.generate_report)
+        reports_menu.addAction(report_action)
+        monte_carlo_action = QAction('Monte Carlo Analysis...', self)
+        monte_carlo_action.triggered.connect(self.show_monte_carlo)
+        reports_menu.addAction(monte_carlo_action)
+        what_if_action = QAction('What-If Analysis...', self)
+        what_if_action.triggered.connect(self.show_what_if)
+        reports_menu.addAction(what_if_action)
         
         # Help menu
         help_menu = menubar.addMenu('Help')
     
+    def generate_report(self):
+        """Ask for a file name and write the PDF report of the current project"""
+        path, _ = QFileDialog.getSaveFileName(self, "Save Report", "report.pdf", "PDF Files (*.pdf)")
+        if not path:
+            return
+        pages = write_report(path, [current_project(results=self.report_results)])
+        QMessageBox.information(self, "Report", f"Report saved to {path} ({pages} pages)")
+    
+    def show_monte_carlo(self):
+        """Show the Monte Carlo panel in a dock on the right"""
+        if getattr(self, "monte_carlo_dock", None) is None:
+            self.monte_carlo_dock = QDockWidget("Monte Carlo Analysis", self)
+            self.monte_carlo_dock.setWidget(MonteCarloPanel(form_data))
+            self.addDockWidget(Qt.RightDockWidgetArea, self.monte_carlo_dock)
+        self.monte_carlo_dock.show()
+    
+    def show_what_if(self):
+        """Show the what-if sliders in a dock on the right"""
+        if getattr(self, "what_if_dock", None) is None:
+            panel = WhatIfPanel(form_data)
+            panel.changed.connect(self.show_results)
+            self.what_if_dock = QDockWidget("What-If Analysis", self)
+            self.what_if_dock.setWidget(panel)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.what_if_dock)
+        self.what_if_dock.show()
+    
+    @tracing.traced("render")
+    def show_results(self, results):
+        """Repaint the stage pies and the cost head bars with new results"""
+        report = results.report_results()
+        self.economic_pie.update_data(report["stages"]["Economic"])
+        self.social_pie.update_data(report["stages"]["Social"])
+        self.env_pie.update_data(report["stages"]["Environmental"])
+        self.bar_chart.update_data([value for _, value in report["cost_heads"]])
+        self.report_results = report
+    
     def create_toolbar(self):
         """Create the toolbar with basic actions"""
         toolbar = QToolBar()
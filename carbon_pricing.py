@@ -0,0 +1,145 @@
+"""
+Carbon price trajectories and emission costs.
+
+A price trajectory is an array of INR per tonne CO2e indexed by year of
+the study period (index 0 is the construction year). Several trajectories
+stacked as a (scenarios, years) array can be evaluated together:
+``emission_costs`` multiplies them by the discount factors once and then
+prices any number of emission time series with a single matrix product.
+
+Scenario files are CSV with a ``year`` column and one column per
+scenario::
+
+    year,low,central,high
+    2025,2000,5000,8000
+    2050,3000,9000,20000
+
+Prices between the listed years are interpolated linearly; before the
+first and after the last listed year they stay constant.
+"""
+
+import csv
+
+import numpy as np
+
+import dialog_schema
+import units
+
+
+# Social cost of carbon, INR per tonne CO2e
+DEFAULT_CARBON_PRICE = 5000.0
+
+
+def flat(price, years):
+    """A constant price for every year."""
+    return np.full(years, float(price))
+
+
+def escalating(price, escalation_rate, years):
+    """
+    A price growing by a fixed rate every year.
+
+    Args:
+        price (float): Price in the first year, INR/tCO2e.
+        escalation_rate (float): Yearly growth as a fraction, 0.03 for 3 %.
+        years (int): Number of years.
+
+    Returns:
+        ndarray: Shape (years,).
+    """
+    return float(price) * (1.0 + escalation_rate) ** np.arange(years)
+
+
+def load_scenarios(path, start_year, years):
+    """
+    Read price scenarios from a CSV file.
+
+    Args:
+        path (str): CSV file with a ``year`` column and one column per scenario.
+        start_year (int): Calendar year of index 0 of the study period.
+        years (int): Number of years.
+
+    Returns:
+        tuple: Scenario names (list) and prices, shape (scenarios, years).
+    """
+    with open(path, newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        names = [name for name in reader.fieldnames if name != "year"]
+        rows = sorted(reader, key=lambda row: float(row["year"]))
+    listed_years = np.array([float(row["year"]) for row in rows])
+    calendar_years = start_year + np.arange(years)
+    prices = np.array([np.interp(calendar_years, listed_years, [float(row[name]) for row in rows])
+                       for name in names])
+    return names, prices
+
+
+def discount_factors(real_discount_rate, years):
+    """Present value of 1 INR paid in each year, for a rate as a fraction."""
+    return (1.0 + real_discount_rate) ** -np.arange(years, dtype=float)
+
+
+def emission_costs(emissions, prices, real_discount_rate):
+    """
+    Present value of emission time series under one or more price trajectories.
+
+    Args:
+        emissions (array): Shape (years,) or (series, years), tonnes CO2e per year.
+        prices (array): Shape (years,) or (scenarios, years), INR/tCO2e.
+        real_discount_rate (float): Discount rate as a fraction.
+
+    Returns:
+        ndarray: Present values, shape (scenarios, series) with the
+        dimensions of 1-D arguments dropped.
+    """
+    emissions = np.asarray(emissions, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    discounted_prices = prices * discount_factors(real_discount_rate, prices.shape[-1])
+    return discounted_prices @ emissions.T
+
+
+def initial_emissions(project_form_data):
+    """
+    Embodied emissions of the materials in the Carbon Emission dialog.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        float: Tonnes CO2e.
+    """
+    values = units.coerce(dialog_schema.CARBON_EMISSION,
+                          project_form_data.get(dialog_schema.CARBON_EMISSION.name, {}))
+    rows = values["materials"]
+    tonnes = np.array([row["quantity"] for row in rows], dtype=float)
+    return float(tonnes @ np.array([row["emission_factor"] for row in rows], dtype=float))
+
+
+def emission_series(project_form_data):
+    """
+    Yearly emissions of a project over its study period.
+
+    Construction emissions fall in year 0. Every periodic maintenance adds
+    the Periodic Maintenance Cost Rate share of the embodied emissions.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        dict: ``initial`` and ``maintenance`` emissions, each of shape
+        (study period + 1,) in tonnes CO2e, years 0 .. study period like
+        the cost heads of ``lcc_engine``.
+    """
+    financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+    maintenance = units.coerce(dialog_schema.MAINTENANCE, project_form_data.get(dialog_schema.MAINTENANCE.name, {}))
+    years = financial["study_period"]
+    embodied = initial_emissions(project_form_data)
+
+    initial = np.zeros(years + 1)
+    initial[0] = embodied
+    year_index = np.arange(years + 1)
+    frequency = maintenance["periodic_maintenance_frequency"]
+    maintained = (year_index > 0) & (year_index % frequency == 0)
+    return {
+        "initial": initial,
+        "maintenance": maintained * embodied * maintenance["periodic_maintenance_rate"],
+    }
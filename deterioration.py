@@ -0,0 +1,310 @@
+"""
+Markov-chain deterioration of bridge components.
+
+Every component is in one of ``N_STATES`` condition states. Each year it
+drops to the next worse state with a component-specific probability, and
+is then repaired or reconstructed if it reached the trigger state set in
+the Maintenance and Repair dialog. The yearly step is therefore one
+transition matrix per component, ``M = P @ R`` (deteriorate, then
+intervene).
+
+The condition distribution of every year is ``d0 @ M^t``. Instead of
+stepping year by year, the distributions are filled in by doubling: the
+first ``k`` years are multiplied by ``M^k`` to get the next ``k``, and
+``M^k`` is squared. A study period of ``T`` years thus takes about
+``log2(T)`` batched matrix products over all components at once.
+"""
+
+import os
+
+import numpy as np
+
+import dialog_schema
+import units
+
+
+CONDITION_LABELS = ["Good", "Satisfactory", "Fair", "Poor", "Failed"]
+N_STATES = len(CONDITION_LABELS)
+
+# State a component is in after a repair and after a reconstruction
+REPAIRED_STATE = 1
+RECONSTRUCTED_STATE = 0
+
+# Yearly probability of dropping one state from each of states 1-4
+DETERIORATION_RATES = {
+    "Earthwork": (0.02, 0.03, 0.04, 0.05),
+    "RCC in Foundation": (0.03, 0.04, 0.05, 0.06),
+    "Deck": (0.08, 0.10, 0.12, 0.15),
+    "Cables": (0.06, 0.08, 0.10, 0.12),
+    "Piers": (0.04, 0.05, 0.06, 0.08),
+    "Abutment": (0.04, 0.05, 0.06, 0.08),
+    "Expansion Joint": (0.15, 0.18, 0.20, 0.25),
+    "Bearing": (0.10, 0.12, 0.15, 0.18),
+}
+DEFAULT_RATES = (0.05, 0.06, 0.08, 0.10)
+
+# Components from which ``portfolio_cash_flows`` spreads the simulation
+# over worker processes; smaller portfolios do not repay starting them
+PARALLEL_MIN_COMPONENTS = 100000
+
+STRUCTURE_SCHEMAS = [
+    dialog_schema.FOUNDATION,
+    dialog_schema.SUPER_STRUCTURE,
+    dialog_schema.SUB_STRUCTURE,
+    dialog_schema.MISCELLANEOUS,
+]
+
+
+def transition_matrices(rates):
+    """
+    Build the yearly deterioration matrices of many components.
+
+    Args:
+        rates (array): Shape (n, N_STATES - 1), probability of dropping one
+            state from each state but the last.
+
+    Returns:
+        ndarray: Shape (n, N_STATES, N_STATES), row-stochastic.
+    """
+    rates = np.asarray(rates, dtype=float)
+    n = rates.shape[0]
+    states = np.arange(N_STATES - 1)
+    matrices = np.zeros((n, N_STATES, N_STATES))
+    matrices[:, states, states] = 1.0 - rates
+    matrices[:, states, states + 1] = rates
+    matrices[:, -1, -1] = 1.0
+    return matrices
+
+
+def intervention_masks(repair_state, reconstruction_state, n):
+    """
+    Find the states that trigger a repair and a reconstruction.
+
+    Args:
+        repair_state (int or array): 1-based state at which to repair.
+        reconstruction_state (int or array): 1-based state at which to reconstruct.
+        n (int): Number of components.
+
+    Returns:
+        tuple: Boolean arrays ``(repair, reconstruct)`` of shape (n, N_STATES).
+    """
+    states = np.arange(1, N_STATES + 1)
+    repair_state = np.broadcast_to(np.asarray(repair_state), (n,))[:, None]
+    reconstruction_state = np.broadcast_to(np.asarray(reconstruction_state), (n,))[:, None]
+    reconstruct = states >= reconstruction_state
+    repair = (states >= repair_state) & ~reconstruct
+    return repair, reconstruct
+
+
+def intervention_matrices(repair, reconstruct):
+    """Matrices moving repaired and reconstructed components to their new state."""
+    n = repair.shape[0]
+    untouched = ~(repair | reconstruct)
+    matrices = np.zeros((n, N_STATES, N_STATES))
+    matrices[:, np.arange(N_STATES), np.arange(N_STATES)] = untouched
+    matrices[:, :, REPAIRED_STATE] += repair
+    matrices[:, :, RECONSTRUCTED_STATE] += reconstruct
+    return matrices
+
+
+def propagate(initial, matrices, years):
+    """
+    Compute ``initial @ matrices^t`` for t = 0..years by repeated squaring.
+
+    Args:
+        initial (ndarray): Shape (n, S), distribution in year 0.
+        matrices (ndarray): Shape (n, S, S), one yearly step per component.
+        years (int): Number of years.
+
+    Returns:
+        ndarray: Shape (n, years + 1, S).
+    """
+    n, states = initial.shape
+    distributions = np.empty((n, years + 1, states))
+    distributions[:, 0] = initial
+    power = matrices
+    filled = 1
+    while filled <= years:
+        count = min(filled, years + 1 - filled)
+        distributions[:, filled:filled + count] = distributions[:, :count] @ power
+        power = power @ power
+        filled += count
+    return distributions
+
+
+def simulate(rates, repair_state, reconstruction_state, years, initial=None):
+    """
+    Expected condition and interventions of many components over the study period.
+
+    Args:
+        rates (array): Shape (n, N_STATES - 1), see ``transition_matrices``.
+        repair_state (int or array): 1-based state at which to repair.
+        reconstruction_state (int or array): 1-based state at which to reconstruct.
+        years (int): Study period in years.
+        initial (array): Shape (n, N_STATES) condition in year 0. New
+            components (all in state 1) by default.
+
+    Returns:
+        dict: ``condition`` (n, years + 1, N_STATES) distribution after each
+        year's interventions, and ``repair`` and ``reconstruction`` (n, years)
+        expected number of interventions in years 1..years.
+    """
+    deteriorate = transition_matrices(rates)
+    n = deteriorate.shape[0]
+    if initial is None:
+        initial = np.zeros((n, N_STATES))
+        initial[:, 0] = 1.0
+    repair, reconstruct = intervention_masks(repair_state, reconstruction_state, n)
+    condition = propagate(np.asarray(initial, dtype=float),
+                          deteriorate @ intervention_matrices(repair, reconstruct), years)
+
+    # Condition reached in each year before that year's interventions
+    before = condition[:, :-1] @ deteriorate
+    return {
+        "condition": condition,
+        "repair": np.einsum("nts,ns->nt", before, repair),
+        "reconstruction": np.einsum("nts,ns->nt", before, reconstruct),
+    }
+
+
+def expected_costs(rates, construction_costs, repair_rate, repair_state, reconstruction_state, years):
+    """
+    Expected yearly repair and reconstruction costs of many components.
+
+    Args:
+        rates (array): Shape (n, N_STATES - 1) deterioration probabilities.
+        construction_costs (array): Shape (n,) initial cost of each component.
+        repair_rate (float or array): Repair cost as a share of construction cost.
+        repair_state (int or array): 1-based state at which to repair.
+        reconstruction_state (int or array): 1-based state at which to reconstruct.
+        years (int): Study period in years.
+
+    Returns:
+        dict: ``repair`` and ``reconstruction`` costs of shape (n, years),
+        the expected ``repair_events`` and ``reconstruction_events`` and the
+        ``condition`` distributions from ``simulate``.
+    """
+    result = simulate(rates, repair_state, reconstruction_state, years)
+    construction_costs = np.asarray(construction_costs, dtype=float)[:, None]
+    repair_rate = np.broadcast_to(np.asarray(repair_rate, dtype=float), construction_costs.shape[:1])[:, None]
+    return {
+        "condition": result["condition"],
+        "repair": result["repair"] * construction_costs * repair_rate,
+        "reconstruction": result["reconstruction"] * construction_costs,
+        "repair_events": result["repair"],
+        "reconstruction_events": result["reconstruction"],
+    }
+
+
+def project_components(project_form_data):
+    """
+    Components of a project and their construction costs.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        tuple: Component names (list) and construction costs (ndarray); only
+        structure dialogs with a non-zero cost are included.
+    """
+    names, costs = [], []
+    for schema in STRUCTURE_SCHEMAS:
+        if schema.name not in project_form_data:
+            continue
+        values = units.coerce(schema, project_form_data[schema.name])
+        cost = sum(row["quantity"] * row["rate"] for row in values["materials"])
+        if cost > 0:
+            names.append(values["component"])
+            costs.append(cost)
+    return names, np.array(costs, dtype=float)
+
+
+def maintenance_cash_flows(project_form_data):
+    """
+    Yearly repair and reconstruction costs of a project.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        dict: ``years`` (1..study period), total ``repair`` and
+        ``reconstruction`` cost per year, the expected number of
+        ``repair_events`` and ``reconstruction_events`` per year over all
+        components, the ``components`` and their ``condition`` distributions.
+    """
+    maintenance = units.coerce(dialog_schema.MAINTENANCE, project_form_data.get(dialog_schema.MAINTENANCE.name, {}))
+    financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+    years = financial["study_period"]
+    names, costs = project_components(project_form_data)
+    rates = np.array([DETERIORATION_RATES.get(name, DEFAULT_RATES) for name in names],
+                     dtype=float).reshape(len(names), N_STATES - 1)
+
+    result = expected_costs(rates, costs, maintenance["repair_rehabilitation_rate"],
+                            maintenance["repair_condition_state"],
+                            maintenance["reconstruction_condition_state"], years)
+    return {
+        "years": np.arange(1, years + 1),
+        "repair": result["repair"].sum(axis=0),
+        "reconstruction": result["reconstruction"].sum(axis=0),
+        "repair_events": result["repair_events"].sum(axis=0),
+        "reconstruction_events": result["reconstruction_events"].sum(axis=0),
+        "components": names,
+        "condition": result["condition"],
+    }
+
+
+def portfolio_cash_flows(projects, workers=None):
+    """
+    Yearly repair and reconstruction costs of many projects at once.
+
+    The components of all projects are stacked and simulated together
+    over the longest study period; the distribution of the first ``T``
+    years does not depend on the years after, so each project then takes
+    the first years of its own study period. Portfolios of at least
+    ``PARALLEL_MIN_COMPONENTS`` components are simulated in worker
+    processes by ``batch_runner.portfolio_expected_costs``.
+
+    Args:
+        projects (list): Saved form data (window name -> data) of each project.
+        workers (int): Worker processes for large portfolios; one per CPU
+            by default, 1 to stay in this process.
+
+    Returns:
+        list: One dict per project with the ``years``, ``repair``,
+        ``reconstruction``, ``repair_events`` and ``reconstruction_events``
+        of ``maintenance_cash_flows``.
+    """
+    owners, rates, costs, repair_rate, repair_state, reconstruction_state = [], [], [], [], [], []
+    periods = []
+    for index, project_form_data in enumerate(projects):
+        maintenance = units.coerce(dialog_schema.MAINTENANCE,
+                                   project_form_data.get(dialog_schema.MAINTENANCE.name, {}))
+        financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+        periods.append(financial["study_period"])
+        names, component_costs = project_components(project_form_data)
+        owners += [index] * len(names)
+        rates += [DETERIORATION_RATES.get(name, DEFAULT_RATES) for name in names]
+        costs += list(component_costs)
+        repair_rate += [maintenance["repair_rehabilitation_rate"]] * len(names)
+        repair_state += [maintenance["repair_condition_state"]] * len(names)
+        reconstruction_state += [maintenance["reconstruction_condition_state"]] * len(names)
+
+    years = max(periods, default=0)
+    totals = {key: np.zeros((len(projects), years))
+              for key in ("repair", "reconstruction", "repair_events", "reconstruction_events")}
+    if owners:
+        arguments = (np.array(rates, dtype=float), costs, repair_rate, np.array(repair_state),
+                     np.array(reconstruction_state), years)
+        if len(owners) >= PARALLEL_MIN_COMPONENTS and (workers or os.cpu_count() or 1) > 1:
+            # Imported here because batch_runner imports this module
+            import batch_runner
+            result = batch_runner.portfolio_expected_costs(*arguments, workers=workers)
+        else:
+            result = expected_costs(*arguments)
+        owners = np.array(owners)
+        for key, total in totals.items():
+            np.add.at(total, owners, result[key])
+    return [dict({key: total[index, :period] for key, total in totals.items()},
+                 years=np.arange(1, period + 1))
+            for index, period in enumerate(periods)]
+
@@ -0,0 +1,329 @@
+"""
+Declarative description of every Project Details dialog.
+
+Each dialog is described once by a ``DialogSchema``: its sections, the
+fields in each section with their unit, default and allowed range, and
+repeated groups such as the material lines of the structure dialogs.
+``schema_dialog`` builds the Qt dialogs from these schemas at runtime, and
+``validate`` / ``coerce`` use the same description to check saved data and
+turn it into typed inputs for headless computations.
+"""
+
+
+class Field(object):
+    """One input of a dialog."""
+
+    def __init__(self, key, label, kind="number", unit="", default=None,
+                 minimum=None, maximum=None, choices=None, help_text=""):
+        """
+        Args:
+            key (str): Key of the value in the saved form data.
+            label (str): Text shown next to the input.
+            kind (str): "number", "integer", "choice" or "text".
+            unit (str): Unit code shown after the input, e.g. "%" or "km"; must
+                be one of ``units.UNITS``.
+            default: Value used when nothing has been saved.
+            minimum (float): Smallest allowed value of numeric fields.
+            maximum (float): Largest allowed value of numeric fields.
+            choices (list): Allowed values of choice fields.
+            help_text (str): Longer description shown as a tooltip.
+        """
+        self.key = key
+        self.label = label
+        self.kind = kind
+        self.unit = unit
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = choices or []
+        self.help_text = help_text
+
+
+class Section(object):
+    """A titled block of fields. Repeated sections hold a list of rows."""
+
+    def __init__(self, key, title, fields, repeated=False, add_label="+ Add"):
+        """
+        Args:
+            key (str): Key of the section rows in the saved data (repeated
+                sections only; fields of plain sections are saved at top level).
+            title (str): Heading shown above the fields.
+            fields (list): The ``Field`` objects of the section.
+            repeated (bool): Whether the user can add more rows of fields.
+            add_label (str): Text of the button adding a row.
+        """
+        self.key = key
+        self.title = title
+        self.fields = fields
+        self.repeated = repeated
+        self.add_label = add_label
+
+
+class DialogSchema(object):
+    """The full description of one Project Details dialog."""
+
+    def __init__(self, name, title, sections):
+        """
+        Args:
+            name (str): Window name used with ``save_form_data``.
+            title (str): Title of the dialog and its navigation entry.
+            sections (list): The ``Section`` objects of the dialog.
+        """
+        self.name = name
+        self.title = title
+        self.sections = sections
+
+    def fields(self):
+        """Return all fields of plain (not repeated) sections."""
+        return [field for section in self.sections if not section.repeated for field in section.fields]
+
+
+def _structure_schema(name, title, components):
+    """Schema shared by the Foundation, Super-, Sub-Structure and Miscellaneous dialogs."""
+    return DialogSchema(name, title, [
+        Section("component", "Components", [
+            Field("component", "Component", "choice", choices=components, default=components[0]),
+        ]),
+        Section("materials", "Materials", [
+            Field("material", "Material Type and Grade", "choice",
+                  choices=["Concrete", "Steel"], default="Concrete"),
+            Field("grade", "Grade", "text", default=""),
+            Field("rate_source", "Rate Data Source", "text", default=""),
+            Field("quantity", "Quantity", "number", default=0.0, minimum=0.0, maximum=1e9),
+            Field("unit", "Unit", "choice", choices=["m3", "kg", "MT"], default="m3"),
+            Field("rate", "Rate", "number", unit="INR/unit", default=0.0, minimum=0.0, maximum=1e9,
+                  help_text="Rate per unit of the quantity"),
+        ], repeated=True, add_label="+ Add Material"),
+    ])
+
+
+FOUNDATION = _structure_schema("Foundation_Dialog", "Foundation",
+                               ["Earthwork", "RCC in Foundation"])
+
+SUPER_STRUCTURE = _structure_schema("SuperStructure_Dialog", "Super-Structure",
+                                    ["Deck", "Cables"])
+
+SUB_STRUCTURE = _structure_schema("SubStructure_Dialog", "Sub-Structure",
+                                  ["Piers", "Abutment"])
+
+MISCELLANEOUS = _structure_schema("Miscellaneous_Dialog", "Miscellaneous",
+                                  ["Expansion Joint", "Bearing"])
+
+FINANCIAL = DialogSchema("FinancialData_Dialog", "Financial Data", [
+    Section("financial", "Financial Data", [
+        Field("real_discount_rate", "Real Discount Rate", unit="%", default=5.0, minimum=0.0, maximum=30.0),
+        Field("interest_rate", "Interest Rate", unit="%", default=8.0, minimum=0.0, maximum=30.0),
+        Field("investment_ratio", "Investment Ratio", default=0.5, minimum=0.0, maximum=1.0,
+              help_text="Share of the construction cost financed by borrowing"),
+        Field("study_period", "Duration of Study", "integer", unit="years", default=50, minimum=1, maximum=150),
+        Field("construction_time", "Time for construction of Base Project", "number", unit="years",
+              default=2.0, minimum=0.0, maximum=20.0),
+    ]),
+])
+
+CARBON_EMISSION = DialogSchema("CarbonEmission_Dialog", "Carbon Emission Data", [
+    Section("component", "Components", [
+        Field("component", "Component", "choice", choices=["Earthwork", "RCC in Foundation"],
+              default="Earthwork"),
+    ]),
+    Section("materials", "Materials", [
+        Field("material", "Material Type and Grade", "choice", choices=["Concrete", "Steel"], default="Concrete"),
+        Field("quantity", "Quantity", "number", default=0.0, minimum=0.0, maximum=1e9),
+        Field("unit", "Unit", "choice", choices=["m3", "kg", "MT"], default="m3"),
+        Field("emission_factor", "Carbon Emission Factor", unit="kgCO2e/kg", default=0.0,
+              minimum=0.0, maximum=100.0),
+        Field("embodied_energy", "Embodied Carbon Energy", unit="MJ/kg", default=0.0,
+              minimum=0.0, maximum=1000.0),
+    ], repeated=True, add_label="+ Add Material"),
+])
+
+BRIDGE_TRAFFIC = DialogSchema("BridgeTraffic_Dialog", "Bridge and Traffic Data", [
+    Section("road", "Bridge and Traffic Data", [
+        Field("number_of_lanes", "Number of Lanes", "choice", choices=[2, 4, 6], default=2),
+        Field("reroute_distance", "Additional Re-Route Distance", unit="km", default=0.0,
+              minimum=0.0, maximum=500.0),
+        Field("road_roughness", "Road Roughness", unit="mm/km", default=2000.0, minimum=0.0, maximum=20000.0),
+        Field("rise_and_fall", "Road Rise and Fall (RF)", unit="m/km", default=0.0, minimum=0.0, maximum=200.0),
+        Field("road_type", "Type of Road", "choice",
+              choices=["National Highway", "State Highway", "District Road"], default="National Highway"),
+        Field("traffic_growth", "Annual Increase in Traffic", unit="%", default=5.0, minimum=0.0, maximum=25.0,
+              help_text="Annual Increase in Traffic if Re-Routing duration increases more than a year"),
+    ]),
+    Section("composition", "Composition of Various Vehicles", [
+        Field("cars", "Cars", unit="PCU/D", default=0.0, minimum=0.0, maximum=1e6),
+        Field("buses", "Buses", unit="PCU/D", default=0.0, minimum=0.0, maximum=1e6),
+        Field("lcv", "LCV", unit="PCU/D", default=0.0, minimum=0.0, maximum=1e6),
+        Field("mcv", "MCV", unit="PCU/D", default=0.0, minimum=0.0, maximum=1e6),
+        Field("hcv", "HCV", unit="PCU/D", default=0.0, minimum=0.0, maximum=1e6),
+    ]),
+])
+
+MAINTENANCE = DialogSchema("Maintenance_Dialog", "Maintenance and Repair", [
+    Section("maintenance", "Maintenance and Repair Data", [
+        Field("periodic_maintenance_rate", "Periodic Maintenance Cost Rate", unit="%", default=0.55,
+              minimum=0.0, maximum=100.0,
+              help_text="Periodic Maintenance Cost rate as percentage to total construction cost"),
+        Field("routine_inspection_rate", "Routine Inspection Cost Rate", unit="%", default=0.1,
+              minimum=0.0, maximum=100.0,
+              help_text="Annual Routine Inspection cost rate as percentage of total construction cost"),
+        Field("repair_rehabilitation_rate", "Repair and Rehabilitation Cost Rate", unit="%", default=10.0,
+              minimum=0.0, maximum=100.0,
+              help_text="Repair and Rehabilitation cost rate as percentage of total construction cost"),
+        Field("periodic_maintenance_frequency", "Frequency of Periodic Maintenance", "integer", unit="years",
+              default=5, minimum=1, maximum=100),
+        Field("routine_inspection_frequency", "Frequency of Routine Inspection", "integer", unit="years",
+              default=1, minimum=1, maximum=100),
+    ]),
+    Section("condition", "Condition-Triggered Interventions", [
+        Field("repair_condition_state", "Repair at Condition State", "integer", default=4, minimum=3, maximum=5,
+              help_text="Repair a component once it reaches this state (1 = Good ... 5 = Failed)"),
+        Field("reconstruction_condition_state", "Reconstruct at Condition State", "integer", default=5,
+              minimum=2, maximum=5,
+              help_text="Reconstruct a component once it reaches this state (1 = Good ... 5 = Failed)"),
+    ]),
+])
+
+DEMOLITION = DialogSchema("Demolition_Dialog", "Demolition and Recycling", [
+    Section("demolition", "Demolition and Recycling Data", [
+        Field("demolition_rate", "Demolition Cost Rate", unit="%", default=10.0, minimum=0.0, maximum=100.0,
+              help_text="Demolition Cost rate as percentage to total construction cost"),
+        Field("steel_scrap_value", "Scrap Value of Structural Steel", unit="INR/MT", default=30000.0,
+              minimum=0.0, maximum=1e6),
+        Field("steel_scrap", "Structural Steel Scrap", unit="%", default=90.0, minimum=0.0, maximum=100.0),
+    ]),
+])
+
+# All dialogs in the order of the Project Details navigation
+SCHEMAS = [
+    FOUNDATION,
+    SUPER_STRUCTURE,
+    SUB_STRUCTURE,
+    MISCELLANEOUS,
+    FINANCIAL,
+    CARBON_EMISSION,
+    BRIDGE_TRAFFIC,
+    MAINTENANCE,
+    DEMOLITION,
+]
+
+SCHEMAS_BY_NAME = {schema.name: schema for schema in SCHEMAS}
+
+
+def default_row(section):
+    """Return the default values of one row of a repeated section."""
+    return {field.key: field.default for field in section.fields}
+
+
+def defaults(schema):
+    """
+    Return the default data of a dialog.
+
+    Args:
+        schema (DialogSchema): The dialog.
+
+    Returns:
+        dict: Defaults of every field, with one default row per repeated section.
+    """
+    data = {field.key: field.default for field in schema.fields()}
+    for section in schema.sections:
+        if section.repeated:
+            data[section.key] = [default_row(section)]
+    return data
+
+
+def _coerce_value(field, value):
+    """Convert a raw saved value to the field type. Raises ValueError."""
+    if value is None or value == "":
+        return field.default
+    if field.kind == "number":
+        return float(value)
+    if field.kind == "integer":
+        return int(float(value))
+    if field.kind == "choice":
+        for choice in field.choices:
+            if str(choice) == str(value):
+                return choice
+        raise ValueError(f"{value!r} is not one of {field.choices}")
+    return str(value)
+
+
+def _check_field(field, value, errors, prefix=""):
+    try:
+        value = _coerce_value(field, value)
+    except ValueError:
+        errors.append(f"{prefix}{field.label}: {value!r} is not a valid value")
+        return field.default
+    if field.kind in ("number", "integer"):
+        if field.minimum is not None and value < field.minimum:
+            errors.append(f"{prefix}{field.label}: must be at least {field.minimum:g} {field.unit}".rstrip())
+        if field.maximum is not None and value > field.maximum:
+            errors.append(f"{prefix}{field.label}: must be at most {field.maximum:g} {field.unit}".rstrip())
+    return value
+
+
+def validate(schema, data):
+    """
+    Check saved data against the schema.
+
+    Args:
+        schema (DialogSchema): The dialog.
+        data (dict): Saved form data of the dialog.
+
+    Returns:
+        list: Human readable error messages, empty when the data is valid.
+    """
+    errors = []
+    _coerce_all(schema, data, errors)
+    return errors
+
+
+def _coerce_all(schema, data, errors):
+    result = {}
+    for field in schema.fields():
+        result[field.key] = _check_field(field, data.get(field.key), errors)
+    for section in schema.sections:
+        if not section.repeated:
+            continue
+        rows = []
+        for index, row in enumerate(data.get(section.key) or [default_row(section)], start=1):
+            prefix = f"{section.title} {index} - "
+            rows.append({field.key: _check_field(field, row.get(field.key), errors, prefix)
+                         for field in section.fields})
+        result[section.key] = rows
+    return result
+
+
+def coerce(schema, data):
+    """
+    Turn saved form data into typed values for computations.
+
+    Missing fields take their defaults.
+
+    Args:
+        schema (DialogSchema): The dialog.
+        data (dict): Saved form data of the dialog.
+
+    Returns:
+        dict: Typed values of every field.
+
+    Raises:
+        ValueError: If the data does not satisfy the schema.
+    """
+    errors = []
+    result = _coerce_all(schema, data, errors)
+    if errors:
+        raise ValueError(f"{schema.title}: " + "; ".join(errors))
+    return result
+
+
+def coerce_project(project_form_data):
+    """
+    Coerce the saved data of every dialog of a project.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        dict: Window name -> typed values, for every known dialog.
+    """
+    return {schema.name: coerce(schema, project_form_data.get(schema.name, {})) for schema in SCHEMAS}
@@ -0,0 +1,135 @@
+"""
+End-of-life material flows of bridges.
+
+Every material line of the structure dialogs is demolished at the end of
+the study period. Its mass is split over the ``FATES`` by a material-flow
+matrix: one row per material, one column per fate, rows summing to one.
+The Structural Steel Scrap share from the Demolition and Recycling dialog
+sets the recycled share of steel; other shares come from
+``DEFAULT_FLOWS``.
+
+For a portfolio, all material lines of all bridges are collected into flat
+arrays once. Summing them per bridge and material is one ``bincount``,
+applying each bridge's flow matrix is one broadcast product, and every
+cost head is a product of the resulting (bridges, materials, fates)
+tonnage with a price array.
+"""
+
+import numpy as np
+
+import dialog_schema
+import units
+from deterioration import STRUCTURE_SCHEMAS
+from units import MATERIALS
+
+
+FATES = ["Reuse", "Recycling", "Landfill"]
+REUSE, RECYCLING, LANDFILL = range(len(FATES))
+
+# Share of each material going to each fate; the steel recycling share is
+# replaced by the Structural Steel Scrap input
+DEFAULT_FLOWS = {
+    "Concrete": (0.0, 0.3, 0.7),
+    "Steel": (0.0, 0.9, 0.1),
+}
+
+# INR per tonne
+LANDFILL_COST = 500.0
+RECYCLING_COST = {"Concrete": 300.0, "Steel": 1500.0}
+# Credit for recycled concrete aggregate; steel uses the Scrap Value input
+CONCRETE_RECYCLING_CREDIT = 200.0
+
+
+def flow_matrices(steel_scrap):
+    """
+    Material-flow matrices of many bridges.
+
+    Args:
+        steel_scrap (array): Shape (n,) recycled share of steel as a fraction.
+
+    Returns:
+        ndarray: Shape (n, materials, fates).
+    """
+    steel_scrap = np.asarray(steel_scrap, dtype=float)
+    flows = np.broadcast_to(np.array([DEFAULT_FLOWS[name] for name in MATERIALS]),
+                            (len(steel_scrap), len(MATERIALS), len(FATES))).copy()
+    steel = MATERIALS.index("Steel")
+    flows[:, steel, REUSE] = 0.0
+    flows[:, steel, RECYCLING] = steel_scrap
+    flows[:, steel, LANDFILL] = 1.0 - steel_scrap
+    return flows
+
+
+def _material_lines(projects):
+    """Flatten the material lines of all bridges into arrays, in tonnes and INR."""
+    owners, materials, tonnes, rates = [], [], [], []
+    demolition = []
+    for index, project_form_data in enumerate(projects):
+        for schema in STRUCTURE_SCHEMAS:
+            if schema.name not in project_form_data:
+                continue
+            for row in units.coerce(schema, project_form_data[schema.name])["materials"]:
+                owners.append(index)
+                materials.append(row["material"])
+                tonnes.append(row["quantity"])
+                rates.append(row["rate"])
+        demolition.append(units.coerce(dialog_schema.DEMOLITION,
+                                       project_form_data.get(dialog_schema.DEMOLITION.name, {})))
+    tonnes = np.array(tonnes, dtype=float)
+    costs = tonnes * np.array(rates, dtype=float)
+    material_index = np.array([MATERIALS.index(material) for material in materials], dtype=int)
+    return (np.array(owners, dtype=int), material_index, tonnes, costs, demolition)
+
+
+def portfolio_end_of_life(projects):
+    """
+    End-of-life costs of every bridge of a portfolio.
+
+    Args:
+        projects (list): Saved form data (window name -> data) of each bridge.
+
+    Returns:
+        dict: Arrays of shape (n,) with ``demolition_disposal_cost``,
+        ``recycling_cost`` and ``recycling_credit`` in INR, and ``flows``
+        of shape (n, materials, fates) in tonnes.
+    """
+    owners, materials, tonnes, costs, demolition = _material_lines(projects)
+    n = len(projects)
+    n_materials = len(MATERIALS)
+
+    mass = np.bincount(owners * n_materials + materials, weights=tonnes,
+                       minlength=n * n_materials).reshape(n, n_materials)
+    construction_costs = np.bincount(owners, weights=costs, minlength=n)
+    demolition_rate = np.array([values["demolition_rate"] for values in demolition], dtype=float)
+    steel_scrap = np.array([values["steel_scrap"] for values in demolition], dtype=float)
+    steel_scrap_value = np.array([values["steel_scrap_value"] for values in demolition], dtype=float)
+
+    flows = mass[:, :, None] * flow_matrices(steel_scrap)
+    recycled = flows[:, :, RECYCLING]
+    recycling_prices = np.array([RECYCLING_COST[name] for name in MATERIALS])
+    credit_prices = np.zeros((n, n_materials))
+    credit_prices[:, MATERIALS.index("Concrete")] = CONCRETE_RECYCLING_CREDIT
+    credit_prices[:, MATERIALS.index("Steel")] = steel_scrap_value
+
+    return {
+        "demolition_disposal_cost": construction_costs * demolition_rate
+                                    + flows[:, :, LANDFILL].sum(axis=1) * LANDFILL_COST,
+        "recycling_cost": recycled @ recycling_prices,
+        "recycling_credit": (recycled * credit_prices).sum(axis=1),
+        "flows": flows,
+    }
+
+
+def end_of_life(project_form_data):
+    """
+    End-of-life costs of one project.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Returns:
+        dict: ``demolition_disposal_cost``, ``recycling_cost`` and
+        ``recycling_credit`` in INR, and the (materials, fates) ``flows``.
+    """
+    result = portfolio_end_of_life([project_form_data])
+    return {key: value[0] if key == "flows" else float(value[0]) for key, value in result.items()}
@@ -1,6 +1,19 @@
 # Global dictionary to store form data
 form_data = {}
 
+# Autosave journal receiving every change, see autosave_journal.start()
+journal = None
+
+def attach_journal(new_journal):
+    """
+    Send every following change of the form data to an autosave journal.
+
+    Args:
+        new_journal (AutosaveJournal): The journal, or None to stop journaling.
+    """
+    global journal
+    journal = new_journal
+
 def save_form_data(window_name, data):
     """
     Save form data to the global dictionary.
@@ -10,6 +23,33 @@ def save_form_data(window_name, data):
         data (dict): The data to save.
     """
     form_data[window_name] = data
+    if journal is not None:
+        journal.record_window(window_name, data)
+
+def record_field_edit(window_name, field, value):
+    """
+    Save a single edited field to the global dictionary.
+
+    Args:
+        window_name (str): The name of the window/dialog.
+        field (str): The field that was edited.
+        value: The new value of the field.
+    """
+    form_data.setdefault(window_name, {})[field] = value
+    if journal is not None:
+        journal.record(window_name, field, value)
+
+def replace_form_data(data):
+    """
+    Replace all saved form data, e.g. when restoring a saved version.
+
+    Args:
+        data (dict): The new data of every window/dialog.
+    """
+    form_data.clear()
+    form_data.update(data)
+    if journal is not None:
+        journal.record_reset(data)
 
 def get_form_data(window_name):
     """
@@ -0,0 +1,315 @@
+"""
+Life-cycle cost engine.
+
+``evaluate`` turns the saved form data of a project into the present value
+of every cost head in every year of the study period, an array of shape
+(heads, years). ``HEAD_MAP`` is a fixed one-hot (heads, pillars, stages)
+array that assigns each cost head to a pillar (economic, social,
+environmental) and a life-cycle stage. Contracting the two gives the
+(pillars, stages, years) result tensor once per evaluation. Pies, donuts
+and stacked bars are then sums over axes of that array instead of each
+chart adding up cost heads again.
+
+Year 0 is construction and the last year is the end of the study period,
+when the bridge is demolished. All values are in INR.
+"""
+
+import io
+
+import numpy as np
+
+import dialog_schema
+import tracing
+import traffic
+import units
+from carbon_pricing import DEFAULT_CARBON_PRICE, discount_factors, emission_series, flat
+from deterioration import maintenance_cash_flows, portfolio_cash_flows, project_components
+from end_of_life import end_of_life, portfolio_end_of_life
+from result_cache import content_key, default_cache
+
+
+PILLARS = ["Economic", "Social", "Environmental"]
+STAGES = ["Initial Stage", "Use Stage", "End-of-Life Stage", "Beyond-Life Stage"]
+
+# Cost head, pillar, stage
+COST_HEADS = [
+    ("Initial Construction Cost", "Economic", "Initial Stage"),
+    ("Initial Carbon Emission Cost", "Environmental", "Initial Stage"),
+    ("Time Cost", "Social", "Initial Stage"),
+    ("User Time Cost", "Social", "Use Stage"),
+    ("Carbon Emission due to Re-Routing", "Environmental", "Use Stage"),
+    ("Periodic Maintenance Costs", "Economic", "Use Stage"),
+    ("Maintenance Emission Costs", "Environmental", "Use Stage"),
+    ("Routine Inspection Costs", "Economic", "Use Stage"),
+    ("Repair & Rehabilitation Costs", "Economic", "Use Stage"),
+    ("Reconstruction Costs", "Economic", "Use Stage"),
+    ("Demolition & Disposal Cost", "Economic", "End-of-Life Stage"),
+    ("Recycling Cost", "Economic", "End-of-Life Stage"),
+    ("Recycling Credit", "Economic", "Beyond-Life Stage"),
+]
+HEAD_LABELS = [label for label, _pillar, _stage in COST_HEADS]
+HEAD_INDEX = {label: index for index, label in enumerate(HEAD_LABELS)}
+
+HEAD_MAP = np.zeros((len(COST_HEADS), len(PILLARS), len(STAGES)))
+for _index, (_label, _pillar, _stage) in enumerate(COST_HEADS):
+    HEAD_MAP[_index, PILLARS.index(_pillar), STAGES.index(_stage)] = 1.0
+HEAD_MAP.setflags(write=False)
+
+# Days the bridge is closed for one repair
+REPAIR_CLOSURE_DAYS = 30.0
+
+# One lakh, the unit of the result charts
+LAKH = 1e5
+
+# Bump when the computation changes so that cached results are not reused
+ENGINE_VERSION = 3
+
+
+class LCCResult(object):
+    """Present values of a project by cost head and year, with chart reductions."""
+
+    def __init__(self, head_values, study_period):
+        """
+        Args:
+            head_values (ndarray): Shape (heads, years), present values in INR.
+            study_period (int): Study period in years.
+        """
+        self.head_values = head_values
+        self.study_period = study_period
+        self.tensor = np.einsum("hps,hy->psy", HEAD_MAP, head_values)
+        self.head_values.setflags(write=False)
+        self.tensor.setflags(write=False)
+
+    def head_totals(self):
+        """Present value of each cost head, in ``HEAD_LABELS`` order."""
+        return self.head_values.sum(axis=1)
+
+    def stage_totals(self, pillar=None):
+        """Present value per stage, of one pillar or as a (pillars, stages) array."""
+        totals = self.tensor.sum(axis=2)
+        return totals if pillar is None else totals[PILLARS.index(pillar)]
+
+    def pillar_totals(self):
+        """Present value of each pillar."""
+        return self.tensor.sum(axis=(1, 2))
+
+    def yearly(self, pillar=None):
+        """(stages, years) present values of one pillar, or of all pillars together."""
+        return self.tensor.sum(axis=0) if pillar is None else self.tensor[PILLARS.index(pillar)]
+
+    def total(self):
+        """Total life-cycle cost."""
+        return float(self.head_values.sum())
+
+    def report_results(self, scale=LAKH):
+        """
+        Results in the form used by ``report_generator.project_pages``.
+
+        Args:
+            scale (float): Unit of the values, one lakh by default.
+
+        Returns:
+            dict: ``cost_heads``, ``stages`` (per pillar, negative credits
+            left out so they can be drawn as pies) and ``study_period``.
+        """
+        head_totals = self.head_totals() / scale
+        stage_totals = np.clip(self.stage_totals(), 0.0, None) / scale
+        return {
+            "cost_heads": [(label, round(float(value), 2)) for label, value in zip(HEAD_LABELS, head_totals)],
+            "stages": {pillar: [round(float(value), 2) for value in stage_totals[index]]
+                       for index, pillar in enumerate(PILLARS)},
+            "study_period": self.study_period,
+        }
+
+
+def _coerced(project_form_data, schema):
+    return units.coerce(schema, project_form_data.get(schema.name, {}))
+
+
+def head_values(project_form_data, carbon_prices=None, repairs=None, disposal=None):
+    """
+    Present value of every cost head in every year.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        carbon_prices (array): INR/tCO2e for years 0..study period; flat at
+            ``DEFAULT_CARBON_PRICE`` by default.
+        repairs (dict): Result of ``maintenance_cash_flows`` if already
+            computed, e.g. for a whole batch by ``portfolio_cash_flows``.
+        disposal (dict): Result of ``end_of_life`` if already computed.
+
+    Returns:
+        ndarray: Shape (heads, study period + 1) in INR.
+    """
+    financial = _coerced(project_form_data, dialog_schema.FINANCIAL)
+    maintenance = _coerced(project_form_data, dialog_schema.MAINTENANCE)
+    years = financial["study_period"]
+    year_index = np.arange(years + 1)
+    if carbon_prices is None:
+        carbon_prices = flat(DEFAULT_CARBON_PRICE, years + 1)
+
+    values = np.zeros((len(COST_HEADS), years + 1))
+    with tracing.span("construction", "compute"):
+        construction_cost = project_components(project_form_data)[1].sum()
+    values[HEAD_INDEX["Initial Construction Cost"], 0] = construction_cost
+
+    with tracing.span("emissions", "compute"):
+        emissions = emission_series(project_form_data)
+    values[HEAD_INDEX["Initial Carbon Emission Cost"]] = emissions["initial"]
+    values[HEAD_INDEX["Maintenance Emission Costs"]] = emissions["maintenance"]
+
+    # Detour driving while the bridge is closed: during construction, and
+    # for repairs and reconstructions in the use stage
+    with tracing.span("traffic", "compute"):
+        daily_pcu_km = traffic.reroute_pcu_km(project_form_data.get(dialog_schema.BRIDGE_TRAFFIC.name, {}), years + 1)
+    construction_days = financial["construction_time"] * 365.0
+    values[HEAD_INDEX["Time Cost"], 0] = daily_pcu_km[0] * construction_days * traffic.REROUTE_COST_PER_PCU_KM
+
+    if repairs is None:
+        with tracing.span("deterioration", "compute"):
+            repairs = maintenance_cash_flows(project_form_data)
+    closure_days = np.zeros(years + 1)
+    closure_days[1:] = (repairs["repair_events"] * REPAIR_CLOSURE_DAYS
+                        + repairs["reconstruction_events"] * construction_days)
+    detour = daily_pcu_km * closure_days
+    values[HEAD_INDEX["User Time Cost"]] = detour * traffic.REROUTE_COST_PER_PCU_KM
+    values[HEAD_INDEX["Carbon Emission due to Re-Routing"]] = detour * traffic.REROUTE_EMISSION_PER_PCU_KM
+    values[HEAD_INDEX["Repair & Rehabilitation Costs"], 1:] = repairs["repair"]
+    values[HEAD_INDEX["Reconstruction Costs"], 1:] = repairs["reconstruction"]
+
+    periodic = (year_index > 0) & (year_index % maintenance["periodic_maintenance_frequency"] == 0)
+    inspection = (year_index > 0) & (year_index % maintenance["routine_inspection_frequency"] == 0)
+    values[HEAD_INDEX["Periodic Maintenance Costs"]] = (
+        periodic * construction_cost * maintenance["periodic_maintenance_rate"])
+    values[HEAD_INDEX["Routine Inspection Costs"]] = (
+        inspection * construction_cost * maintenance["routine_inspection_rate"])
+
+    if disposal is None:
+        with tracing.span("end of life", "compute"):
+            disposal = end_of_life(project_form_data)
+    values[HEAD_INDEX["Demolition & Disposal Cost"], years] = disposal["demolition_disposal_cost"]
+    values[HEAD_INDEX["Recycling Cost"], years] = disposal["recycling_cost"]
+    values[HEAD_INDEX["Recycling Credit"], years] = -disposal["recycling_credit"]
+
+    # Emission rows are in tonnes CO2e until priced here
+    for label in ("Initial Carbon Emission Cost", "Maintenance Emission Costs",
+                  "Carbon Emission due to Re-Routing"):
+        values[HEAD_INDEX[label]] *= carbon_prices
+    return values * discount_factors(financial["real_discount_rate"], years + 1)
+
+
+def _encode(result):
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, head_values=result.head_values, study_period=result.study_period)
+    return buffer.getvalue()
+
+
+def _decode(blob):
+    arrays = np.load(io.BytesIO(blob))
+    return LCCResult(arrays["head_values"].copy(), int(arrays["study_period"]))
+
+
+@tracing.traced("compute", "lcc_engine.evaluate")
+def _compute(project_form_data):
+    financial = _coerced(project_form_data, dialog_schema.FINANCIAL)
+    return LCCResult(head_values(project_form_data), financial["study_period"])
+
+
+def evaluate(project_form_data, cache=None):
+    """
+    Life-cycle costs of a project.
+
+    Results are cached on a hash of the form data, in memory and on disk,
+    so reopening an unchanged project shows its results without computing
+    them again.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        cache (ResultCache): Cache to use; the application cache by default.
+
+    Returns:
+        LCCResult: The read-only result.
+    """
+    cache = cache if cache is not None else default_cache()
+    key = content_key(project_form_data, f"lcc_engine/{ENGINE_VERSION}")
+    return cache.get_or_compute(key, lambda: _compute(project_form_data), _encode, _decode)
+
+
+@tracing.traced("compute", "lcc_engine.evaluate_batch")
+def evaluate_batch(projects, cache=None):
+    """
+    Life-cycle costs of many projects, computed together.
+
+    Identical projects are computed once and cached projects are looked
+    up. The deterioration and end-of-life stages of the remaining projects
+    are evaluated as one stacked batch, the per-project rest of
+    ``head_values`` only assembles and discounts their rows.
+
+    Args:
+        projects (list): Saved form data of each project.
+        cache (ResultCache): Cache to use; the application cache by default.
+
+    Returns:
+        list: One ``LCCResult`` per project, in order.
+    """
+    cache = cache if cache is not None else default_cache()
+    keys = [content_key(project_form_data, f"lcc_engine/{ENGINE_VERSION}") for project_form_data in projects]
+    results = {}
+    missing = {}
+    for key, project_form_data in zip(keys, projects):
+        if key in results or key in missing:
+            continue
+        result = cache.get(key, _decode)
+        if result is None:
+            missing[key] = project_form_data
+        else:
+            results[key] = result
+
+    if missing:
+        for key, values in zip(missing, batch_head_values(list(missing.values()))):
+            results[key] = LCCResult(values, values.shape[1] - 1)
+        # One transaction for the batch, which also writes the hits' use times
+        cache.put_many([(key, results[key]) for key in missing], _encode)
+    else:
+        cache.flush()
+    return [results[key] for key in keys]
+
+
+def batch_head_values(projects, carbon_prices=None):
+    """
+    ``head_values`` of many projects, with their deterioration and
+    end-of-life stages evaluated as one stacked batch.
+
+    Args:
+        projects (list): Saved form data of each project.
+        carbon_prices (list): Carbon prices of each project, see
+            ``head_values``; the default price for all by default.
+
+    Returns:
+        list: One (heads, study period + 1) array per project.
+    """
+    with tracing.span("deterioration", "compute", batch=len(projects)):
+        repairs = portfolio_cash_flows(projects)
+    with tracing.span("end of life", "compute", batch=len(projects)):
+        disposal = portfolio_end_of_life(projects)
+    values = []
+    for index, project_form_data in enumerate(projects):
+        project_disposal = {name: value[index] if name == "flows" else float(value[index])
+                            for name, value in disposal.items()}
+        prices = None if carbon_prices is None else carbon_prices[index]
+        values.append(head_values(project_form_data, prices, repairs[index], project_disposal))
+    return values
+
+
+def evaluate_portfolio(projects, cache=None):
+    """
+    Life-cycle costs of many projects; unchanged projects cost one lookup each.
+
+    Args:
+        projects (iterable): Saved form data of each project.
+        cache (ResultCache): Cache to use; the application cache by default.
+
+    Returns:
+        list: One ``LCCResult`` per project.
+    """
+    return evaluate_batch(list(projects), cache)
@@ -0,0 +1,317 @@
+"""
+Cheapest maintenance policy of bridge components.
+
+Each year a component in condition state ``s`` gets one of the ``ACTIONS``.
+The action costs a share of the component's construction cost, sets the
+condition the component starts the year in, and the component then
+deteriorates with the Markov model of ``deterioration``. Being in a poor
+state also costs something every year (``STATE_COSTS``: lost service and
+risk), so doing nothing is not free.
+
+The policy is found by discounted value iteration, or by backward
+induction over the study period for a 0 % discount rate, where the best
+action also depends on the years left and the policy has one row per
+year. All components
+of all bridges are solved together: the value function is an (n, states) array,
+and one iteration evaluates every action of every component with a single
+batched product against the (n, actions, states, states) transition
+tensor. Costs are proportional to the construction cost, so components
+that differ only in cost share one solution.
+"""
+
+import numpy as np
+
+import dialog_schema
+import deterioration
+import units
+
+
+ACTIONS = ["Do Nothing", "Maintain", "Repair", "Reconstruct"]
+DO_NOTHING, MAINTAIN, REPAIR, RECONSTRUCT = range(len(ACTIONS))
+
+# Periodic maintenance slows deterioration by this factor for the year
+MAINTAINED_RATE_FACTOR = 0.5
+
+# Yearly cost of being in each condition state, as a share of construction cost
+STATE_COSTS = (0.0, 0.001, 0.005, 0.02, 0.25)
+
+
+def yearly_maintenance_rate(maintenance):
+    """
+    Cost of one year of the Maintain action, as a share of construction cost.
+
+    The engine charges ``periodic_maintenance_rate`` once every
+    ``periodic_maintenance_frequency`` years, so a year of maintenance
+    costs that share of the rate.
+
+    Args:
+        maintenance (dict): Coerced maintenance dialog values.
+    """
+    return maintenance["periodic_maintenance_rate"] / maintenance["periodic_maintenance_frequency"]
+
+
+def discount_factor(real_discount_rate):
+    """Yearly discount factor for a real discount rate as a fraction."""
+    return 1.0 / (1.0 + np.asarray(real_discount_rate, dtype=float))
+
+
+def action_model(rates, construction_costs, maintenance_rate, repair_rate, reconstruction_rate, closure_costs=0.0):
+    """
+    Transition tensor and costs of every action for many components.
+
+    Args:
+        rates (array): Shape (n, N_STATES - 1) deterioration probabilities.
+        construction_costs (array): Shape (n,) construction cost of each component.
+        maintenance_rate (float or array): Yearly maintenance cost, share of
+            construction cost, see ``yearly_maintenance_rate``.
+        repair_rate (float or array): Repair cost, share of construction cost.
+        reconstruction_rate (float or array): Reconstruction cost, share of construction cost.
+        closure_costs (float or array): Yearly user cost while a component is
+            failed and traffic has to re-route.
+
+    Returns:
+        tuple: ``transitions`` of shape (n, actions, S, S) and ``costs`` of
+        shape (n, actions, S), the cost of taking each action in each state
+        including that year's condition cost.
+    """
+    rates = np.asarray(rates, dtype=float)
+    n = rates.shape[0]
+    states = deterioration.N_STATES
+    deteriorate = deterioration.transition_matrices(rates)
+    maintained = deterioration.transition_matrices(rates * MAINTAINED_RATE_FACTOR)
+
+    repaired = np.eye(states)
+    repaired[deterioration.REPAIRED_STATE + 1:] = 0.0
+    repaired[deterioration.REPAIRED_STATE + 1:, deterioration.REPAIRED_STATE] = 1.0
+    reconstructed = np.zeros((states, states))
+    reconstructed[:, deterioration.RECONSTRUCTED_STATE] = 1.0
+
+    transitions = np.empty((n, len(ACTIONS), states, states))
+    transitions[:, DO_NOTHING] = deteriorate
+    transitions[:, MAINTAIN] = maintained
+    transitions[:, REPAIR] = repaired @ deteriorate
+    transitions[:, RECONSTRUCT] = reconstructed @ deteriorate
+
+    construction_costs = np.asarray(construction_costs, dtype=float)
+    shares = np.zeros((n, len(ACTIONS)))
+    shares[:, MAINTAIN] = np.broadcast_to(maintenance_rate, (n,))
+    shares[:, REPAIR] = np.broadcast_to(repair_rate, (n,))
+    shares[:, RECONSTRUCT] = np.broadcast_to(reconstruction_rate, (n,))
+    action_costs = shares[:, :, None] * construction_costs[:, None, None]
+    state_costs = np.outer(construction_costs, STATE_COSTS)
+    state_costs[:, -1] += closure_costs
+    condition_costs = np.einsum("nasj,nj->nas", transitions, state_costs)
+    return transitions, action_costs + condition_costs
+
+
+def value_iteration(transitions, costs, gamma, tolerance=1e-6, max_iterations=10000, horizon=None,
+                    schedule=False):
+    """
+    Solve many discounted MDPs at once.
+
+    With a 0 % discount rate (``gamma`` of 1) the infinite-horizon values
+    are unbounded, so those components are solved by backward induction
+    over a finite ``horizon`` instead, e.g. the study period. They get the
+    policy of the first year, or of every year with ``schedule``.
+
+    Args:
+        transitions (ndarray): Shape (n, actions, S, S).
+        costs (ndarray): Shape (n, actions, S).
+        gamma (float or array): Discount factor, scalar or shape (n,).
+        tolerance (float): Stop once the values are within this share of
+            the component's largest value from the optimum.
+        max_iterations (int): Upper bound on the number of sweeps.
+        horizon (int or array): Years of the undiscounted problems,
+            scalar or shape (n,); required when any ``gamma`` is 1 or more,
+            or with ``schedule``.
+        schedule (bool): Return the policy of every year of the longest
+            horizon; discounted components repeat their stationary policy.
+
+    Returns:
+        tuple: ``policy`` (n, S) action index per state, or (n, years, S)
+        with ``schedule``, ``values`` (n, S) expected discounted cost, and
+        the number of sweeps.
+    """
+    n = costs.shape[0]
+    gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (n,))
+    undiscounted = gamma >= 1.0
+    if (undiscounted.any() or schedule) and horizon is None:
+        raise ValueError("A 0 % discount rate needs a finite horizon such as the study period")
+
+    years = int(np.max(horizon)) if schedule else 1
+    policy = np.zeros((n, years, costs.shape[2]), dtype=int)
+    values = np.zeros((n, costs.shape[2]))
+    sweeps = 0
+    if undiscounted.any():
+        undiscounted_horizon = np.broadcast_to(np.asarray(horizon, dtype=int), (n,))[undiscounted]
+        schedules, values[undiscounted], sweeps = backward_induction(
+            transitions[undiscounted], costs[undiscounted], gamma[undiscounted], undiscounted_horizon,
+            schedule=True)
+        policy[undiscounted] = schedules[:, :years] if schedule else schedules[:, :1]
+    if (~undiscounted).any():
+        discounted = ~undiscounted
+        stationary, values[discounted], discounted_sweeps = _discounted_value_iteration(
+            transitions[discounted], costs[discounted], gamma[discounted], tolerance, max_iterations)
+        policy[discounted] = stationary[:, None, :]
+        sweeps = max(sweeps, discounted_sweeps)
+    return (policy if schedule else policy[:, 0]), values, sweeps
+
+
+def _discounted_value_iteration(transitions, costs, gamma, tolerance, max_iterations):
+    gamma = gamma[:, None, None]
+    # A sweep changing values by at most delta leaves them within
+    # delta * gamma / (1 - gamma) of the optimum
+    gamma_bound = (gamma / (1.0 - gamma))[:, 0, 0]
+    values = costs.min(axis=1)
+    for iteration in range(1, max_iterations + 1):
+        q = costs + gamma * np.einsum("nasj,nj->nas", transitions, values)
+        new_values = q.min(axis=1)
+        change = np.abs(new_values - values).max(axis=1)
+        values = new_values
+        if np.all(change * gamma_bound <= tolerance * values.max(axis=1)):
+            break
+    return q.argmin(axis=1), values, iteration
+
+
+def backward_induction(transitions, costs, gamma, horizon, schedule=False):
+    """
+    Solve many finite-horizon MDPs at once.
+
+    Args:
+        transitions (ndarray): Shape (n, actions, S, S).
+        costs (ndarray): Shape (n, actions, S).
+        gamma (float or array): Discount factor, scalar or shape (n,); may be 1.
+        horizon (int or array): Number of years, scalar or shape (n,).
+        schedule (bool): Return the policy of every year instead of the first.
+
+    Returns:
+        tuple: ``policy`` (n, S) action index per state in the first year,
+        or (n, years, S) for each year of the longest horizon with
+        ``schedule`` (years past a component's horizon repeat its last
+        year), ``values`` (n, S) expected cost over the horizon, and the
+        number of sweeps.
+    """
+    n = costs.shape[0]
+    gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (n,))[:, None, None]
+    horizon = np.broadcast_to(np.asarray(horizon, dtype=int), (n,))
+    years = int(horizon.max())
+    values = np.zeros((n, costs.shape[2]))
+    policy = np.zeros((n, years, costs.shape[2]), dtype=int)
+    q = costs.copy()
+    # Sweep ``years_left`` solves the last ``years_left`` years; components
+    # with a shorter horizon keep their values once they are done
+    for years_left in range(1, years + 1):
+        active = horizon >= years_left
+        q[active] = costs[active] + gamma[active] * np.einsum("nasj,nj->nas", transitions[active], values[active])
+        values[active] = q[active].min(axis=1)
+        policy[active, horizon[active] - years_left] = q[active].argmin(axis=1)
+    if schedule:
+        past_horizon = np.arange(years)[None, :] >= horizon[:, None]
+        policy[past_horizon] = np.repeat(policy[np.arange(n), horizon - 1], years - horizon, axis=0)
+        return policy, values, years
+    return policy[:, 0], values, years
+
+
+def policy_cash_flows(policy, transitions, costs, years, initial=None):
+    """
+    Expected yearly cost of following a policy from a given condition.
+
+    Args:
+        policy (ndarray): Shape (n, S) action per state, or (n, years, S)
+            action per state in each year.
+        transitions (ndarray): Shape (n, actions, S, S).
+        costs (ndarray): Shape (n, actions, S).
+        years (int): Study period in years.
+        initial (array): Shape (n, S) condition at the start; new
+            components by default.
+
+    Returns:
+        ndarray: Shape (n, years) undiscounted expected cost of each year.
+    """
+    n, states = policy.shape[0], policy.shape[-1]
+    rows = np.arange(n)[:, None]
+    columns = np.arange(states)[None, :]
+    if initial is None:
+        initial = np.zeros((n, states))
+        initial[:, deterioration.RECONSTRUCTED_STATE] = 1.0
+    initial = np.asarray(initial, dtype=float)
+    if policy.ndim == 2:
+        chosen_transitions = transitions[rows, policy, columns]
+        chosen_costs = costs[rows, policy, columns]
+        condition = deterioration.propagate(initial, chosen_transitions, years - 1)
+        return np.einsum("nts,ns->nt", condition, chosen_costs)
+
+    flows = np.zeros((n, years))
+    condition = initial
+    for year in range(years):
+        chosen = policy[:, year]
+        flows[:, year] = np.einsum("ns,ns->n", condition, costs[rows, chosen, columns])
+        condition = np.einsum("ns,nsj->nj", condition, transitions[rows, chosen, columns])
+    return flows
+
+
+def solve_portfolio(projects, tolerance=1e-6):
+    """
+    Find the cheapest maintenance policy of every component of many bridges.
+
+    Args:
+        projects (list): Saved form data (window name -> data) of each bridge.
+        tolerance (float): See ``value_iteration``.
+
+    Returns:
+        list: One dict per bridge with its ``components``, ``policy`` (a list
+        of action names per condition state for each component, in the
+        first year), and the discounted ``life_cycle_cost`` of the policy
+        over the study period.
+    """
+    names, rates, costs, parameters, owners = [], [], [], [], []
+    for index, project_form_data in enumerate(projects):
+        maintenance = units.coerce(dialog_schema.MAINTENANCE,
+                                   project_form_data.get(dialog_schema.MAINTENANCE.name, {}))
+        financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+        demolition = units.coerce(dialog_schema.DEMOLITION, project_form_data.get(dialog_schema.DEMOLITION.name, {}))
+        component_names, component_costs = deterioration.project_components(project_form_data)
+        for name, cost in zip(component_names, component_costs):
+            names.append(name)
+            rates.append(deterioration.DETERIORATION_RATES.get(name, deterioration.DEFAULT_RATES))
+            costs.append(cost)
+            parameters.append((yearly_maintenance_rate(maintenance),
+                               maintenance["repair_rehabilitation_rate"],
+                               1.0 + demolition["demolition_rate"],
+                               financial["real_discount_rate"],
+                               financial["study_period"]))
+            owners.append(index)
+
+    results = [{"components": [], "policy": [], "life_cycle_cost": 0.0} for _ in projects]
+    if not names:
+        return results
+
+    # Costs scale with the construction cost, so the policy only depends on
+    # the deterioration rates, cost shares and discount rate. Solve each
+    # distinct combination once, per unit of construction cost.
+    model_inputs = np.column_stack([np.array(rates, dtype=float), np.array(parameters, dtype=float)])
+    unique_inputs, inverse = np.unique(model_inputs, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    unique_rates, unique_parameters = unique_inputs[:, :deterioration.N_STATES - 1], \
+        unique_inputs[:, deterioration.N_STATES - 1:]
+    transitions, action_costs = action_model(unique_rates, np.ones(len(unique_inputs)), unique_parameters[:, 0],
+                                             unique_parameters[:, 1], unique_parameters[:, 2])
+    gamma = discount_factor(unique_parameters[:, 3])
+    study_periods = unique_parameters[:, 4].astype(int)
+    schedule, _values, _iterations = value_iteration(transitions, action_costs, gamma, tolerance,
+                                                     horizon=study_periods, schedule=True)
+
+    # Life-cycle cost over each bridge's own study period, following the
+    # year-by-year policy of undiscounted components
+    flows = policy_cash_flows(schedule, transitions, action_costs, study_periods.max())
+    years = np.arange(flows.shape[1])
+    discount = gamma[:, None] ** years * (years < study_periods[:, None])
+    life_cycle_costs = (flows * discount).sum(axis=1)[inverse] * np.array(costs)
+    policy = schedule[inverse, 0]
+
+    for component in range(len(names)):
+        result = results[owners[component]]
+        result["components"].append(names[component])
+        result["policy"].append([ACTIONS[action] for action in policy[component]])
+        result["life_cycle_cost"] += float(life_cycle_costs[component])
+    return results
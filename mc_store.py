@@ -0,0 +1,319 @@
+"""
+On-disk store of Monte Carlo sample cubes.
+
+A Monte Carlo run produces one (heads, years) array of present values per
+sample; all samples together form a (samples, heads, years) cube that is
+usually much larger than memory. The cube is stored in chunks of
+``chunk_samples`` samples by one head by all years, compressed, so that
+
+* a run writes its samples chunk by chunk as they are computed,
+* the samples of one head are read without touching the others, and
+* percentiles and histograms are computed one chunk at a time.
+
+The format follows the file name given to ``create`` / ``open_store``:
+
+* ``*.zarr``: a Zarr array (needs ``zarr``),
+* ``*.h5`` or ``*.hdf5``: an HDF5 dataset (needs ``h5py``),
+* anything else: a directory with one compressed ``.npz`` file per chunk
+  of samples, holding one member per head; works with NumPy alone.
+
+Writes must cover whole chunks (the last one may be short). Stores are
+written by one process; Monte Carlo workers hand their chunks to it.
+"""
+
+import json
+import os
+
+import numpy as np
+
+try:
+    import zarr
+except ImportError:
+    zarr = None
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+DEFAULT_CHUNK_SAMPLES = 1024
+
+# Stores use single precision unless told otherwise: half the disk space,
+# far more precision than the inputs of a Monte Carlo run have
+DEFAULT_DTYPE = "float32"
+
+# Memory ``percentiles`` may use for the samples of one block of years
+PERCENTILE_BLOCK_BYTES = 256 * 1024 * 1024
+
+
+def _format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".zarr":
+        return "zarr"
+    if extension in (".h5", ".hdf5"):
+        return "hdf5"
+    return "npz"
+
+
+class SampleStore(object):
+    """Chunked (samples, heads, years) array on disk."""
+
+    def __init__(self, path, shape, chunk_samples, heads, dtype):
+        self.path = path
+        self.shape = tuple(shape)
+        self.chunk_samples = chunk_samples
+        self.heads = list(heads)
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def samples(self):
+        return self.shape[0]
+
+    def chunk_starts(self):
+        """First sample of every chunk."""
+        return range(0, self.samples, self.chunk_samples)
+
+    def write(self, start, block):
+        """
+        Store samples ``start .. start + len(block)``.
+
+        Args:
+            start (int): First sample, a multiple of ``chunk_samples``.
+            block (array): Shape (samples, heads, years).
+        """
+        block = np.asarray(block, dtype=self.dtype)
+        if start % self.chunk_samples or (len(block) != self.chunk_samples
+                                          and start + len(block) != self.samples):
+            raise ValueError(f"Writes must cover whole chunks of {self.chunk_samples} samples")
+        self._write(start, block)
+
+    def read(self, samples=slice(None), head=slice(None)):
+        """
+        Read part of the cube.
+
+        Args:
+            samples (slice): Samples to read.
+            head (int or slice): Head index, or a slice of heads.
+
+        Returns:
+            ndarray: (samples, years) for one head, else (samples, heads, years).
+        """
+        start, stop, _step = samples.indices(self.samples)
+        return np.concatenate([block for _start, block in self._blocks(head, start, stop)]
+                              or [np.empty((0,) + self._head_shape(head), dtype=self.dtype)])
+
+    def iter_chunks(self, head=slice(None)):
+        """Yield ``(first sample, block)`` of every chunk, for out-of-core reductions."""
+        return self._blocks(head, 0, self.samples)
+
+    def _head_shape(self, head):
+        if isinstance(head, slice):
+            return (len(range(*head.indices(self.shape[1]))), self.shape[2])
+        return (self.shape[2],)
+
+    def _blocks(self, head, start, stop):
+        for chunk_start in self.chunk_starts():
+            chunk_stop = min(chunk_start + self.chunk_samples, self.samples)
+            if chunk_stop <= start or chunk_start >= stop:
+                continue
+            low, high = max(start, chunk_start), min(stop, chunk_stop)
+            yield low, self._read(low, high, head)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class ZarrStore(SampleStore):
+
+    def __init__(self, path, array):
+        super().__init__(path, array.shape, array.chunks[0], array.attrs["heads"], array.dtype)
+        self.array = array
+
+    def _write(self, start, block):
+        self.array[start:start + len(block)] = block
+
+    def _read(self, start, stop, head):
+        return self.array[start:stop, head]
+
+
+class HDF5Store(SampleStore):
+
+    def __init__(self, path, handle):
+        dataset = handle["samples"]
+        heads = [label.decode("utf-8") if isinstance(label, bytes) else label
+                 for label in dataset.attrs["heads"]]
+        super().__init__(path, dataset.shape, dataset.chunks[0], heads, dataset.dtype)
+        self.handle = handle
+        self.dataset = dataset
+
+    def _write(self, start, block):
+        self.dataset[start:start + len(block)] = block
+
+    def _read(self, start, stop, head):
+        return self.dataset[start:stop, head]
+
+    def close(self):
+        self.handle.close()
+
+
+class NpzStore(SampleStore):
+    """Directory of ``chunk_<first sample>.npz`` files with one member per head."""
+
+    def _chunk_path(self, chunk_start):
+        return os.path.join(self.path, f"chunk_{chunk_start:012d}.npz")
+
+    def _write(self, start, block):
+        tmp_path = self._chunk_path(start) + ".tmp"
+        with open(tmp_path, "wb") as handle:
+            np.savez_compressed(handle, **{f"h{index}": block[:, index] for index in range(block.shape[1])})
+        os.replace(tmp_path, self._chunk_path(start))
+
+    def _read(self, start, stop, head):
+        chunk_start = start - start % self.chunk_samples
+        rows = slice(start - chunk_start, stop - chunk_start)
+        heads = range(*head.indices(self.shape[1])) if isinstance(head, slice) else [head]
+        path = self._chunk_path(chunk_start)
+        if not os.path.exists(path):
+            # Chunks not written yet read as NaN, like unwritten Zarr chunks
+            block = np.full((stop - start, len(heads), self.shape[2]), np.nan, dtype=self.dtype)
+        else:
+            with np.load(path) as chunk:
+                block = np.stack([chunk[f"h{index}"][rows] for index in heads], axis=1)
+        return block if isinstance(head, slice) else block[:, 0]
+
+
+def create(path, samples, heads, years, chunk_samples=DEFAULT_CHUNK_SAMPLES, dtype=DEFAULT_DTYPE):
+    """
+    Create an empty store, replacing any store at ``path``.
+
+    Args:
+        path (str): Store location; its extension selects the format.
+        samples (int): Number of samples.
+        heads (list): Labels of the cost heads.
+        years (int): Number of years per head.
+        chunk_samples (int): Samples per chunk.
+        dtype: Stored value type.
+
+    Returns:
+        SampleStore: The store, open for writing.
+    """
+    shape = (samples, len(heads), years)
+    chunks = (min(chunk_samples, max(samples, 1)), 1, years)
+    file_format = _format(path)
+    if file_format == "zarr":
+        if zarr is None:
+            raise ImportError("Zarr sample stores require zarr (pip install zarr)")
+        array = zarr.open_array(path, mode="w", shape=shape, chunks=chunks, dtype=dtype, fill_value=np.nan)
+        array.attrs["heads"] = list(heads)
+        return ZarrStore(path, array)
+    if file_format == "hdf5":
+        if h5py is None:
+            raise ImportError("HDF5 sample stores require h5py (pip install h5py)")
+        handle = h5py.File(path, "w")
+        dataset = handle.create_dataset("samples", shape=shape, dtype=dtype, chunks=chunks,
+                                        compression="gzip", compression_opts=4, shuffle=True,
+                                        fillvalue=np.nan)
+        dataset.attrs["heads"] = list(heads)
+        return HDF5Store(path, handle)
+
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.startswith("chunk_") and name.endswith(".npz"):
+            os.remove(os.path.join(path, name))
+    with open(os.path.join(path, "store.json"), "w", encoding="utf-8") as handle:
+        json.dump({"shape": shape, "chunk_samples": chunks[0], "heads": list(heads),
+                   "dtype": np.dtype(dtype).str}, handle)
+    return NpzStore(path, shape, chunks[0], heads, dtype)
+
+
+def open_store(path, mode="r"):
+    """
+    Open an existing store.
+
+    Args:
+        path (str): Store location.
+        mode (str): "r" to read, "r+" to also write missing chunks.
+    """
+    file_format = _format(path)
+    if file_format == "zarr":
+        if zarr is None:
+            raise ImportError("Zarr sample stores require zarr (pip install zarr)")
+        return ZarrStore(path, zarr.open_array(path, mode=mode))
+    if file_format == "hdf5":
+        if h5py is None:
+            raise ImportError("HDF5 sample stores require h5py (pip install h5py)")
+        return HDF5Store(path, h5py.File(path, mode))
+    with open(os.path.join(path, "store.json"), encoding="utf-8") as handle:
+        meta = json.load(handle)
+    return NpzStore(path, meta["shape"], meta["chunk_samples"], meta["heads"], meta["dtype"])
+
+
+def percentiles(store, head, q=(5, 50, 95), max_bytes=PERCENTILE_BLOCK_BYTES):
+    """
+    Percentiles of one head in every year.
+
+    Only the chunks of ``head`` are read. The years are split into blocks
+    whose samples fit in ``max_bytes``; for each block the chunks are read
+    one at a time into a (samples, block years) array and reduced, so the
+    whole (samples, years) slice of the head is never in memory at once
+    when it is larger than ``max_bytes``. The result is exact.
+
+    Args:
+        store (SampleStore): The samples.
+        head (int): Head index.
+        q (sequence): Percentiles in 0..100.
+        max_bytes (int): Memory for the samples of one block; a block
+            holds at least one year.
+
+    Returns:
+        ndarray: Shape (len(q), years).
+    """
+    years = store.shape[2]
+    block_years = int(min(years, max(1, max_bytes // (store.dtype.itemsize * max(store.samples, 1)))))
+    result = np.empty(np.shape(q) + (years,))
+    for first in range(0, years, block_years):
+        last = min(first + block_years, years)
+        values = np.empty((store.samples, last - first), dtype=store.dtype)
+        for start, block in store.iter_chunks(head):
+            values[start:start + len(block)] = block[:, first:last]
+        result[..., first:last] = np.nanpercentile(values, q, axis=0)
+    return result
+
+
+def histogram(store, head, bins=50, year=None):
+    """
+    Histogram of one head, computed one chunk at a time.
+
+    Args:
+        store (SampleStore): The samples.
+        head (int): Head index.
+        bins (int): Number of bins.
+        year (int): Year to take; the total over all years by default.
+
+    Returns:
+        tuple: ``(counts, edges)`` as from ``numpy.histogram``.
+    """
+    def values(block):
+        values = block.sum(axis=1) if year is None else block[:, year]
+        return values[np.isfinite(values)]
+
+    low, high = np.inf, -np.inf
+    for _start, block in store.iter_chunks(head):
+        chunk_values = values(block)
+        if len(chunk_values):
+            low, high = min(low, chunk_values.min()), max(high, chunk_values.max())
+    if not np.isfinite(low):
+        low, high = 0.0, 1.0
+    edges = np.linspace(low, high if high > low else low + 1.0, bins + 1)
+    counts = np.zeros(bins, dtype=np.int64)
+    for _start, block in store.iter_chunks(head):
+        counts += np.histogram(values(block), edges)[0]
+    return counts, edges
@@ -0,0 +1,292 @@
+"""
+Monte Carlo analysis of the life-cycle costs of a project.
+
+Uncertain inputs are varied by a factor drawn between the bounds listed in
+``PARAMETERS``: each sample scales the saved value of the inputs of a
+parameter, e.g. all material rates for "construction_rates", and is then
+clipped to the range allowed by the dialog. Every sample gives the
+(heads, years) present values of ``lcc_engine.head_values``.
+
+Factors are drawn with one of the ``sampling.SAMPLERS``: scrambled Sobol
+points by default, which reach stable percentiles with far fewer samples
+than plain random draws, or a Latin hypercube. They can be given rank
+correlations, e.g. between traffic growth and re-route distance, by
+Iman-Conover reordering.
+
+Samples are evaluated in chunks. The deterioration and end-of-life
+stages of a chunk are evaluated together as a stacked portfolio, chunks
+are spread over worker processes with ``batch_runner.run`` (the factors
+and results of a few chunks per worker at a time pass through shared
+memory), and every finished chunk is written to an ``mc_store`` cube on
+disk, so the number of samples is limited by disk space rather than
+memory.
+
+``run(..., backend="surrogate")`` fits a ``surrogate.Surrogate`` of the
+project over the scaled dialog fields instead, and predicts the head
+totals of every sample with ``Surrogate.predict_many``, which falls back
+to the exact engine for samples outside its trained domain. Construction
+rates and the carbon price are applied to the predictions exactly. The
+store then holds one column of totals per head rather than yearly values.
+"""
+
+import concurrent.futures
+import os
+
+import numpy as np
+
+import batch_runner
+import dialog_schema
+from carbon_pricing import DEFAULT_CARBON_PRICE, discount_factors, flat
+from deterioration import STRUCTURE_SCHEMAS, project_components
+import lcc_engine
+import mc_store
+import sampling
+import surrogate
+import units
+
+
+# Parameter, smallest and largest factor applied to the saved inputs
+PARAMETERS = [
+    ("construction_rates", 0.8, 1.3),
+    ("real_discount_rate", 0.6, 1.4),
+    ("maintenance_rates", 0.5, 1.5),
+    ("repair_rate", 0.5, 1.5),
+    ("traffic_growth", 0.5, 1.5),
+    ("reroute_distance", 0.8, 1.2),
+    ("demolition_rate", 0.5, 1.5),
+    ("carbon_price", 0.5, 2.0),
+]
+PARAMETER_NAMES = [name for name, _low, _high in PARAMETERS]
+LOW = np.array([low for _name, low, _high in PARAMETERS])
+HIGH = np.array([high for _name, _low, high in PARAMETERS])
+
+# Dialog fields scaled by each parameter; construction rates scale the
+# material lines and the carbon price is applied by ``evaluate_samples``
+SCALED_FIELDS = {
+    "real_discount_rate": [(dialog_schema.FINANCIAL, "real_discount_rate")],
+    "maintenance_rates": [(dialog_schema.MAINTENANCE, "periodic_maintenance_rate"),
+                          (dialog_schema.MAINTENANCE, "routine_inspection_rate")],
+    "repair_rate": [(dialog_schema.MAINTENANCE, "repair_rehabilitation_rate")],
+    "traffic_growth": [(dialog_schema.BRIDGE_TRAFFIC, "traffic_growth")],
+    "reroute_distance": [(dialog_schema.BRIDGE_TRAFFIC, "reroute_distance")],
+    "demolition_rate": [(dialog_schema.DEMOLITION, "demolition_rate")],
+}
+
+# Heads proportional to the construction cost, hence to the material rates
+CONSTRUCTION_COST_HEADS = ["Initial Construction Cost", "Periodic Maintenance Costs", "Routine Inspection Costs",
+                           "Repair & Rehabilitation Costs", "Reconstruction Costs"]
+EMISSION_HEADS = ["Initial Carbon Emission Cost", "Maintenance Emission Costs",
+                  "Carbon Emission due to Re-Routing"]
+
+# A power of two, which keeps Sobol points balanced
+DEFAULT_SAMPLES = 8192
+DEFAULT_SAMPLER = "sobol"
+BACKENDS = ("exact", "surrogate")
+
+
+def sample_unit(n, rng, sampler=DEFAULT_SAMPLER, correlations=None):
+    """
+    Points of the unit cube, one column per parameter.
+
+    Args:
+        n (int): Number of samples.
+        rng (numpy.random.Generator): Random source.
+        sampler (str): Key of ``sampling.SAMPLERS``.
+        correlations (dict): ``(parameter, parameter) -> rank correlation``.
+
+    Returns:
+        ndarray: Shape (n, parameters).
+    """
+    unit = sampling.SAMPLERS[sampler](n, len(PARAMETERS), rng)
+    if correlations:
+        unit = sampling.iman_conover(unit, sampling.correlation_matrix(PARAMETER_NAMES, correlations), rng)
+    return unit
+
+
+def factors_from_unit(unit):
+    """Map unit-cube samples to the factor ranges of ``PARAMETERS``."""
+    return LOW + np.asarray(unit) * (HIGH - LOW)
+
+
+def _field(schema, key):
+    return next(field for field in schema.fields() if field.key == key)
+
+
+def scenario(project_form_data, factors):
+    """
+    The inputs of one sample.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        factors (array): One factor per parameter, in ``PARAMETERS`` order.
+
+    Returns:
+        dict: Form data with the scaled inputs; only the changed dialogs
+        are copied.
+    """
+    factors = dict(zip(PARAMETER_NAMES, factors))
+    result = dict(project_form_data)
+    for name, fields in SCALED_FIELDS.items():
+        for schema, key in fields:
+            values = dialog_schema.coerce(schema, result.get(schema.name, {}))
+            field = _field(schema, key)
+            values[key] = float(np.clip(values[key] * factors[name], field.minimum, field.maximum))
+            result[schema.name] = values
+    for schema in STRUCTURE_SCHEMAS:
+        if schema.name in result:
+            values = dialog_schema.coerce(schema, result[schema.name])
+            values["materials"] = [dict(row, rate=row["rate"] * factors["construction_rates"])
+                                   for row in values["materials"]]
+            result[schema.name] = values
+    return result
+
+
+def evaluate_samples(project_form_data, factors):
+    """
+    Present values of many samples of a project.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        factors (array): Shape (samples, parameters).
+
+    Returns:
+        ndarray: Shape (samples, heads, study period + 1) in INR.
+    """
+    factors = np.atleast_2d(factors)
+    scenarios = [scenario(project_form_data, row) for row in factors]
+    financial = dialog_schema.coerce(dialog_schema.FINANCIAL,
+                                     project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+    carbon_price = PARAMETER_NAMES.index("carbon_price")
+    prices = [flat(DEFAULT_CARBON_PRICE * factor, financial["study_period"] + 1)
+              for factor in factors[:, carbon_price]]
+    return np.stack(lcc_engine.batch_head_values(scenarios, prices))
+
+
+def fit_surrogate(project_form_data, degree=surrogate.DEFAULT_DEGREE, seed=None):
+    """
+    Surrogate of a project over the dialog fields of ``SCALED_FIELDS``.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        degree (int): Total degree of the polynomial.
+        seed (int): Seed of the design.
+
+    Returns:
+        Surrogate: Trained over the range every field takes in the samples.
+    """
+    variables, bounds = [], {}
+    for name, low, high in PARAMETERS:
+        for schema, key in SCALED_FIELDS.get(name, []):
+            saved = dialog_schema.coerce(schema, project_form_data.get(schema.name, {}))[key]
+            field = _field(schema, key)
+            variables.append((schema, key))
+            bounds[key] = tuple(np.clip([saved * low, saved * high], field.minimum, field.maximum))
+    return surrogate.fit(project_form_data, variables, bounds, degree, seed=seed)
+
+
+def surrogate_samples(project_form_data, factors, fitted):
+    """
+    Head totals of many samples of a project, predicted by a surrogate.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        factors (array): Shape (samples, parameters).
+        fitted (Surrogate): From ``fit_surrogate``.
+
+    Returns:
+        ndarray: Shape (samples, heads) in INR.
+    """
+    factors = np.atleast_2d(factors)
+    construction = factors[:, PARAMETER_NAMES.index("construction_rates")]
+    saved_rates = factors.copy()
+    saved_rates[:, PARAMETER_NAMES.index("construction_rates")] = 1.0
+    scenarios = [scenario(project_form_data, row) for row in saved_rates]
+    values, _errors, _exact = fitted.predict_many(scenarios)
+
+    values[:, [lcc_engine.HEAD_INDEX[label] for label in CONSTRUCTION_COST_HEADS]] *= construction[:, None]
+    # Demolition is a share of the construction cost, paid in the last year
+    construction_cost = project_components(project_form_data)[1].sum()
+    study_period = dialog_schema.coerce(dialog_schema.FINANCIAL,
+                                        project_form_data.get(dialog_schema.FINANCIAL.name, {}))["study_period"]
+    for index, data in enumerate(scenarios):
+        rate = units.coerce(dialog_schema.FINANCIAL, data[dialog_schema.FINANCIAL.name])["real_discount_rate"]
+        demolition_rate = units.coerce(dialog_schema.DEMOLITION, data[dialog_schema.DEMOLITION.name])["demolition_rate"]
+        values[index, lcc_engine.HEAD_INDEX["Demolition & Disposal Cost"]] += (
+            (construction[index] - 1.0) * construction_cost * demolition_rate
+            * discount_factors(rate, study_period + 1)[-1])
+    values[:, [lcc_engine.HEAD_INDEX[label] for label in EMISSION_HEADS]] *= (
+        factors[:, PARAMETER_NAMES.index("carbon_price"), None])
+    return values
+
+
+def _samples_kernel(inputs, outputs, start, stop, project_form_data):
+    outputs["values"][start:stop] = evaluate_samples(project_form_data, inputs["factors"][start:stop])
+
+
+def run(project_form_data, samples, store_path, chunk_samples=mc_store.DEFAULT_CHUNK_SAMPLES,
+        seed=None, workers=None, progress=None, sampler=DEFAULT_SAMPLER, correlations=None, mp_context=None,
+        backend="exact"):
+    """
+    Run a Monte Carlo analysis into an on-disk sample store.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        samples (int): Number of samples.
+        store_path (str): Store location, see ``mc_store``.
+        chunk_samples (int): Samples evaluated and written together.
+        seed (int): Seed of the sampler, for reproducible runs.
+        workers (int): Worker processes; 1 evaluates in this process.
+        progress (callable): Called as ``progress(first sample, block)``
+            after each chunk is written.
+        sampler (str): Key of ``sampling.SAMPLERS``.
+        correlations (dict): Rank correlations between parameters, see
+            ``sample_unit``.
+        mp_context: ``multiprocessing`` context of the worker processes,
+            e.g. "spawn" when called from a thread; the platform default
+            by default.
+        backend (str): One of ``BACKENDS``. "surrogate" evaluates in this
+            process and stores a single column of head totals.
+
+    Returns:
+        SampleStore: The filled store.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown Monte Carlo backend: {backend}")
+    financial = dialog_schema.coerce(dialog_schema.FINANCIAL,
+                                     project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+    years = 1 if backend == "surrogate" else financial["study_period"] + 1
+    store = mc_store.create(store_path, samples, lcc_engine.HEAD_LABELS, years, chunk_samples)
+    # The whole design is drawn up front: stratification and correlation
+    # hold over all samples, and results do not depend on the workers
+    factors = factors_from_unit(sample_unit(samples, np.random.default_rng(seed), sampler, correlations))
+    chunks = [(start, factors[start:start + store.chunk_samples]) for start in store.chunk_starts()]
+
+    def finished(start, block):
+        store.write(start, block)
+        if progress is not None:
+            progress(start, block)
+
+    if backend == "surrogate":
+        fitted = fit_surrogate(project_form_data, seed=seed)
+        for start, chunk_factors in chunks:
+            finished(start, surrogate_samples(project_form_data, chunk_factors, fitted)[:, :, None])
+        return store
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start, chunk_factors in chunks:
+            finished(start, evaluate_samples(project_form_data, chunk_factors))
+        return store
+
+    # A couple of chunks per worker at a time, no more, go through shared memory
+    wave_samples = 2 * workers * store.chunk_samples
+    shape = (len(lcc_engine.HEAD_LABELS), financial["study_period"] + 1)
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=mp_context) as pool:
+        for wave_start in range(0, samples, wave_samples):
+            wave = factors[wave_start:wave_start + wave_samples]
+            values = batch_runner.run(_samples_kernel, {"factors": wave}, {"values": ((len(wave),) + shape, float)},
+                                      len(wave), chunk_rows=store.chunk_samples, pool=pool,
+                                      project_form_data=project_form_data)["values"]
+            for offset in range(0, len(wave), store.chunk_samples):
+                finished(wave_start + offset, values[offset:offset + store.chunk_samples])
+    return store
@@ -0,0 +1,128 @@
+"""
+Monte Carlo panel of the results window.
+
+The run happens on a ``QThread`` so the window stays responsive. After
+every chunk of samples the thread folds the chunk into a
+``streaming_stats.MonteCarloSummary`` and emits a snapshot of it; the
+panel redraws its table from the snapshot, so the mean and the P5 / P50 /
+P95 estimates of each cost head settle on screen while the run goes on.
+The "Surrogate" box runs with ``backend="surrogate"`` instead.
+"""
+
+import multiprocessing
+import os
+
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtWidgets import (QCheckBox, QHBoxLayout, QHeaderView, QLabel, QProgressBar, QPushButton,
+                             QSpinBox, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+
+import lcc_engine
+import monte_carlo
+from streaming_stats import MonteCarloSummary
+
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".blcca_studio", "monte_carlo")
+
+
+class MonteCarloThread(QThread):
+    """Runs ``monte_carlo.run`` and reports running statistics."""
+
+    updated = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, project_form_data, samples, store_path=DEFAULT_STORE_PATH, backend="exact", parent=None):
+        super().__init__(parent)
+        self.project_form_data = dict(project_form_data)
+        self.samples = samples
+        self.store_path = store_path
+        self.backend = backend
+
+    def run(self):
+        summary = MonteCarloSummary(lcc_engine.HEAD_LABELS)
+
+        def progress(_start, block):
+            summary.update(block)
+            self.updated.emit(summary.snapshot())
+
+        try:
+            # Forking a process that runs Qt threads can copy held locks into
+            # the workers; spawned workers start clean
+            monte_carlo.run(self.project_form_data, self.samples, self.store_path, progress=progress,
+                            mp_context=multiprocessing.get_context("spawn"), backend=self.backend).close()
+        except Exception as error:
+            # Whatever went wrong, the panel must hear of it and re-enable Run
+            self.failed.emit(str(error) or type(error).__name__)
+
+
+class MonteCarloPanel(QWidget):
+    """Runs a Monte Carlo analysis and shows its statistics as they converge."""
+
+    COLUMNS = ["Cost Head", "Mean", "Std. Dev.", "P5", "P50", "P95"]
+
+    def __init__(self, project_form_data, parent=None):
+        super().__init__(parent)
+        self.project_form_data = project_form_data
+        self.thread = None
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        title_label = QLabel("Monte Carlo Analysis (Lakh)")
+        title_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(title_label)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Samples"))
+        self.samples_box = QSpinBox()
+        self.samples_box.setRange(100, 10000000)
+        self.samples_box.setSingleStep(1000)
+        self.samples_box.setValue(monte_carlo.DEFAULT_SAMPLES)
+        controls.addWidget(self.samples_box)
+        self.surrogate_box = QCheckBox("Surrogate")
+        self.surrogate_box.setToolTip("Predict the samples with a fitted surrogate: approximate, much faster")
+        controls.addWidget(self.surrogate_box)
+        self.run_button = QPushButton("Run")
+        self.run_button.clicked.connect(self.start)
+        controls.addWidget(self.run_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.progress_bar = QProgressBar()
+        layout.addWidget(self.progress_bar)
+
+        labels = lcc_engine.HEAD_LABELS + ["Total"]
+        self.table = QTableWidget(len(labels), len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for row, label in enumerate(labels):
+            self.table.setItem(row, 0, QTableWidgetItem(label))
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+    def start(self):
+        if self.thread is not None and self.thread.isRunning():
+            return
+        samples = self.samples_box.value()
+        self.progress_bar.setRange(0, samples)
+        self.progress_bar.setValue(0)
+        self.run_button.setEnabled(False)
+        self.status_label.setText("Running...")
+        backend = "surrogate" if self.surrogate_box.isChecked() else "exact"
+        self.thread = MonteCarloThread(self.project_form_data, samples, backend=backend, parent=self)
+        self.thread.updated.connect(self.show_statistics)
+        self.thread.failed.connect(self.status_label.setText)
+        self.thread.finished.connect(lambda: self.run_button.setEnabled(True))
+        self.thread.start()
+
+    def show_statistics(self, snapshot):
+        """Redraw the table from a ``MonteCarloSummary.snapshot``."""
+        columns = [snapshot["mean"], snapshot["std"]] + list(snapshot["estimates"].T)
+        for row in range(len(snapshot["labels"])):
+            for column, values in enumerate(columns, start=1):
+                self.table.setItem(row, column, QTableWidgetItem(f"{values[row] / lcc_engine.LAKH:,.2f}"))
+        self.progress_bar.setValue(snapshot["count"])
+        self.status_label.setText(f"{snapshot['count']} of {self.progress_bar.maximum()} samples")
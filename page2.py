@@ -8,6 +8,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QSize, QPoint
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QPixmap
 
+import tracing
+
 
 class CloseableTabWidget(QTabWidget):
     """Custom tab widget with closeable tabs"""
@@ -567,6 +569,7 @@ class BLCCAStudio(QMainWindow):
         super(BLCCAStudio, self).__init__()
         self.initUI()
         
+    @tracing.traced("ui", "page2.BLCCAStudio.initUI")
     def initUI(self):
         # Set window properties
         self.setWindowTitle("BLCCA Studio 1.0.0")
@@ -0,0 +1,234 @@
+"""
+Network-level maintenance prioritization under a yearly budget.
+
+Every year each bridge may get at most one intervention (maintain, repair
+or reconstruct) and the total cost must fit that year's budget: a
+multiple-choice knapsack. ``select_options`` solves it with the greedy
+algorithm for its LP relaxation. On each bridge's convex hull of options
+the extra benefit per extra rupee decreases, so sorting all hull steps of
+all bridges by that ratio and taking them until the budget is spent gives
+the LP optimum. Dropping the one fractional step gives a feasible
+selection. A few vectorized fill rounds then spend what is left on steps
+that still fit, and the result is compared with the best single option.
+The LP value is returned as an upper bound on the best integer selection.
+
+``prioritize`` repeats this for every year of the plan. Bridges
+deteriorate with the Markov model of ``deterioration``. The benefit of an
+intervention is the reduction in expected life-cycle cost from the
+``maintenance_policy`` value function, and that cost includes the
+re-routing cost of a closed bridge from the Bridge and Traffic inputs.
+Only the loop over years is in Python; each year is a handful of array
+operations over all bridges.
+"""
+
+import numpy as np
+
+import dialog_schema
+import deterioration
+import maintenance_policy
+import units
+from traffic import REROUTE_COST_PER_PCU_KM, VEHICLE_CLASSES
+
+
+def _hull(costs, benefits):
+    """
+    Mark the options of each bridge on the upper convex hull of (cost, benefit).
+
+    Args:
+        costs (ndarray): Shape (n, k + 1), column 0 is "do nothing" (0, 0).
+        benefits (ndarray): Shape (n, k + 1).
+
+    Returns:
+        ndarray: Boolean (n, k + 1) mask; "do nothing" is always on the hull.
+    """
+    k = costs.shape[1]
+    valid = np.isfinite(costs) & (benefits > 0)
+    valid[:, 0] = True
+    c_i, c_j = costs[:, :, None], costs[:, None, :]
+    b_i, b_j = benefits[:, :, None], benefits[:, None, :]
+    index = np.arange(k)
+
+    # j is dominated by a valid i that costs no more and gives no less
+    better = (c_i <= c_j) & (b_i >= b_j) & ((c_i < c_j) | (b_i > b_j) | (index[:, None] < index[None, :]))
+    dominated = (better & valid[:, :, None] & (index[:, None] != index[None, :])).any(axis=1)
+
+    # j lies on or under the chord from a cheaper i to a dearer l
+    c_i, c_j, c_l = costs[:, :, None, None], costs[:, None, :, None], costs[:, None, None, :]
+    b_i, b_j, b_l = benefits[:, :, None, None], benefits[:, None, :, None], benefits[:, None, None, :]
+    with np.errstate(invalid="ignore"):
+        under = (c_i < c_j) & (c_j < c_l) & ((b_j - b_i) * (c_l - c_j) <= (b_l - b_j) * (c_j - c_i))
+    pair_valid = valid[:, :, None, None] & valid[:, None, None, :]
+    under = (under & pair_valid).any(axis=(1, 3))
+
+    hull = valid & ~dominated & ~under
+    hull[:, 0] = True
+    return hull
+
+
+def select_options(costs, benefits, budget, fill_rounds=20):
+    """
+    Choose at most one option per bridge to maximize benefit within a budget.
+
+    Args:
+        costs (array): Shape (n, k) cost of each option of each bridge; use
+            ``inf`` for options that are not available.
+        benefits (array): Shape (n, k) benefit of each option.
+        budget (float): Money available.
+        fill_rounds (int): Upper bound on the rounds spending the leftover budget.
+
+    Returns:
+        tuple: ``chosen`` (n,) option index or -1 for none, and the LP
+        relaxation value, an upper bound on the achievable benefit.
+    """
+    costs = np.asarray(costs, dtype=float)
+    benefits = np.asarray(benefits, dtype=float)
+    n, k = costs.shape
+    points_c = np.concatenate([np.zeros((n, 1)), costs], axis=1)
+    points_b = np.concatenate([np.zeros((n, 1)), benefits], axis=1)
+    hull = _hull(points_c, points_b)
+
+    # Hull points of each bridge ordered by cost; steps between neighbours
+    order = np.argsort(np.where(hull, points_c, np.inf), axis=1, kind="stable")
+    sorted_c = np.take_along_axis(points_c, order, axis=1)
+    sorted_b = np.take_along_axis(points_b, order, axis=1)
+    hull_size = hull.sum(axis=1)
+    step_valid = np.arange(1, k + 1)[None, :] < hull_size[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        step_c = np.where(step_valid, np.diff(sorted_c, axis=1), 0.0)
+        step_b = np.where(step_valid, np.diff(sorted_b, axis=1), 0.0)
+        ratio = np.where(step_c > 0, step_b / step_c, np.inf)
+
+    # Greedy over all steps, best ratio first; a bridge's own steps keep their order
+    rows, positions = np.nonzero(step_valid)
+    ranking = np.lexsort((positions, -ratio[rows, positions]))
+    rows, positions = rows[ranking], positions[ranking]
+    spent = np.cumsum(step_c[rows, positions])
+    taken = int(np.searchsorted(spent, budget, side="right"))
+    levels = np.zeros(n, dtype=int)
+    np.add.at(levels, rows[:taken], 1)
+
+    upper_bound = step_b[rows[:taken], positions[:taken]].sum()
+    remaining = budget - (spent[taken - 1] if taken else 0.0)
+    if taken < len(rows):
+        row, position = rows[taken], positions[taken]
+        upper_bound += step_b[row, position] * remaining / step_c[row, position]
+
+    # Spend the rest on next steps that still fit
+    for _ in range(fill_rounds):
+        candidates = np.nonzero(levels < hull_size - 1)[0]
+        next_c = step_c[candidates, levels[candidates]]
+        fits = next_c <= remaining
+        candidates, next_c = candidates[fits], next_c[fits]
+        if not len(candidates):
+            break
+        best_first = np.argsort(-ratio[candidates, levels[candidates]], kind="stable")
+        candidates, next_c = candidates[best_first], next_c[best_first]
+        fill = max(int(np.searchsorted(np.cumsum(next_c), remaining, side="right")), 1)
+        levels[candidates[:fill]] += 1
+        remaining -= next_c[:fill].sum()
+
+    chosen = np.take_along_axis(order, levels[:, None], axis=1)[:, 0] - 1
+
+    # Greedy can lose to one large option that it had to skip
+    affordable = np.where(costs <= budget, benefits, -np.inf)
+    best = np.unravel_index(np.argmax(affordable), affordable.shape)
+    if affordable[best] > np.take_along_axis(sorted_b, levels[:, None], axis=1).sum():
+        chosen = np.full(n, -1)
+        chosen[best[0]] = best[1]
+    return chosen, upper_bound
+
+
+def network_model(projects):
+    """
+    Bridge-level inputs of the prioritization from saved project data.
+
+    Components of a bridge are merged into one deteriorating element with
+    cost-weighted deterioration rates.
+
+    Args:
+        projects (list): Saved form data (window name -> data) of each bridge.
+
+    Returns:
+        dict: Arrays of shape (n, ...) with ``rates``, ``construction_costs``,
+        ``maintenance_rate``, ``repair_rate``, ``reconstruction_rate``,
+        ``closure_costs``, ``discount_rate`` and ``study_period``.
+    """
+    columns = {key: [] for key in ("rates", "construction_costs", "maintenance_rate", "repair_rate",
+                                   "reconstruction_rate", "closure_costs", "discount_rate", "study_period")}
+    for project_form_data in projects:
+        values = {schema.name: units.coerce(schema, project_form_data.get(schema.name, {}))
+                  for schema in (dialog_schema.MAINTENANCE, dialog_schema.FINANCIAL,
+                                 dialog_schema.DEMOLITION, dialog_schema.BRIDGE_TRAFFIC)}
+        maintenance = values[dialog_schema.MAINTENANCE.name]
+        traffic = values[dialog_schema.BRIDGE_TRAFFIC.name]
+        names, costs = deterioration.project_components(project_form_data)
+        rates = np.array([deterioration.DETERIORATION_RATES.get(name, deterioration.DEFAULT_RATES)
+                          for name in names], dtype=float).reshape(len(names), deterioration.N_STATES - 1)
+        total = costs.sum()
+
+        columns["rates"].append(costs @ rates / total if total > 0 else deterioration.DEFAULT_RATES)
+        columns["construction_costs"].append(total)
+        columns["maintenance_rate"].append(maintenance_policy.yearly_maintenance_rate(maintenance))
+        columns["repair_rate"].append(maintenance["repair_rehabilitation_rate"])
+        columns["reconstruction_rate"].append(1.0 + values[dialog_schema.DEMOLITION.name]["demolition_rate"])
+        columns["closure_costs"].append(sum(traffic[field] for field in VEHICLE_CLASSES) * 365.0
+                                        * traffic["reroute_distance"] * REROUTE_COST_PER_PCU_KM)
+        columns["discount_rate"].append(values[dialog_schema.FINANCIAL.name]["real_discount_rate"])
+        columns["study_period"].append(values[dialog_schema.FINANCIAL.name]["study_period"])
+    return {key: np.array(value, dtype=float) for key, value in columns.items()}
+
+
+def prioritize(network, budgets, initial=None):
+    """
+    Plan the interventions of a bridge network year by year.
+
+    Args:
+        network (dict): Bridge arrays as returned by ``network_model``.
+        budgets (array): Budget of each year of the plan.
+        initial (array): Shape (n, N_STATES) condition of each bridge now;
+            all bridges in state 1 by default.
+
+    Returns:
+        dict: ``actions`` (years, n) index into ``maintenance_policy.ACTIONS``,
+        ``spent``, ``benefit`` and ``upper_bound`` per year, and
+        ``condition`` (years + 1, n, N_STATES) expected condition.
+    """
+    budgets = np.asarray(budgets, dtype=float)
+    construction_costs = network["construction_costs"]
+    n = len(construction_costs)
+    transitions, costs = maintenance_policy.action_model(
+        network["rates"], construction_costs, network["maintenance_rate"], network["repair_rate"],
+        network["reconstruction_rate"], network["closure_costs"])
+    gamma = maintenance_policy.discount_factor(network["discount_rate"])
+    _policy, values, _iterations = maintenance_policy.value_iteration(
+        transitions, costs, gamma, horizon=network["study_period"].astype(int))
+
+    # Expected discounted cost of taking each action this year, then acting optimally
+    q = costs + gamma[:, None, None] * np.einsum("nasj,nj->nas", transitions, values)
+    agency_costs = np.stack([np.zeros(n), network["maintenance_rate"], network["repair_rate"],
+                             network["reconstruction_rate"]], axis=1) * construction_costs[:, None]
+
+    condition = np.empty((len(budgets) + 1, n, deterioration.N_STATES))
+    if initial is None:
+        condition[0] = 0.0
+        condition[0, :, 0] = 1.0
+    else:
+        condition[0] = initial
+    actions = np.zeros((len(budgets), n), dtype=int)
+    result = {"spent": np.zeros(len(budgets)), "benefit": np.zeros(len(budgets)),
+              "upper_bound": np.zeros(len(budgets))}
+
+    for year, budget in enumerate(budgets):
+        expected_q = np.einsum("nas,ns->na", q, condition[year])
+        benefits = expected_q[:, :1] - expected_q[:, 1:]
+        chosen, upper_bound = select_options(agency_costs[:, 1:], benefits, budget)
+        actions[year] = chosen + 1
+        taken = chosen >= 0
+        result["spent"][year] = agency_costs[taken, chosen[taken] + 1].sum()
+        result["benefit"][year] = benefits[taken, chosen[taken]].sum()
+        result["upper_bound"][year] = upper_bound
+        condition[year + 1] = (condition[year][:, None, :] @ transitions[np.arange(n), actions[year]])[:, 0]
+
+    result["actions"] = actions
+    result["condition"] = condition
+    return result
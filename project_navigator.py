@@ -0,0 +1,129 @@
+"""
+Project Details navigation shared by all input sections.
+
+The main window owns a single ``ProjectNavigatorDock``: one "Input
+Parameters" tree and one form pane. Selecting a section in the tree swaps
+the page shown in the pane. Pages are built the first time a section is
+visited and kept afterwards, so moving between sections does not rebuild
+any widgets.
+"""
+
+from PyQt5 import QtCore, QtWidgets
+
+import dialog_schema
+from schema_dialog import SchemaPage
+
+
+# (tree label, schema or None for a grouping node, children)
+NAVIGATION = [
+    ("Structure Works Data", None, [
+        ("Foundation", dialog_schema.FOUNDATION, []),
+        ("Super-Structure", dialog_schema.SUPER_STRUCTURE, []),
+        ("Sub-Structure", dialog_schema.SUB_STRUCTURE, []),
+        ("Miscellaneous", dialog_schema.MISCELLANEOUS, []),
+    ]),
+    ("Financial Data", dialog_schema.FINANCIAL, []),
+    ("Carbon Emission Data", dialog_schema.CARBON_EMISSION, []),
+    ("Bridge and Traffic Data", dialog_schema.BRIDGE_TRAFFIC, []),
+    ("Maintenance and Repair", dialog_schema.MAINTENANCE, []),
+    ("Demolition and Recycling", dialog_schema.DEMOLITION, []),
+]
+
+OUTPUT_ITEMS = [
+    "Initial Construction Cost",
+    "Initial Carbon Emission Cost",
+    "Time Cost",
+    "User Time Cost",
+    "Carbon Emission due to Re-Routing",
+    "Periodic Maintenance Costs",
+    "Maintenance Emission Costs",
+    "Routine Inspection Costs",
+    "Repair & Rehabilitation Costs",
+    "Reconstruction Costs",
+    "Demolition & Disposal Cost",
+    "Recycling Cost",
+    "Total Life-Cycle Cost",
+]
+
+
+class ProjectNavigatorDock(QtWidgets.QDockWidget):
+    """Project Details Window: navigation tree plus the current input form"""
+
+    def __init__(self, parent=None):
+        super(ProjectNavigatorDock, self).__init__("Project Details Window", parent)
+        self.setObjectName("ProjectNavigatorDock")
+        self.setFeatures(QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable)
+        self.pages = {}
+        self.tree_items = {}
+        self.initUI()
+
+    def initUI(self):
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
+
+        # Navigation tree
+        self.tree = QtWidgets.QTreeWidget()
+        self.tree.setHeaderLabel("Input Parameters")
+        self.tree.setStyleSheet("QTreeWidget { background-color: rgb(240,230,230); }")
+        for label, schema, children in NAVIGATION:
+            item = self._add_item(self.tree, label, schema)
+            for child_label, child_schema, _children in children:
+                self._add_item(item, child_label, child_schema)
+        self.tree.expandAll()
+
+        output = QtWidgets.QTreeWidgetItem(self.tree, ["Output"])
+        for label in OUTPUT_ITEMS:
+            QtWidgets.QTreeWidgetItem(output, [label])
+
+        self.tree.currentItemChanged.connect(self._item_selected)
+        splitter.addWidget(self.tree)
+
+        # Form pane; pages are added on first visit
+        self.pane = QtWidgets.QStackedWidget()
+        placeholder = QtWidgets.QLabel("Select an input section")
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        self.pane.addWidget(placeholder)
+        splitter.addWidget(self.pane)
+
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 3)
+        self.setWidget(splitter)
+
+    def _add_item(self, parent, label, schema):
+        item = QtWidgets.QTreeWidgetItem(parent, [label])
+        if schema is not None:
+            item.setData(0, QtCore.Qt.UserRole, schema.name)
+            self.tree_items[schema.name] = item
+        return item
+
+    def _item_selected(self, item, _previous):
+        schema_name = item.data(0, QtCore.Qt.UserRole) if item is not None else None
+        if schema_name:
+            self.show_section(dialog_schema.SCHEMAS_BY_NAME[schema_name])
+
+    def page(self, schema):
+        """Return the page of a section, building it on first use."""
+        if schema.name not in self.pages:
+            page = SchemaPage(schema)
+            page.closed.connect(page.reload)
+            self.pages[schema.name] = page
+            self.pane.addWidget(page)
+        return self.pages[schema.name]
+
+    def show_section(self, schema):
+        """
+        Show the input form of a section and select it in the tree.
+
+        Args:
+            schema (DialogSchema): The section to show.
+        """
+        self.pane.setCurrentWidget(self.page(schema))
+        item = self.tree_items[schema.name]
+        if self.tree.currentItem() is not item:
+            self.tree.setCurrentItem(item)
+        self.show()
+        self.raise_()
+
+    def reload(self):
+        """Refresh every built page from the saved form data."""
+        for page in self.pages.values():
+            page.reload()
@@ -0,0 +1,308 @@
+"""
+Multi-page PDF report generation for BLCCA Studio.
+
+Reports are streamed to disk one page at a time: every page is drawn on its
+own matplotlib ``Figure`` (not registered with pyplot), written through
+``PdfPages`` and released before the next one is created. Only one figure is
+ever alive, so a report for a whole portfolio of bridges can be produced in a
+single headless run without memory growing with the number of bridges.
+
+Usage from the command line::
+
+    python report_generator.py portfolio.jsonl report.pdf
+
+where every line of ``portfolio.jsonl`` is one project record (see
+``write_report``). Records without ``results`` are evaluated by
+``lcc_engine.evaluate_batch``, ``PORTFOLIO_BATCH`` records at a time.
+"""
+
+import json
+import sys
+
+import matplotlib
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from form_data_storage import form_data
+import lcc_engine
+import tracing
+import units
+
+
+# A4 portrait, in inches
+PAGE_SIZE = (8.27, 11.69)
+
+# Number of input rows that fit on one page of the inputs table
+INPUT_ROWS_PER_PAGE = 40
+
+# Portfolio records read and evaluated together
+PORTFOLIO_BATCH = 64
+
+STAGE_LABELS = ["Initial Stage", "Use Stage", "End-of-Life Stage", "Beyond-Life Stage"]
+
+PILLAR_COLORS = {
+    "Economic": ['#3366cc', '#109618', '#ff9900', '#4B0082'],
+    "Social": ['#dc3912', '#990099', '#0099c6', '#4B0082'],
+    "Environmental": ['#dd4477', '#66aa00', '#b82e2e', '#4B0082'],
+}
+
+COST_COLORS = ['#3366cc', '#dc3912', '#ff9900', '#109618', '#990099', '#0099c6',
+               '#dd4477', '#66aa00', '#b82e2e', '#316395', '#994499', '#22aa99', '#aaaa11']
+
+
+def _new_page(title, subtitle=None):
+    """
+    Create a blank report page with a title.
+
+    Args:
+        title (str): Page title.
+        subtitle (str): Optional smaller line under the title.
+
+    Returns:
+        Figure: A figure that is not tracked by pyplot.
+    """
+    fig = Figure(figsize=PAGE_SIZE)
+    fig.text(0.5, 0.96, title, ha="center", va="top", fontsize=14, fontweight="bold")
+    if subtitle:
+        fig.text(0.5, 0.935, subtitle, ha="center", va="top", fontsize=9, color="#555555")
+    return fig
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _input_rows(project_form_data):
+    """Flatten the saved dialog data into (dialog, field, value) rows."""
+    for window_name, data in project_form_data.items():
+        if not isinstance(data, dict):
+            yield (window_name, "", _format_value(data))
+            continue
+        for field, value in data.items():
+            yield (window_name.replace("_Dialog", ""), field, _format_value(value))
+
+
+def _table_page(title, subtitle, col_labels, rows, col_widths):
+    fig = _new_page(title, subtitle)
+    ax = fig.add_axes([0.06, 0.05, 0.88, 0.86])
+    ax.axis("off")
+    if not rows:
+        ax.text(0.5, 0.5, "No data saved", ha="center", va="center", color="#888888")
+        return fig
+    table = ax.table(cellText=rows, colLabels=col_labels, colWidths=col_widths,
+                     loc="upper center", cellLoc="left")
+    table.auto_set_font_size(False)
+    table.set_fontsize(8)
+    table.scale(1, 1.2)
+    for (row, _col), cell in table.get_celld().items():
+        if row == 0:
+            cell.set_facecolor("#f0e6e6")
+            cell.set_text_props(fontweight="bold")
+    return fig
+
+
+def _input_pages(name, project_form_data):
+    """Yield the inputs table, split over as many pages as needed."""
+    page_rows = []
+    page_number = 1
+    for row in _input_rows(project_form_data):
+        page_rows.append(row)
+        if len(page_rows) == INPUT_ROWS_PER_PAGE:
+            yield _table_page(f"{name} - Input Parameters", f"Page {page_number}",
+                              ["Dialog", "Field", "Value"], page_rows, [0.3, 0.35, 0.35])
+            page_rows = []
+            page_number += 1
+    if page_rows or page_number == 1:
+        yield _table_page(f"{name} - Input Parameters", f"Page {page_number}",
+                          ["Dialog", "Field", "Value"], page_rows, [0.3, 0.35, 0.35])
+
+
+def _cost_table_page(name, cost_heads):
+    rows = [[label, _format_value(float(value))] for label, value in cost_heads]
+    rows.append(["Total Life-Cycle Cost", _format_value(float(sum(v for _, v in cost_heads)))])
+    return _table_page(f"{name} - Cost Heads", "Values in INR Lakh",
+                       ["Cost Head", "Value"], rows, [0.7, 0.3])
+
+
+def _stage_pie_page(name, stages, study_period):
+    fig = _new_page(f"{name} - Stage Distribution",
+                    f"Cost distribution across stages for {study_period} years")
+    for index, (pillar, values) in enumerate(stages.items()):
+        ax = fig.add_subplot(len(stages), 1, index + 1)
+        if sum(values) <= 0:
+            ax.axis('off')
+            ax.set_title(f"{pillar} cost", fontsize=10)
+            ax.text(0.5, 0.5, "No results", ha="center", va="center", color="#888888")
+            continue
+        colors = PILLAR_COLORS.get(pillar)[:len(values)] if pillar in PILLAR_COLORS else None
+        wedges, _texts, _autotexts = ax.pie(
+            values,
+            colors=colors,
+            autopct='%1.1f%%',
+            startangle=90,
+            wedgeprops={'edgecolor': 'w', 'linewidth': 1},
+            textprops={'fontsize': 8}
+        )
+        ax.axis('equal')
+        ax.set_title(f"{pillar} cost", fontsize=10)
+        ax.legend(wedges, STAGE_LABELS[:len(values)], loc="center left",
+                  bbox_to_anchor=(1.0, 0.5), fontsize=8)
+    return fig
+
+
+def _life_cycle_bar_page(name, cost_heads, study_period):
+    fig = _new_page(f"{name} - Life-Cycle Costs", f"Life-Cycle Costs for {study_period} years")
+    ax = fig.add_axes([0.42, 0.12, 0.5, 0.78])
+    labels = [label for label, _ in cost_heads]
+    values = [float(value) for _, value in cost_heads]
+    y_pos = range(len(labels))
+    ax.barh(y_pos, values, color=COST_COLORS[:len(labels)])
+    ax.set_yticks(list(y_pos))
+    ax.set_yticklabels(labels, fontsize=8)
+    ax.invert_yaxis()  # labels read top-to-bottom
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.xaxis.grid(True, linestyle='--', alpha=0.7)
+    fig.text(0.5, 0.05, f"Total Life-Cycle Cost: {sum(values):,.2f} Lakh",
+             ha="center", fontsize=11, fontweight="bold")
+    return fig
+
+
+def project_pages(project):
+    """
+    Generate the report pages of one project, one figure at a time.
+
+    Args:
+        project (dict): Project record with the keys ``name``, ``form_data``
+            (dialog name -> saved field dict) and optionally ``results``
+            (``cost_heads`` as a list of (label, value) pairs, ``stages`` as
+            pillar -> per-stage values and ``study_period`` in years).
+
+    Yields:
+        Figure: The next page of the report.
+    """
+    name = project.get("name", "Untitled Project")
+    yield from _input_pages(name, project.get("form_data", {}))
+
+    results = project.get("results")
+    if not results:
+        return
+    study_period = results.get("study_period", 50)
+    cost_heads = [tuple(pair) for pair in results.get("cost_heads", [])]
+    if cost_heads:
+        yield _cost_table_page(name, cost_heads)
+    if results.get("stages"):
+        yield _stage_pie_page(name, results["stages"], study_period)
+    if cost_heads:
+        yield _life_cycle_bar_page(name, cost_heads, study_period)
+
+
+def write_report(path, projects, progress=None):
+    """
+    Stream a multi-page PDF report for any number of projects.
+
+    Pages are written as soon as they are drawn, so ``projects`` may be a
+    generator that loads each bridge lazily.
+
+    Args:
+        path (str): Output PDF file.
+        projects (iterable): Project records, see ``project_pages``.
+        progress (callable): Optional callback receiving the number of
+            projects written so far.
+
+    Returns:
+        int: The number of pages written.
+    """
+    page_count = 0
+    with tracing.span("write_report", "io", path=path), PdfPages(path) as pdf:
+        for count, project in enumerate(projects, start=1):
+            for fig in project_pages(project):
+                with tracing.span("report page", "render"):
+                    pdf.savefig(fig)
+                fig.clear()
+                page_count += 1
+            if progress is not None:
+                progress(count)
+    return page_count
+
+
+def current_project(name="Current Project", results=None):
+    """
+    Build a project record from the data saved by the open dialogs.
+
+    Args:
+        name (str): Title printed on each page.
+        results (dict): Results, see ``project_pages``. By default they are
+            computed from the saved data by ``lcc_engine``.
+
+    Returns:
+        dict: A project record for ``write_report``.
+    """
+    if results is None:
+        results = lcc_engine.evaluate(form_data).report_results()
+    return {"name": name, "form_data": dict(form_data), "results": results}
+
+
+def _with_results(records):
+    """Fill in the ``results`` of the records that have none, in one batch."""
+    missing = [record for record in records if not record.get("results")]
+    if missing:
+        evaluated = lcc_engine.evaluate_batch([record.get("form_data", {}) for record in missing])
+        for record, result in zip(missing, evaluated):
+            record["results"] = result.report_results()
+    return records
+
+
+def iter_portfolio(path, evaluate=True, batch_size=PORTFOLIO_BATCH):
+    """
+    Lazily read a portfolio file with one JSON project record per line.
+
+    Args:
+        path (str): Path to a JSON Lines portfolio file.
+        evaluate (bool): Compute the ``results`` of records that have none.
+        batch_size (int): Records read and evaluated together.
+
+    Yields:
+        dict: One project record at a time.
+
+    Raises:
+        ValueError: If a record's form data uses unit codes the dialogs do
+            not offer, see ``units.check_project``.
+    """
+    batch = []
+    with open(path, encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            try:
+                if not isinstance(record, dict):
+                    raise ValueError("a project record must be an object")
+                units.check_project(record.get("form_data", {}))
+            except ValueError as error:
+                # Hand out the records read before the bad one first
+                yield from _with_results(batch)
+                raise ValueError(f"{path}, line {number}: {error}") from None
+            if not evaluate:
+                yield record
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield from _with_results(batch)
+                batch = []
+    yield from _with_results(batch)
+
+
+if __name__ == "__main__":
+    matplotlib.use("Agg")
+    if len(sys.argv) != 3:
+        print("Usage: python report_generator.py <portfolio.jsonl> <report.pdf>")
+        sys.exit(1)
+    pages = write_report(sys.argv[2], iter_portfolio(sys.argv[1]),
+                         progress=lambda n: print(f"{n} projects written", end="\r"))
+    print(f"\nReport written to {sys.argv[2]} ({pages} pages)")
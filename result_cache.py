@@ -0,0 +1,226 @@
+"""
+Persistent cache of computed results.
+
+Results are stored under a key derived from the canonical JSON of the
+inputs (the data saved by ``save_form_data``), so an unchanged project
+maps to the same key across sessions. Two levels are used:
+
+* an in-memory LRU of decoded results, for instant repeated lookups,
+* an SQLite file on local disk holding encoded results, evicted by least
+  recent use once it exceeds its size budget.
+
+Disk hits do not write: their use times are buffered and written in one
+transaction by ``flush``, which runs with the next write, once
+``TOUCH_FLUSH_ITEMS`` hits are pending, and on ``close``. The size of the
+stored results is kept as a running total, re-read from the file only
+when it appears over budget.
+"""
+
+import atexit
+import collections
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import tracing
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".blcca_studio", "results.sqlite")
+
+# Disk hits whose use time may wait in memory before being written
+TOUCH_FLUSH_ITEMS = 1024
+
+
+def content_key(inputs, namespace=""):
+    """
+    Key of a set of inputs, equal for equal data regardless of dict order.
+
+    Args:
+        inputs: JSON-serializable inputs, e.g. the form data of a project.
+        namespace (str): Distinguishes results of different computations or
+            engine versions computed from the same inputs.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    data = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{namespace}\n{data}".encode("utf-8")).hexdigest()
+
+
+class ResultCache(object):
+    """Two-level (memory, SQLite) cache of encoded results."""
+
+    def __init__(self, path, memory_items=128, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            path (str): SQLite database file, created if missing.
+            memory_items (int): Number of decoded results kept in memory.
+            max_bytes (int): Size budget of the results stored on disk.
+        """
+        self.path = path
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                                "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self.connection.commit()
+        self._touched = {}
+        self._total_bytes = self._stored_bytes()
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def get(self, key, decode):
+        """
+        Look up a result.
+
+        Args:
+            key (str): Key from ``content_key``.
+            decode (callable): Turns the stored bytes back into the result.
+
+        Returns:
+            The result, or None if it is not cached.
+        """
+        with self._lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            with tracing.span("cache read", "io"):
+                row = self.connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._touched[key] = time.time()
+                if len(self._touched) >= TOUCH_FLUSH_ITEMS:
+                    self._flush()
+                    self.connection.commit()
+            value = decode(row[0])
+            self._remember(key, value)
+            return value
+
+    def put(self, key, value, encode):
+        """
+        Store a result in memory and on disk.
+
+        Args:
+            key (str): Key from ``content_key``.
+            value: The result.
+            encode (callable): Turns the result into bytes.
+        """
+        self.put_many([(key, value)], encode)
+
+    def put_many(self, items, encode):
+        """
+        Store many results in one transaction.
+
+        Args:
+            items (list): ``(key, value)`` pairs.
+            encode (callable): Turns a result into bytes.
+        """
+        blobs = [(key, value, encode(value)) for key, value in items]
+        with self._lock:
+            with tracing.span("cache write", "io", size=sum(len(blob) for _key, _value, blob in blobs)):
+                now = time.time()
+                for key, value, blob in blobs:
+                    self._remember(key, value)
+                    self._touched.pop(key, None)
+                    row = self.connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+                    self.connection.execute("INSERT OR REPLACE INTO results (key, value, size, last_used) "
+                                            "VALUES (?, ?, ?, ?)", (key, blob, len(blob), now))
+                    self._total_bytes += len(blob) - (row[0] if row else 0)
+                self._flush()
+                self._evict()
+                self.connection.commit()
+
+    def flush(self):
+        """Write the buffered use times of disk hits."""
+        with self._lock:
+            if self._touched:
+                self._flush()
+                self.connection.commit()
+
+    def _flush(self):
+        touched, self._touched = self._touched, {}
+        self.connection.executemany("UPDATE results SET last_used = ? WHERE key = ?",
+                                    [(used, key) for key, used in touched.items()])
+
+    def _stored_bytes(self):
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get_or_compute(self, key, compute, encode, decode):
+        """
+        Return the cached result of ``key``, computing and storing it if needed.
+
+        Args:
+            key (str): Key from ``content_key``.
+            compute (callable): Computes the result when it is not cached.
+            encode (callable): Turns the result into bytes.
+            decode (callable): Turns stored bytes back into the result.
+        """
+        value = self.get(key, decode)
+        if value is None:
+            value = compute()
+            self.put(key, value, encode)
+        return value
+
+    def _evict(self):
+        """Delete least recently used results until the disk budget is met."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        # Other processes may share the file; trust only its own total
+        total = self._stored_bytes()
+        self._total_bytes = total
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for key, size in self.connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((key,))
+            freed += size
+        self.connection.executemany("DELETE FROM results WHERE key = ?", victims)
+        self._total_bytes = total - freed
+
+    def disk_usage(self):
+        """Return the number of bytes of results stored on disk."""
+        with self._lock:
+            return self._total_bytes
+
+    def clear(self):
+        """Forget every cached result."""
+        with self._lock:
+            self.memory.clear()
+            self._touched = {}
+            self.connection.execute("DELETE FROM results")
+            self.connection.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.connection.close()
+
+
+_default_cache = None
+
+
+def default_cache():
+    """Return the cache shared by the application, opening it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache(DEFAULT_CACHE_PATH)
+        atexit.register(_default_cache.flush)
+    return _default_cache
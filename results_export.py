@@ -0,0 +1,221 @@
+"""
+Export of life-cycle cost results to Apache Parquet.
+
+Two tables are written:
+
+* the head table, one row per bridge, cost head and year, with columns
+  ``bridge``, ``pillar``, ``stage``, ``cost_head``, ``year`` and ``value``
+  (present value in INR),
+* the stage table, one row per bridge, pillar and stage, with the total
+  present value of that stage.
+
+Text columns are dictionary encoded, so the repeated bridge, pillar,
+stage and head names cost a few bytes per row. Results are buffered until
+``batch_rows`` rows are collected and then written as one Arrow record
+batch (one Parquet row group), so a portfolio of any size is exported with
+bounded memory. Readers such as pandas or DuckDB can load only the columns
+and row groups they need.
+
+Usage from the command line::
+
+    python results_export.py portfolio.jsonl results.parquet
+
+writes ``results.parquet`` and ``results_stages.parquet``. Requires
+``pyarrow``; the rest of the application works without it.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+import lcc_engine
+
+
+# Rows collected before a record batch is written
+DEFAULT_BATCH_ROWS = 1 << 20
+
+_HEAD_PILLARS = np.array([lcc_engine.PILLARS.index(pillar) for _label, pillar, _stage in lcc_engine.COST_HEADS])
+_HEAD_STAGES = np.array([lcc_engine.STAGES.index(stage) for _label, _pillar, stage in lcc_engine.COST_HEADS])
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Exporting results to Parquet requires pyarrow (pip install pyarrow)")
+
+
+def stages_path_for(path):
+    """Return the stage table file written next to the head table ``path``."""
+    root, extension = os.path.splitext(path)
+    return f"{root}_stages{extension or '.parquet'}"
+
+
+def _category():
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _categorical(codes, labels):
+    """
+    Dictionary-encoded column from integer codes into ``labels``.
+
+    Repeated labels, e.g. two bridges with the same name, share one
+    dictionary value; Parquet readers expect dictionary values to be unique.
+    """
+    unique = list(dict.fromkeys(labels))
+    if len(unique) < len(labels):
+        position = {label: index for index, label in enumerate(unique)}
+        codes = np.array([position[label] for label in labels], dtype=np.int32)[codes]
+    return pa.DictionaryArray.from_arrays(pa.array(np.asarray(codes, dtype=np.int32), type=pa.int32()),
+                                          pa.array(unique, type=pa.string()))
+
+
+class ParquetResultsWriter(object):
+    """Streams ``LCCResult`` objects into the head and stage Parquet tables."""
+
+    def __init__(self, path, stages_path=None, batch_rows=DEFAULT_BATCH_ROWS, compression="zstd"):
+        """
+        Args:
+            path (str): Head table file.
+            stages_path (str): Stage table file; next to ``path`` by default.
+            batch_rows (int): Rows of the head table per record batch.
+            compression (str): Parquet compression codec.
+        """
+        _require_pyarrow()
+        self.batch_rows = batch_rows
+        self.head_schema = pa.schema([
+            pa.field("bridge", _category()),
+            pa.field("pillar", _category()),
+            pa.field("stage", _category()),
+            pa.field("cost_head", _category()),
+            pa.field("year", pa.int16()),
+            pa.field("value", pa.float64()),
+        ])
+        self.stage_schema = pa.schema([
+            pa.field("bridge", _category()),
+            pa.field("pillar", _category()),
+            pa.field("stage", _category()),
+            pa.field("value", pa.float64()),
+        ])
+        self.head_writer = pq.ParquetWriter(path, self.head_schema, compression=compression)
+        self.stage_writer = pq.ParquetWriter(stages_path or stages_path_for(path), self.stage_schema,
+                                             compression=compression)
+        self.rows_written = 0
+        self._names = []
+        self._results = []
+        self._pending_rows = 0
+
+    def write(self, name, result):
+        """
+        Add the results of one bridge.
+
+        Args:
+            name (str): Bridge name stored in the ``bridge`` column.
+            result (LCCResult): Its results.
+        """
+        self._names.append(name)
+        self._results.append(result)
+        self._pending_rows += result.head_values.size
+        if self._pending_rows >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered bridges as one record batch of each table."""
+        if not self._results:
+            return
+        names, results = self._names, self._results
+        self._names, self._results, self._pending_rows = [], [], 0
+
+        sizes = np.array([result.head_values.size for result in results])
+        heads = np.concatenate([np.repeat(np.arange(result.head_values.shape[0]), result.head_values.shape[1])
+                                for result in results])
+        years = np.concatenate([np.tile(np.arange(result.head_values.shape[1]), result.head_values.shape[0])
+                                for result in results])
+        values = np.concatenate([result.head_values.ravel() for result in results])
+        bridges = np.repeat(np.arange(len(results)), sizes)
+        self.head_writer.write_batch(pa.RecordBatch.from_arrays([
+            _categorical(bridges, names),
+            _categorical(_HEAD_PILLARS[heads], lcc_engine.PILLARS),
+            _categorical(_HEAD_STAGES[heads], lcc_engine.STAGES),
+            _categorical(heads, lcc_engine.HEAD_LABELS),
+            pa.array(years.astype(np.int16), type=pa.int16()),
+            pa.array(values, type=pa.float64()),
+        ], schema=self.head_schema))
+
+        # (bridges, pillars, stages) totals, flattened in C order
+        totals = np.stack([result.stage_totals() for result in results])
+        index = np.indices(totals.shape).reshape(3, -1)
+        self.stage_writer.write_batch(pa.RecordBatch.from_arrays([
+            _categorical(index[0], names),
+            _categorical(index[1], lcc_engine.PILLARS),
+            _categorical(index[2], lcc_engine.STAGES),
+            pa.array(totals.ravel(), type=pa.float64()),
+        ], schema=self.stage_schema))
+        self.rows_written += int(sizes.sum())
+
+    def close(self):
+        """Write what is left and finish both files."""
+        self.flush()
+        self.head_writer.close()
+        self.stage_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def export_results(path, named_results, batch_rows=DEFAULT_BATCH_ROWS, progress=None):
+    """
+    Stream results to Parquet.
+
+    Args:
+        path (str): Head table file; the stage table goes next to it.
+        named_results (iterable): ``(bridge name, LCCResult)`` pairs; may be
+            a generator computing each bridge lazily.
+        batch_rows (int): Rows of the head table per record batch.
+        progress (callable): Optional callback receiving the number of
+            bridges written so far.
+
+    Returns:
+        int: Number of rows of the head table.
+    """
+    with ParquetResultsWriter(path, batch_rows=batch_rows) as writer:
+        for count, (name, result) in enumerate(named_results, start=1):
+            writer.write(name, result)
+            if progress is not None:
+                progress(count)
+    return writer.rows_written
+
+
+def portfolio_results(projects):
+    """
+    Evaluate project records lazily.
+
+    Args:
+        projects (iterable): Records with ``name`` and ``form_data``, e.g.
+            from ``report_generator.iter_portfolio``.
+
+    Yields:
+        tuple: ``(name, LCCResult)`` of each project.
+    """
+    for count, project in enumerate(projects, start=1):
+        yield project.get("name", f"Bridge {count}"), lcc_engine.evaluate(project.get("form_data", {}))
+
+
+if __name__ == "__main__":
+    from report_generator import iter_portfolio
+    if len(sys.argv) != 3:
+        print("Usage: python results_export.py <portfolio.jsonl> <results.parquet>")
+        sys.exit(1)
+    rows = export_results(sys.argv[2], portfolio_results(iter_portfolio(sys.argv[1], evaluate=False)),
+                          progress=lambda n: print(f"{n} projects written", end="\r"))
+    print(f"\nResults written to {sys.argv[2]} and {stages_path_for(sys.argv[2])} ({rows} rows)")
@@ -0,0 +1,190 @@
+"""
+Samplers of the unit hypercube for uncertainty runs.
+
+Every sampler returns an (n, d) array of points in [0, 1) that
+``monte_carlo`` maps to the factor ranges of its parameters:
+
+* ``random_uniform``: independent draws, the reference.
+* ``latin_hypercube``: each dimension is cut into ``n`` equal strata and
+  every stratum gets exactly one point, in random order.
+* ``sobol``: the Sobol low-discrepancy sequence with the direction numbers
+  of Joe and Kuo (2008) for up to ``SOBOL_MAX_DIMENSIONS`` dimensions,
+  randomized by a linear matrix scramble and a digital shift so that
+  independent replicates give error estimates. Sample sizes that are
+  powers of two keep the sequence balanced.
+
+``iman_conover`` then reorders the columns of any sample to a target rank
+correlation without changing the values of each column.
+"""
+
+import statistics
+
+import numpy as np
+
+
+# Bits of the Sobol points, enough for 2**30 samples
+SOBOL_BITS = 30
+
+# Degree s, polynomial coefficients a and initial direction numbers m of
+# dimensions 2.. (dimension 1 is the van der Corput sequence)
+SOBOL_DIRECTIONS = [
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+]
+SOBOL_MAX_DIMENSIONS = len(SOBOL_DIRECTIONS) + 1
+
+
+def random_uniform(n, d, rng):
+    """Independent uniform points."""
+    return rng.random((n, d))
+
+
+def latin_hypercube(n, d, rng):
+    """
+    Latin hypercube sample.
+
+    Args:
+        n (int): Number of points.
+        d (int): Number of dimensions.
+        rng (numpy.random.Generator): Random source.
+
+    Returns:
+        ndarray: Shape (n, d), one point in every 1/n stratum of each dimension.
+    """
+    strata = rng.permuted(np.tile(np.arange(n), (d, 1)), axis=1).T
+    return (strata + rng.random((n, d))) / n
+
+
+def _direction_integers(d):
+    """(d, SOBOL_BITS) direction numbers as integers with SOBOL_BITS bits."""
+    if d > SOBOL_MAX_DIMENSIONS:
+        raise ValueError(f"Sobol points are available for up to {SOBOL_MAX_DIMENSIONS} dimensions")
+    directions = np.zeros((d, SOBOL_BITS), dtype=np.int64)
+    directions[0] = 1 << np.arange(SOBOL_BITS - 1, -1, -1)
+    for dimension, (s, a, initial) in enumerate(SOBOL_DIRECTIONS[:d - 1], start=1):
+        m = list(initial)
+        for k in range(s, SOBOL_BITS):
+            value = m[k - s] ^ (m[k - s] << s)
+            for j in range(1, s):
+                if (a >> (s - 1 - j)) & 1:
+                    value ^= m[k - j] << j
+            m.append(value)
+        directions[dimension] = [m[k] << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)]
+    return directions
+
+
+def _bits(values):
+    """Integers as bit columns, most significant bit first: shape (..., SOBOL_BITS)."""
+    return (values[..., None] >> np.arange(SOBOL_BITS - 1, -1, -1)) & 1
+
+
+def _scramble(directions, rng):
+    """Linear matrix scramble: multiply every generator matrix by a random unit lower-triangular one."""
+    d = directions.shape[0]
+    lower = np.tril(rng.integers(0, 2, (d, SOBOL_BITS, SOBOL_BITS)), -1) + np.eye(SOBOL_BITS, dtype=np.int64)
+    # Columns of the generator matrix of each dimension are its direction numbers
+    generators = np.swapaxes(_bits(directions), 1, 2)
+    scrambled = (lower @ generators) % 2
+    weights = 1 << np.arange(SOBOL_BITS - 1, -1, -1)
+    return np.einsum("dbk,b->dk", scrambled, weights)
+
+
+def sobol(n, d, rng, scramble=True):
+    """
+    Sobol points.
+
+    Args:
+        n (int): Number of points; powers of two keep the sequence balanced.
+        d (int): Number of dimensions, at most ``SOBOL_MAX_DIMENSIONS``.
+        rng (numpy.random.Generator): Random source of the scramble.
+        scramble (bool): Randomize the points; the plain sequence starts at 0.
+
+    Returns:
+        ndarray: Shape (n, d).
+    """
+    directions = _direction_integers(d)
+    shift = np.zeros(d, dtype=np.int64)
+    if scramble:
+        directions = _scramble(directions, rng)
+        shift = rng.integers(0, 1 << SOBOL_BITS, d)
+    index = np.arange(n, dtype=np.int64)
+    gray = index ^ (index >> 1)
+    points = np.broadcast_to(shift, (n, d)).copy()
+    for bit in range(max(1, int(n - 1).bit_length())):
+        points ^= ((gray >> bit) & 1)[:, None] * directions[:, bit]
+    return points / float(1 << SOBOL_BITS)
+
+
+SAMPLERS = {
+    "random": random_uniform,
+    "lhs": latin_hypercube,
+    "sobol": sobol,
+}
+
+
+def _normal_scores(n):
+    """van der Waerden scores: standard normal quantiles of i / (n + 1)."""
+    normal = statistics.NormalDist()
+    return np.array([normal.inv_cdf(i / (n + 1)) for i in range(1, n + 1)])
+
+
+def iman_conover(sample, correlation, rng):
+    """
+    Reorder the columns of a sample to a target rank correlation.
+
+    The values of every column are kept; only their pairing changes, so
+    stratification of each dimension (e.g. Latin hypercube) is preserved.
+
+    Args:
+        sample (array): Shape (n, d).
+        correlation (array): Target (d, d) correlation matrix, positive definite.
+        rng (numpy.random.Generator): Random source of the score permutations.
+
+    Returns:
+        ndarray: Shape (n, d).
+    """
+    sample = np.asarray(sample, dtype=float)
+    n, d = sample.shape
+    scores = rng.permuted(np.tile(_normal_scores(n), (d, 1)), axis=1).T
+    current = np.linalg.cholesky(np.corrcoef(scores, rowvar=False))
+    target = np.linalg.cholesky(np.asarray(correlation, dtype=float))
+    # Scores with (almost exactly) the target correlation
+    scores = scores @ np.linalg.inv(current).T @ target.T
+    ranks = np.argsort(np.argsort(scores, axis=0), axis=0)
+    return np.take_along_axis(np.sort(sample, axis=0), ranks, axis=0)
+
+
+def correlation_matrix(names, correlations):
+    """
+    Build a correlation matrix from pairwise values.
+
+    Args:
+        names (list): Parameter names, in sample column order.
+        correlations (dict): ``(name, name) -> rank correlation``; missing
+            pairs are uncorrelated.
+
+    Returns:
+        ndarray: Shape (len(names), len(names)).
+    """
+    matrix = np.eye(len(names))
+    for (first, second), value in correlations.items():
+        i, j = names.index(first), names.index(second)
+        matrix[i, j] = matrix[j, i] = value
+    return matrix
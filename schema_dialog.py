@@ -0,0 +1,275 @@
+"""
+Project Details dialogs built at runtime from ``dialog_schema``.
+
+One set of widget factories creates the input for every field kind, and
+``SchemaForm`` lays the fields of a schema out with Qt layouts instead of
+absolute geometry. Labels are translated once while the form is built.
+"""
+
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtWidgets import QMessageBox
+
+import tracing
+from dialog_schema import default_row, defaults, validate
+from form_data_storage import get_form_data, record_field_edit, save_form_data
+
+
+def _create_number(field):
+    widget = QtWidgets.QDoubleSpinBox()
+    widget.setDecimals(3)
+    widget.setRange(field.minimum if field.minimum is not None else -1e12,
+                    field.maximum if field.maximum is not None else 1e12)
+    return widget
+
+
+def _create_integer(field):
+    widget = QtWidgets.QSpinBox()
+    widget.setRange(int(field.minimum if field.minimum is not None else -2 ** 31),
+                    int(field.maximum if field.maximum is not None else 2 ** 31 - 1))
+    return widget
+
+
+def _create_choice(field):
+    widget = QtWidgets.QComboBox()
+    for choice in field.choices:
+        widget.addItem(str(choice), choice)
+    return widget
+
+
+def _set_choice(widget, value):
+    index = widget.findText(str(value))
+    widget.setCurrentIndex(max(index, 0))
+
+
+# kind -> (create, get value, set value, change signal name)
+WIDGET_FACTORIES = {
+    "number": (_create_number, lambda w: w.value(), lambda w, v: w.setValue(float(v)), "valueChanged"),
+    "integer": (_create_integer, lambda w: w.value(), lambda w, v: w.setValue(int(float(v))), "valueChanged"),
+    "choice": (_create_choice, lambda w: w.currentData(), _set_choice, "currentIndexChanged"),
+    "text": (lambda field: QtWidgets.QLineEdit(), lambda w: w.text(), lambda w, v: w.setText(str(v)),
+             "textChanged"),
+}
+
+
+def create_input(field, context):
+    """
+    Create the input widget of a field.
+
+    Args:
+        field (Field): The field to create an input for.
+        context (str): Translation context of the dialog.
+
+    Returns:
+        QWidget: The input widget.
+    """
+    create, _get, _set, _signal = WIDGET_FACTORIES[field.kind]
+    widget = create(field)
+    widget.setObjectName(field.key)
+    if field.help_text:
+        widget.setToolTip(QtCore.QCoreApplication.translate(context, field.help_text))
+    if field.unit and field.kind in ("number", "integer"):
+        widget.setSuffix(f" {field.unit}")
+    return widget
+
+
+def input_value(field, widget):
+    return WIDGET_FACTORIES[field.kind][1](widget)
+
+
+def set_input_value(field, widget, value):
+    if value is None or value == "":
+        value = field.default
+    try:
+        WIDGET_FACTORIES[field.kind][2](widget, value)
+    except (TypeError, ValueError):
+        WIDGET_FACTORIES[field.kind][2](widget, field.default)
+
+
+def connect_input(field, widget, slot):
+    getattr(widget, WIDGET_FACTORIES[field.kind][3]).connect(lambda *args: slot())
+
+
+class SchemaForm(QtWidgets.QWidget):
+    """The inputs of one dialog schema, laid out section by section"""
+
+    # Emitted with the key and new value whenever the user edits a field;
+    # for repeated sections the key is the section key and the value all rows
+    edited = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, schema, data=None, parent=None):
+        super(SchemaForm, self).__init__(parent)
+        self.schema = schema
+        self.inputs = {}
+        self.rows = {}
+        self.row_layouts = {}
+        self._loading = False
+        with tracing.span("SchemaForm", "ui", schema=schema.name):
+            self.initUI()
+            self.set_values(data if data is not None else defaults(schema))
+
+    def initUI(self):
+        _translate = QtCore.QCoreApplication.translate
+        context = self.schema.name
+        layout = QtWidgets.QVBoxLayout(self)
+
+        for section in self.schema.sections:
+            group = QtWidgets.QGroupBox(_translate(context, section.title))
+            group.setStyleSheet("QGroupBox { font-weight: bold; }")
+            if section.repeated:
+                group_layout = QtWidgets.QVBoxLayout(group)
+                rows_layout = QtWidgets.QVBoxLayout()
+                group_layout.addLayout(rows_layout)
+                add_button = QtWidgets.QPushButton(_translate(context, section.add_label))
+                add_button.clicked.connect(lambda checked, s=section: self.add_row(s, default_row(s), True))
+                group_layout.addWidget(add_button, 0, QtCore.Qt.AlignLeft)
+                self.rows[section.key] = []
+                self.row_layouts[section.key] = rows_layout
+            else:
+                form_layout = QtWidgets.QFormLayout(group)
+                for field in section.fields:
+                    widget = create_input(field, context)
+                    connect_input(field, widget, lambda f=field: self._field_edited(f))
+                    form_layout.addRow(_translate(context, field.label), widget)
+                    self.inputs[field.key] = (field, widget)
+            layout.addWidget(group)
+
+        layout.addStretch()
+
+    def add_row(self, section, values, notify=False):
+        """Add one row of inputs to a repeated section."""
+        _translate = QtCore.QCoreApplication.translate
+        context = self.schema.name
+        row_widget = QtWidgets.QFrame()
+        row_widget.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        row_layout = QtWidgets.QFormLayout(row_widget)
+
+        row_inputs = {}
+        for field in section.fields:
+            widget = create_input(field, context)
+            set_input_value(field, widget, values.get(field.key))
+            connect_input(field, widget, lambda s=section: self._rows_edited(s))
+            row_layout.addRow(_translate(context, field.label), widget)
+            row_inputs[field.key] = (field, widget)
+
+        remove_button = QtWidgets.QPushButton("×")
+        remove_button.setFixedSize(20, 20)
+        remove_button.clicked.connect(lambda checked: self.remove_row(section, row_widget))
+        row_layout.addRow("", remove_button)
+
+        row_widget.row_inputs = row_inputs
+        self.rows[section.key].append(row_widget)
+        self.row_layouts[section.key].addWidget(row_widget)
+        if notify:
+            self._rows_edited(section)
+
+    def remove_row(self, section, row_widget):
+        self.rows[section.key].remove(row_widget)
+        row_widget.deleteLater()
+        self._rows_edited(section)
+
+    def values(self):
+        """Return the current values, shaped like the saved form data."""
+        data = {key: input_value(field, widget) for key, (field, widget) in self.inputs.items()}
+        for key, row_widgets in self.rows.items():
+            data[key] = [{field_key: input_value(field, widget)
+                          for field_key, (field, widget) in row_widget.row_inputs.items()}
+                         for row_widget in row_widgets]
+        return data
+
+    def set_values(self, data):
+        """Show saved form data; missing values fall back to the defaults."""
+        self._loading = True
+        for key, (field, widget) in self.inputs.items():
+            set_input_value(field, widget, data.get(key))
+        for section in self.schema.sections:
+            if not section.repeated:
+                continue
+            for row_widget in self.rows[section.key]:
+                row_widget.deleteLater()
+            self.rows[section.key] = []
+            for row in data.get(section.key) or [default_row(section)]:
+                self.add_row(section, row)
+        self._loading = False
+
+    def _field_edited(self, field):
+        if not self._loading:
+            self.edited.emit(field.key, input_value(field, self.inputs[field.key][1]))
+
+    def _rows_edited(self, section):
+        if not self._loading:
+            self.edited.emit(section.key, self.values()[section.key])
+
+
+class SchemaPage(QtWidgets.QWidget):
+    """Header, scrollable form and Save/Close buttons of one schema"""
+
+    # Emitted after the form was validated and saved
+    saved = QtCore.pyqtSignal()
+    # Emitted after the user confirmed closing without saving
+    closed = QtCore.pyqtSignal()
+
+    def __init__(self, schema, parent=None):
+        super(SchemaPage, self).__init__(parent)
+        self.schema = schema
+        # Edits are journaled as they happen; keep what was saved on open so
+        # that closing without saving can put it back
+        self.saved_data = dict(get_form_data(schema.name))
+        with tracing.span("SchemaPage", "ui", schema=schema.name):
+            self.initUI()
+
+    def initUI(self):
+        _translate = QtCore.QCoreApplication.translate
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header = QtWidgets.QLabel(_translate(self.schema.name, self.schema.title))
+        header.setStyleSheet("background-color: rgb(240,230,230); font-weight: bold; padding: 5px;")
+        layout.addWidget(header)
+
+        scroll_area = QtWidgets.QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        self.form = SchemaForm(self.schema, self.saved_data or None)
+        self.form.edited.connect(lambda key, value: record_field_edit(self.schema.name, key, value))
+        scroll_area.setWidget(self.form)
+        layout.addWidget(scroll_area)
+
+        self.buttonBox = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Close | QtWidgets.QDialogButtonBox.Save)
+        self.buttonBox.accepted.connect(self.save_data)
+        self.buttonBox.rejected.connect(self.show_warning)
+        layout.addWidget(self.buttonBox)
+
+    def reload(self):
+        """Show the data currently saved for this dialog, e.g. after a restore."""
+        self.saved_data = dict(get_form_data(self.schema.name))
+        self.form.set_values(self.saved_data or defaults(self.schema))
+
+    def save_data(self):
+        """
+        Validate the form and save it to the global dictionary.
+        """
+        data = self.form.values()
+        errors = validate(self.schema, data)
+        if errors:
+            QMessageBox.warning(self, "Invalid Input", "\n".join(errors))
+            return
+        save_form_data(self.schema.name, data)
+        self.saved_data = data
+        self.saved.emit()
+
+    def show_warning(self):
+        """
+        Show a warning window when the Close button is pressed.
+        """
+        warning_box = QMessageBox()
+        warning_box.setIcon(QMessageBox.Warning)
+        warning_box.setWindowTitle("Confirm Close")
+        warning_box.setText("Are you sure you want to close without saving?")
+        warning_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        warning_box.setDefaultButton(QMessageBox.No)
+
+        # Check the user's response
+        response = warning_box.exec_()
+        if response == QMessageBox.Yes:
+            save_form_data(self.schema.name, self.saved_data)
+            self.closed.emit()
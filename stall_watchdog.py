@@ -0,0 +1,133 @@
+"""
+Watchdog reporting stalls of the Qt event loop.
+
+A ``QTimer`` on the GUI thread beats every ``interval`` seconds and stamps
+the time of each beat. A daemon thread wakes up at the same rate and
+compares the clock with the last beat: the difference is the latency of the
+event loop. When it exceeds ``threshold`` the GUI thread is stuck in some
+Python code, and the watchdog takes that thread's current stack from
+``sys._current_frames`` and writes it to a rotating log, once per stall.
+When the loop comes back, the next beat logs how long the stall lasted.
+
+Usage, once the ``QApplication`` exists::
+
+    watchdog = stall_watchdog.start()
+    app.aboutToQuit.connect(watchdog.stop)
+"""
+
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PyQt5 import QtCore
+
+
+DEFAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), ".blcca_studio", "stalls.log")
+
+logger = logging.getLogger("blcca_studio.stalls")
+
+
+def _log_to(path, max_bytes=1024 * 1024, backup_count=3):
+    """Send the stall log to a rotating file, once per path."""
+    path = os.path.abspath(path)
+    for handler in logger.handlers:
+        if getattr(handler, "baseFilename", None) == path:
+            return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                   encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class StallWatchdog(QtCore.QObject):
+    """Measures event-loop latency and logs the GUI stack of long stalls."""
+
+    def __init__(self, threshold=0.5, interval=0.1, parent=None):
+        """
+        Args:
+            threshold (float): Latency in seconds reported as a stall.
+            interval (float): Seconds between heartbeats and checks.
+            parent (QObject): Optional Qt parent.
+        """
+        super().__init__(parent)
+        self.threshold = threshold
+        self.interval = interval
+        self.max_latency = 0.0
+        self.stall_count = 0
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._reported = False
+        self._stop = threading.Event()
+        self._thread = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(int(interval * 1000))
+        self._timer.timeout.connect(self._beat)
+
+    def start(self):
+        """Start beating on the GUI thread and watching from a daemon thread."""
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self):
+        now = time.monotonic()
+        latency = now - self._last_beat - self.interval
+        self._last_beat = now
+        self.max_latency = max(self.max_latency, latency)
+        if latency > self.threshold:
+            logger.warning("Event loop resumed after %.0f ms", latency * 1000.0)
+            self._reported = False
+
+    def latency(self):
+        """Current delay of the event loop behind its next heartbeat, in seconds."""
+        return max(0.0, time.monotonic() - self._last_beat - self.interval)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            latency = self.latency()
+            if latency > self.threshold and not self._reported:
+                self._reported = True
+                self.stall_count += 1
+                self._dump(latency)
+
+    def _dump(self, latency):
+        frame = sys._current_frames().get(self._gui_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "  <no frame>\n"
+        logger.warning("Event loop stalled for %.0f ms, GUI thread stack:\n%s", latency * 1000.0, stack)
+
+
+def start(threshold=0.5, log_path=DEFAULT_LOG_PATH):
+    """
+    Log stalls of the running application's event loop.
+
+    Must be called on the GUI thread after the ``QApplication`` is created.
+
+    Args:
+        threshold (float): Latency in seconds reported as a stall.
+        log_path (str): Rotating log file.
+
+    Returns:
+        StallWatchdog: The started watchdog; call ``stop`` before quitting.
+    """
+    _log_to(log_path)
+    watchdog = StallWatchdog(threshold, parent=QtCore.QCoreApplication.instance())
+    watchdog.start()
+    return watchdog
@@ -0,0 +1,192 @@
+"""
+Running statistics of Monte Carlo results.
+
+Statistics are updated one chunk of samples at a time and take constant
+memory whatever the number of samples:
+
+* ``RunningMoments`` keeps count, mean and sum of squared deviations of
+  an array of outputs and merges each chunk with the parallel form of
+  Welford's update (Chan et al.), which stays accurate for large values.
+* ``P2Quantiles`` estimates quantiles with the P-square algorithm (Jain
+  and Chlamtac, 1985): five markers per quantile whose heights are
+  adjusted by piecewise-parabolic interpolation as observations arrive.
+  The markers of all streams and quantiles are kept in (estimators, 5)
+  arrays, so every observation is one set of array operations.
+
+``MonteCarloSummary`` combines both for the present value of each cost
+head and of the total, which is what the results panel shows.
+"""
+
+import numpy as np
+
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+class RunningMoments(object):
+    """Mean and variance of an array-valued output, merged chunk by chunk."""
+
+    def __init__(self, shape=()):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+
+    def update(self, block):
+        """
+        Add a chunk of samples.
+
+        Args:
+            block (array): Shape (samples,) + shape.
+        """
+        block = np.asarray(block, dtype=float)
+        n = len(block)
+        if n == 0:
+            return
+        block_mean = block.mean(axis=0)
+        block_m2 = ((block - block_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = block_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + block_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+
+    def variance(self):
+        """Sample variance (NaN until two samples are seen)."""
+        if self.count < 2:
+            return np.full_like(self.mean, np.nan)
+        return self.m2 / (self.count - 1)
+
+    def std(self):
+        return np.sqrt(self.variance())
+
+
+class P2Quantiles(object):
+    """P-square estimates of several quantiles of several streams."""
+
+    def __init__(self, streams, quantiles=DEFAULT_QUANTILES):
+        """
+        Args:
+            streams (int): Number of independent streams of observations.
+            quantiles (sequence): Probabilities in (0, 1).
+        """
+        self.streams = streams
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        p = np.tile(self.quantiles, streams)[:, None]
+        # One estimator per (stream, quantile), streams major
+        self.increments = np.hstack([np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)])
+        self.desired = np.hstack([np.zeros_like(p), 2 * p, 4 * p, 2 + 2 * p, 4 * np.ones_like(p)])
+        self.positions = np.tile(np.arange(5.0), (len(p), 1))
+        self.heights = np.zeros((len(p), 5))
+        self.count = 0
+        self._first = []
+        self._markers = np.arange(5)
+
+    def update(self, block):
+        """
+        Add observations.
+
+        Args:
+            block (array): Shape (samples, streams).
+        """
+        block = np.asarray(block, dtype=float).reshape(-1, self.streams)
+        start = 0
+        while self.count < 5 and start < len(block):
+            self._first.append(block[start])
+            self.count += 1
+            start += 1
+            if self.count == 5:
+                first = np.sort(np.array(self._first), axis=0)
+                self.heights = np.repeat(first.T, len(self.quantiles), axis=0)
+        for row in np.repeat(block[start:], len(self.quantiles), axis=1):
+            self._add(row)
+
+    def _add(self, x):
+        q, n = self.heights, self.positions
+        # Cell of each observation, extending the extreme markers if needed
+        np.minimum(q[:, 0], x, out=q[:, 0])
+        np.maximum(q[:, 4], x, out=q[:, 4])
+        k = (x[:, None] >= q[:, 1:4]).sum(axis=1)
+        n += self._markers > k[:, None]
+        self.desired += self.increments
+        self.count += 1
+
+        # Markers are adjusted in order, each seeing its updated neighbour;
+        # estimators whose marker stays put get s = 0 and keep their height
+        for i in (1, 2, 3):
+            d = self.desired[:, i] - n[:, i]
+            ni, nm, np_ = n[:, i], n[:, i - 1], n[:, i + 1]
+            s = (((d >= 1) & (np_ - ni > 1)).astype(float)
+                 - ((d <= -1) & (nm - ni < -1)))
+            if not s.any():
+                continue
+            qi, qm, qp = q[:, i], q[:, i - 1], q[:, i + 1]
+            parabolic = qi + s / (np_ - nm) * ((ni - nm + s) * (qp - qi) / (np_ - ni)
+                                               + (np_ - ni - s) * (qi - qm) / (ni - nm))
+            linear = np.where(s > 0, qi + (qp - qi) / (np_ - ni), qi - (qm - qi) / (nm - ni))
+            q[:, i] = np.where(s == 0, qi, np.where((qm < parabolic) & (parabolic < qp), parabolic, linear))
+            n[:, i] += s
+
+    def estimates(self):
+        """
+        Current estimates.
+
+        Returns:
+            ndarray: Shape (streams, quantiles); exact order statistics
+            while fewer than five observations have been seen.
+        """
+        if self.count == 0:
+            return np.full((self.streams, len(self.quantiles)), np.nan)
+        if self.count < 5:
+            return np.quantile(np.array(self._first), self.quantiles, axis=0).T
+        return self.heights[:, 2].reshape(self.streams, len(self.quantiles))
+
+
+class MonteCarloSummary(object):
+    """Running mean, standard deviation and quantiles of each cost head and the total."""
+
+    def __init__(self, heads, quantiles=DEFAULT_QUANTILES):
+        """
+        Args:
+            heads (list): Labels of the cost heads; a "Total" row is added.
+            quantiles (sequence): Probabilities to estimate.
+        """
+        self.labels = list(heads) + ["Total"]
+        self.quantiles = tuple(quantiles)
+        self.moments = RunningMoments((len(self.labels),))
+        self.yearly = None
+        self.p2 = P2Quantiles(len(self.labels), quantiles)
+
+    def update(self, block):
+        """
+        Add a chunk of Monte Carlo samples.
+
+        Args:
+            block (array): Shape (samples, heads, years) of present values.
+        """
+        block = np.asarray(block, dtype=float)
+        head_totals = block.sum(axis=2)
+        values = np.hstack([head_totals, head_totals.sum(axis=1, keepdims=True)])
+        self.moments.update(values)
+        if self.yearly is None:
+            self.yearly = RunningMoments(block.shape[2:])
+        self.yearly.update(block.sum(axis=1))
+        self.p2.update(values)
+
+    def snapshot(self):
+        """
+        Current statistics, safe to hand to another thread.
+
+        Returns:
+            dict: ``count``, ``labels``, ``quantiles``, ``mean`` and ``std``
+            per label, ``estimates`` (labels, quantiles) and the mean total
+            per year in ``yearly_mean``.
+        """
+        return {
+            "count": self.moments.count,
+            "labels": list(self.labels),
+            "quantiles": self.quantiles,
+            "mean": self.moments.mean.copy(),
+            "std": self.moments.std(),
+            "estimates": self.p2.estimates().copy(),
+            "yearly_mean": None if self.yearly is None else self.yearly.mean.copy(),
+        }
@@ -0,0 +1,323 @@
+"""
+Polynomial chaos surrogate of the life-cycle cost engine.
+
+What-if exploration changes a few inputs of one project over and over,
+and the exact engine, cheap as it is, is too slow to call for every
+slider move of every sample of a Monte Carlo run. ``fit`` builds a
+surrogate of one project instead:
+
+* the varied inputs are fields of the Financial Data and Bridge and
+  Traffic Data dialogs (``DEFAULT_VARIABLES``), each over a range around
+  its saved value, the trained domain;
+* a scrambled Sobol design of experiments over that box is evaluated with
+  ``lcc_engine.batch_head_values``, all points in one batch;
+* the present value of each cost head is fitted by least squares on a
+  total-degree basis of orthonormal Legendre polynomials (a polynomial
+  chaos expansion for inputs uniform over the box).
+
+Predictions are one small matrix product, a few microseconds per point.
+Every head comes with an error bound: the root-mean-square leave-one-out
+error of the fit, computed exactly from the hat matrix without refitting.
+``Surrogate.predict`` falls back to the exact engine, with a zero error,
+when a project leaves the trained domain: a varied input outside its
+range, or any other input different from the project that was fitted.
+``Surrogate.predict_many`` does the same for many projects at once.
+
+The surrogate is an opt-in backend of the what-if sliders
+(``what_if.SurrogateWhatIfModel``) and of Monte Carlo runs
+(``monte_carlo.run(..., backend="surrogate")``).
+"""
+
+import math
+
+import numpy as np
+
+import dialog_schema
+import lcc_engine
+import sampling
+from result_cache import content_key
+
+
+# Inputs the surrogate varies: (dialog schema, field key)
+DEFAULT_VARIABLES = [
+    (dialog_schema.FINANCIAL, "real_discount_rate"),
+    (dialog_schema.FINANCIAL, "construction_time"),
+    (dialog_schema.BRIDGE_TRAFFIC, "reroute_distance"),
+    (dialog_schema.BRIDGE_TRAFFIC, "traffic_growth"),
+    (dialog_schema.BRIDGE_TRAFFIC, "cars"),
+    (dialog_schema.BRIDGE_TRAFFIC, "buses"),
+    (dialog_schema.BRIDGE_TRAFFIC, "lcv"),
+    (dialog_schema.BRIDGE_TRAFFIC, "mcv"),
+    (dialog_schema.BRIDGE_TRAFFIC, "hcv"),
+]
+
+DEFAULT_DEGREE = 3
+
+# Relative half-width of the trained range around each saved value
+DEFAULT_SPREAD = 0.5
+
+# Design points per basis term; least squares needs well over one
+OVERSAMPLING = 2
+
+
+def _field(schema, key):
+    return next(field for field in schema.fields() if field.key == key)
+
+
+def multi_indices(dimensions, degree):
+    """
+    Exponents of the total-degree basis.
+
+    Args:
+        dimensions (int): Number of variables.
+        degree (int): Largest total degree.
+
+    Returns:
+        ndarray: Shape (terms, dimensions), constant term first, terms
+        sorted by total degree.
+    """
+    indices = [()]
+    for _dimension in range(dimensions):
+        indices = [index + (power,) for index in indices for power in range(degree + 1 - sum(index))]
+    indices.sort(key=lambda index: (sum(index), [-power for power in index]))
+    return np.array(indices, dtype=np.int64).reshape(-1, dimensions)
+
+
+def legendre(x, degree):
+    """
+    Orthonormal Legendre polynomials on [-1, 1].
+
+    Args:
+        x (array): Points, shape (n, d).
+        degree (int): Largest degree.
+
+    Returns:
+        ndarray: Shape (n, d, degree + 1); unit variance for uniform x.
+    """
+    x = np.asarray(x, dtype=float)
+    values = np.empty(x.shape + (degree + 1,))
+    values[..., 0] = 1.0
+    if degree > 0:
+        values[..., 1] = x
+    for k in range(1, degree):
+        values[..., k + 1] = ((2 * k + 1) * x * values[..., k] - k * values[..., k - 1]) / (k + 1)
+    return values * np.sqrt(2 * np.arange(degree + 1) + 1.0)
+
+
+def basis(x, indices):
+    """Polynomial chaos basis at points ``x`` in [-1, 1]^d: shape (n, terms)."""
+    degree = int(indices.max()) if indices.size else 0
+    polynomials = legendre(x, degree)
+    columns = np.ones((len(polynomials), len(indices)))
+    for dimension in range(indices.shape[1]):
+        columns *= polynomials[:, dimension, indices[:, dimension]]
+    return columns
+
+
+def _base_key(project_form_data, variables):
+    """Key of every input of a project except the varied ones."""
+    project = dialog_schema.coerce_project(project_form_data)
+    for schema, key in variables:
+        project[schema.name] = dict(project[schema.name], **{key: None})
+    return content_key(project, "surrogate")
+
+
+def with_values(project_form_data, variables, values):
+    """
+    Form data of a project with the varied inputs set.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        variables (list): ``(schema, key)`` of each value.
+        values (array): One value per variable.
+
+    Returns:
+        dict: Form data; only the changed dialogs are copied.
+    """
+    result = dict(project_form_data)
+    for (schema, key), value in zip(variables, values):
+        result[schema.name] = dict(dialog_schema.coerce(schema, result.get(schema.name, {})), **{key: float(value)})
+    return result
+
+
+def variable_values(project_form_data, variables):
+    """Saved values of the varied inputs of a project."""
+    return np.array([dialog_schema.coerce(schema, project_form_data.get(schema.name, {}))[key]
+                     for schema, key in variables], dtype=float)
+
+
+class Surrogate(object):
+    """Polynomial chaos fit of the cost head present values of one project."""
+
+    def __init__(self, project_form_data, variables, low, high, indices, coefficients, errors, samples):
+        """
+        Args:
+            project_form_data (dict): The fitted project.
+            variables (list): ``(schema, key)`` of each varied input.
+            low (ndarray): Lower end of the trained range of each variable.
+            high (ndarray): Upper end of the trained range of each variable.
+            indices (ndarray): Basis exponents, see ``multi_indices``.
+            coefficients (ndarray): Shape (terms, heads).
+            errors (ndarray): Leave-one-out RMS error of each head, in INR.
+            samples (int): Size of the design of experiments.
+        """
+        self.project_form_data = project_form_data
+        self.variables = list(variables)
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.indices = indices
+        self.coefficients = coefficients
+        self.errors = errors
+        self.samples = samples
+        self._base_key = _base_key(project_form_data, self.variables)
+
+    @property
+    def names(self):
+        return [key for _schema, key in self.variables]
+
+    def scaled(self, points):
+        """Map variable values to [-1, 1]."""
+        return 2.0 * (np.atleast_2d(points) - self.low) / (self.high - self.low) - 1.0
+
+    def in_domain(self, points):
+        """Whether each point lies inside the trained ranges."""
+        points = np.atleast_2d(points)
+        return np.all((points >= self.low) & (points <= self.high), axis=1)
+
+    def predict_points(self, points):
+        """
+        Surrogate present values at points of the trained domain.
+
+        Args:
+            points (array): Shape (n, variables), values in ``variables`` order.
+
+        Returns:
+            ndarray: Shape (n, heads) in INR.
+        """
+        return basis(self.scaled(points), self.indices) @ self.coefficients
+
+    def mean(self):
+        """Mean of each head over the trained domain: the constant coefficient."""
+        return self.coefficients[0].copy()
+
+    def std(self):
+        """Standard deviation of each head over the trained domain."""
+        return np.sqrt((self.coefficients[1:] ** 2).sum(axis=0))
+
+    def in_trained_domain(self, project_form_data):
+        """Whether a project differs from the fitted one only by varied inputs inside their ranges."""
+        return (bool(self.in_domain(variable_values(project_form_data, self.variables))[0])
+                and _base_key(project_form_data, self.variables) == self._base_key)
+
+    def predict(self, project_form_data):
+        """
+        Present value of each cost head of a project.
+
+        Args:
+            project_form_data (dict): Window name -> saved form data.
+
+        Returns:
+            tuple: ``(values, errors, exact)``: values and error bounds of
+            each head in INR, and whether the exact engine was used because
+            the project left the trained domain.
+        """
+        if self.in_trained_domain(project_form_data):
+            points = variable_values(project_form_data, self.variables)
+            return self.predict_points(points)[0], self.errors.copy(), False
+        values = lcc_engine.evaluate(project_form_data).head_totals()
+        return values, np.zeros_like(values), True
+
+    def predict_many(self, projects):
+        """
+        ``predict`` of many projects: one matrix product for those in the
+        trained domain, one exact batch for the others.
+
+        Args:
+            projects (list): Saved form data of each project.
+
+        Returns:
+            tuple: ``(values, errors, exact)``: values of shape (projects,
+            heads) in INR, the error bound of each head, and a boolean
+            array telling which projects were evaluated exactly.
+        """
+        points = np.array([variable_values(project_form_data, self.variables) for project_form_data in projects],
+                          dtype=float).reshape(len(projects), len(self.variables))
+        inside = self.in_domain(points) & np.array(
+            [_base_key(project_form_data, self.variables) == self._base_key for project_form_data in projects],
+            dtype=bool)
+        values = np.empty((len(projects), len(lcc_engine.HEAD_LABELS)))
+        if inside.any():
+            values[inside] = self.predict_points(points[inside])
+        outside = np.flatnonzero(~inside)
+        if len(outside):
+            exact_values = lcc_engine.batch_head_values([projects[index] for index in outside])
+            values[outside] = [head_values.sum(axis=1) for head_values in exact_values]
+        return values, self.errors.copy(), ~inside
+
+
+def domain(project_form_data, variables=None, spread=DEFAULT_SPREAD):
+    """
+    Default trained ranges: each saved value plus or minus ``spread`` of
+    itself, within the range the dialog accepts.
+
+    Returns:
+        tuple: ``(low, high)`` arrays in ``variables`` order.
+    """
+    variables = DEFAULT_VARIABLES if variables is None else variables
+    values = variable_values(project_form_data, variables)
+    minimum = np.array([_field(schema, key).minimum for schema, key in variables], dtype=float)
+    maximum = np.array([_field(schema, key).maximum for schema, key in variables], dtype=float)
+    return (np.clip(values * (1.0 - spread), minimum, maximum),
+            np.clip(values * (1.0 + spread), minimum, maximum))
+
+
+def fit(project_form_data, variables=None, bounds=None, degree=DEFAULT_DEGREE, samples=None, seed=None):
+    """
+    Fit a surrogate of a project.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+        variables (list): ``(schema, key)`` of the varied inputs;
+            ``DEFAULT_VARIABLES`` by default.
+        bounds (dict): ``key -> (low, high)`` trained range of some
+            variables; the others use ``domain``.
+        degree (int): Total degree of the polynomial.
+        samples (int): Design size; the power of two at or above
+            ``OVERSAMPLING`` times the number of basis terms by default.
+        seed (int): Seed of the design.
+
+    Returns:
+        Surrogate: The fit. Variables with an empty range, e.g. a saved
+        value of 0, are held at that value and not varied.
+    """
+    variables = DEFAULT_VARIABLES if variables is None else variables
+    low, high = domain(project_form_data, variables)
+    for index, (_schema, key) in enumerate(variables):
+        if bounds and key in bounds:
+            low[index], high[index] = bounds[key]
+    varied = high > low
+    variables = [variable for variable, keep in zip(variables, varied) if keep]
+    low, high = low[varied], high[varied]
+    if not variables:
+        raise ValueError("The surrogate needs at least one input with a non-empty range")
+
+    indices = multi_indices(len(variables), degree)
+    if samples is None:
+        samples = 1 << math.ceil(math.log2(OVERSAMPLING * len(indices)))
+    if samples <= len(indices):
+        raise ValueError(f"A degree {degree} surrogate of {len(variables)} inputs needs more than "
+                         f"{len(indices)} samples")
+
+    unit = sampling.sobol(samples, len(variables), np.random.default_rng(seed))
+    points = low + unit * (high - low)
+    scenarios = [with_values(project_form_data, variables, point) for point in points]
+    targets = np.array([values.sum(axis=1) for values in lcc_engine.batch_head_values(scenarios)])
+
+    design = basis(2.0 * unit - 1.0, indices)
+    q, r = np.linalg.qr(design)
+    coefficients = np.linalg.solve(r, q.T @ targets)
+    # Leave-one-out residuals from the diagonal of the hat matrix Q Q^T
+    leverage = (q ** 2).sum(axis=1)
+    residuals = (targets - design @ coefficients) / (1.0 - leverage)[:, None]
+    errors = np.sqrt((residuals ** 2).mean(axis=0))
+    return Surrogate(project_form_data, variables, low, high, indices, coefficients, errors, samples)
@@ -0,0 +1,37 @@
+"""Saved form data of made-up bridges for the tests."""
+
+import random
+
+import dialog_schema
+
+
+def project(seed=0, **financial):
+    """
+    A random but valid project.
+
+    Args:
+        seed (int): Seed of the random values.
+        **financial: Financial Data fields to override.
+    """
+    rng = random.Random(seed)
+    data = {}
+    for schema in (dialog_schema.FOUNDATION, dialog_schema.SUPER_STRUCTURE, dialog_schema.SUB_STRUCTURE,
+                   dialog_schema.MISCELLANEOUS):
+        data[schema.name] = {
+            "component": rng.choice(schema.sections[0].fields[0].choices),
+            "materials": [
+                {"material": "Concrete", "quantity": rng.uniform(10, 500), "unit": "m3",
+                 "rate": rng.uniform(4000, 9000)},
+                {"material": "Steel", "quantity": rng.uniform(1, 50), "unit": "MT",
+                 "rate": rng.uniform(50000, 80000)},
+            ],
+        }
+    data[dialog_schema.FINANCIAL.name] = dict({"study_period": rng.choice([30, 50, 75]),
+                                               "real_discount_rate": rng.uniform(2, 8)}, **financial)
+    data[dialog_schema.MAINTENANCE.name] = {"repair_condition_state": rng.choice([3, 4, 5]),
+                                            "reconstruction_condition_state": 5}
+    data[dialog_schema.BRIDGE_TRAFFIC.name] = {"reroute_distance": rng.uniform(1, 20),
+                                               "cars": rng.uniform(100, 5000), "hcv": 500}
+    data[dialog_schema.CARBON_EMISSION.name] = {"materials": [
+        {"material": "Concrete", "quantity": 300, "unit": "m3", "emission_factor": 0.15}]}
+    return data
@@ -0,0 +1,116 @@
+import json
+import os
+import time
+
+import pytest
+
+import autosave_journal
+import form_data_storage
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    yield str(tmp_path / "project.json")
+    form_data_storage.attach_journal(None)
+    form_data_storage.form_data.clear()
+
+
+def _crash_journal(project_path, entries):
+    with open(autosave_journal.journal_path_for(project_path), "w", encoding="utf-8") as handle:
+        for entry in entries:
+            handle.write(json.dumps(entry) + "\n")
+
+
+def test_replay_applies_entries_and_ignores_torn_line(project_path):
+    autosave_journal.write_project(project_path, {"A": {"x": 1}})
+    _crash_journal(project_path, [{"window": "A", "field": "x", "value": 2},
+                                  {"window": "B", "field": None, "value": {"y": 3}}])
+    with open(autosave_journal.journal_path_for(project_path), "a", encoding="utf-8") as handle:
+        handle.write('{"window": "A", "fie')
+
+    state, replayed = autosave_journal.load_project(project_path)
+    assert replayed == 2
+    assert state == {"A": {"x": 2}, "B": {"y": 3}}
+
+
+def test_start_compacts_recovered_entries(project_path):
+    autosave_journal.write_project(project_path, {"A": {"x": 1}})
+    _crash_journal(project_path, [{"window": "A", "field": "x", "value": 5}])
+
+    journal = autosave_journal.start(project_path, batch_interval=0.01)
+    assert journal.recovered == 1
+    assert form_data_storage.form_data == {"A": {"x": 5}}
+    journal.close()
+
+    # The recovered edit is in the project file and is not replayed again
+    assert os.path.getsize(autosave_journal.journal_path_for(project_path)) == 0
+    state, replayed = autosave_journal.load_project(project_path)
+    assert (state, replayed) == ({"A": {"x": 5}}, 0)
+
+
+def test_edits_reach_project_file_on_close(project_path):
+    journal = autosave_journal.start(project_path, batch_interval=0.01)
+    form_data_storage.record_field_edit("A", "x", 7)
+    form_data_storage.save_form_data("B", {"y": 8})
+    journal.close()
+
+    with open(project_path, encoding="utf-8") as handle:
+        assert json.load(handle) == {"A": {"x": 7}, "B": {"y": 8}}
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_edits_after_a_torn_first_line_are_recovered(project_path):
+    autosave_journal.write_project(project_path, {"A": {"x": 1}})
+    journal_path = autosave_journal.journal_path_for(project_path)
+    with open(journal_path, "w", encoding="utf-8") as handle:
+        handle.write('{"window": "A", "fie')
+
+    journal = autosave_journal.start(project_path, batch_interval=0.01)
+    assert journal.recovered == 0
+    form_data_storage.record_field_edit("A", "x", 9)
+    # Crash before compaction: the new entry must replay on its own line
+    _wait_for(lambda: autosave_journal.load_project(project_path)[1] == 1)
+    assert autosave_journal.load_project(project_path)[0] == {"A": {"x": 9}}
+    journal.close()
+
+
+def test_recorded_values_are_copied(project_path):
+    journal = autosave_journal.start(project_path, batch_interval=0.05)
+    rows = [{"material": "Steel"}]
+    form_data_storage.record_field_edit("A", "materials", rows)
+    rows.append({"material": "Concrete"})
+    journal.close()
+    with open(project_path, encoding="utf-8") as handle:
+        assert json.load(handle) == {"A": {"materials": [{"material": "Steel"}]}}
+
+
+def test_write_errors_are_kept_and_retried(project_path, monkeypatch, caplog):
+    fsync = os.fsync
+    failing = [True]
+
+    def flaky_fsync(descriptor):
+        if failing[0]:
+            raise OSError("disk full")
+        fsync(descriptor)
+
+    monkeypatch.setattr(autosave_journal.os, "fsync", flaky_fsync)
+    journal = autosave_journal.AutosaveJournal(project_path, batch_interval=0.01)
+    journal.record("A", "x", 1)
+    _wait_for(lambda: journal.error is not None)
+    assert "Autosave" in caplog.text
+    assert os.path.getsize(journal.journal_path) == 0
+
+    failing[0] = False
+    journal.record("A", "y", 2)
+    _wait_for(lambda: journal.error is None)
+    assert autosave_journal.load_project(project_path) == ({"A": {"x": 1, "y": 2}}, 2)
+    failing[0] = True
+    journal.record("A", "z", 3)
+    with pytest.raises(OSError, match="disk full"):
+        journal.close()
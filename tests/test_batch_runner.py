@@ -0,0 +1,74 @@
+import concurrent.futures
+
+import numpy as np
+import pytest
+
+import batch_runner
+import deterioration
+import monte_carlo
+from projects import project
+
+
+def _components(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.02, 0.2, (n, deterioration.N_STATES - 1)), rng.uniform(1e5, 1e7, n),
+            rng.uniform(0.05, 0.2, n), rng.integers(3, 5, n), np.full(n, 5))
+
+
+def test_portfolio_expected_costs_match_one_process():
+    components = _components(300)
+    parallel = batch_runner.portfolio_expected_costs(*components, years=40, workers=2)
+    expected = deterioration.expected_costs(*components, 40)
+    for name, values in parallel.items():
+        np.testing.assert_allclose(values, expected[name])
+
+
+def _failing_kernel(inputs, outputs, start, stop):
+    raise ValueError("broken kernel")
+
+
+def test_worker_errors_reach_the_caller_and_free_the_blocks():
+    with pytest.raises(ValueError, match="broken kernel"):
+        batch_runner.run(_failing_kernel, {"x": np.arange(10.0)}, {"y": ((10,), float)}, 10, workers=2)
+    assert not any(arrays.arrays for arrays in batch_runner._open_blocks)
+
+
+def _double_kernel(inputs, outputs, start, stop):
+    outputs["y"][start:stop] = 2 * inputs["x"][start:stop]
+
+
+def _attached_blocks():
+    return len(batch_runner._attached)
+
+
+def test_reused_pool_workers_detach_after_every_task():
+    with concurrent.futures.ProcessPoolExecutor(1) as pool:
+        for _ in range(2):
+            result = batch_runner.run(_double_kernel, {"x": np.arange(10.0)}, {"y": ((10,), float)}, 10,
+                                      chunk_rows=3, pool=pool)
+            np.testing.assert_allclose(result["y"], 2 * np.arange(10.0))
+        with pytest.raises(ValueError):
+            batch_runner.run(_failing_kernel, {"x": np.arange(10.0)}, {"y": ((10,), float)}, 10, pool=pool)
+        assert pool.submit(_attached_blocks).result() == 0
+
+
+def test_large_portfolios_run_in_workers(monkeypatch):
+    projects = [project(seed) for seed in range(6)]
+    expected = deterioration.portfolio_cash_flows(projects, workers=1)
+    calls = []
+    original = batch_runner.portfolio_expected_costs
+    monkeypatch.setattr(deterioration, "PARALLEL_MIN_COMPONENTS", 1)
+    monkeypatch.setattr(batch_runner, "portfolio_expected_costs",
+                        lambda *args, **kwargs: calls.append(kwargs) or original(*args, **kwargs))
+    parallel = deterioration.portfolio_cash_flows(projects, workers=2)
+    assert calls == [{"workers": 2}]
+    for expected_flows, parallel_flows in zip(expected, parallel):
+        for name, values in expected_flows.items():
+            np.testing.assert_allclose(parallel_flows[name], values)
+
+
+def test_monte_carlo_workers_match_one_process(tmp_path):
+    data = project(3, study_period=30)
+    serial = monte_carlo.run(data, 40, str(tmp_path / "serial"), chunk_samples=8, seed=1, workers=1)
+    parallel = monte_carlo.run(data, 40, str(tmp_path / "parallel"), chunk_samples=8, seed=1, workers=2)
+    np.testing.assert_allclose(parallel.read(), serial.read())
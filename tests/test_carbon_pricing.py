@@ -0,0 +1,33 @@
+import numpy as np
+
+import carbon_pricing
+import dialog_schema
+import lcc_engine
+from projects import project
+
+
+def test_emission_series_covers_every_year():
+    data = project(0, study_period=30)
+    data[dialog_schema.MAINTENANCE.name]["periodic_maintenance_frequency"] = 5
+    emissions = carbon_pricing.emission_series(data)
+    assert emissions["initial"].shape == emissions["maintenance"].shape == (31,)
+    # Year 30 is a maintenance year like 5, 10, ... 25
+    assert np.flatnonzero(emissions["maintenance"]).tolist() == [5, 10, 15, 20, 25, 30]
+
+
+def test_maintenance_emissions_line_up_with_maintenance_costs():
+    data = project(2, study_period=30)
+    data[dialog_schema.MAINTENANCE.name]["periodic_maintenance_frequency"] = 5
+    values = lcc_engine.head_values(data)
+    costs = values[lcc_engine.HEAD_INDEX["Periodic Maintenance Costs"]]
+    emissions = values[lcc_engine.HEAD_INDEX["Maintenance Emission Costs"]]
+    np.testing.assert_array_equal(np.flatnonzero(costs), np.flatnonzero(emissions))
+
+
+def test_emission_costs_match_direct_discounting():
+    emissions = np.array([[10.0, 0.0, 2.0, 0.0], [1.0, 1.0, 1.0, 1.0]])
+    prices = np.array([carbon_pricing.flat(5000.0, 4), carbon_pricing.escalating(5000.0, 0.03, 4)])
+    costs = carbon_pricing.emission_costs(emissions, prices, 0.05)
+    discount = 1.05 ** -np.arange(4)
+    expected = np.array([[(price * discount) @ series for series in emissions] for price in prices])
+    np.testing.assert_allclose(costs, expected)
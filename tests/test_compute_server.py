@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+import compute_server
+import lcc_engine
+from projects import project
+
+
+@pytest.fixture
+def warm_worker():
+    compute_server._warm_worker()
+    yield
+    compute_server._worker_cache = None
+
+
+def _request(method, params):
+    return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+
+
+def _answer(server, request):
+    return asyncio.run(server.handle_request(request))
+
+
+def test_form_data_must_be_objects():
+    server = compute_server.ComputeServer(workers=1)
+    for params in ({"form_data": "oops"}, {"form_data": {"FinancialData_Dialog": "oops"}},
+                   {"projects": "oops"}, {"projects": [{}, ["oops"]]}):
+        method = "evaluate" if "form_data" in params else "evaluate_portfolio"
+        response = _answer(server, _request(method, params))
+        assert response["error"]["code"] == compute_server.INVALID_PARAMS
+    assert server.batcher.items == 0
+
+
+def test_bad_project_fails_alone(warm_worker):
+    # A wrong type deep in the data raises AttributeError in the engine
+    bad = {"Foundation_Dialog": {"materials": "oops"}}
+    outcomes = compute_server._evaluate_batch([project(0), bad, project(1)])
+    assert [ok for ok, _value in outcomes] == [True, False, True]
+    expected = lcc_engine.evaluate(project(1), compute_server._worker_cache).total()
+    assert outcomes[2][1]["total"] == pytest.approx(expected)
+
+
+def test_micro_batches_share_one_evaluation(warm_worker):
+    async def run_batch(projects):
+        return compute_server._evaluate_batch(projects)
+
+    async def main():
+        batcher = compute_server.MicroBatcher(run_batch, max_batch_size=8, max_batch_latency=0.01)
+        futures = [batcher.submit(project(seed)) for seed in range(3)]
+        futures.append(batcher.submit({"Foundation_Dialog": {"materials": "oops"}}))
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        return batcher, results
+
+    batcher, results = asyncio.run(main())
+    assert batcher.batches == 1 and batcher.items == 4
+    assert [result["total"] for result in results[:3]] == pytest.approx(
+        [lcc_engine.evaluate(project(seed), compute_server._worker_cache).total() for seed in range(3)])
+    assert isinstance(results[3], compute_server.RPCError)
+    assert results[3].code == compute_server.COMPUTE_ERROR
+
+
+def _recording_batcher(max_batch_size, max_batch_latency):
+    sizes = []
+
+    async def run_batch(projects):
+        sizes.append(len(projects))
+        return [(True, index) for index, _project in enumerate(projects)]
+
+    return compute_server.MicroBatcher(run_batch, max_batch_size, max_batch_latency), sizes
+
+
+def test_full_batches_are_sent_without_waiting():
+    async def main():
+        batcher, sizes = _recording_batcher(max_batch_size=4, max_batch_latency=60.0)
+        futures = [batcher.submit({}) for _ in range(10)]
+        sent = batcher.batches
+        batcher.flush()
+        results = await asyncio.wait_for(asyncio.gather(*futures), 5.0)
+        return sent, sizes, results
+
+    sent, sizes, results = asyncio.run(main())
+    assert sent == 2
+    assert sizes == [4, 4, 2]
+    assert results == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+
+
+def test_open_batch_is_sent_after_the_max_delay():
+    async def main():
+        batcher, sizes = _recording_batcher(max_batch_size=64, max_batch_latency=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first = batcher.submit({})
+        await asyncio.sleep(0.01)
+        second = batcher.submit({})
+        results = await asyncio.wait_for(asyncio.gather(first, second), 5.0)
+        waited = loop.time() - start
+        third = await asyncio.wait_for(batcher.submit({}), 5.0)
+        return sizes, results + [third], waited
+
+    sizes, results, waited = asyncio.run(main())
+    # The second bridge joins the batch the first one opened
+    assert sizes == [2, 1]
+    assert results == [0, 1, 0]
+    assert 0.05 <= waited < 1.0
+
+
+def test_invalid_project_is_found_one_at_a_time(warm_worker, monkeypatch):
+    calls = []
+    evaluate = lcc_engine.evaluate
+    monkeypatch.setattr(lcc_engine, "evaluate", lambda data, cache=None: calls.append(data) or evaluate(data, cache))
+    bad = {"Foundation_Dialog": {"materials": "oops"}}
+    projects = [project(0), project(1), bad]
+    outcomes = compute_server._evaluate_batch(projects)
+    assert calls == projects
+    assert [ok for ok, _value in outcomes] == [True, True, False]
+    assert outcomes[2][1].startswith("AttributeError")
+
+    calls.clear()
+    assert all(ok for ok, _value in compute_server._evaluate_batch(projects[:2]))
+    assert calls == []
+
+
+def test_failed_batch_fails_every_request():
+    async def run_batch(projects):
+        raise OSError("worker died")
+
+    async def main():
+        batcher = compute_server.MicroBatcher(run_batch, max_batch_size=8, max_batch_latency=0.01)
+        futures = [batcher.submit({}) for _ in range(3)]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    for error in asyncio.run(main()):
+        assert isinstance(error, compute_server.RPCError)
+        assert error.code == compute_server.COMPUTE_ERROR and error.message == "OSError: worker died"
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import deterioration
+from projects import project
+
+
+def _rates(n, seed=0):
+    return np.random.default_rng(seed).uniform(0.02, 0.3, (n, deterioration.N_STATES - 1))
+
+
+@pytest.mark.parametrize("years", [0, 1, 2, 7, 8, 50])
+def test_propagate_matches_year_by_year_steps(years):
+    matrices = deterioration.transition_matrices(_rates(4))
+    initial = np.random.default_rng(1).dirichlet(np.ones(deterioration.N_STATES), 4)
+    expected = [initial]
+    for _year in range(years):
+        expected.append(np.einsum("ns,nst->nt", expected[-1], matrices))
+    np.testing.assert_allclose(deterioration.propagate(initial, matrices, years),
+                               np.stack(expected, axis=1), atol=1e-12)
+
+
+def test_interventions_keep_distributions_whole():
+    result = deterioration.simulate(_rates(6), 3, 5, 40)
+    np.testing.assert_allclose(result["condition"].sum(axis=2), 1.0)
+    # Repaired and reconstructed components never stay in a triggering state
+    assert np.allclose(result["condition"][:, :, 2:], 0.0)
+    assert (result["repair"] >= 0).all() and (result["reconstruction"] >= 0).all()
+
+
+def test_expected_costs_scale_the_intervention_counts():
+    rates, costs = _rates(3), np.array([1e6, 2e6, 5e5])
+    result = deterioration.expected_costs(rates, costs, 0.1, 4, 5, 30)
+    np.testing.assert_allclose(result["repair"], result["repair_events"] * costs[:, None] * 0.1)
+    np.testing.assert_allclose(result["reconstruction"], result["reconstruction_events"] * costs[:, None])
+
+
+def test_portfolio_matches_one_project_at_a_time():
+    projects = [project(seed) for seed in range(5)]
+    for data, flows in zip(projects, deterioration.portfolio_cash_flows(projects, workers=1)):
+        expected = deterioration.maintenance_cash_flows(data)
+        for key in ("years", "repair", "reconstruction", "repair_events", "reconstruction_events"):
+            np.testing.assert_allclose(flows[key], expected[key])
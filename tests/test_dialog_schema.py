@@ -0,0 +1,48 @@
+import pytest
+
+import dialog_schema
+
+
+def test_defaults_pass_validation():
+    for schema in dialog_schema.SCHEMAS:
+        assert dialog_schema.validate(schema, dialog_schema.defaults(schema)) == []
+
+
+def test_out_of_range_values_are_reported():
+    errors = dialog_schema.validate(dialog_schema.FINANCIAL, {"real_discount_rate": -1, "study_period": 200})
+    assert errors == ["Real Discount Rate: must be at least 0 %", "Duration of Study: must be at most 150 years"]
+    with pytest.raises(ValueError, match="Financial Data: Real Discount Rate"):
+        dialog_schema.coerce(dialog_schema.FINANCIAL, {"real_discount_rate": 31})
+
+
+def test_missing_and_empty_fields_take_their_defaults():
+    values = dialog_schema.coerce(dialog_schema.FINANCIAL, {"real_discount_rate": "", "interest_rate": None})
+    assert values["real_discount_rate"] == 5.0
+    assert values["interest_rate"] == 8.0
+    assert values["study_period"] == 50
+    rows = dialog_schema.coerce(dialog_schema.FOUNDATION, {})["materials"]
+    assert rows == [dialog_schema.default_row(dialog_schema.FOUNDATION.sections[-1])]
+
+
+def test_values_are_coerced_to_the_field_kind():
+    values = dialog_schema.coerce(dialog_schema.FINANCIAL, {"real_discount_rate": "7.5", "study_period": "30.0"})
+    assert values["real_discount_rate"] == 7.5
+    assert values["study_period"] == 30 and isinstance(values["study_period"], int)
+    road = dialog_schema.coerce(dialog_schema.BRIDGE_TRAFFIC, {"number_of_lanes": "4"})
+    assert road["number_of_lanes"] == 4
+    errors = dialog_schema.validate(dialog_schema.BRIDGE_TRAFFIC, {"number_of_lanes": 3, "cars": "many"})
+    assert errors == ["Number of Lanes: 3 is not a valid value", "Cars: 'many' is not a valid value"]
+
+
+def test_repeated_rows_are_checked_one_by_one():
+    data = {"materials": [{"material": "Steel", "quantity": 2, "unit": "MT", "rate": 60000},
+                          {"material": "Steel", "quantity": -1, "unit": "MT", "rate": 60000}]}
+    errors = dialog_schema.validate(dialog_schema.FOUNDATION, data)
+    assert len(errors) == 1 and errors[0].startswith("Materials 2 - Quantity")
+
+
+def test_coerce_project_covers_every_dialog():
+    project = dialog_schema.coerce_project({dialog_schema.FINANCIAL.name: {"study_period": 75}})
+    assert set(project) == set(dialog_schema.SCHEMAS_BY_NAME)
+    assert project[dialog_schema.FINANCIAL.name]["study_period"] == 75
+    assert project[dialog_schema.DEMOLITION.name] == dialog_schema.coerce(dialog_schema.DEMOLITION, {})
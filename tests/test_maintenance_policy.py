@@ -0,0 +1,99 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import deterioration
+import dialog_schema
+import maintenance_policy
+from projects import project
+
+
+def _model(n=3):
+    rates = np.tile([0.1, 0.08, 0.06, 0.05], (n, 1))
+    return maintenance_policy.action_model(rates, np.ones(n), 0.0055, 0.1, 1.1)
+
+
+def test_transitions_are_stochastic():
+    transitions, costs = _model()
+    np.testing.assert_allclose(transitions.sum(axis=3), 1.0)
+    assert (costs >= 0).all()
+
+
+def test_value_iteration_matches_long_backward_induction():
+    transitions, costs = _model()
+    policy, values, _sweeps = maintenance_policy.value_iteration(transitions, costs, 0.95, tolerance=1e-9)
+    long_policy, long_values, _sweeps = maintenance_policy.backward_induction(transitions, costs, 0.95, 2000)
+    np.testing.assert_allclose(values, long_values, rtol=1e-6)
+    np.testing.assert_array_equal(policy, long_policy)
+
+
+def test_zero_discount_rate_needs_horizon():
+    transitions, costs = _model()
+    with pytest.raises(ValueError):
+        maintenance_policy.value_iteration(transitions, costs, 1.0)
+
+
+def test_zero_discount_rate_solves_study_period():
+    transitions, costs = _model(2)
+    gamma = maintenance_policy.discount_factor([0.0, 0.05])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        policy, values, _sweeps = maintenance_policy.value_iteration(transitions, costs, gamma, horizon=50)
+    # Undiscounted costs over 50 years exceed the discounted infinite-horizon ones
+    assert np.isfinite(values).all()
+    assert (values[0] > values[1]).all()
+    finite_policy, finite_values, _sweeps = maintenance_policy.backward_induction(
+        transitions[:1], costs[:1], 1.0, 50)
+    np.testing.assert_allclose(values[0], finite_values[0])
+    np.testing.assert_array_equal(policy[0], finite_policy[0])
+
+
+def test_solve_portfolio_with_zero_discount_rate():
+    results = maintenance_policy.solve_portfolio([project(1, real_discount_rate=0.0),
+                                                project(1, real_discount_rate=5.0)])
+    costs = [result["life_cycle_cost"] for result in results]
+    assert all(np.isfinite(costs))
+    assert costs[0] > costs[1] > 0
+    assert all(action in maintenance_policy.ACTIONS for action in results[0]["policy"][0])
+
+
+def test_undiscounted_policy_changes_with_the_years_left():
+    transitions, costs = _model(2)
+    horizon = np.array([30, 20])
+    schedule, values, _sweeps = maintenance_policy.value_iteration(transitions, costs, 1.0, horizon=horizon,
+                                                                   schedule=True)
+    first_year, _values, _sweeps = maintenance_policy.backward_induction(transitions, costs, 1.0, horizon)
+    np.testing.assert_array_equal(schedule[:, 0], first_year)
+    assert schedule.shape == (2, 30, costs.shape[2])
+    assert (schedule[0] != schedule[0, :1]).any()
+    # Following the schedule costs exactly the optimal values, the first-year policy costs more
+    flows = maintenance_policy.policy_cash_flows(schedule, transitions, costs, 30)
+    for index, years in enumerate(horizon):
+        new = values[index, deterioration.RECONSTRUCTED_STATE]
+        assert flows[index, :years].sum() == pytest.approx(new)
+    stationary = maintenance_policy.policy_cash_flows(first_year, transitions, costs, 30)
+    assert stationary[0].sum() > flows[0].sum()
+
+
+def test_repeated_schedule_matches_the_stationary_policy():
+    transitions, costs = _model()
+    policy, _values, _sweeps = maintenance_policy.value_iteration(transitions, costs, 0.95)
+    schedule = np.repeat(policy[:, None, :], 40, axis=1)
+    np.testing.assert_allclose(maintenance_policy.policy_cash_flows(schedule, transitions, costs, 40),
+                               maintenance_policy.policy_cash_flows(policy, transitions, costs, 40))
+
+
+def test_maintenance_is_charged_per_year_of_its_frequency():
+    def with_maintenance(**values):
+        data = project(2)
+        maintenance = dict(data.get(dialog_schema.MAINTENANCE.name, {}), **values)
+        return dict(data, **{dialog_schema.MAINTENANCE.name: maintenance})
+
+    every_fifth, yearly = maintenance_policy.solve_portfolio([
+        with_maintenance(periodic_maintenance_rate=2.0, periodic_maintenance_frequency=5),
+        with_maintenance(periodic_maintenance_rate=0.4, periodic_maintenance_frequency=1)])
+    assert every_fifth["policy"] == yearly["policy"]
+    assert every_fifth["life_cycle_cost"] == pytest.approx(yearly["life_cycle_cost"])
+    assert maintenance_policy.yearly_maintenance_rate(
+        {"periodic_maintenance_rate": 0.02, "periodic_maintenance_frequency": 5}) == pytest.approx(0.004)
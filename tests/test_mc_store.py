@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+import mc_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    rng = np.random.default_rng(0)
+    store = mc_store.create(str(tmp_path / "samples"), 50, ["a", "b"], 7, chunk_samples=16)
+    for start in store.chunk_starts():
+        rows = min(store.chunk_samples, store.samples - start)
+        store.write(start, rng.lognormal(10, 1, (rows, 2, 7)))
+    return store
+
+
+@pytest.mark.parametrize("max_bytes", [1, 50 * 4 * 3, mc_store.PERCENTILE_BLOCK_BYTES])
+def test_percentiles_by_year_blocks_are_exact(store, max_bytes):
+    expected = np.nanpercentile(store.read(head=1), (5, 50, 95), axis=0)
+    np.testing.assert_array_equal(mc_store.percentiles(store, 1, max_bytes=max_bytes), expected)
+
+
+def test_percentiles_skip_missing_samples(tmp_path):
+    store = mc_store.create(str(tmp_path / "partial"), 32, ["a"], 3, chunk_samples=16)
+    store.write(0, np.arange(48.0).reshape(16, 1, 3))
+    np.testing.assert_allclose(mc_store.percentiles(store, 0, q=50, max_bytes=1),
+                               np.median(np.arange(48.0).reshape(16, 3), axis=0))
@@ -0,0 +1,39 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+import monte_carlo
+from projects import project
+
+
+def test_spawned_workers_match_one_process(tmp_path):
+    data = project(4, study_period=30)
+    serial = monte_carlo.run(data, 24, str(tmp_path / "serial"), chunk_samples=8, seed=2, workers=1)
+    spawned = monte_carlo.run(data, 24, str(tmp_path / "spawned"), chunk_samples=8, seed=2, workers=2,
+                              mp_context=multiprocessing.get_context("spawn"))
+    np.testing.assert_allclose(spawned.read(), serial.read())
+
+
+def test_thread_reports_any_failure(monkeypatch, tmp_path):
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import monte_carlo_panel
+
+    app = QApplication.instance() or QApplication([])
+    calls = []
+
+    def broken_run(*args, **kwargs):
+        calls.append(kwargs)
+        raise RuntimeError("worker pool broke")
+
+    monkeypatch.setattr(monte_carlo, "run", broken_run)
+    thread = monte_carlo_panel.MonteCarloThread(project(0), 16, str(tmp_path / "store"))
+    messages = []
+    thread.failed.connect(messages.append)
+    thread.run()
+    assert messages == ["worker pool broke"]
+    assert calls[0]["mp_context"].get_start_method() == "spawn"
+    assert app is not None
@@ -0,0 +1,59 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import deterioration
+import dialog_schema
+import prioritization
+import units
+from projects import project
+
+
+def _best_selection(costs, benefits, budget):
+    n, k = costs.shape
+    best = 0.0
+    for chosen in itertools.product(range(-1, k), repeat=n):
+        taken = [(row, option) for row, option in enumerate(chosen) if option >= 0]
+        if sum(costs[row, option] for row, option in taken) <= budget:
+            best = max(best, sum(benefits[row, option] for row, option in taken))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_selection_fits_the_budget_and_the_bound(seed):
+    rng = np.random.default_rng(seed)
+    costs = rng.uniform(1, 10, (4, 3))
+    benefits = rng.uniform(0, 20, (4, 3))
+    budget = rng.uniform(5, 25)
+    chosen, upper_bound = prioritization.select_options(costs, benefits, budget)
+    taken = chosen >= 0
+    assert costs[taken, chosen[taken]].sum() <= budget
+    best = _best_selection(costs, benefits, budget)
+    assert benefits[taken, chosen[taken]].sum() <= best + 1e-9
+    assert best <= upper_bound + 1e-9
+
+
+def test_network_model_reads_base_units():
+    projects = [project(seed) for seed in range(3)]
+    network = prioritization.network_model(projects)
+    for index, data in enumerate(projects):
+        financial = units.coerce(dialog_schema.FINANCIAL, data[dialog_schema.FINANCIAL.name])
+        assert network["construction_costs"][index] == pytest.approx(
+            deterioration.project_components(data)[1].sum())
+        assert network["discount_rate"][index] == pytest.approx(financial["real_discount_rate"])
+        assert network["study_period"][index] == financial["study_period"]
+    assert (network["discount_rate"] < 1).all()
+
+
+def test_plan_respects_every_budget():
+    network = prioritization.network_model([project(seed) for seed in range(8)])
+    budgets = np.full(15, 0.02 * network["construction_costs"].sum())
+    plan = prioritization.prioritize(network, budgets)
+    assert (plan["spent"] <= budgets + 1e-6).all()
+    assert (plan["benefit"] <= plan["upper_bound"] + 1e-6).all()
+    assert plan["actions"].shape == (15, 8)
+    np.testing.assert_allclose(plan["condition"].sum(axis=2), 1.0)
+
+    nothing = prioritization.prioritize(network, np.zeros(5))
+    assert not nothing["actions"].any() and not nothing["spent"].any()
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+import lcc_engine
+from projects import project
+
+pytest.importorskip("matplotlib")
+import report_generator  # noqa: E402
+
+
+def _portfolio(tmp_path, records):
+    path = tmp_path / "portfolio.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+    return str(path)
+
+
+def test_records_without_results_are_evaluated(tmp_path):
+    given = {"cost_heads": [["Initial Construction Cost", 1.0]], "stages": {}, "study_period": 30}
+    path = _portfolio(tmp_path, [{"name": "A", "form_data": project(0)},
+                                 {"name": "B", "form_data": project(1), "results": given},
+                                 {"name": "C", "form_data": project(2)}])
+    records = list(report_generator.iter_portfolio(path, batch_size=2))
+    assert [record["name"] for record in records] == ["A", "B", "C"]
+    assert records[1]["results"] == given
+    for record, seed in ((records[0], 0), (records[2], 2)):
+        assert record["results"] == lcc_engine.evaluate(project(seed)).report_results()
+    assert all("results" not in record for record in report_generator.iter_portfolio(path, evaluate=False)
+               if record["name"] != "B")
+
+
+def test_batch_report_has_result_pages(tmp_path):
+    path = _portfolio(tmp_path, [{"name": f"Bridge {seed}", "form_data": project(seed)} for seed in range(2)])
+    inputs_only = report_generator.write_report(str(tmp_path / "inputs.pdf"),
+                                                report_generator.iter_portfolio(path, evaluate=False))
+    pages = report_generator.write_report(str(tmp_path / "report.pdf"), report_generator.iter_portfolio(path))
+    # A cost table, the stage pies and the cost bars per bridge
+    assert pages == inputs_only + 2 * 3
@@ -0,0 +1,70 @@
+import lcc_engine
+import result_cache
+from projects import project
+
+
+def _cache(tmp_path, **options):
+    return result_cache.ResultCache(str(tmp_path / "results.sqlite"), **options)
+
+
+def _encode(value):
+    return value.encode("utf-8")
+
+
+def _decode(blob):
+    return bytes(blob).decode("utf-8")
+
+
+def test_hit_and_miss(tmp_path):
+    cache = _cache(tmp_path)
+    assert cache.get("a", _decode) is None
+    cache.put("a", "value", _encode)
+    cache.close()
+    reopened = _cache(tmp_path)
+    assert reopened.get("a", _decode) == "value"
+    assert reopened.get("b", _decode) is None
+    calls = []
+    assert reopened.get_or_compute("b", lambda: calls.append(1) or "computed", _encode, _decode) == "computed"
+    assert reopened.get_or_compute("b", lambda: calls.append(1) or "again", _encode, _decode) == "computed"
+    assert calls == [1]
+
+
+def test_engine_version_invalidates_results(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    calls = []
+    compute = lcc_engine._compute
+    monkeypatch.setattr(lcc_engine, "_compute", lambda data: calls.append(1) or compute(data))
+    data = project(0)
+    first = lcc_engine.evaluate(data, cache)
+    lcc_engine.evaluate(data, cache)
+    assert len(calls) == 1
+    monkeypatch.setattr(lcc_engine, "ENGINE_VERSION", lcc_engine.ENGINE_VERSION + 1)
+    assert lcc_engine.evaluate(data, cache).total() == first.total()
+    assert len(calls) == 2
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    cache = _cache(tmp_path, memory_items=0, max_bytes=250)
+    for key in "abc":
+        cache.put(key, key * 100, _encode)
+    # Only two fit; "a" was the oldest
+    assert cache.get("a", _decode) is None
+    assert cache.disk_usage() == 200
+    # A buffered hit on "b" counts once written with the next put
+    assert cache.get("b", _decode) == "b" * 100
+    cache.put("d", "d" * 100, _encode)
+    assert cache.get("c", _decode) is None
+    assert cache.get("b", _decode) == "b" * 100
+    cache.put("d", "d" * 50, _encode)
+    assert cache.disk_usage() == cache._stored_bytes() == 150
+
+
+def test_hits_do_not_commit_until_flushed(tmp_path):
+    cache = _cache(tmp_path, memory_items=0)
+    cache.put("a", "value", _encode)
+    before = cache.connection.total_changes
+    for _ in range(5):
+        cache.get("a", _decode)
+    assert cache.connection.total_changes == before
+    cache.flush()
+    assert cache.connection.total_changes == before + 1
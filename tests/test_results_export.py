@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import lcc_engine
+import results_export
+from projects import project
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _results():
+    # Two bridges share a name, as they may in an imported portfolio
+    return [(name, lcc_engine.evaluate(project(seed))) for name, seed in (("A", 0), ("B", 1), ("A", 2))]
+
+
+def test_export_round_trip(tmp_path):
+    path = str(tmp_path / "results.parquet")
+    results = _results()
+    rows = results_export.export_results(path, results, batch_rows=100)
+    assert rows == sum(result.head_values.size for _name, result in results)
+
+    heads = pq.read_table(path)
+    assert heads.num_rows == rows
+    values = np.array(heads.column("value").to_pylist())
+    np.testing.assert_allclose(values, np.concatenate([result.head_values.ravel() for _name, result in results]))
+    stages = pq.read_table(results_export.stages_path_for(path))
+    np.testing.assert_allclose(stages.column("value").to_pylist(),
+                               np.concatenate([result.stage_totals().ravel() for _name, result in results]))
+
+
+def test_dictionary_values_are_unique(tmp_path):
+    path = str(tmp_path / "results.parquet")
+    results = _results()
+    results_export.export_results(path, results)
+    bridges = pq.read_table(path).column("bridge")
+    for chunk in bridges.chunks:
+        dictionary = chunk.dictionary.to_pylist()
+        assert len(dictionary) == len(set(dictionary))
+    expected = np.repeat([name for name, _result in results], [result.head_values.size for _name, result in results])
+    assert bridges.to_pylist() == expected.tolist()
+
+
+def test_categorical_dedupes_labels():
+    column = results_export._categorical(np.array([0, 1, 2, 2, 0]), ["A", "B", "A"])
+    assert column.dictionary.to_pylist() == ["A", "B"]
+    assert column.to_pylist() == ["A", "B", "A", "A", "A"]
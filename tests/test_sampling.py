@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import sampling
+
+
+def _rank_correlation(x, y):
+    return np.corrcoef(np.argsort(np.argsort(x)), np.argsort(np.argsort(y)))[0, 1]
+
+
+def test_plain_sobol_starts_with_the_known_points():
+    points = sampling.sobol(4, 3, np.random.default_rng(0), scramble=False)
+    np.testing.assert_array_equal(points, [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5],
+                                           [0.75, 0.25, 0.25], [0.25, 0.75, 0.75]])
+
+
+@pytest.mark.parametrize("scramble", [False, True])
+def test_sobol_points_are_balanced(scramble):
+    n, d = 256, 8
+    points = sampling.sobol(n, d, np.random.default_rng(1), scramble)
+    assert points.shape == (n, d) and ((points >= 0) & (points < 1)).all()
+    # Every elementary interval of width 1/n holds exactly one point per dimension
+    for column in points.T:
+        np.testing.assert_array_equal(np.sort(np.floor(column * n)), np.arange(n))
+
+
+def test_sobol_dimension_limit():
+    with pytest.raises(ValueError):
+        sampling.sobol(8, sampling.SOBOL_MAX_DIMENSIONS + 1, np.random.default_rng(0))
+
+
+def test_latin_hypercube_has_one_point_per_stratum():
+    n = 100
+    points = sampling.latin_hypercube(n, 5, np.random.default_rng(2))
+    for column in points.T:
+        np.testing.assert_array_equal(np.sort(np.floor(column * n)), np.arange(n))
+
+
+def test_iman_conover_reaches_the_target_and_keeps_the_values():
+    rng = np.random.default_rng(3)
+    sample = sampling.latin_hypercube(2000, 3, rng)
+    target = sampling.correlation_matrix(["a", "b", "c"], {("a", "b"): 0.7, ("b", "c"): -0.3})
+    reordered = sampling.iman_conover(sample, target, rng)
+    np.testing.assert_array_equal(np.sort(reordered, axis=0), np.sort(sample, axis=0))
+    assert _rank_correlation(reordered[:, 0], reordered[:, 1]) == pytest.approx(0.7, abs=0.03)
+    assert _rank_correlation(reordered[:, 1], reordered[:, 2]) == pytest.approx(-0.3, abs=0.03)
+    assert _rank_correlation(reordered[:, 0], reordered[:, 2]) == pytest.approx(0.0, abs=0.05)
@@ -0,0 +1,70 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import QApplication
+
+import stall_watchdog
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = str(tmp_path / "stalls.log")
+    stall_watchdog._log_to(path)
+    yield path
+    for handler in list(stall_watchdog.logger.handlers):
+        if getattr(handler, "baseFilename", None) == os.path.abspath(path):
+            stall_watchdog.logger.removeHandler(handler)
+            handler.close()
+
+
+def _spin(app, seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def _block_the_event_loop(seconds):
+    time.sleep(seconds)
+
+
+def _read(path):
+    for handler in stall_watchdog.logger.handlers:
+        handler.flush()
+    with open(path, encoding="utf-8") as handle:
+        return handle.read()
+
+
+def test_stall_dumps_the_blocked_frame(log_path):
+    app = QApplication.instance() or QApplication([])
+    watchdog = stall_watchdog.StallWatchdog(threshold=0.2, interval=0.05)
+    watchdog.start()
+    try:
+        _spin(app, 0.2)
+        _block_the_event_loop(0.8)
+        _spin(app, 0.2)
+    finally:
+        watchdog.stop()
+    log = _read(log_path)
+    assert watchdog.stall_count == 1
+    assert "Event loop stalled" in log and "GUI thread stack" in log
+    assert "in _block_the_event_loop" in log and "time.sleep(seconds)" in log
+    assert "Event loop resumed" in log
+    assert watchdog.max_latency > watchdog.threshold
+
+
+def test_fast_heartbeat_writes_no_dump(log_path):
+    app = QApplication.instance() or QApplication([])
+    watchdog = stall_watchdog.StallWatchdog(threshold=0.3, interval=0.05)
+    watchdog.start()
+    try:
+        _spin(app, 1.0)
+    finally:
+        watchdog.stop()
+    assert watchdog.stall_count == 0
+    assert watchdog.max_latency < watchdog.threshold
+    assert _read(log_path) == ""
@@ -0,0 +1,50 @@
+import numpy as np
+
+from streaming_stats import MonteCarloSummary, P2Quantiles, RunningMoments
+
+
+def test_chan_merge_matches_two_pass_moments():
+    rng = np.random.default_rng(0)
+    # A large offset loses all precision in a naive sum of squares
+    values = 1e9 + rng.normal(0.0, 1.0, (1000, 3))
+    moments = RunningMoments((3,))
+    for chunk in np.split(values, [1, 7, 300, 301, 900]):
+        moments.update(chunk)
+    assert moments.count == 1000
+    np.testing.assert_allclose(moments.mean, values.mean(axis=0), rtol=1e-15)
+    np.testing.assert_allclose(moments.variance(), values.var(axis=0, ddof=1), rtol=1e-6)
+
+
+def test_moments_need_two_samples_for_a_variance():
+    moments = RunningMoments()
+    moments.update([5.0])
+    assert np.isnan(moments.variance())
+
+
+def test_p2_estimates_converge_to_sample_quantiles():
+    rng = np.random.default_rng(1)
+    values = np.column_stack([rng.normal(0.0, 1.0, 20000), rng.lognormal(0.0, 0.5, 20000)])
+    estimator = P2Quantiles(2, (0.05, 0.5, 0.95))
+    for chunk in np.array_split(values, 13):
+        estimator.update(chunk)
+    exact = np.quantile(values, (0.05, 0.5, 0.95), axis=0).T
+    np.testing.assert_allclose(estimator.estimates(), exact, atol=0.03)
+
+
+def test_p2_is_exact_below_five_observations():
+    estimator = P2Quantiles(1, (0.5,))
+    estimator.update([[3.0], [1.0], [2.0]])
+    assert estimator.estimates()[0, 0] == 2.0
+
+
+def test_summary_of_cost_cubes():
+    rng = np.random.default_rng(2)
+    block = rng.uniform(0.0, 10.0, (200, 2, 4))
+    summary = MonteCarloSummary(["a", "b"])
+    summary.update(block[:50])
+    summary.update(block[50:])
+    snapshot = summary.snapshot()
+    assert snapshot["labels"] == ["a", "b", "Total"]
+    np.testing.assert_allclose(snapshot["mean"][:2], block.sum(axis=2).mean(axis=0))
+    np.testing.assert_allclose(snapshot["mean"][2], block.sum(axis=(1, 2)).mean())
+    np.testing.assert_allclose(snapshot["yearly_mean"], block.sum(axis=1).mean(axis=0))
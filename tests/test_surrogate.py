@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+import dialog_schema
+import lcc_engine
+import monte_carlo
+import surrogate
+import what_if
+from projects import project
+
+
+def test_predict_many_matches_predict():
+    data = project(1)
+    fitted = surrogate.fit(data, seed=0)
+    inside = surrogate.with_values(data, fitted.variables, (fitted.low + fitted.high) / 2)
+    outside = dict(data, **{dialog_schema.DEMOLITION.name: {"demolition_rate": 20.0}})
+    values, errors, exact = fitted.predict_many([inside, outside])
+    assert list(exact) == [False, True]
+    for row, form_data in enumerate((inside, outside)):
+        expected, _errors, _exact = fitted.predict(form_data)
+        np.testing.assert_allclose(values[row], expected)
+    np.testing.assert_allclose(errors, fitted.errors)
+
+
+def test_monte_carlo_adjustments_are_exact():
+    data = project(3, study_period=30)
+    factors = monte_carlo.factors_from_unit(monte_carlo.sample_unit(16, np.random.default_rng(0)))
+    # No sample varies the construction time only, so every one falls back
+    held = surrogate.fit(data, [(dialog_schema.FINANCIAL, "construction_time")], seed=0)
+    np.testing.assert_allclose(monte_carlo.surrogate_samples(data, factors, held),
+                               monte_carlo.evaluate_samples(data, factors).sum(axis=2), rtol=1e-9, atol=1e-6)
+
+
+def test_monte_carlo_surrogate_backend(tmp_path):
+    data = project(3, study_period=30)
+    store = monte_carlo.run(data, 64, str(tmp_path / "store"), chunk_samples=16, seed=1, backend="surrogate")
+    assert store.read().shape == (64, len(lcc_engine.HEAD_LABELS), 1)
+    factors = monte_carlo.factors_from_unit(monte_carlo.sample_unit(64, np.random.default_rng(1)))
+    exact = monte_carlo.evaluate_samples(data, factors).sum(axis=(1, 2))
+    np.testing.assert_allclose(store.read().sum(axis=(1, 2)), exact, rtol=0.02)
+    with pytest.raises(ValueError, match="backend"):
+        monte_carlo.run(data, 8, str(tmp_path / "other"), backend="fast")
+
+
+def test_what_if_surrogate_inside_and_outside_its_domain():
+    data = project(2)
+    model = what_if.SurrogateWhatIfModel(data)
+    exact_model = what_if.WhatIfModel(data)
+    for name, value in (("real_discount_rate", 6.5), ("traffic", 150.0), ("carbon_price", 3000.0)):
+        model.set(name, value)
+        exact_model.set(name, value)
+    totals = model.result().head_totals()
+    assert not model.exact
+    np.testing.assert_allclose(totals, exact_model.result().head_totals(),
+                               atol=4 * model.errors.max() + 1e-6)
+
+    model.set("periodic_maintenance_frequency", 7)
+    exact_model.set("periodic_maintenance_frequency", 7)
+    np.testing.assert_allclose(model.result().head_totals(), exact_model.result().head_totals(), rtol=1e-9)
+    assert model.exact and not model.errors.any()
+
+
+def test_panel_switches_backend_and_keeps_values():
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import what_if_panel
+
+    app = QApplication.instance() or QApplication([])
+    panel = what_if_panel.WhatIfPanel(project(2))
+    results = []
+    panel.changed.connect(results.append)
+    panel.sliders["real_discount_rate"].setValue(panel.position("real_discount_rate", 4.0))
+    panel.surrogate_box.setChecked(True)
+    assert isinstance(panel.model, what_if.SurrogateWhatIfModel)
+    assert panel.model.values["real_discount_rate"] == 4.0
+    panel.emit_result()
+    assert "lakh" in panel.accuracy_label.text()
+    assert results[-1].head_values.shape == (len(lcc_engine.HEAD_LABELS), 1)
+    assert app is not None
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+import tracing
+
+
+@pytest.fixture
+def recording():
+    tracing.clear()
+    tracing.enable()
+    yield
+    tracing.disable()
+    tracing.clear()
+
+
+def test_summary_matches_recorded_spans(recording):
+    for _ in range(3):
+        with tracing.span("a", "compute"):
+            pass
+    with tracing.span("b", "io"):
+        pass
+    summary = tracing.summary()
+    for category in ("compute", "io"):
+        durations = [event[3] for event in tracing.events() if event[1] == category]
+        count, total, slowest = summary[category]
+        assert count == len(durations)
+        assert total == pytest.approx(sum(durations) / 1e6)
+        assert slowest == pytest.approx(max(durations) / 1e6)
+
+
+def test_summary_keeps_spans_dropped_from_the_buffer(recording, monkeypatch):
+    monkeypatch.setattr(tracing, "_events", tracing.collections.deque(maxlen=2))
+    for _ in range(5):
+        with tracing.span("a", "compute"):
+            pass
+    assert len(tracing.events()) == 2
+    assert tracing.summary()["compute"][0] == 5
+    tracing.clear()
+    assert tracing.summary() == {}
+
+
+def test_schema_form_construction_is_traced(recording):
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import dialog_schema
+    import schema_dialog
+
+    app = QApplication.instance() or QApplication([])
+    schema_dialog.SchemaForm(dialog_schema.FINANCIAL)
+    assert [(name, category, args) for name, category, _start, _duration, _thread, args in tracing.events()] == [
+        ("SchemaForm", "ui", {"schema": dialog_schema.FINANCIAL.name})]
+    assert app is not None
+
+
+def test_home_toggle_and_export(tmp_path, monkeypatch):
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication, QFileDialog
+    import Home
+
+    app = QApplication.instance() or QApplication([])
+    tracing.clear()
+    window = Home.BICCAStudio()
+    path = str(tmp_path / "trace.json")
+    monkeypatch.setattr(QFileDialog, "getSaveFileName", lambda *args: (path, ""))
+    try:
+        assert window.tracing_btn.text() == "Start Tracing"
+        window.export_trace()
+        assert not os.path.exists(path) and "Start Tracing" in window.statusBar().currentMessage()
+
+        window.tracing_btn.click()
+        assert tracing.enabled() and window.tracing_btn.text() == "Stop Tracing"
+        with tracing.span("a", "compute"):
+            pass
+        window.tracing_btn.click()
+        assert not tracing.enabled()
+        # Spans recorded before stopping are still exported
+        window.export_trace()
+        with open(path, encoding="utf-8") as handle:
+            assert [event["name"] for event in json.load(handle)["traceEvents"]] == ["a"]
+        assert window.statusBar().currentMessage().startswith("1 spans written")
+    finally:
+        tracing.disable()
+        tracing.clear()
+        window.close()
+    assert app is not None
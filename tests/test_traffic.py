@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import traffic
+
+
+def _road(**values):
+    return dict({"road_type": "District Road", "number_of_lanes": 2, "traffic_growth": 5.0,
+                 "reroute_distance": 10.0, "cars": 1000.0, "hcv": 500.0}, **values)
+
+
+def test_total_grows_at_the_growth_rate():
+    totals = traffic.projection(_road(), 10).sum(axis=1)
+    np.testing.assert_allclose(totals, 1500.0 * 1.05 ** np.arange(10))
+    np.testing.assert_allclose(traffic.projection(_road(traffic_growth=0.0), 10).sum(axis=1), 1500.0)
+
+
+def test_total_is_capped_by_the_carriageway():
+    capacity = traffic.LANE_CAPACITY["District Road"] * 2
+    projected = traffic.projection(_road(traffic_growth=20.0), 15)
+    totals = projected.sum(axis=1)
+    assert totals.max() == pytest.approx(capacity)
+    assert totals[0] == pytest.approx(1500.0)
+    # The cap keeps the class shares of the uncapped projection
+    uncapped = traffic.projection(_road(traffic_growth=20.0, road_type="National Highway", number_of_lanes=6), 15)
+    assert uncapped.sum(axis=1).max() > capacity
+    np.testing.assert_allclose(projected / totals[:, None], uncapped / uncapped.sum(axis=1)[:, None])
+
+
+def test_cached_projection_follows_every_input():
+    base = traffic.projection(_road(), 20)
+    assert traffic.projection(_road(), 20) is base
+    with pytest.raises(ValueError):
+        base[0, 0] = 1.0
+    for change in ({"cars": 2000.0}, {"traffic_growth": 2.0}):
+        assert not np.array_equal(traffic.projection(_road(**change), 20), base)
+    # Capacity only matters once the cap is reached
+    capped = traffic.projection(_road(traffic_growth=20.0), 20)
+    for change in ({"number_of_lanes": 4}, {"road_type": "National Highway"}):
+        assert not np.array_equal(traffic.projection(_road(traffic_growth=20.0, **change), 20), capped)
+    assert traffic.projection(_road(), 25).shape == (25, len(traffic.VEHICLE_CLASSES))
+
+
+def test_reroute_pcu_km_is_the_daily_detour():
+    road = _road(reroute_distance=12.5)
+    np.testing.assert_allclose(traffic.reroute_pcu_km(road, 5), traffic.projection(road, 5).sum(axis=1) * 12.5)
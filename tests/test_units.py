@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+import pytest
+
+import autosave_journal
+import dialog_schema
+import report_generator
+import units
+from projects import project
+
+
+def test_coerce_converts_percentages_once():
+    values = units.coerce(dialog_schema.MAINTENANCE, {"repair_rehabilitation_rate": 12.5,
+                                                      "periodic_maintenance_frequency": 5})
+    assert values["repair_rehabilitation_rate"] == pytest.approx(0.125)
+    assert values["periodic_maintenance_frequency"] == 5
+    assert isinstance(values["periodic_maintenance_frequency"], int)
+
+
+def test_material_rows_in_tonnes_keep_their_cost():
+    rows = [{"material": "Concrete", "quantity": 10, "unit": "m3", "rate": 6000},
+            {"material": "Steel", "quantity": 2000, "unit": "kg", "rate": 70},
+            {"material": "Steel", "quantity": 3, "unit": "MT", "rate": 65000}]
+    values = units.coerce(dialog_schema.FOUNDATION, {"materials": rows})["materials"]
+    np.testing.assert_allclose([row["quantity"] for row in values], [24.0, 2.0, 3.0])
+    np.testing.assert_allclose([row["rate"] for row in values], [2500.0, 70000.0, 65000.0])
+    np.testing.assert_allclose([row["quantity"] * row["rate"] for row in values],
+                               [row["quantity"] * row["rate"] for row in rows])
+    assert {row["unit"] for row in values} == {units.BASE_QUANTITY_UNIT}
+
+
+def test_to_base_matches_coerce():
+    records = [dialog_schema.coerce(dialog_schema.DEMOLITION, {"demolition_rate": rate}) for rate in (5, 10, 20)]
+    keys, values = units.to_base(dialog_schema.DEMOLITION, records)
+    np.testing.assert_allclose(values[:, keys.index("demolition_rate")], [0.05, 0.1, 0.2])
+
+
+def test_check_project_rejects_unknown_unit_codes():
+    data = project(0)
+    data[dialog_schema.FOUNDATION.name]["materials"][0]["unit"] = "ft3"
+    with pytest.raises(ValueError, match="Foundation"):
+        units.check_project(data)
+    units.check_project(project(0))
+
+
+def test_load_project_rejects_bad_units(tmp_path):
+    path = str(tmp_path / "project.json")
+    data = project(1)
+    data[dialog_schema.CARBON_EMISSION.name]["materials"][0]["unit"] = "litre"
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle)
+    with pytest.raises(ValueError, match="project.json"):
+        autosave_journal.load_project(path)
+
+
+def test_portfolio_import_rejects_bad_units(tmp_path):
+    path = tmp_path / "portfolio.jsonl"
+    bad = project(2)
+    bad[dialog_schema.SUPER_STRUCTURE.name]["materials"][1]["unit"] = "tonnes"
+    path.write_text("\n".join(json.dumps({"name": name, "form_data": data})
+                              for name, data in (("A", project(1)), ("B", bad))), encoding="utf-8")
+    records = report_generator.iter_portfolio(str(path))
+    assert next(records)["name"] == "A"
+    with pytest.raises(ValueError, match="line 2"):
+        next(records)
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from version_history import VersionStore
+
+
+def _object_count(store):
+    return sum(len(files) for _dir, _dirs, files in os.walk(store.objects_dir))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return VersionStore(str(tmp_path / "versions"))
+
+
+def test_checkout_returns_committed_state(store):
+    state = {"Bridge 1": {"FinancialData_Dialog": {"real_discount_rate": 5.0}}, "Notes": {"text": "a"}}
+    version = store.commit(state, "first")
+    assert store.checkout(version["id"]) == state
+
+
+def test_unchanged_sections_share_chunks(store):
+    state = {"A": {"x": 1}, "B": {"y": 2}}
+    store.commit(state)
+    before = _object_count(store)
+    store.commit({"A": {"x": 1}, "B": {"y": 3}})
+    # Only the changed section and the new root tree are added
+    assert _object_count(store) == before + 2
+
+
+def test_diff_reports_added_removed_and_changed(store):
+    old = store.commit({"A": {"x": 1}, "B": {"y": 2}})
+    new = store.commit({"A": {"x": 5}, "C": {"z": 3}})
+    diff = store.diff(old["id"], new["id"])
+    assert diff["added"] == [("C",)]
+    assert diff["removed"] == [("B",)]
+    assert diff["changed"] == {("A",): {"x": (1, 5)}}
+
+
+def test_compare_escapes_paths(store, monkeypatch):
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import VersionHistory_Window
+
+    app = QApplication.instance() or QApplication([])
+    old = store.commit({"A": {"x": 1}})
+    new = store.commit({"A": {"x": 1}, "<b>bold</b>": {"y": 2}})
+    dialog = VersionHistory_Window.VersionHistoryDialog(store)
+    monkeypatch.setattr(dialog, "selected_ids", lambda: [old["id"], new["id"]])
+    dialog.compare_versions()
+    # Escaped markup shows up as text instead of formatting
+    assert "Added: <b>bold</b>" in dialog.diff_view.toPlainText()
+    dialog.close()
+    app.processEvents()
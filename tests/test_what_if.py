@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pytest
+
+import dialog_schema
+import lcc_engine
+import traffic
+import what_if
+from carbon_pricing import flat
+from projects import project
+
+
+def _with(data, schema, **values):
+    return dict(data, **{schema.name: dict(data.get(schema.name, {}), **values)})
+
+
+def _scaled_traffic(data, percent):
+    road = data[dialog_schema.BRIDGE_TRAFFIC.name]
+    return _with(data, dialog_schema.BRIDGE_TRAFFIC,
+                 **{name: road.get(name, 0.0) * percent / 100.0 for name in traffic.VEHICLE_CLASSES})
+
+
+@pytest.mark.parametrize("name, value, changed", [
+    ("real_discount_rate", 3.5, lambda data: _with(data, dialog_schema.FINANCIAL, real_discount_rate=3.5)),
+    ("real_discount_rate", 0.0, lambda data: _with(data, dialog_schema.FINANCIAL, real_discount_rate=0.0)),
+    ("traffic", 40.0, lambda data: _scaled_traffic(data, 40.0)),
+    ("traffic", 250.0, lambda data: _scaled_traffic(data, 250.0)),
+    ("periodic_maintenance_frequency", 7,
+     lambda data: _with(data, dialog_schema.MAINTENANCE, periodic_maintenance_frequency=7)),
+    ("steel_scrap_value", 42000.0, lambda data: _with(data, dialog_schema.DEMOLITION, steel_scrap_value=42000.0)),
+])
+def test_driver_matches_exact_evaluation(name, value, changed):
+    data = project(5)
+    model = what_if.WhatIfModel(data)
+    heads = model.set(name, value)
+    expected = lcc_engine.evaluate(changed(data)).head_values
+    np.testing.assert_allclose(model.result().head_values, expected, rtol=1e-9, atol=1e-6)
+    untouched = np.setdiff1d(np.arange(len(lcc_engine.HEAD_LABELS)), heads)
+    np.testing.assert_allclose(expected[untouched], lcc_engine.evaluate(data).head_values[untouched],
+                               rtol=1e-9, atol=1e-6)
+
+
+def test_carbon_price_matches_repriced_evaluation():
+    data = project(6)
+    model = what_if.WhatIfModel(data)
+    model.set("carbon_price", 4500.0)
+    expected = lcc_engine.head_values(data, flat(4500.0, model.study_period + 1))
+    np.testing.assert_allclose(model.result().head_values, expected, rtol=1e-9, atol=1e-6)
+
+
+def test_drivers_combine_and_reset():
+    data = project(7)
+    model = what_if.WhatIfModel(data)
+    for name, value in (("traffic", 180.0), ("real_discount_rate", 6.0), ("periodic_maintenance_frequency", 4)):
+        model.set(name, value)
+    changed = _with(_scaled_traffic(data, 180.0), dialog_schema.FINANCIAL, real_discount_rate=6.0)
+    changed = _with(changed, dialog_schema.MAINTENANCE, periodic_maintenance_frequency=4)
+    np.testing.assert_allclose(model.result().head_values, lcc_engine.evaluate(changed).head_values,
+                               rtol=1e-9, atol=1e-6)
+    model.reset()
+    assert model.values == model.saved
+    np.testing.assert_allclose(model.result().head_values, lcc_engine.evaluate(data).head_values,
+                               rtol=1e-9, atol=1e-6)
+    with pytest.raises(ValueError, match="driver"):
+        model.set("inflation", 3.0)
+
+
+def test_result_window_panels_follow_the_sliders():
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    import Result_window4
+
+    app = QApplication.instance() or QApplication([])
+    data = project(8)
+    data_panel = Result_window4.DataWindowPanel(data)
+    results_panel = Result_window4.ResultsWindowPanel(data_panel.results)
+    data_panel.what_if.changed.connect(results_panel.show_results)
+    report = lcc_engine.evaluate(data).report_results()
+    assert data_panel.bar_chart.data == [value for _label, value in report["cost_heads"]]
+    assert results_panel.pies["Social"].data == report["stages"]["Social"]
+
+    data_panel.what_if.sliders["real_discount_rate"].setValue(
+        data_panel.what_if.position("real_discount_rate", 2.0))
+    data_panel.what_if.emit_result()
+    expected = lcc_engine.evaluate(_with(data, dialog_schema.FINANCIAL, real_discount_rate=2.0)).report_results()
+    assert data_panel.bar_chart.data == pytest.approx([value for _label, value in expected["cost_heads"]])
+    assert results_panel.pies["Economic"].data == pytest.approx(expected["stages"]["Economic"])
+    assert app is not None
@@ -0,0 +1,217 @@
+"""
+Lightweight tracing of where a session spends its time.
+
+Code is wrapped in spans::
+
+    with tracing.span("head_values", "compute"):
+        ...
+
+or, for whole functions, ``@tracing.traced("io")``. While tracing is
+disabled ``span`` returns one shared do-nothing context manager, so an
+instrumented call costs a flag test and nothing is recorded. Tracing is
+enabled with ``enable()`` or by starting the application with the
+environment variable ``BLCCA_TRACE=1``.
+
+Finished spans are kept in a bounded in-memory buffer (oldest dropped
+first) with monotonic ``perf_counter_ns`` timestamps. ``export_chrome_trace``
+writes them in the Chrome trace-event format, which can be opened in
+``chrome://tracing`` or https://ui.perfetto.dev. ``summary`` reports the
+time per category for the status bar from running totals kept as spans
+finish, so refreshing it every second does not rescan the buffer.
+"""
+
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+
+# Span categories used by the application
+CATEGORIES = ["ui", "compute", "render", "io"]
+
+# Number of finished spans kept; older ones are dropped
+MAX_EVENTS = 100000
+
+_enabled = os.environ.get("BLCCA_TRACE", "") not in ("", "0")
+_events = collections.deque(maxlen=MAX_EVENTS)
+_origin = time.perf_counter_ns()
+
+# category -> [number of spans, total ns, slowest ns] since the last clear
+_totals = {}
+_totals_lock = threading.Lock()
+
+
+class _NullSpan(object):
+    """Context manager used while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args = dict(self.args, error=exc_type.__name__)
+        duration = end - self.start
+        # deque.append is atomic, so worker threads can record without a lock
+        _events.append((self.name, self.category, self.start, duration, threading.get_ident(), self.args))
+        with _totals_lock:
+            totals = _totals.get(self.category)
+            if totals is None:
+                _totals[self.category] = [1, duration, duration]
+            else:
+                totals[0] += 1
+                totals[1] += duration
+                if duration > totals[2]:
+                    totals[2] = duration
+        return False
+
+
+def enabled():
+    """True while spans are being recorded."""
+    return _enabled
+
+
+def enable():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans; recorded spans are kept until ``clear``."""
+    global _enabled
+    _enabled = False
+
+
+def clear():
+    """Forget every recorded span."""
+    with _totals_lock:
+        _events.clear()
+        _totals.clear()
+
+
+def span(name, category="app", **args):
+    """
+    Context manager timing the code it wraps.
+
+    Args:
+        name (str): Name of the span, e.g. the function or file it covers.
+        category (str): One of ``CATEGORIES`` for application spans.
+        **args: JSON-serializable details shown with the span in the trace.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(category, name=None):
+    """
+    Decorator recording every call of a function as a span.
+
+    Args:
+        category (str): Category of the span.
+        name (str): Span name; the qualified function name by default.
+    """
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Span(span_name, category, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def events():
+    """Return the recorded spans as (name, category, start ns, duration ns, thread, args) tuples."""
+    return list(_events)
+
+
+def chrome_trace():
+    """
+    The recorded spans as a Chrome trace-event document.
+
+    Returns:
+        dict: ``traceEvents`` of complete ("X") events with times in
+        microseconds since this module was imported.
+    """
+    pid = os.getpid()
+    trace_events = [{
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": (start - _origin) / 1000.0,
+        "dur": duration / 1000.0,
+        "pid": pid,
+        "tid": thread,
+        "args": args,
+    } for name, category, start, duration, thread, args in list(_events)]
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path):
+    """
+    Write the recorded spans to a JSON file for chrome://tracing or Perfetto.
+
+    Args:
+        path (str): Output file.
+
+    Returns:
+        int: Number of spans written.
+    """
+    document = chrome_trace()
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, default=str)
+    return len(document["traceEvents"])
+
+
+def summary():
+    """
+    Time spent per category.
+
+    Nested spans of the same category are counted in both the inner and
+    the outer span, so totals are an upper bound of the wall time. Spans
+    dropped from the buffer still count until ``clear``.
+
+    Returns:
+        dict: category -> (number of spans, total ms, slowest ms).
+    """
+    with _totals_lock:
+        totals = {category: tuple(values) for category, values in _totals.items()}
+    return {category: (count, total / 1e6, slowest / 1e6)
+            for category, (count, total, slowest) in totals.items()}
+
+
+def summary_text():
+    """One-line summary of ``summary`` for the status bar."""
+    if not _enabled and not _totals:
+        return "Tracing off"
+    totals = summary()
+    parts = [f"{category} {totals[category][1]:.0f} ms" for category in CATEGORIES if category in totals]
+    parts += [f"{category} {value[1]:.0f} ms" for category, value in sorted(totals.items())
+              if category not in CATEGORIES]
+    return "Trace: " + (", ".join(parts) if parts else "no spans yet")
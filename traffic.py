@@ -0,0 +1,109 @@
+"""
+Traffic projection over the study period.
+
+The Bridge and Traffic dialog gives today's traffic of each vehicle class
+in PCU/day, an annual growth rate and the number of lanes. ``projection``
+turns these into a (years, classes) array:
+
+* the total grows at the compound growth rate,
+* the class shares drift with ``COMPOSITION_SHIFT`` (e.g. cars gaining on
+  buses) while the total stays on its growth path,
+* the total is capped at the capacity of the carriageway, keeping the
+  class shares.
+
+Every user-cost head needs the same projection, so results are cached on
+the inputs and returned read-only; asking again with the same inputs
+returns the same array without recomputing it.
+"""
+
+import functools
+
+import numpy as np
+
+import dialog_schema
+import units
+
+
+VEHICLE_CLASSES = ["cars", "buses", "lcv", "mcv", "hcv"]
+
+# Design service volume per lane, PCU/day
+LANE_CAPACITY = {
+    "National Highway": 10000.0,
+    "State Highway": 8000.0,
+    "District Road": 5000.0,
+}
+
+# Vehicle operating cost of re-routed traffic, INR per PCU per km
+REROUTE_COST_PER_PCU_KM = 10.0
+
+# Tailpipe emissions of re-routed traffic, tonnes CO2e per PCU per km
+REROUTE_EMISSION_PER_PCU_KM = 0.15e-3
+
+# Yearly change of each class's share relative to the others
+COMPOSITION_SHIFT = {
+    "cars": 0.010,
+    "buses": -0.005,
+    "lcv": 0.005,
+    "mcv": 0.0,
+    "hcv": -0.005,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _projection(base, growth_rate, capacity, years):
+    base = np.array(base, dtype=float)
+    t = np.arange(years)[:, None]
+    total = base.sum() * (1.0 + growth_rate) ** t[:, 0]
+
+    shift = np.array([COMPOSITION_SHIFT[name] for name in VEHICLE_CLASSES])
+    weights = base * (1.0 + shift) ** t
+    weight_totals = weights.sum(axis=1)
+    shares = np.divide(weights, weight_totals[:, None], out=np.zeros_like(weights),
+                       where=weight_totals[:, None] > 0)
+
+    traffic = shares * np.minimum(total, capacity)[:, None]
+    traffic.setflags(write=False)
+    return traffic
+
+
+def projection(bridge_traffic_data, years):
+    """
+    Project the traffic of every vehicle class over the study period.
+
+    Args:
+        bridge_traffic_data (dict): Saved data of the Bridge and Traffic dialog.
+        years (int): Number of years, the first being today's traffic.
+
+    Returns:
+        ndarray: Read-only (years, len(VEHICLE_CLASSES)) traffic in PCU/day.
+    """
+    values = units.coerce(dialog_schema.BRIDGE_TRAFFIC, bridge_traffic_data)
+    base = tuple(values[name] for name in VEHICLE_CLASSES)
+    capacity = LANE_CAPACITY[values["road_type"]] * values["number_of_lanes"]
+    return _projection(base, values["traffic_growth"], capacity, int(years))
+
+
+def project_traffic(project_form_data):
+    """Traffic projection of a project over its study period."""
+    financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+    return projection(project_form_data.get(dialog_schema.BRIDGE_TRAFFIC.name, {}), financial["study_period"])
+
+
+def reroute_pcu_km(bridge_traffic_data, years):
+    """
+    PCU-km driven on the detour per day the bridge is closed.
+
+    Args:
+        bridge_traffic_data (dict): Saved data of the Bridge and Traffic dialog.
+        years (int): Number of years.
+
+    Returns:
+        ndarray: (years,) PCU-km per day of closure in each year.
+    """
+    values = units.coerce(dialog_schema.BRIDGE_TRAFFIC, bridge_traffic_data)
+    return projection(bridge_traffic_data, years).sum(axis=1) * values["reroute_distance"]
+
+
+def clear_cache():
+    """Forget all cached projections, e.g. after changing the constants."""
+    _projection.cache_clear()
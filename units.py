@@ -0,0 +1,270 @@
+"""
+Units of the dialog fields and conversion to the engine's base units.
+
+Every field of ``dialog_schema`` carries a unit code. ``UNITS`` gives the
+dimension of each code and its factor to the base unit of that dimension.
+The base units are the ones the engine computes in: fractions for
+percentages, km, tonnes, INR, INR per tonne and years. The codes are
+checked when this module is imported, so a schema using an unknown code
+fails at startup instead of producing wrong numbers later.
+
+``coerce`` is ``dialog_schema.coerce`` followed by the conversion, and is
+what every computation reads its inputs with; the saved data and the
+dialogs stay in the units shown to the user. Conversions are done on
+arrays: ``scale_factors`` returns the factor of every field of a schema
+that needs one, computed once and cached, and ``to_base`` multiplies a
+whole (records, fields) matrix by it. Material rows, whose unit is chosen
+per row, are converted to tonnes with a (materials, units) lookup table
+indexed by integer codes, and their "INR/unit" rates to INR per tonne of
+the same row. Unit combinations that have no conversion raise
+``ValueError`` before any result is computed, and ``check_project``
+rejects imported projects whose unit codes do not match the schema.
+"""
+
+import functools
+
+import numpy as np
+
+import dialog_schema
+
+
+# code -> (dimension, factor to the base unit of the dimension)
+UNITS = {
+    "": ("dimensionless", 1.0),
+    "%": ("dimensionless", 0.01),
+    "years": ("time", 1.0),
+    "km": ("length", 1.0),
+    "m": ("length", 1e-3),
+    "mm/km": ("slope", 1e-6),
+    "m/km": ("slope", 1e-3),
+    "kg": ("mass", 1e-3),
+    "MT": ("mass", 1.0),
+    "m3": ("volume", 1.0),
+    "INR": ("money", 1.0),
+    "INR/unit": ("money per quantity", 1.0),
+    "INR/kg": ("money per mass", 1000.0),
+    "INR/MT": ("money per mass", 1.0),
+    "kgCO2e/kg": ("emission per mass", 1.0),
+    "MJ/kg": ("energy per mass", 1.0),
+    "PCU/D": ("traffic", 1.0),
+}
+
+# Density used to turn volumes into mass, tonnes/m3
+DENSITY = {
+    "Concrete": 2.4,
+    "Steel": 7.85,
+}
+
+MATERIALS = ["Concrete", "Steel"]
+QUANTITY_UNITS = ["m3", "kg", "MT"]
+
+# Unit of material quantities after ``coerce``
+BASE_QUANTITY_UNIT = "MT"
+
+
+def check_schema_units(schemas):
+    """
+    Reject schemas using unit codes without a conversion.
+
+    Args:
+        schemas (list): ``DialogSchema`` objects to check.
+
+    Raises:
+        ValueError: If a field or a quantity unit choice is not in ``UNITS``.
+    """
+    unknown = []
+    for schema in schemas:
+        for section in schema.sections:
+            for field in section.fields:
+                codes = [field.unit]
+                if field.key == "unit":
+                    codes += field.choices
+                unknown += [f"{schema.name}.{field.key}: {code!r}" for code in codes if code not in UNITS]
+    if unknown:
+        raise ValueError("Unknown unit codes: " + ", ".join(unknown))
+
+
+def convert(value, from_unit, to_unit):
+    """
+    Convert a value between two units of the same dimension.
+
+    Raises:
+        ValueError: If the units have different dimensions.
+    """
+    from_dimension, from_factor = UNITS[from_unit]
+    to_dimension, to_factor = UNITS[to_unit]
+    if from_dimension != to_dimension:
+        raise ValueError(f"Cannot convert {from_unit!r} ({from_dimension}) to {to_unit!r} ({to_dimension})")
+    return np.asarray(value) * (from_factor / to_factor)
+
+
+@functools.lru_cache(maxsize=None)
+def scale_factors(schema_name):
+    """
+    Factors to base units of the plain numeric fields of a dialog.
+
+    Fields already in their base unit are left out, so integer fields such
+    as years keep their type.
+
+    Args:
+        schema_name (str): Window name of the dialog.
+
+    Returns:
+        tuple: Field keys (tuple) and read-only factors (ndarray).
+    """
+    fields = [field for field in dialog_schema.SCHEMAS_BY_NAME[schema_name].fields()
+              if field.kind in ("number", "integer") and UNITS[field.unit][1] != 1.0]
+    factors = np.array([UNITS[field.unit][1] for field in fields])
+    factors.setflags(write=False)
+    return tuple(field.key for field in fields), factors
+
+
+def to_base(schema, records):
+    """
+    Converted fields of many records in base units.
+
+    Args:
+        schema (DialogSchema): The dialog the records belong to.
+        records (list): Coerced data of the dialog, one dict per record.
+
+    Returns:
+        tuple: Field keys of ``scale_factors`` and an array of shape
+        (records, fields).
+    """
+    keys, factors = scale_factors(schema.name)
+    values = np.array([[record[key] for key in keys] for record in records], dtype=float)
+    return keys, values.reshape(len(records), len(keys)) * factors
+
+
+def _mass_table():
+    table = np.full((len(MATERIALS), len(QUANTITY_UNITS)), np.nan)
+    for row, material in enumerate(MATERIALS):
+        for column, unit in enumerate(QUANTITY_UNITS):
+            dimension, factor = UNITS[unit]
+            if dimension == "mass":
+                table[row, column] = factor
+            elif dimension == "volume" and material in DENSITY:
+                table[row, column] = factor * DENSITY[material]
+    table.setflags(write=False)
+    return table
+
+
+# Tonnes per unit of quantity, indexed by (material, quantity unit)
+MASS_TABLE = _mass_table()
+
+
+def tonnes_per_unit(materials, quantity_units):
+    """
+    Mass of one unit of many material quantities.
+
+    Args:
+        materials (list): Material names.
+        quantity_units (list): Unit code of each quantity.
+
+    Returns:
+        ndarray: Tonnes per unit.
+
+    Raises:
+        ValueError: If a material or unit is unknown, or a material cannot
+            be measured in its unit.
+    """
+    try:
+        material_index = np.array([MATERIALS.index(material) for material in materials], dtype=int)
+        unit_index = np.array([QUANTITY_UNITS.index(unit) for unit in quantity_units], dtype=int)
+    except ValueError as error:
+        raise ValueError(f"Unknown material or quantity unit: {error}") from None
+    factors = MASS_TABLE[material_index, unit_index]
+    if np.isnan(factors).any():
+        bad = np.nonzero(np.isnan(factors))[0][0]
+        raise ValueError(f"No conversion from {quantity_units[bad]!r} to tonnes for {materials[bad]}")
+    return factors
+
+
+def mass(materials, quantities, quantity_units):
+    """
+    Mass of many material quantities.
+
+    Args:
+        materials (list): Material names.
+        quantities (array): Quantities in their own units.
+        quantity_units (list): Unit code of each quantity.
+
+    Returns:
+        ndarray: Mass in tonnes.
+
+    Raises:
+        ValueError: If a material cannot be measured in its unit.
+    """
+    return np.asarray(quantities, dtype=float) * tonnes_per_unit(materials, quantity_units)
+
+
+def _base_rows(rows):
+    """Material rows with quantities in tonnes and per-unit rates per tonne."""
+    if not rows or "unit" not in rows[0]:
+        return rows
+    factors = tonnes_per_unit([row["material"] for row in rows], [row["unit"] for row in rows])
+    quantities = np.array([row["quantity"] for row in rows], dtype=float) * factors
+    result = [dict(row, quantity=quantity, unit=BASE_QUANTITY_UNIT) for row, quantity in zip(rows, quantities.tolist())]
+    if "rate" in rows[0]:
+        rates = np.array([row["rate"] for row in rows], dtype=float) / factors
+        for row, rate in zip(result, rates.tolist()):
+            row["rate"] = rate
+    return result
+
+
+def coerce(schema, data):
+    """
+    Saved form data of a dialog as typed values in base units.
+
+    Args:
+        schema (DialogSchema): The dialog.
+        data (dict): Saved form data of the dialog.
+
+    Returns:
+        dict: Values of every field; percentages as fractions, lengths in
+        km, material quantities in tonnes and their rates in INR/tonne.
+
+    Raises:
+        ValueError: If the data does not satisfy the schema or a material
+            row has no conversion to tonnes.
+    """
+    values = dialog_schema.coerce(schema, data)
+    keys, factors = scale_factors(schema.name)
+    if keys:
+        scaled = np.array([values[key] for key in keys], dtype=float) * factors
+        values.update(zip(keys, scaled.tolist()))
+    for section in schema.sections:
+        if section.repeated:
+            values[section.key] = _base_rows(values[section.key])
+    return values
+
+
+def check_project(project_form_data):
+    """
+    Reject an imported project whose unit codes do not match the schema.
+
+    Every known dialog is coerced, which rejects unit choices the dialog
+    does not offer, and every material row must be convertible to tonnes.
+
+    Args:
+        project_form_data (dict): Window name -> saved form data.
+
+    Raises:
+        ValueError: Naming the dialog and the offending value.
+    """
+    if not isinstance(project_form_data, dict):
+        raise ValueError(f"Project form data must be an object, not {type(project_form_data).__name__}")
+    for name, data in project_form_data.items():
+        schema = dialog_schema.SCHEMAS_BY_NAME.get(name)
+        if schema is None:
+            continue
+        if not isinstance(data, dict):
+            raise ValueError(f"{schema.title}: saved data must be an object, not {type(data).__name__}")
+        try:
+            coerce(schema, data)
+        except ValueError as error:
+            message = str(error)
+            raise ValueError(message if message.startswith(schema.title) else f"{schema.title}: {message}") from None
+
+
+check_schema_units(dialog_schema.SCHEMAS)
@@ -0,0 +1,213 @@
+"""
+Project version history backed by a content-addressed chunk store.
+
+Every section of the project (one dialog of one bridge) is stored as a
+chunk named by the SHA-256 digest of its canonical JSON. Groups of sections
+(the dialogs of a bridge, the bridges of a portfolio) are stored as tree
+chunks listing the digests of their members, and a version manifest only
+records the digest of the root tree. Unchanged sections and unchanged
+bridges therefore share the same chunks between versions, and comparing two
+versions only descends into trees whose digests differ.
+
+Layout of a store directory::
+
+    objects/ab/cdef...   zlib-compressed section and tree chunks
+    versions/<id>.json   version manifests
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+
+import tracing
+
+
+def _canonical(value):
+    """Serialize ``value`` so that equal data always gives equal bytes."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _is_section_group(value):
+    """True for dicts whose values are all dicts, e.g. bridge -> dialogs."""
+    return isinstance(value, dict) and value and all(isinstance(v, dict) for v in value.values())
+
+
+class VersionStore(object):
+    """Deduplicating store of project versions."""
+
+    def __init__(self, root):
+        """
+        Args:
+            root (str): Directory holding the objects and versions folders.
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.versions_dir = os.path.join(root, "versions")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.versions_dir, exist_ok=True)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put_chunk(self, value):
+        """
+        Store one section and return its digest. Existing chunks are reused.
+
+        Args:
+            value: JSON-serializable section data.
+
+        Returns:
+            str: Hex SHA-256 digest of the canonical section data.
+        """
+        data = _canonical(value)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as handle:
+                handle.write(zlib.compress(data))
+            os.replace(tmp_path, path)
+        return digest
+
+    def get_chunk(self, digest):
+        """Load the section stored under ``digest``."""
+        with open(self._object_path(digest), "rb") as handle:
+            return json.loads(zlib.decompress(handle.read()).decode("utf-8"))
+
+    def put_tree(self, state):
+        """
+        Store project data as section chunks and tree chunks.
+
+        Args:
+            state (dict): Form data, or a portfolio of form data dicts.
+
+        Returns:
+            str: Digest of the tree chunk describing ``state``.
+        """
+        entries = {}
+        for key, value in state.items():
+            if _is_section_group(value):
+                entries[key] = ["tree", self.put_tree(value)]
+            else:
+                entries[key] = ["section", self.put_chunk(value)]
+        return self.put_chunk({"tree": entries})
+
+    def get_tree(self, digest):
+        """Rebuild the project data stored under a tree digest."""
+        state = {}
+        for key, (kind, child) in self.get_chunk(digest)["tree"].items():
+            state[key] = self.get_tree(child) if kind == "tree" else self.get_chunk(child)
+        return state
+
+    @tracing.traced("io")
+    def commit(self, state, message="", parent=None):
+        """
+        Save a new version of the project.
+
+        Args:
+            state (dict): Project data to save.
+            message (str): Description shown in the version list.
+            parent (str): Id of the version this one was derived from.
+
+        Returns:
+            dict: The version manifest, including its ``id``.
+        """
+        manifest = {
+            "time": time.time(),
+            "message": message,
+            "parent": parent,
+            "root": self.put_tree(state),
+        }
+        manifest["id"] = hashlib.sha256(_canonical(manifest)).hexdigest()[:16]
+        with open(os.path.join(self.versions_dir, manifest["id"] + ".json"), "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+        return manifest
+
+    def manifest(self, version_id):
+        """Load the manifest of one version."""
+        with open(os.path.join(self.versions_dir, version_id + ".json"), encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def versions(self):
+        """
+        List all versions, oldest first.
+
+        Returns:
+            list: Version manifests.
+        """
+        manifests = [self.manifest(name[:-5]) for name in os.listdir(self.versions_dir)
+                     if name.endswith(".json")]
+        return sorted(manifests, key=lambda manifest: manifest["time"])
+
+    @tracing.traced("io")
+    def checkout(self, version_id):
+        """
+        Rebuild the project data of a version.
+
+        Args:
+            version_id (str): Version to load.
+
+        Returns:
+            dict: The project data as it was saved.
+        """
+        return self.get_tree(self.manifest(version_id)["root"])
+
+    def diff(self, old_id, new_id):
+        """
+        Compare two versions, loading only the chunks that changed.
+
+        Args:
+            old_id (str): The older version.
+            new_id (str): The newer version.
+
+        Returns:
+            dict: ``added`` and ``removed`` paths, and ``changed`` mapping each
+            changed section path to {field: (old, new)}.
+        """
+        result = {"added": [], "removed": [], "changed": {}}
+        self._diff_trees(self.manifest(old_id)["root"], self.manifest(new_id)["root"], (), result)
+        result["added"].sort()
+        result["removed"].sort()
+        return result
+
+    def _diff_trees(self, old_digest, new_digest, prefix, result):
+        if old_digest == new_digest:
+            return
+        old_entries = self.get_chunk(old_digest)["tree"]
+        new_entries = self.get_chunk(new_digest)["tree"]
+        result["added"].extend(prefix + (key,) for key in new_entries.keys() - old_entries.keys())
+        result["removed"].extend(prefix + (key,) for key in old_entries.keys() - new_entries.keys())
+
+        for key in old_entries.keys() & new_entries.keys():
+            (old_kind, old_child), (new_kind, new_child) = old_entries[key], new_entries[key]
+            if old_child == new_child:
+                continue
+            path = prefix + (key,)
+            if old_kind == new_kind == "tree":
+                self._diff_trees(old_child, new_child, path, result)
+                continue
+            old_value = self.get_tree(old_child) if old_kind == "tree" else self.get_chunk(old_child)
+            new_value = self.get_tree(new_child) if new_kind == "tree" else self.get_chunk(new_child)
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                result["changed"][path] = {
+                    field: (old_value.get(field), new_value.get(field))
+                    for field in old_value.keys() | new_value.keys()
+                    if old_value.get(field) != new_value.get(field)
+                }
+            else:
+                result["changed"][path] = {"": (old_value, new_value)}
+
+    def disk_usage(self):
+        """Return the number of bytes used by chunks and manifests."""
+        total = 0
+        for directory, _dirs, files in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+        return total
+
+
+def store_for(project_path):
+    """Return the version store kept next to ``project_path``."""
+    return VersionStore(project_path + ".versions")
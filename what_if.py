@@ -0,0 +1,243 @@
+"""
+What-if recomputation of the cost heads of one project.
+
+A what-if slider changes one driver at a time, and each driver only
+touches a few cost heads. ``WhatIfModel`` evaluates the project once with
+the exact engine, undiscounted and with emissions left in tonnes, and
+keeps those (heads, years) rows together with the few intermediate
+arrays the drivers act on:
+
+* discount rate: every head, but only through the discount factors;
+* carbon price: the three emission heads, re-priced;
+* traffic (percent of the saved daily traffic): the time cost, user time
+  cost and re-routing emission heads, scaled year by year by the ratio of
+  the new projected traffic to the saved one (the projection is capped by
+  the road capacity, so this is not a single factor);
+* periodic maintenance frequency: the periodic maintenance and
+  maintenance emission heads;
+* scrap value of structural steel: the recycling credit.
+
+A change re-evaluates only the rows of its heads and discounts them, well
+under a millisecond; the result equals ``lcc_engine.evaluate`` of the
+project with the driver values saved.
+
+``SurrogateWhatIfModel`` is the opt-in approximate backend: a
+``surrogate.Surrogate`` fitted over the discount rate and traffic slider
+ranges predicts the head totals with an error bound, and its exact
+fallback takes over once the maintenance frequency or scrap value leave
+their saved values.
+"""
+
+import numpy as np
+
+import dialog_schema
+import lcc_engine
+import surrogate
+import traffic
+import units
+from carbon_pricing import DEFAULT_CARBON_PRICE, discount_factors
+from end_of_life import RECYCLING, end_of_life
+from units import MATERIALS
+
+
+# Driver, label, unit, smallest value, largest value, slider step
+DRIVERS = [
+    ("real_discount_rate", "Discount Rate", "%", 0.0, 15.0, 0.1),
+    ("traffic", "Traffic", "% of saved", 0.0, 300.0, 1.0),
+    ("periodic_maintenance_frequency", "Maintenance Frequency", "years", 1, 30, 1),
+    ("carbon_price", "Carbon Price", "INR/tCO2e", 0.0, 20000.0, 100.0),
+    ("steel_scrap_value", "Scrap Value", "INR/MT", 0.0, 100000.0, 500.0),
+]
+DRIVER_NAMES = [name for name, _label, _unit, _low, _high, _step in DRIVERS]
+
+EMISSION_HEADS = ["Initial Carbon Emission Cost", "Maintenance Emission Costs",
+                  "Carbon Emission due to Re-Routing"]
+TRAFFIC_HEADS = ["Time Cost", "User Time Cost", "Carbon Emission due to Re-Routing"]
+
+# Heads re-evaluated by each driver; the discount rate re-discounts all
+AFFECTED_HEADS = {
+    "real_discount_rate": list(lcc_engine.HEAD_LABELS),
+    "traffic": TRAFFIC_HEADS,
+    "periodic_maintenance_frequency": ["Periodic Maintenance Costs", "Maintenance Emission Costs"],
+    "carbon_price": EMISSION_HEADS,
+    "steel_scrap_value": ["Recycling Credit"],
+}
+
+
+class WhatIfModel(object):
+    """Cost heads of a project under changing driver values."""
+
+    def __init__(self, project_form_data):
+        """
+        Args:
+            project_form_data (dict): Window name -> saved form data. The
+                saved values are the starting driver values.
+        """
+        financial = units.coerce(dialog_schema.FINANCIAL, project_form_data.get(dialog_schema.FINANCIAL.name, {}))
+        maintenance = units.coerce(dialog_schema.MAINTENANCE,
+                                   project_form_data.get(dialog_schema.MAINTENANCE.name, {}))
+        demolition = units.coerce(dialog_schema.DEMOLITION, project_form_data.get(dialog_schema.DEMOLITION.name, {}))
+        # Saved form data of the road, which the traffic projection reads,
+        # and its values in base units
+        self.road_form = project_form_data.get(dialog_schema.BRIDGE_TRAFFIC.name, {})
+        self.road = units.coerce(dialog_schema.BRIDGE_TRAFFIC, self.road_form)
+        self.study_period = financial["study_period"]
+        # Slider values are in the units of ``DRIVERS``
+        self.saved = {
+            "real_discount_rate": float(units.convert(financial["real_discount_rate"], "", "%")),
+            "traffic": 100.0,
+            "periodic_maintenance_frequency": maintenance["periodic_maintenance_frequency"],
+            "carbon_price": DEFAULT_CARBON_PRICE,
+            "steel_scrap_value": demolition["steel_scrap_value"],
+        }
+        self.values = dict(self.saved)
+
+        # Undiscounted rows, emissions in tonnes
+        undiscounted = dict(project_form_data)
+        undiscounted[dialog_schema.FINANCIAL.name] = dict(project_form_data.get(dialog_schema.FINANCIAL.name, {}),
+                                                          real_discount_rate=0.0)
+        self._base = lcc_engine.head_values(undiscounted, np.ones(self.study_period + 1))
+        self._rows = self._base.copy()
+        self._base_traffic = self._daily_traffic(100.0)
+        self._periodic_rate = maintenance["periodic_maintenance_rate"]
+        disposal = end_of_life(project_form_data)
+        self._recycled_steel = disposal["flows"][MATERIALS.index("Steel"), RECYCLING]
+
+        self._discount = self._discount_factors(self.values["real_discount_rate"])
+        self._prices = np.ones(len(lcc_engine.HEAD_LABELS))
+        self._prices[self._indices(EMISSION_HEADS)] = self.values["carbon_price"]
+        self.present_values = self._rows * self._prices[:, None] * self._discount
+
+    @staticmethod
+    def _indices(labels):
+        return [lcc_engine.HEAD_INDEX[label] for label in labels]
+
+    def _discount_factors(self, percent):
+        return discount_factors(float(units.convert(percent, "%", "")), self.study_period + 1)
+
+    def _daily_traffic(self, percent):
+        scaled = dict(self.road_form,
+                      **{name: self.road[name] * percent / 100.0 for name in traffic.VEHICLE_CLASSES})
+        return traffic.projection(scaled, self.study_period + 1).sum(axis=1)
+
+    def _update_rows(self, name, value):
+        rows, head = self._rows, lcc_engine.HEAD_INDEX
+        if name == "traffic":
+            ratio = np.divide(self._daily_traffic(value), self._base_traffic,
+                              out=np.zeros(self.study_period + 1), where=self._base_traffic > 0)
+            for label in TRAFFIC_HEADS:
+                rows[head[label]] = self._base[head[label]] * ratio
+        elif name == "periodic_maintenance_frequency":
+            year_index = np.arange(self.study_period + 1)
+            maintained = (year_index > 0) & (year_index % int(value) == 0)
+            construction_cost = self._base[head["Initial Construction Cost"], 0]
+            embodied = self._base[head["Initial Carbon Emission Cost"], 0]
+            rows[head["Periodic Maintenance Costs"]] = maintained * construction_cost * self._periodic_rate
+            rows[head["Maintenance Emission Costs"]] = maintained * embodied * self._periodic_rate
+        elif name == "carbon_price":
+            self._prices[self._indices(EMISSION_HEADS)] = value
+        elif name == "steel_scrap_value":
+            credit = self._recycled_steel * (value - self.saved["steel_scrap_value"])
+            rows[head["Recycling Credit"], -1] = self._base[head["Recycling Credit"], -1] - credit
+        elif name == "real_discount_rate":
+            self._discount = self._discount_factors(value)
+
+    def set(self, name, value):
+        """
+        Change one driver.
+
+        Args:
+            name (str): One of ``DRIVER_NAMES``.
+            value (float): New value, in the unit listed in ``DRIVERS``.
+
+        Returns:
+            list: Indices of the cost heads that changed.
+        """
+        if name not in self.values:
+            raise ValueError(f"Unknown what-if driver: {name}")
+        self.values[name] = value
+        self._update_rows(name, value)
+        heads = self._indices(AFFECTED_HEADS[name])
+        self.present_values[heads] = self._rows[heads] * self._prices[heads, None] * self._discount
+        return heads
+
+    def reset(self):
+        """Go back to the saved driver values."""
+        for name in DRIVER_NAMES:
+            if self.values[name] != self.saved[name]:
+                self.set(name, self.saved[name])
+
+    def result(self):
+        """Current present values as an ``LCCResult``."""
+        return lcc_engine.LCCResult(self.present_values.copy(), self.study_period)
+
+
+class SurrogateWhatIfModel(WhatIfModel):
+    """Cost head totals of a project predicted by a surrogate under changing driver values."""
+
+    def __init__(self, project_form_data, degree=surrogate.DEFAULT_DEGREE, seed=0):
+        """
+        Args:
+            project_form_data (dict): Window name -> saved form data. The
+                saved values are the starting driver values.
+            degree (int): Total degree of the surrogate polynomial.
+            seed (int): Seed of the surrogate design.
+        """
+        super().__init__(project_form_data)
+        self.project_form_data = project_form_data
+        variables = [(dialog_schema.FINANCIAL, "real_discount_rate")]
+        variables += [(dialog_schema.BRIDGE_TRAFFIC, name) for name in traffic.VEHICLE_CLASSES]
+        bounds = {}
+        for schema, key in variables:
+            name = "traffic" if schema is dialog_schema.BRIDGE_TRAFFIC else key
+            _name, _label, _unit, low, high, _step = DRIVERS[DRIVER_NAMES.index(name)]
+            if name == "traffic":
+                low, high = self.road[key] * low / 100.0, self.road[key] * high / 100.0
+            field = next(field for field in schema.fields() if field.key == key)
+            bounds[key] = tuple(np.clip([low, high], field.minimum, field.maximum))
+        self.surrogate = surrogate.fit(project_form_data, variables, bounds, degree, seed=seed)
+        self.errors = np.zeros(len(lcc_engine.HEAD_LABELS))
+        self.exact = True
+
+    def form_data(self):
+        """Form data of the project with the current driver values, but the saved carbon price."""
+        result = dict(self.project_form_data)
+        for schema, key in ((dialog_schema.FINANCIAL, "real_discount_rate"),
+                            (dialog_schema.MAINTENANCE, "periodic_maintenance_frequency"),
+                            (dialog_schema.DEMOLITION, "steel_scrap_value")):
+            result[schema.name] = dict(dialog_schema.coerce(schema, result.get(schema.name, {})),
+                                       **{key: self.values[key]})
+        percent = self.values["traffic"]
+        result[dialog_schema.BRIDGE_TRAFFIC.name] = dict(
+            self.road_form, **{name: self.road[name] * percent / 100.0 for name in traffic.VEHICLE_CLASSES})
+        return result
+
+    def set(self, name, value):
+        """
+        Change one driver.
+
+        Args:
+            name (str): One of ``DRIVER_NAMES``.
+            value (float): New value, in the unit listed in ``DRIVERS``.
+
+        Returns:
+            list: Indices of every cost head, as the prediction may move all.
+        """
+        if name not in self.values:
+            raise ValueError(f"Unknown what-if driver: {name}")
+        self.values[name] = value
+        return list(range(len(lcc_engine.HEAD_LABELS)))
+
+    def result(self):
+        """
+        Current head totals as an ``LCCResult`` with a single column.
+
+        ``errors`` and ``exact`` are updated with the error bound of each
+        head and whether the exact engine was used.
+        """
+        totals, self.errors, self.exact = self.surrogate.predict(self.form_data())
+        emission = self._indices(EMISSION_HEADS)
+        price_ratio = self.values["carbon_price"] / DEFAULT_CARBON_PRICE
+        totals[emission] *= price_ratio
+        self.errors[emission] *= price_ratio
+        return lcc_engine.LCCResult(totals[:, None], self.study_period)
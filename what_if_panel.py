@@ -0,0 +1,132 @@
+"""
+What-if panel of the results window.
+
+One slider per ``what_if.DRIVERS`` entry. Every slider move updates the
+``what_if.WhatIfModel`` of the project, which re-evaluates only the cost
+heads of that driver. The new result is emitted once the event loop is
+idle, so the moves of a fast drag that arrive together give one repaint;
+the results window then moves its existing bars and wedges and repaints
+only them over a cached background of each chart.
+
+The "Surrogate" box switches to ``what_if.SurrogateWhatIfModel``, which
+predicts head totals from a fitted surrogate and shows its error bound.
+"""
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QCheckBox, QGridLayout, QLabel, QPushButton, QSlider, QVBoxLayout, QWidget
+
+from lcc_engine import LAKH
+import tracing
+import what_if
+
+
+class WhatIfPanel(QWidget):
+    """Sliders for the key cost drivers of a project."""
+
+    changed = pyqtSignal(object)
+
+    def __init__(self, project_form_data, surrogate=False, parent=None):
+        super().__init__(parent)
+        self.project_form_data = project_form_data
+        self.model = self.create_model(surrogate)
+        self.sliders = {}
+        self.value_labels = {}
+        self.emit_timer = QTimer(self)
+        self.emit_timer.setSingleShot(True)
+        self.emit_timer.setInterval(0)
+        self.emit_timer.timeout.connect(self.emit_result)
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        title_label = QLabel("What-If Analysis")
+        title_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(title_label)
+
+        grid = QGridLayout()
+        for row, (name, label, unit, low, high, step) in enumerate(what_if.DRIVERS):
+            grid.addWidget(QLabel(f"{label} ({unit})"), row, 0)
+            slider = QSlider(Qt.Horizontal)
+            slider.setRange(0, round((high - low) / step))
+            slider.setValue(self.position(name, self.model.values[name]))
+            slider.valueChanged.connect(lambda position, name=name: self.move(name, position))
+            grid.addWidget(slider, row, 1)
+            value_label = QLabel(self.format_value(name, self.model.values[name]))
+            value_label.setMinimumWidth(70)
+            grid.addWidget(value_label, row, 2)
+            self.sliders[name] = slider
+            self.value_labels[name] = value_label
+        grid.setColumnStretch(1, 1)
+        layout.addLayout(grid)
+
+        self.surrogate_box = QCheckBox("Surrogate (approximate, faster)")
+        self.surrogate_box.setChecked(isinstance(self.model, what_if.SurrogateWhatIfModel))
+        self.surrogate_box.toggled.connect(self.use_surrogate)
+        layout.addWidget(self.surrogate_box)
+        self.accuracy_label = QLabel()
+        layout.addWidget(self.accuracy_label)
+
+        reset_button = QPushButton("Reset to Saved Values")
+        reset_button.clicked.connect(self.reset)
+        layout.addWidget(reset_button)
+        layout.addStretch()
+
+    def create_model(self, surrogate):
+        with tracing.span("what-if model", "compute", surrogate=surrogate):
+            if surrogate:
+                return what_if.SurrogateWhatIfModel(self.project_form_data)
+            return what_if.WhatIfModel(self.project_form_data)
+
+    def use_surrogate(self, surrogate):
+        """Switch between the exact and the surrogate model, keeping the driver values."""
+        values = self.model.values
+        self.model = self.create_model(surrogate)
+        for name in what_if.DRIVER_NAMES:
+            if values[name] != self.model.values[name]:
+                self.model.set(name, values[name])
+        self.emit_timer.start()
+
+    def emit_result(self):
+        result = self.model.result()
+        if not isinstance(self.model, what_if.SurrogateWhatIfModel):
+            self.accuracy_label.setText("")
+        elif self.model.exact:
+            self.accuracy_label.setText("Outside the surrogate range: exact")
+        else:
+            self.accuracy_label.setText(f"Surrogate error: \u00b1{self.model.errors.max() / LAKH:,.2f} lakh per head")
+        self.changed.emit(result)
+
+    @staticmethod
+    def _driver(name):
+        return what_if.DRIVERS[what_if.DRIVER_NAMES.index(name)]
+
+    def position(self, name, value):
+        """Slider position of a driver value, clamped to the slider range."""
+        _name, _label, _unit, low, high, step = self._driver(name)
+        return round((min(max(value, low), high) - low) / step)
+
+    def value(self, name, position):
+        _name, _label, _unit, low, _high, step = self._driver(name)
+        value = low + position * step
+        return int(value) if isinstance(step, int) else round(value, 6)
+
+    def format_value(self, name, value):
+        step = self._driver(name)[5]
+        return f"{value:,.1f}" if step < 1 else f"{value:,.0f}"
+
+    def move(self, name, position):
+        with tracing.span("what-if", "compute", driver=name):
+            value = self.value(name, position)
+            self.model.set(name, value)
+            self.value_labels[name].setText(self.format_value(name, value))
+        self.emit_timer.start()
+
+    def reset(self):
+        self.model.reset()
+        for name, slider in self.sliders.items():
+            slider.blockSignals(True)
+            slider.setValue(self.position(name, self.model.values[name]))
+            slider.blockSignals(False)
+            self.value_labels[name].setText(self.format_value(name, self.model.values[name]))
+        self.emit_timer.start()